@@ -1,18 +1,78 @@
+from dataclasses import asdict
 from pathlib import Path
 from typing import Generator
 
 import pytest
+import requests
 
-from lib.tracing import Phases, TestTiming, get_collector, render_table
+from lib.isolation import GLOBAL_TIMELINE_MARKER, global_timeline_lock
+from lib.server_spans import ServerSpanSource, create_server_span_source, server_spans_timeout_seconds
+from lib.sessions import create_api_client, create_http_session
+from lib.tracing import Phases, TestTiming, get_collector, render_endpoint_table, render_table
+from openapi_gen.micro_chirp_api_client.client import Client
 
 _SPAN_REPORT_OPTION = "--span-report"
 _REPORT_FILE = Path("reports/spanTiming/spanTiming.txt")
+_TIMING_PROPERTY = "span_timing"
+_SERVER_SPAN_SOURCE = pytest.StashKey[ServerSpanSource | None]()
 
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     parser.addoption(_SPAN_REPORT_OPTION, action="store_true", default=False)
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        f"{GLOBAL_TIMELINE_MARKER}: asserts on the top of the global timeline; runs exclusively across xdist workers",
+    )
+    # Server spans are collected once by the controller, workers only forward act trace ids
+    if _is_xdist_worker(config) or not config.getoption(_SPAN_REPORT_OPTION):
+        return
+    config.stash[_SERVER_SPAN_SOURCE] = create_server_span_source()
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    source = config.stash.get(_SERVER_SPAN_SOURCE, None)
+    if source is not None:
+        source.close()
+
+
+def _is_xdist_worker(config: pytest.Config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+@pytest.fixture(scope="session")
+def client() -> Generator[Client, None, None]:
+    with create_api_client() as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def http() -> Generator[requests.Session, None, None]:
+    with create_http_session() as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def _global_timeline_lock_file(tmp_path_factory: pytest.TempPathFactory, worker_id: str) -> Path | None:
+    if worker_id == "master":
+        return None
+    return tmp_path_factory.getbasetemp().parent / "global_timeline.lock"
+
+
+@pytest.fixture(autouse=True)
+def _global_timeline_isolation(
+    request: pytest.FixtureRequest, _global_timeline_lock_file: Path | None
+) -> Generator[None, None, None]:
+    if _global_timeline_lock_file is None:
+        yield
+        return
+    exclusive = request.node.get_closest_marker(GLOBAL_TIMELINE_MARKER) is not None
+    with global_timeline_lock(_global_timeline_lock_file, exclusive):
+        yield
+
+
 @pytest.fixture
 def phases(request: pytest.FixtureRequest) -> Generator[Phases, None, None]:
     enabled: bool = request.config.getoption(_SPAN_REPORT_OPTION)
@@ -21,18 +81,29 @@ def phases(request: pytest.FixtureRequest) -> Generator[Phases, None, None]:
     p.finish()
     if enabled:
         phase_nanos = p.get_phase_nanos()
-        get_collector().record(
-            TestTiming(
-                test_module=request.node.module.__name__,
-                test_name=request.node.name,
-                arrange_nanos=phase_nanos["arrange"],
-                act_nanos=phase_nanos["act"],
-                assert_nanos=phase_nanos["assert"],
-            )
+        timing = TestTiming(
+            test_module=request.node.module.__name__,
+            test_name=request.node.name,
+            arrange_nanos=phase_nanos["arrange"],
+            act_nanos=phase_nanos["act"],
+            assert_nanos=phase_nanos["assert"],
+            act_trace_ids=p.get_act_trace_ids(),
         )
+        # user_properties travel with the teardown report, so xdist workers hand timings to the controller
+        request.node.user_properties.append((_TIMING_PROPERTY, asdict(timing)))
+
+
+def pytest_runtest_logreport(report: pytest.TestReport) -> None:
+    if report.when != "teardown":
+        return
+    for name, value in report.user_properties:
+        if name == _TIMING_PROPERTY:
+            get_collector().record(TestTiming(**value))
 
 
 def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    if _is_xdist_worker(session.config):
+        return
     try:
         span_report: bool = session.config.getoption(_SPAN_REPORT_OPTION)
     except ValueError:
@@ -42,7 +113,13 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
     timings = get_collector().all()
     if not timings:
         return
-    table = render_table(timings)
+    source = session.config.stash.get(_SERVER_SPAN_SOURCE, None)
+    if source is None:
+        table = render_table(timings)
+    else:
+        trace_ids = {trace_id for t in timings for trace_id in t.act_trace_ids}
+        server_spans = source.collect(trace_ids, server_spans_timeout_seconds())
+        table = "\n\n".join(filter(None, [render_table(timings, server_spans), render_endpoint_table(server_spans)]))
     print(f"\n{table}")
     _REPORT_FILE.parent.mkdir(parents=True, exist_ok=True)
     _REPORT_FILE.write_text(table)
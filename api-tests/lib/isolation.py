@@ -0,0 +1,22 @@
+import fcntl
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Generator
+
+GLOBAL_TIMELINE_MARKER = "global_timeline"
+
+
+@contextmanager
+def global_timeline_lock(lock_file: Path, exclusive: bool) -> Generator[None, None, None]:
+    """Hold an inter-process lock that serializes tests observing the top of the global timeline.
+
+    Every test holds the lock in shared mode, so ordinary tests still run in parallel across
+    workers. Tests marked `global_timeline` take it exclusively and therefore run while no other
+    test is writing posts, likes or views that could appear at the top of the global timeline.
+    """
+    with lock_file.open("a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
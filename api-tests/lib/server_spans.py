@@ -0,0 +1,301 @@
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Protocol
+
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
+    ExportTraceServiceRequest,
+    ExportTraceServiceResponse,
+)
+from opentelemetry.proto.common.v1.common_pb2 import AnyValue
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+_TRACES_PATH = "/v1/traces"
+_DB_SYSTEM_ATTRIBUTES = ("db.system", "db.system.name")
+_DB_QUERY_ATTRIBUTES = ("db.query.text", "db.statement")
+_STATEMENT_COUNT_ATTRIBUTE = "app.db.statement_count"
+_ROWS_ATTRIBUTE_PREFIX = "app.db.rows."
+
+
+@dataclass(frozen=True)
+class ServerSpan:
+    trace_id: str
+    span_id: str
+    parent_span_id: str
+    name: str
+    kind: int
+    start_nanos: int
+    end_nanos: int
+    attributes: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def duration_nanos(self) -> int:
+        return self.end_nanos - self.start_nanos
+
+    @property
+    def is_db(self) -> bool:
+        return any(key in self.attributes for key in _DB_SYSTEM_ATTRIBUTES)
+
+    @property
+    def query(self) -> str:
+        for key in _DB_QUERY_ATTRIBUTES:
+            if key in self.attributes:
+                return " ".join(self.attributes[key].split())
+        return self.name
+
+
+@dataclass
+class ServerBreakdown:
+    """Server time of one or more traces, split into service method self time and DB time.
+
+    Statement and row counts come from the request metrics the server attaches to its HTTP server span.
+    """
+
+    server_nanos: int = 0
+    service_nanos: int = 0
+    db_nanos: int = 0
+    statements: int = 0
+    rows: int = 0
+    query_nanos: dict[str, int] = field(default_factory=dict)
+
+    def add(self, other: "ServerBreakdown") -> None:
+        self.server_nanos += other.server_nanos
+        self.service_nanos += other.service_nanos
+        self.db_nanos += other.db_nanos
+        self.statements += other.statements
+        self.rows += other.rows
+        for query, nanos in other.query_nanos.items():
+            self.query_nanos[query] = self.query_nanos.get(query, 0) + nanos
+
+    def top_query(self) -> tuple[str, int] | None:
+        if not self.query_nanos:
+            return None
+        return max(self.query_nanos.items(), key=lambda item: item[1])
+
+
+def breakdown_trace(spans: list[ServerSpan]) -> ServerBreakdown:
+    """Break one server trace down into HTTP server, `@WithSpan` service and JDBC time.
+
+    Service time is the self time of the outermost INTERNAL spans, i.e. their duration minus the
+    DB spans nested below them, so that service and DB columns add up to at most the server time.
+    """
+    by_id = {span.span_id: span for span in spans}
+
+    def outermost_internal_ancestor(span: ServerSpan) -> ServerSpan | None:
+        found = None
+        parent = by_id.get(span.parent_span_id)
+        while parent is not None:
+            if parent.kind == SPAN_KIND_INTERNAL:
+                found = parent
+            parent = by_id.get(parent.parent_span_id)
+        return found
+
+    result = ServerBreakdown()
+    for span in spans:
+        if span.kind == SPAN_KIND_SERVER:
+            result.server_nanos += span.duration_nanos
+            result.statements += int(span.attributes.get(_STATEMENT_COUNT_ATTRIBUTE, 0))
+            result.rows += sum(
+                int(value) for key, value in span.attributes.items() if key.startswith(_ROWS_ATTRIBUTE_PREFIX)
+            )
+        elif span.is_db:
+            result.db_nanos += span.duration_nanos
+            result.query_nanos[span.query] = result.query_nanos.get(span.query, 0) + span.duration_nanos
+            if outermost_internal_ancestor(span) is not None:
+                result.service_nanos -= span.duration_nanos
+        elif span.kind == SPAN_KIND_INTERNAL and outermost_internal_ancestor(span) is None:
+            result.service_nanos += span.duration_nanos
+    return result
+
+
+def server_span_name(spans: list[ServerSpan]) -> str | None:
+    return next((span.name for span in spans if span.kind == SPAN_KIND_SERVER), None)
+
+
+def _any_value_to_str(value: AnyValue) -> str:
+    kind = value.WhichOneof("value")
+    return "" if kind is None else str(getattr(value, kind))
+
+
+def spans_from_otlp_protobuf(body: bytes) -> list[ServerSpan]:
+    request = ExportTraceServiceRequest()
+    request.ParseFromString(body)
+    return [
+        ServerSpan(
+            trace_id=span.trace_id.hex(),
+            span_id=span.span_id.hex(),
+            parent_span_id=span.parent_span_id.hex(),
+            name=span.name,
+            kind=span.kind,
+            start_nanos=span.start_time_unix_nano,
+            end_nanos=span.end_time_unix_nano,
+            attributes={attribute.key: _any_value_to_str(attribute.value) for attribute in span.attributes},
+        )
+        for resource_spans in request.resource_spans
+        for scope_spans in resource_spans.scope_spans
+        for span in scope_spans.spans
+    ]
+
+
+def spans_from_otlp_json(document: dict) -> list[ServerSpan]:
+    """Parse OTLP/JSON, either an export request (`resourceSpans`) or a single ResourceSpans object.
+
+    The latter is what the Java `logging-otlp` exporter writes, one object per log line.
+    """
+    resource_spans_list = document.get("resourceSpans", [document])
+    return [
+        ServerSpan(
+            trace_id=span.get("traceId", "").lower(),
+            span_id=span.get("spanId", "").lower(),
+            parent_span_id=span.get("parentSpanId", "").lower(),
+            name=span.get("name", ""),
+            kind=int(span.get("kind", 0)),
+            start_nanos=int(span.get("startTimeUnixNano", 0)),
+            end_nanos=int(span.get("endTimeUnixNano", 0)),
+            attributes={
+                attribute["key"]: str(next(iter(attribute.get("value", {}).values()), ""))
+                for attribute in span.get("attributes", [])
+            },
+        )
+        for resource_spans in resource_spans_list
+        for scope_spans in resource_spans.get("scopeSpans", [])
+        for span in scope_spans.get("spans", [])
+    ]
+
+
+def _group_by_trace(spans: list[ServerSpan]) -> dict[str, list[ServerSpan]]:
+    grouped: dict[str, list[ServerSpan]] = defaultdict(list)
+    for span in spans:
+        grouped[span.trace_id].append(span)
+    return dict(grouped)
+
+
+def _await_traces(
+    load: Callable[[], dict[str, list[ServerSpan]]], trace_ids: set[str], timeout: float
+) -> dict[str, list[ServerSpan]]:
+    # The server span ends last, so once it has been exported the rest of the trace has been too
+    deadline = time.monotonic() + timeout
+    while True:
+        traces = load()
+        complete = all(server_span_name(traces.get(trace_id, [])) is not None for trace_id in trace_ids)
+        if complete or time.monotonic() >= deadline:
+            return {trace_id: traces[trace_id] for trace_id in trace_ids if trace_id in traces}
+        time.sleep(0.2)
+
+
+class ServerSpanSource(Protocol):
+    def collect(self, trace_ids: set[str], timeout: float) -> dict[str, list[ServerSpan]]: ...
+
+    def close(self) -> None: ...
+
+
+class OtlpReceiver:
+    """Minimal OTLP/HTTP trace receiver standing in for the collector.
+
+    Point the server at it with OTEL_EXPORTER_OTLP_ENDPOINT=http://<host>:<port>.
+    Accepts both `application/x-protobuf` and `application/json` payloads on /v1/traces.
+    """
+
+    def __init__(self, port: int, host: str = "0.0.0.0") -> None:
+        self._spans: list[ServerSpan] = []
+        self._lock = threading.Lock()
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                if self.path != _TRACES_PATH:
+                    self.send_error(404)
+                    return
+                body = self.rfile.read(int(self.headers.get("Content-Length", "0")))
+                is_json = self.headers.get("Content-Type", "").startswith("application/json")
+                try:
+                    spans = spans_from_otlp_json(json.loads(body)) if is_json else spans_from_otlp_protobuf(body)
+                except ValueError:
+                    self.send_error(400)
+                    return
+                receiver._add(spans)
+                response = b"{}" if is_json else ExportTraceServiceResponse().SerializeToString()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json" if is_json else "application/x-protobuf")
+                self.send_header("Content-Length", str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def _add(self, spans: list[ServerSpan]) -> None:
+        with self._lock:
+            self._spans.extend(spans)
+
+    def _load(self) -> dict[str, list[ServerSpan]]:
+        with self._lock:
+            return _group_by_trace(list(self._spans))
+
+    def collect(self, trace_ids: set[str], timeout: float) -> dict[str, list[ServerSpan]]:
+        return _await_traces(self._load, trace_ids, timeout)
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class SpanFile:
+    """Reads server spans from a file the server's `logging-otlp` exporter writes to.
+
+    Each line may carry a log prefix; everything from the first `{` is parsed as OTLP/JSON
+    and lines that are not valid OTLP/JSON are skipped.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    def _load(self) -> dict[str, list[ServerSpan]]:
+        if not self._path.exists():
+            return {}
+        spans: list[ServerSpan] = []
+        with self._path.open(encoding="utf-8", errors="replace") as f:
+            for line in f:
+                start = line.find("{")
+                if start < 0:
+                    continue
+                try:
+                    document = json.loads(line[start:])
+                except ValueError:
+                    continue
+                if isinstance(document, dict):
+                    spans.extend(spans_from_otlp_json(document))
+        return _group_by_trace(spans)
+
+    def collect(self, trace_ids: set[str], timeout: float) -> dict[str, list[ServerSpan]]:
+        return _await_traces(self._load, trace_ids, timeout)
+
+    def close(self) -> None:
+        pass
+
+
+def server_spans_timeout_seconds() -> float:
+    return float(os.getenv("SERVER_SPANS_TIMEOUT_SECONDS", "15"))
+
+
+def create_server_span_source() -> ServerSpanSource | None:
+    """Create the server span source configured by OTLP_RECEIVER_PORT or SERVER_SPANS_FILE, if any."""
+    port = os.getenv("OTLP_RECEIVER_PORT")
+    if port:
+        return OtlpReceiver(int(port))
+    path = os.getenv("SERVER_SPANS_FILE")
+    if path:
+        return SpanFile(Path(path))
+    return None
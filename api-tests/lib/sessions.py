@@ -0,0 +1,35 @@
+import os
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from lib.api_config import BASE_URL
+from lib.tracing import inject_trace_context
+from openapi_gen.micro_chirp_api_client.client import Client
+
+POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "10"))
+
+
+class _TraceContextAdapter(HTTPAdapter):
+    def send(self, request: requests.PreparedRequest, *args, **kwargs) -> requests.Response:
+        inject_trace_context(request.headers)
+        return super().send(request, *args, **kwargs)
+
+
+def _inject_trace_context(request: httpx.Request) -> None:
+    inject_trace_context(request.headers)
+
+
+def create_http_session() -> requests.Session:
+    """Create a keep-alive `requests.Session` that reuses up to POOL_SIZE connections and propagates trace context."""
+    session = requests.Session()
+    adapter = _TraceContextAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def create_api_client() -> Client:
+    """Create a generated API client whose underlying `httpx.Client` keeps connections alive between calls."""
+    return Client(base_url=BASE_URL, httpx_args={"event_hooks": {"request": [_inject_trace_context]}})
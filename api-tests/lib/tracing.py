@@ -1,17 +1,33 @@
 import threading
-from dataclasses import dataclass
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field
 from typing import Optional
 
+from opentelemetry import context, trace
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import SimpleSpanProcessor
 from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+
+from lib.server_spans import ServerBreakdown, ServerSpan, breakdown_trace, server_span_name
 
 _TEST_HEADER = "Test"
 _ARRANGE_HEADER = "Arrange (ms)"
 _ACT_HEADER = "Act (ms)"
 _ASSERT_HEADER = "Assert (ms)"
 _TOTAL_HEADER = "Total (ms)"
+_SERVER_HEADER = "Server (ms)"
+_SERVICE_HEADER = "Service (ms)"
+_DB_HEADER = "DB (ms)"
+_STATEMENTS_HEADER = "Stmts"
+_ROWS_HEADER = "Rows"
+_TOP_QUERY_HEADER = "Top query (ms)"
+_ENDPOINT_HEADER = "Endpoint"
+_REQUESTS_HEADER = "Requests"
 _MAX_TEST_COLUMN_WIDTH = 60
+_MAX_QUERY_COLUMN_WIDTH = 80
+
+_propagator = TraceContextTextMapPropagator()
 
 
 @dataclass
@@ -21,6 +37,7 @@ class TestTiming:
     arrange_nanos: int
     act_nanos: int
     assert_nanos: int
+    act_trace_ids: list[str] = field(default_factory=list)
 
 
 class TestTimingCollector:
@@ -50,6 +67,8 @@ class Phases:
         self._exporter: Optional[InMemorySpanExporter] = None
         self._tracer = None
         self._current_span = None
+        self._act_token: Optional[object] = None
+        self._act_trace_ids: list[str] = []
 
         if enabled:
             self._exporter = InMemorySpanExporter()
@@ -69,15 +88,27 @@ class Phases:
     def _switch_to(self, name: str) -> None:
         if not self._enabled or self._tracer is None:
             return
-        if self._current_span is not None:
-            self._current_span.end()
+        self._end_current_span()
         self._current_span = self._tracer.start_span(name)
+        if name == "act":
+            # Requests sent while the act span is current carry its traceparent to the server
+            self._act_token = context.attach(trace.set_span_in_context(self._current_span))
+            self._act_trace_ids.append(format(self._current_span.get_span_context().trace_id, "032x"))
 
-    def finish(self) -> None:
+    def _end_current_span(self) -> None:
+        if self._act_token is not None:
+            context.detach(self._act_token)
+            self._act_token = None
         if self._current_span is not None:
             self._current_span.end()
             self._current_span = None
 
+    def finish(self) -> None:
+        self._end_current_span()
+
+    def get_act_trace_ids(self) -> list[str]:
+        return list(self._act_trace_ids)
+
     def get_phase_nanos(self) -> dict[str, int]:
         if self._exporter is None:
             return {"arrange": 0, "act": 0, "assert": 0}
@@ -88,25 +119,62 @@ class Phases:
         return result
 
 
-def render_table(timings: list[TestTiming]) -> str:
+def inject_trace_context(headers: MutableMapping[str, str]) -> None:
+    """Add a W3C `traceparent` header for the current act span, if any."""
+    _propagator.inject(headers)
+
+
+def _breakdown(trace_ids: list[str], server_spans: dict[str, list[ServerSpan]]) -> ServerBreakdown | None:
+    traces = [server_spans[trace_id] for trace_id in trace_ids if trace_id in server_spans]
+    if not traces:
+        return None
+    result = ServerBreakdown()
+    for spans in traces:
+        result.add(breakdown_trace(spans))
+    return result
+
+
+def _format_top_query(breakdown: ServerBreakdown | None) -> str:
+    top = breakdown.top_query() if breakdown is not None else None
+    if top is None:
+        return ""
+    query, nanos = top
+    label = f"{nanos / 1_000_000.0:.2f} {query}"
+    if len(label) > _MAX_QUERY_COLUMN_WIDTH:
+        label = label[: _MAX_QUERY_COLUMN_WIDTH - 3] + "..."
+    return label
+
+
+def render_table(timings: list[TestTiming], server_spans: dict[str, list[ServerSpan]] | None = None) -> str:
+    """Render per-test phase timings, split act time into server, service and DB time when server spans are given."""
+
     def fmt(value: float) -> str:
         return f"{value:.2f}"
 
-    rows = sorted(
-        [
+    def fmt_nanos(nanos: int | None) -> str:
+        return "-" if nanos is None else fmt(nanos / 1_000_000.0)
+
+    rows = []
+    for t in timings:
+        breakdown = _breakdown(t.act_trace_ids, server_spans) if server_spans is not None else None
+        rows.append(
             {
                 "test": f"{t.test_module} > {t.test_name}",
                 "arrange_ms": t.arrange_nanos / 1_000_000.0,
                 "act_ms": t.act_nanos / 1_000_000.0,
                 "assert_ms": t.assert_nanos / 1_000_000.0,
                 "total_ms": (t.arrange_nanos + t.act_nanos + t.assert_nanos) / 1_000_000.0,
+                "server": fmt_nanos(breakdown.server_nanos if breakdown else None),
+                "service": fmt_nanos(breakdown.service_nanos if breakdown else None),
+                "db": fmt_nanos(breakdown.db_nanos if breakdown else None),
+                "statements": str(breakdown.statements) if breakdown else "-",
+                "rows": str(breakdown.rows) if breakdown else "-",
+                "top_query": _format_top_query(breakdown),
             }
-            for t in timings
-        ],
-        key=lambda r: r["total_ms"],
-        reverse=True,
-    )
+        )
+    rows.sort(key=lambda r: r["total_ms"], reverse=True)
 
+    with_server = server_spans is not None
     test_width = min(
         _MAX_TEST_COLUMN_WIDTH,
         max(len(_TEST_HEADER), max(len(r["test"]) for r in rows)),
@@ -115,17 +183,47 @@ def render_table(timings: list[TestTiming]) -> str:
     act_width = max(len(_ACT_HEADER), max(len(fmt(r["act_ms"])) for r in rows))
     assert_width = max(len(_ASSERT_HEADER), max(len(fmt(r["assert_ms"])) for r in rows))
     total_width = max(len(_TOTAL_HEADER), max(len(fmt(r["total_ms"])) for r in rows))
+    server_width = max(len(_SERVER_HEADER), max(len(r["server"]) for r in rows))
+    service_width = max(len(_SERVICE_HEADER), max(len(r["service"]) for r in rows))
+    db_width = max(len(_DB_HEADER), max(len(r["db"]) for r in rows))
+    statements_width = max(len(_STATEMENTS_HEADER), max(len(r["statements"]) for r in rows))
+    rows_width = max(len(_ROWS_HEADER), max(len(r["rows"]) for r in rows))
 
-    def make_row(test_lines: list[str], arrange: str, act: str, assert_val: str, total: str) -> str:
+    def make_row(
+        test_lines: list[str],
+        arrange: str,
+        act: str,
+        assert_val: str,
+        total: str,
+        server: str = "",
+        service: str = "",
+        db: str = "",
+        statements: str = "",
+        row_count: str = "",
+        top_query: str = "",
+    ) -> str:
         result_lines = []
         for i, line in enumerate(test_lines):
             arr = arrange if i == 0 else ""
             a = act if i == 0 else ""
             asr = assert_val if i == 0 else ""
             tot = total if i == 0 else ""
-            result_lines.append(
-                f"{line:<{test_width}} | {arr:>{arrange_width}} | {a:>{act_width}} | {asr:>{assert_width}} | {tot:>{total_width}}"
+            result_line = (
+                f"{line:<{test_width}} | {arr:>{arrange_width}} | {a:>{act_width}} | "
+                f"{asr:>{assert_width}} | {tot:>{total_width}}"
             )
+            if with_server:
+                srv = server if i == 0 else ""
+                svc = service if i == 0 else ""
+                d = db if i == 0 else ""
+                st = statements if i == 0 else ""
+                rc = row_count if i == 0 else ""
+                q = top_query if i == 0 else ""
+                result_line += (
+                    f" | {srv:>{server_width}} | {svc:>{service_width}} | {d:>{db_width}} | "
+                    f"{st:>{statements_width}} | {rc:>{rows_width}} | {q}"
+                )
+            result_lines.append(result_line.rstrip())
         return "\n".join(result_lines)
 
     def wrap_test_name(name: str) -> list[str]:
@@ -142,7 +240,19 @@ def render_table(timings: list[TestTiming]) -> str:
         lines.append(remaining)
         return lines
 
-    header = make_row([_TEST_HEADER], _ARRANGE_HEADER, _ACT_HEADER, _ASSERT_HEADER, _TOTAL_HEADER)
+    header = make_row(
+        [_TEST_HEADER],
+        _ARRANGE_HEADER,
+        _ACT_HEADER,
+        _ASSERT_HEADER,
+        _TOTAL_HEADER,
+        _SERVER_HEADER,
+        _SERVICE_HEADER,
+        _DB_HEADER,
+        _STATEMENTS_HEADER,
+        _ROWS_HEADER,
+        _TOP_QUERY_HEADER,
+    )
     separator = "".join("+" if c == "|" else "-" for c in header.split("\n")[0])
     body_rows = [
         make_row(
@@ -151,8 +261,96 @@ def render_table(timings: list[TestTiming]) -> str:
             fmt(r["act_ms"]),
             fmt(r["assert_ms"]),
             fmt(r["total_ms"]),
+            r["server"],
+            r["service"],
+            r["db"],
+            r["statements"],
+            r["rows"],
+            r["top_query"],
         )
         for r in rows
     ]
 
     return "\n".join([header, separator] + body_rows)
+
+
+def render_endpoint_table(server_spans: dict[str, list[ServerSpan]]) -> str:
+    """Render mean server, service and DB time per endpoint with the query that dominates it."""
+
+    def fmt(nanos: float) -> str:
+        return f"{nanos / 1_000_000.0:.2f}"
+
+    endpoints: dict[str, tuple[int, ServerBreakdown]] = {}
+    for spans in server_spans.values():
+        name = server_span_name(spans)
+        if name is None:
+            continue
+        count, total = endpoints.get(name, (0, ServerBreakdown()))
+        total.add(breakdown_trace(spans))
+        endpoints[name] = (count + 1, total)
+
+    rows = sorted(
+        [
+            {
+                "endpoint": name,
+                "requests": str(count),
+                "server": fmt(total.server_nanos / count),
+                "service": fmt(total.service_nanos / count),
+                "db": fmt(total.db_nanos / count),
+                "statements": f"{total.statements / count:.1f}",
+                "rows": f"{total.rows / count:.1f}",
+                "top_query": _format_top_query(
+                    ServerBreakdown(query_nanos={query: nanos // count for query, nanos in total.query_nanos.items()})
+                ),
+                "server_nanos": total.server_nanos / count,
+            }
+            for name, (count, total) in endpoints.items()
+        ],
+        key=lambda r: r["server_nanos"],
+        reverse=True,
+    )
+    if not rows:
+        return ""
+
+    endpoint_width = max(len(_ENDPOINT_HEADER), max(len(r["endpoint"]) for r in rows))
+    requests_width = max(len(_REQUESTS_HEADER), max(len(r["requests"]) for r in rows))
+    server_width = max(len(_SERVER_HEADER), max(len(r["server"]) for r in rows))
+    service_width = max(len(_SERVICE_HEADER), max(len(r["service"]) for r in rows))
+    db_width = max(len(_DB_HEADER), max(len(r["db"]) for r in rows))
+    statements_width = max(len(_STATEMENTS_HEADER), max(len(r["statements"]) for r in rows))
+    rows_width = max(len(_ROWS_HEADER), max(len(r["rows"]) for r in rows))
+
+    def make_row(
+        endpoint: str,
+        requests: str,
+        server: str,
+        service: str,
+        db: str,
+        statements: str,
+        row_count: str,
+        top_query: str,
+    ) -> str:
+        return (
+            f"{endpoint:<{endpoint_width}} | {requests:>{requests_width}} | {server:>{server_width}} | "
+            f"{service:>{service_width}} | {db:>{db_width}} | {statements:>{statements_width}} | "
+            f"{row_count:>{rows_width}} | {top_query}"
+        ).rstrip()
+
+    header = make_row(
+        _ENDPOINT_HEADER,
+        _REQUESTS_HEADER,
+        _SERVER_HEADER,
+        _SERVICE_HEADER,
+        _DB_HEADER,
+        _STATEMENTS_HEADER,
+        _ROWS_HEADER,
+        _TOP_QUERY_HEADER,
+    )
+    separator = "".join("+" if c == "|" else "-" for c in header)
+    body_rows = [
+        make_row(
+            r["endpoint"], r["requests"], r["server"], r["service"], r["db"], r["statements"], r["rows"], r["top_query"]
+        )
+        for r in rows
+    ]
+    return "\n".join([header, separator] + body_rows)
@@ -8,9 +8,9 @@ from lib.tracing import Phases
 UUID_PATTERN = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
 
 
-def test_post_auth_login_normal(phases: Phases):
+def test_post_auth_login_normal(phases: Phases, http: requests.Session):
     phases.act()
-    response = requests.post(f"{BASE_URL}/auth/login")
+    response = http.post(f"{BASE_URL}/auth/login")
 
     phases.assert_()
     assert response.status_code == 200
@@ -0,0 +1,80 @@
+from uuid import uuid4
+
+import requests
+
+from lib.api_config import BASE_URL
+from lib.tracing import Phases
+from openapi_gen.micro_chirp_api_client.api.auth import post_auth_login
+from openapi_gen.micro_chirp_api_client.api.posts import post_posts
+from openapi_gen.micro_chirp_api_client.client import Client
+from openapi_gen.micro_chirp_api_client.models.post_posts_body import PostPostsBody
+
+
+def test_post_engagement_batch_with_valid_request_returns_200(phases: Phases, client: Client, http: requests.Session):
+    phases.arrange()
+    auth_response = post_auth_login.sync(client=client)
+    user_id = str(auth_response.user_id)
+    body = PostPostsBody(user_id=auth_response.user_id, content=f"Test content {uuid4().hex[:8]}")
+    create_response = post_posts.sync(client=client, body=body)
+    assert create_response is not None
+    post_id = str(create_response.post_id)
+    events = [
+        {"type": "like", "postId": post_id, "userId": user_id},
+        {"type": "repost", "postId": post_id, "userId": user_id},
+        {"type": "view", "postId": post_id, "userId": user_id},
+        {"type": "unlike", "postId": post_id, "userId": user_id},
+        {"type": "unlike", "postId": post_id, "userId": user_id},
+    ]
+
+    phases.act()
+    response = http.post(f"{BASE_URL}/engagement/batch", json={"events": events})
+
+    phases.assert_()
+    assert response.status_code == 200
+    data = response.json()
+    assert [r["index"] for r in data["results"]] == [0, 1, 2, 3, 4]
+    assert [r["status"] for r in data["results"]] == ["created", "created", "created", "created", "unchanged"]
+    assert data["createdCount"] == 4
+    post = http.get(f"{BASE_URL}/posts/{post_id}", params={"userId": user_id}).json()
+    assert post["likeCount"] == 0
+    assert post["repostCount"] == 1
+    assert post["viewCount"] == 1
+    assert post["isLikedByCurrentUser"] is False
+    assert post["isRepostedByCurrentUser"] is True
+
+
+def test_post_engagement_batch_with_unknown_user_and_post_returns_per_item_errors(
+    phases: Phases, client: Client, http: requests.Session
+):
+    phases.arrange()
+    auth_response = post_auth_login.sync(client=client)
+    user_id = str(auth_response.user_id)
+    body = PostPostsBody(user_id=auth_response.user_id, content=f"Test content {uuid4().hex[:8]}")
+    create_response = post_posts.sync(client=client, body=body)
+    assert create_response is not None
+    post_id = str(create_response.post_id)
+    events = [
+        {"type": "like", "postId": post_id, "userId": str(uuid4())},
+        {"type": "like", "postId": str(uuid4()), "userId": user_id},
+        {"type": "like", "postId": post_id, "userId": user_id},
+    ]
+
+    phases.act()
+    response = http.post(f"{BASE_URL}/engagement/batch", json={"events": events})
+
+    phases.assert_()
+    assert response.status_code == 200
+    data = response.json()
+    assert [r["status"] for r in data["results"]] == ["user_not_found", "post_not_found", "created"]
+    assert data["createdCount"] == 1
+
+
+def test_post_engagement_batch_with_empty_events_returns_400(phases: Phases, http: requests.Session):
+    phases.arrange()
+    events: list[dict[str, str]] = []
+
+    phases.act()
+    response = http.post(f"{BASE_URL}/engagement/batch", json={"events": events})
+
+    phases.assert_()
+    assert response.status_code == 400
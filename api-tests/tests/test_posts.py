@@ -14,15 +14,14 @@ UUID_PATTERN = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-
 ISO8601_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})$")
 
 
-def test_post_posts_with_valid_request_returns_201(phases: Phases):
+def test_post_posts_with_valid_request_returns_201(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     expected_content = f"Test content {uuid4().hex[:8]}"
 
     phases.act()
-    response = requests.post(
+    response = http.post(
         f"{BASE_URL}/posts",
         json={"userId": user_id, "content": expected_content},
     )
@@ -36,14 +35,13 @@ def test_post_posts_with_valid_request_returns_201(phases: Phases):
     assert ISO8601_PATTERN.match(data["createdAt"])
 
 
-def test_post_posts_with_blank_content_returns_400(phases: Phases):
+def test_post_posts_with_blank_content_returns_400(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
 
     phases.act()
-    response = requests.post(
+    response = http.post(
         f"{BASE_URL}/posts",
         json={"userId": user_id, "content": "   "},
     )
@@ -54,14 +52,15 @@ def test_post_posts_with_blank_content_returns_400(phases: Phases):
     assert data["error"] == "Content is invalid"
 
 
-def test_post_posts_with_content_exceeding_280_graphemes_returns_400(phases: Phases):
+def test_post_posts_with_content_exceeding_280_graphemes_returns_400(
+    phases: Phases, client: Client, http: requests.Session
+):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
 
     phases.act()
-    response = requests.post(
+    response = http.post(
         f"{BASE_URL}/posts",
         json={"userId": user_id, "content": "a" * 281},
     )
@@ -72,10 +71,10 @@ def test_post_posts_with_content_exceeding_280_graphemes_returns_400(phases: Pha
     assert data["error"] == "Content is invalid"
 
 
-def test_post_posts_with_nonexistent_user_id_returns_400(phases: Phases):
+def test_post_posts_with_nonexistent_user_id_returns_400(phases: Phases, http: requests.Session):
     phases.act()
     expected_content = f"Test content {uuid4().hex[:8]}"
-    response = requests.post(
+    response = http.post(
         f"{BASE_URL}/posts",
         json={"userId": "00000000-0000-0000-0000-000000000000", "content": expected_content},
     )
@@ -86,9 +85,8 @@ def test_post_posts_with_nonexistent_user_id_returns_400(phases: Phases):
     assert data["error"] == "User not found"
 
 
-def test_get_posts_by_id_with_existing_post_returns_200(phases: Phases):
+def test_get_posts_by_id_with_existing_post_returns_200(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = auth_response.user_id
     expected_content = f"Test content {uuid4().hex[:8]}"
@@ -98,7 +96,7 @@ def test_get_posts_by_id_with_existing_post_returns_200(phases: Phases):
     post_id = str(create_response.post_id)
 
     phases.act()
-    response = requests.get(f"{BASE_URL}/posts/{post_id}")
+    response = http.get(f"{BASE_URL}/posts/{post_id}")
 
     phases.assert_()
     assert response.status_code == 200
@@ -115,9 +113,9 @@ def test_get_posts_by_id_with_existing_post_returns_200(phases: Phases):
     assert data["isRepostedByCurrentUser"] is None
 
 
-def test_get_posts_by_id_with_nonexistent_post_returns_404(phases: Phases):
+def test_get_posts_by_id_with_nonexistent_post_returns_404(phases: Phases, http: requests.Session):
     phases.act()
-    response = requests.get(f"{BASE_URL}/posts/00000000-0000-0000-0000-000000000000")
+    response = http.get(f"{BASE_URL}/posts/00000000-0000-0000-0000-000000000000")
 
     phases.assert_()
     assert response.status_code == 404
@@ -125,9 +123,8 @@ def test_get_posts_by_id_with_nonexistent_post_returns_404(phases: Phases):
     assert data["error"] == "Post not found"
 
 
-def test_get_posts_by_id_with_user_id_parameter_returns_200(phases: Phases):
+def test_get_posts_by_id_with_user_id_parameter_returns_200(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = auth_response.user_id
     expected_content = f"Test content {uuid4().hex[:8]}"
@@ -137,7 +134,7 @@ def test_get_posts_by_id_with_user_id_parameter_returns_200(phases: Phases):
     post_id = str(create_response.post_id)
 
     phases.act()
-    response = requests.get(f"{BASE_URL}/posts/{post_id}", params={"userId": str(user_id)})
+    response = http.get(f"{BASE_URL}/posts/{post_id}", params={"userId": str(user_id)})
 
     phases.assert_()
     assert response.status_code == 200
@@ -149,9 +146,8 @@ def test_get_posts_by_id_with_user_id_parameter_returns_200(phases: Phases):
     assert data["isRepostedByCurrentUser"] is False
 
 
-def test_get_posts_by_id_with_deleted_post_returns_404(phases: Phases):
+def test_get_posts_by_id_with_deleted_post_returns_404(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = auth_response.user_id
     expected_content = f"Test content {uuid4().hex[:8]}"
@@ -159,14 +155,14 @@ def test_get_posts_by_id_with_deleted_post_returns_404(phases: Phases):
     create_response = post_posts.sync(client=client, body=body)
     assert create_response is not None
     post_id = str(create_response.post_id)
-    delete_response = requests.delete(
+    delete_response = http.delete(
         f"{BASE_URL}/posts/{post_id}",
         json={"userId": str(user_id)},
     )
     assert delete_response.status_code == 204
 
     phases.act()
-    response = requests.get(f"{BASE_URL}/posts/{post_id}")
+    response = http.get(f"{BASE_URL}/posts/{post_id}")
 
     phases.assert_()
     assert response.status_code == 404
@@ -174,9 +170,78 @@ def test_get_posts_by_id_with_deleted_post_returns_404(phases: Phases):
     assert data["error"] == "Post not found"
 
 
-def test_delete_posts_by_id_with_valid_request_returns_204(phases: Phases):
+def test_get_posts_by_id_with_matching_if_none_match_returns_304(
+    phases: Phases, client: Client, http: requests.Session
+):
+    phases.arrange()
+    auth_response = post_auth_login.sync(client=client)
+    body = PostPostsBody(user_id=auth_response.user_id, content=f"Test content {uuid4().hex[:8]}")
+    create_response = post_posts.sync(client=client, body=body)
+    assert create_response is not None
+    post_id = str(create_response.post_id)
+    first = http.get(f"{BASE_URL}/posts/{post_id}")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    phases.act()
+    response = http.get(f"{BASE_URL}/posts/{post_id}", headers={"If-None-Match": etag})
+
+    phases.assert_()
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+def test_get_posts_by_id_with_if_none_match_after_like_returns_200(
+    phases: Phases, client: Client, http: requests.Session
+):
+    phases.arrange()
+    auth_response = post_auth_login.sync(client=client)
+    user_id = str(auth_response.user_id)
+    body = PostPostsBody(user_id=auth_response.user_id, content=f"Test content {uuid4().hex[:8]}")
+    create_response = post_posts.sync(client=client, body=body)
+    assert create_response is not None
+    post_id = str(create_response.post_id)
+    first = http.get(f"{BASE_URL}/posts/{post_id}")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    like_response = http.post(f"{BASE_URL}/posts/{post_id}/likes", json={"userId": user_id})
+    assert like_response.status_code == 201
+
+    phases.act()
+    response = http.get(f"{BASE_URL}/posts/{post_id}", headers={"If-None-Match": etag})
+
+    phases.assert_()
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["likeCount"] == 1
+
+
+def test_get_posts_by_id_with_if_none_match_wildcard_for_deleted_post_returns_404(
+    phases: Phases, client: Client, http: requests.Session
+):
+    phases.arrange()
+    auth_response = post_auth_login.sync(client=client)
+    user_id = auth_response.user_id
+    body = PostPostsBody(user_id=user_id, content=f"Test content {uuid4().hex[:8]}")
+    create_response = post_posts.sync(client=client, body=body)
+    assert create_response is not None
+    post_id = str(create_response.post_id)
+    delete_response = http.delete(
+        f"{BASE_URL}/posts/{post_id}",
+        json={"userId": str(user_id)},
+    )
+    assert delete_response.status_code == 204
+
+    phases.act()
+    response = http.get(f"{BASE_URL}/posts/{post_id}", headers={"If-None-Match": "*"})
+
+    phases.assert_()
+    assert response.status_code == 404
+
+
+def test_delete_posts_by_id_with_valid_request_returns_204(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = auth_response.user_id
     expected_content = f"Test content {uuid4().hex[:8]}"
@@ -186,7 +251,7 @@ def test_delete_posts_by_id_with_valid_request_returns_204(phases: Phases):
     post_id = str(create_response.post_id)
 
     phases.act()
-    response = requests.delete(
+    response = http.delete(
         f"{BASE_URL}/posts/{post_id}",
         json={"userId": str(user_id)},
     )
@@ -195,14 +260,13 @@ def test_delete_posts_by_id_with_valid_request_returns_204(phases: Phases):
     assert response.status_code == 204
 
 
-def test_delete_posts_by_id_with_nonexistent_post_returns_404(phases: Phases):
+def test_delete_posts_by_id_with_nonexistent_post_returns_404(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = auth_response.user_id
 
     phases.act()
-    response = requests.delete(
+    response = http.delete(
         f"{BASE_URL}/posts/00000000-0000-0000-0000-000000000000",
         json={"userId": str(user_id)},
     )
@@ -213,9 +277,8 @@ def test_delete_posts_by_id_with_nonexistent_post_returns_404(phases: Phases):
     assert data["error"] == "Post not found"
 
 
-def test_delete_posts_by_id_with_different_user_returns_403(phases: Phases):
+def test_delete_posts_by_id_with_different_user_returns_403(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response1 = post_auth_login.sync(client=client)
     user_id1 = auth_response1.user_id
     expected_content = f"Test content {uuid4().hex[:8]}"
@@ -227,7 +290,7 @@ def test_delete_posts_by_id_with_different_user_returns_403(phases: Phases):
     user_id2 = auth_response2.user_id
 
     phases.act()
-    response = requests.delete(
+    response = http.delete(
         f"{BASE_URL}/posts/{post_id}",
         json={"userId": str(user_id2)},
     )
@@ -238,9 +301,8 @@ def test_delete_posts_by_id_with_different_user_returns_403(phases: Phases):
     assert data["error"] == "User is not the post author"
 
 
-def test_get_post_with_liked_post_returns_like_info(phases: Phases):
+def test_get_post_with_liked_post_returns_like_info(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     expected_content = f"Test content {uuid4().hex[:8]}"
@@ -248,14 +310,14 @@ def test_get_post_with_liked_post_returns_like_info(phases: Phases):
     create_response = post_posts.sync(client=client, body=body)
     assert create_response is not None
     post_id = str(create_response.post_id)
-    like_response = requests.post(
+    like_response = http.post(
         f"{BASE_URL}/posts/{post_id}/likes",
         json={"userId": user_id},
     )
     assert like_response.status_code == 201
 
     phases.act()
-    response = requests.get(f"{BASE_URL}/posts/{post_id}", params={"userId": user_id})
+    response = http.get(f"{BASE_URL}/posts/{post_id}", params={"userId": user_id})
 
     phases.assert_()
     assert response.status_code == 200
@@ -264,9 +326,9 @@ def test_get_post_with_liked_post_returns_like_info(phases: Phases):
     assert data["isLikedByCurrentUser"] is True
 
 
-def test_get_posts_with_empty_ids_returns_200_with_empty_posts(phases: Phases):
+def test_get_posts_with_empty_ids_returns_200_with_empty_posts(phases: Phases, http: requests.Session):
     phases.act()
-    response = requests.get(f"{BASE_URL}/posts", params={"ids": ""})
+    response = http.get(f"{BASE_URL}/posts", params={"ids": ""})
 
     phases.assert_()
     assert response.status_code == 200
@@ -275,9 +337,8 @@ def test_get_posts_with_empty_ids_returns_200_with_empty_posts(phases: Phases):
     assert data["total"] == 0
 
 
-def test_get_posts_with_ids_returns_200(phases: Phases):
+def test_get_posts_with_ids_returns_200(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = auth_response.user_id
     body1 = PostPostsBody(user_id=user_id, content=f"Post A {uuid4().hex[:8]}")
@@ -289,7 +350,7 @@ def test_get_posts_with_ids_returns_200(phases: Phases):
     post_id2 = str(post2.post_id)
 
     phases.act()
-    response = requests.get(f"{BASE_URL}/posts", params={"ids": f"{post_id1},{post_id2}"})
+    response = http.get(f"{BASE_URL}/posts", params={"ids": f"{post_id1},{post_id2}"})
 
     phases.assert_()
     assert response.status_code == 200
@@ -309,9 +370,8 @@ def test_get_posts_with_ids_returns_200(phases: Phases):
     assert data["posts"][1]["isLikedByCurrentUser"] is None
 
 
-def test_get_posts_with_user_id_returns_like_status(phases: Phases):
+def test_get_posts_with_user_id_returns_like_status(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     body = PostPostsBody(user_id=auth_response.user_id, content=f"Post {uuid4().hex[:8]}")
@@ -320,7 +380,7 @@ def test_get_posts_with_user_id_returns_like_status(phases: Phases):
     post_id = str(created.post_id)
 
     phases.act()
-    response = requests.get(f"{BASE_URL}/posts", params={"ids": post_id, "userId": user_id})
+    response = http.get(f"{BASE_URL}/posts", params={"ids": post_id, "userId": user_id})
 
     phases.assert_()
     assert response.status_code == 200
@@ -330,23 +390,24 @@ def test_get_posts_with_user_id_returns_like_status(phases: Phases):
     assert data["posts"][0]["isRepostedByCurrentUser"] is False
 
 
-def test_get_posts_with_liked_post_and_user_id_returns_is_liked_true(phases: Phases):
+def test_get_posts_with_liked_post_and_user_id_returns_is_liked_true(
+    phases: Phases, client: Client, http: requests.Session
+):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     body = PostPostsBody(user_id=auth_response.user_id, content=f"Post {uuid4().hex[:8]}")
     created = post_posts.sync(client=client, body=body)
     assert created is not None
     post_id = str(created.post_id)
-    like_response = requests.post(
+    like_response = http.post(
         f"{BASE_URL}/posts/{post_id}/likes",
         json={"userId": user_id},
     )
     assert like_response.status_code == 201
 
     phases.act()
-    response = requests.get(
+    response = http.get(
         f"{BASE_URL}/posts",
         params={"ids": post_id, "userId": user_id},
     )
@@ -359,23 +420,22 @@ def test_get_posts_with_liked_post_and_user_id_returns_is_liked_true(phases: Pha
     assert data["posts"][0]["isLikedByCurrentUser"] is True
 
 
-def test_get_posts_by_id_with_reposted_post_returns_repost_info(phases: Phases):
+def test_get_posts_by_id_with_reposted_post_returns_repost_info(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     body = PostPostsBody(user_id=auth_response.user_id, content=f"Post {uuid4().hex[:8]}")
     create_response = post_posts.sync(client=client, body=body)
     assert create_response is not None
     post_id = str(create_response.post_id)
-    repost_response = requests.post(
+    repost_response = http.post(
         f"{BASE_URL}/posts/{post_id}/reposts",
         json={"userId": user_id},
     )
     assert repost_response.status_code == 201
 
     phases.act()
-    response = requests.get(f"{BASE_URL}/posts/{post_id}", params={"userId": user_id})
+    response = http.get(f"{BASE_URL}/posts/{post_id}", params={"userId": user_id})
 
     phases.assert_()
     assert response.status_code == 200
@@ -384,26 +444,25 @@ def test_get_posts_by_id_with_reposted_post_returns_repost_info(phases: Phases):
     assert data["isRepostedByCurrentUser"] is True
 
 
-def test_get_posts_by_id_with_replies_returns_reply_count(phases: Phases):
+def test_get_posts_by_id_with_replies_returns_reply_count(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     body = PostPostsBody(user_id=auth_response.user_id, content=f"Post {uuid4().hex[:8]}")
     create_response = post_posts.sync(client=client, body=body)
     assert create_response is not None
     post_id = str(create_response.post_id)
-    requests.post(
+    http.post(
         f"{BASE_URL}/posts/{post_id}/replies",
         json={"userId": user_id, "content": f"Reply {uuid4().hex[:8]}"},
     )
-    requests.post(
+    http.post(
         f"{BASE_URL}/posts/{post_id}/replies",
         json={"userId": user_id, "content": f"Reply {uuid4().hex[:8]}"},
     )
 
     phases.act()
-    response = requests.get(f"{BASE_URL}/posts/{post_id}")
+    response = http.get(f"{BASE_URL}/posts/{post_id}")
 
     phases.assert_()
     assert response.status_code == 200
@@ -411,29 +470,30 @@ def test_get_posts_by_id_with_replies_returns_reply_count(phases: Phases):
     assert data["replyCount"] == 2
 
 
-def test_get_posts_by_id_with_deleted_reply_excludes_from_reply_count(phases: Phases):
+def test_get_posts_by_id_with_deleted_reply_excludes_from_reply_count(
+    phases: Phases, client: Client, http: requests.Session
+):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     body = PostPostsBody(user_id=auth_response.user_id, content=f"Post {uuid4().hex[:8]}")
     create_response = post_posts.sync(client=client, body=body)
     assert create_response is not None
     post_id = str(create_response.post_id)
-    requests.post(
+    http.post(
         f"{BASE_URL}/posts/{post_id}/replies",
         json={"userId": user_id, "content": "Active reply"},
     )
-    deleted_reply = requests.post(
+    deleted_reply = http.post(
         f"{BASE_URL}/posts/{post_id}/replies",
         json={"userId": user_id, "content": "To be deleted"},
     )
     assert deleted_reply.status_code == 201
     deleted_reply_id = deleted_reply.json()["replyPostId"]
-    requests.delete(f"{BASE_URL}/posts/{deleted_reply_id}", json={"userId": user_id})
+    http.delete(f"{BASE_URL}/posts/{deleted_reply_id}", json={"userId": user_id})
 
     phases.act()
-    response = requests.get(f"{BASE_URL}/posts/{post_id}")
+    response = http.get(f"{BASE_URL}/posts/{post_id}")
 
     phases.assert_()
     assert response.status_code == 200
@@ -441,23 +501,24 @@ def test_get_posts_by_id_with_deleted_reply_excludes_from_reply_count(phases: Ph
     assert data["replyCount"] == 1
 
 
-def test_get_posts_with_reposted_post_and_user_id_returns_is_reposted_true(phases: Phases):
+def test_get_posts_with_reposted_post_and_user_id_returns_is_reposted_true(
+    phases: Phases, client: Client, http: requests.Session
+):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     body = PostPostsBody(user_id=auth_response.user_id, content=f"Post {uuid4().hex[:8]}")
     created = post_posts.sync(client=client, body=body)
     assert created is not None
     post_id = str(created.post_id)
-    repost_response = requests.post(
+    repost_response = http.post(
         f"{BASE_URL}/posts/{post_id}/reposts",
         json={"userId": user_id},
     )
     assert repost_response.status_code == 201
 
     phases.act()
-    response = requests.get(
+    response = http.get(
         f"{BASE_URL}/posts",
         params={"ids": post_id, "userId": user_id},
     )
@@ -470,26 +531,25 @@ def test_get_posts_with_reposted_post_and_user_id_returns_is_reposted_true(phase
     assert data["posts"][0]["isRepostedByCurrentUser"] is True
 
 
-def test_get_posts_with_replies_returns_reply_count(phases: Phases):
+def test_get_posts_with_replies_returns_reply_count(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     body = PostPostsBody(user_id=auth_response.user_id, content=f"Post {uuid4().hex[:8]}")
     created = post_posts.sync(client=client, body=body)
     assert created is not None
     post_id = str(created.post_id)
-    requests.post(
+    http.post(
         f"{BASE_URL}/posts/{post_id}/replies",
         json={"userId": user_id, "content": f"Reply {uuid4().hex[:8]}"},
     )
-    requests.post(
+    http.post(
         f"{BASE_URL}/posts/{post_id}/replies",
         json={"userId": user_id, "content": f"Reply {uuid4().hex[:8]}"},
     )
 
     phases.act()
-    response = requests.get(f"{BASE_URL}/posts", params={"ids": post_id})
+    response = http.get(f"{BASE_URL}/posts", params={"ids": post_id})
 
     phases.assert_()
     assert response.status_code == 200
@@ -498,9 +558,10 @@ def test_get_posts_with_replies_returns_reply_count(phases: Phases):
     assert data["posts"][0]["replyCount"] == 2
 
 
-def test_get_posts_with_limit_and_offset_returns_paginated_results(phases: Phases):
+def test_get_posts_with_limit_and_offset_returns_paginated_results(
+    phases: Phases, client: Client, http: requests.Session
+):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = auth_response.user_id
     post1 = post_posts.sync(client=client, body=PostPostsBody(user_id=user_id, content=f"Post 0 {uuid4().hex[:8]}"))
@@ -511,7 +572,7 @@ def test_get_posts_with_limit_and_offset_returns_paginated_results(phases: Phase
     all_ids = f"{post1.post_id},{post2.post_id},{post3.post_id},{post4.post_id},{post5.post_id}"
 
     phases.act()
-    response = requests.get(
+    response = http.get(
         f"{BASE_URL}/posts",
         params={"ids": all_ids, "limit": 2, "offset": 1},
     )
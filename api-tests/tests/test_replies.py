@@ -14,9 +14,8 @@ UUID_PATTERN = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-
 ISO8601_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})$")
 
 
-def test_post_replies_with_valid_request_returns_201(phases: Phases):
+def test_post_replies_with_valid_request_returns_201(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     original_content = f"Original post {uuid4().hex[:8]}"
@@ -27,7 +26,7 @@ def test_post_replies_with_valid_request_returns_201(phases: Phases):
 
     phases.act()
     reply_content = f"Reply content {uuid4().hex[:8]}"
-    response = requests.post(
+    response = http.post(
         f"{BASE_URL}/posts/{post_id}/replies",
         json={"userId": user_id, "content": reply_content},
     )
@@ -44,15 +43,14 @@ def test_post_replies_with_valid_request_returns_201(phases: Phases):
     assert ISO8601_PATTERN.match(data["createdAt"])
 
 
-def test_post_replies_with_nonexistent_post_returns_404(phases: Phases):
+def test_post_replies_with_nonexistent_post_returns_404(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
 
     phases.act()
     reply_content = f"Reply content {uuid4().hex[:8]}"
-    response = requests.post(
+    response = http.post(
         f"{BASE_URL}/posts/00000000-0000-0000-0000-000000000000/replies",
         json={"userId": user_id, "content": reply_content},
     )
@@ -63,9 +61,8 @@ def test_post_replies_with_nonexistent_post_returns_404(phases: Phases):
     assert data["error"] == "Post not found"
 
 
-def test_post_replies_with_invalid_content_returns_400(phases: Phases):
+def test_post_replies_with_invalid_content_returns_400(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     original_content = f"Original post {uuid4().hex[:8]}"
@@ -75,7 +72,7 @@ def test_post_replies_with_invalid_content_returns_400(phases: Phases):
     post_id = str(create_response.post_id)
 
     phases.act()
-    response = requests.post(
+    response = http.post(
         f"{BASE_URL}/posts/{post_id}/replies",
         json={"userId": user_id, "content": ""},
     )
@@ -86,9 +83,10 @@ def test_post_replies_with_invalid_content_returns_400(phases: Phases):
     assert data["error"] == "Content is invalid"
 
 
-def test_post_replies_with_content_exceeding_280_graphemes_returns_400(phases: Phases):
+def test_post_replies_with_content_exceeding_280_graphemes_returns_400(
+    phases: Phases, client: Client, http: requests.Session
+):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     original_content = f"Original post {uuid4().hex[:8]}"
@@ -99,7 +97,7 @@ def test_post_replies_with_content_exceeding_280_graphemes_returns_400(phases: P
 
     phases.act()
     long_content = "a" * 281
-    response = requests.post(
+    response = http.post(
         f"{BASE_URL}/posts/{post_id}/replies",
         json={"userId": user_id, "content": long_content},
     )
@@ -108,3 +106,48 @@ def test_post_replies_with_content_exceeding_280_graphemes_returns_400(phases: P
     assert response.status_code == 400
     data = response.json()
     assert data["error"] == "Content is invalid"
+
+
+def test_get_post_thread_returns_ancestors_and_replies_down_to_depth(
+    phases: Phases, client: Client, http: requests.Session
+):
+    phases.arrange()
+    auth_response = post_auth_login.sync(client=client)
+    user_id = str(auth_response.user_id)
+    body = PostPostsBody(user_id=auth_response.user_id, content=f"Root post {uuid4().hex[:8]}")
+    create_response = post_posts.sync(client=client, body=body)
+    assert create_response is not None
+    root_id = str(create_response.post_id)
+    chain = [root_id]
+    for level in range(3):
+        response = http.post(
+            f"{BASE_URL}/posts/{chain[-1]}/replies",
+            json={"userId": user_id, "content": f"Reply level {level + 1}"},
+        )
+        assert response.status_code == 201
+        chain.append(response.json()["replyPostId"])
+
+    phases.act()
+    response = http.get(f"{BASE_URL}/posts/{chain[1]}/thread", params={"depth": 1, "userId": user_id})
+
+    phases.assert_()
+    assert response.status_code == 200
+    data = response.json()
+    assert data["post"]["postId"] == chain[1]
+    assert data["post"]["replyToPostId"] == root_id
+    assert [post["postId"] for post in data["ancestors"]] == [root_id]
+    assert [post["postId"] for post in data["descendants"]] == [chain[2]]
+    assert data["descendants"][0]["replyCount"] == 1
+    assert data["descendants"][0]["isLikedByCurrentUser"] is False
+
+
+def test_get_post_thread_with_nonexistent_post_returns_404(phases: Phases, http: requests.Session):
+    phases.arrange()
+
+    phases.act()
+    response = http.get(f"{BASE_URL}/posts/00000000-0000-0000-0000-000000000000/thread")
+
+    phases.assert_()
+    assert response.status_code == 404
+    data = response.json()
+    assert data["error"] == "Post not found"
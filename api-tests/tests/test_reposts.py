@@ -14,9 +14,8 @@ UUID_PATTERN = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-
 ISO8601_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})$")
 
 
-def test_post_reposts_with_valid_request_returns_201(phases: Phases):
+def test_post_reposts_with_valid_request_returns_201(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     expected_content = f"Test content {uuid4().hex[:8]}"
@@ -26,7 +25,7 @@ def test_post_reposts_with_valid_request_returns_201(phases: Phases):
     post_id = str(create_response.post_id)
 
     phases.act()
-    response = requests.post(
+    response = http.post(
         f"{BASE_URL}/posts/{post_id}/reposts",
         json={"userId": user_id},
     )
@@ -41,14 +40,13 @@ def test_post_reposts_with_valid_request_returns_201(phases: Phases):
     assert ISO8601_PATTERN.match(data["repostedAt"])
 
 
-def test_post_reposts_with_nonexistent_post_returns_404(phases: Phases):
+def test_post_reposts_with_nonexistent_post_returns_404(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
 
     phases.act()
-    response = requests.post(
+    response = http.post(
         f"{BASE_URL}/posts/00000000-0000-0000-0000-000000000000/reposts",
         json={"userId": user_id},
     )
@@ -59,9 +57,8 @@ def test_post_reposts_with_nonexistent_post_returns_404(phases: Phases):
     assert data["error"] == "Post not found"
 
 
-def test_delete_reposts_with_valid_request_returns_204(phases: Phases):
+def test_delete_reposts_with_valid_request_returns_204(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     expected_content = f"Test content {uuid4().hex[:8]}"
@@ -69,14 +66,14 @@ def test_delete_reposts_with_valid_request_returns_204(phases: Phases):
     create_response = post_posts.sync(client=client, body=body)
     assert create_response is not None
     post_id = str(create_response.post_id)
-    repost_response = requests.post(
+    repost_response = http.post(
         f"{BASE_URL}/posts/{post_id}/reposts",
         json={"userId": user_id},
     )
     assert repost_response.status_code == 201
 
     phases.act()
-    response = requests.delete(
+    response = http.delete(
         f"{BASE_URL}/posts/{post_id}/reposts",
         json={"userId": user_id},
     )
@@ -85,14 +82,13 @@ def test_delete_reposts_with_valid_request_returns_204(phases: Phases):
     assert response.status_code == 204
 
 
-def test_delete_reposts_with_nonexistent_post_returns_404(phases: Phases):
+def test_delete_reposts_with_nonexistent_post_returns_404(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
 
     phases.act()
-    response = requests.delete(
+    response = http.delete(
         f"{BASE_URL}/posts/00000000-0000-0000-0000-000000000000/reposts",
         json={"userId": user_id},
     )
@@ -1,6 +1,8 @@
+import json
 import re
 from uuid import uuid4
 
+import pytest
 import requests
 
 from lib.api_config import BASE_URL
@@ -14,9 +16,9 @@ UUID_PATTERN = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-
 ISO8601_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})$")
 
 
-def test_get_timeline_global_with_valid_request_returns_200(phases: Phases):
+@pytest.mark.global_timeline
+def test_get_timeline_global_with_valid_request_returns_200(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     expected_content = f"Test content {uuid4().hex[:8]}"
@@ -26,7 +28,7 @@ def test_get_timeline_global_with_valid_request_returns_200(phases: Phases):
     post_id = str(create_response.post_id)
 
     phases.act()
-    response = requests.get(f"{BASE_URL}/timeline/global", params={"limit": 1})
+    response = http.get(f"{BASE_URL}/timeline/global", params={"limit": 1})
 
     phases.assert_()
     assert response.status_code == 200
@@ -46,9 +48,10 @@ def test_get_timeline_global_with_valid_request_returns_200(phases: Phases):
     assert data["posts"][0]["isRepostedByCurrentUser"] is None
 
 
-def test_get_timeline_global_with_deleted_post_returns_200_without_deleted_post(phases: Phases):
+def test_get_timeline_global_with_deleted_post_returns_200_without_deleted_post(
+    phases: Phases, client: Client, http: requests.Session
+):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     expected_content = f"Test content {uuid4().hex[:8]}"
@@ -56,11 +59,11 @@ def test_get_timeline_global_with_deleted_post_returns_200_without_deleted_post(
     create_response = post_posts.sync(client=client, body=body)
     assert create_response is not None
     post_id = str(create_response.post_id)
-    delete_response = requests.delete(f"{BASE_URL}/posts/{post_id}", json={"userId": user_id})
+    delete_response = http.delete(f"{BASE_URL}/posts/{post_id}", json={"userId": user_id})
     assert delete_response.status_code == 204
 
     phases.act()
-    response = requests.get(f"{BASE_URL}/timeline/global")
+    response = http.get(f"{BASE_URL}/timeline/global")
 
     phases.assert_()
     assert response.status_code == 200
@@ -69,9 +72,11 @@ def test_get_timeline_global_with_deleted_post_returns_200_without_deleted_post(
     assert post_id not in post_ids
 
 
-def test_get_timeline_global_with_liked_post_and_user_id_returns_is_liked_true(phases: Phases):
+@pytest.mark.global_timeline
+def test_get_timeline_global_with_liked_post_and_user_id_returns_is_liked_true(
+    phases: Phases, client: Client, http: requests.Session
+):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     expected_content = f"Test content {uuid4().hex[:8]}"
@@ -79,11 +84,11 @@ def test_get_timeline_global_with_liked_post_and_user_id_returns_is_liked_true(p
     create_response = post_posts.sync(client=client, body=body)
     assert create_response is not None
     post_id = str(create_response.post_id)
-    like_response = requests.post(f"{BASE_URL}/posts/{post_id}/likes", json={"userId": user_id})
+    like_response = http.post(f"{BASE_URL}/posts/{post_id}/likes", json={"userId": user_id})
     assert like_response.status_code == 201
 
     phases.act()
-    response = requests.get(f"{BASE_URL}/timeline/global", params={"limit": 1, "userId": user_id})
+    response = http.get(f"{BASE_URL}/timeline/global", params={"limit": 1, "userId": user_id})
 
     phases.assert_()
     assert response.status_code == 200
@@ -94,9 +99,11 @@ def test_get_timeline_global_with_liked_post_and_user_id_returns_is_liked_true(p
     assert data["posts"][0]["isRepostedByCurrentUser"] is False
 
 
-def test_get_timeline_global_with_limit_and_cursor_returns_paginated_results(phases: Phases):
+@pytest.mark.global_timeline
+def test_get_timeline_global_with_limit_and_cursor_returns_paginated_results(
+    phases: Phases, client: Client, http: requests.Session
+):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = auth_response.user_id
     post1 = post_posts.sync(
@@ -111,7 +118,7 @@ def test_get_timeline_global_with_limit_and_cursor_returns_paginated_results(pha
     assert post1 is not None and post2 is not None and post3 is not None
 
     phases.act()
-    page1 = requests.get(f"{BASE_URL}/timeline/global", params={"limit": 2})
+    page1 = http.get(f"{BASE_URL}/timeline/global", params={"limit": 2})
 
     phases.assert_()
     assert page1.status_code == 200
@@ -122,15 +129,69 @@ def test_get_timeline_global_with_limit_and_cursor_returns_paginated_results(pha
     assert page1_data["posts"][1]["postId"] == str(post2.post_id)
 
     cursor = page1_data["posts"][-1]["postId"]
-    page2 = requests.get(f"{BASE_URL}/timeline/global", params={"limit": 2, "afterPostId": cursor})
+    page2 = http.get(f"{BASE_URL}/timeline/global", params={"limit": 2, "afterPostId": cursor})
     assert page2.status_code == 200
     page2_data = page2.json()
     assert page2_data["posts"][0]["postId"] == str(post1.post_id)
 
 
-def test_get_timeline_by_user_id_with_valid_request_returns_200(phases: Phases):
+@pytest.mark.global_timeline
+def test_get_timeline_global_with_next_cursor_returns_next_page(phases: Phases, client: Client, http: requests.Session):
+    phases.arrange()
+    auth_response = post_auth_login.sync(client=client)
+    user_id = auth_response.user_id
+    post1 = post_posts.sync(
+        client=client, body=PostPostsBody(user_id=user_id, content=f"Test content {uuid4().hex[:8]}")
+    )
+    post2 = post_posts.sync(
+        client=client, body=PostPostsBody(user_id=user_id, content=f"Test content {uuid4().hex[:8]}")
+    )
+    post3 = post_posts.sync(
+        client=client, body=PostPostsBody(user_id=user_id, content=f"Test content {uuid4().hex[:8]}")
+    )
+    assert post1 is not None and post2 is not None and post3 is not None
+    page1 = http.get(f"{BASE_URL}/timeline/global", params={"limit": 2})
+    assert page1.status_code == 200
+    next_cursor = page1.json()["nextCursor"]
+
+    phases.act()
+    page2 = http.get(f"{BASE_URL}/timeline/global", params={"limit": 2, "cursor": next_cursor})
+
+    phases.assert_()
+    assert page2.status_code == 200
+    assert page2.json()["posts"][0]["postId"] == str(post1.post_id)
+
+
+def test_get_timeline_global_with_tampered_cursor_returns_400(phases: Phases, http: requests.Session):
+    phases.arrange()
+    tampered_cursor = "not-a-valid-cursor"
+
+    phases.act()
+    response = http.get(f"{BASE_URL}/timeline/global", params={"cursor": tampered_cursor})
+
+    phases.assert_()
+    assert response.status_code == 400
+
+
+def test_get_timeline_trending_with_valid_request_returns_200(phases: Phases, http: requests.Session):
+    phases.arrange()
+
+    phases.act()
+    response = http.get(f"{BASE_URL}/timeline/trending", params={"limit": 5})
+
+    phases.assert_()
+    assert response.status_code == 200
+    data = response.json()
+    assert data["limit"] == 5
+    assert len(data["posts"]) <= 5
+    assert data.get("nextCursor") is None
+    for post in data["posts"]:
+        assert UUID_PATTERN.match(post["postId"])
+        assert ISO8601_PATTERN.match(post["createdAt"])
+
+
+def test_get_timeline_by_user_id_with_valid_request_returns_200(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     expected_content = f"Test content {uuid4().hex[:8]}"
@@ -140,7 +201,7 @@ def test_get_timeline_by_user_id_with_valid_request_returns_200(phases: Phases):
     post_id = str(create_response.post_id)
 
     phases.act()
-    response = requests.get(f"{BASE_URL}/timeline/users/{user_id}", params={"limit": 1})
+    response = http.get(f"{BASE_URL}/timeline/users/{user_id}", params={"limit": 1})
 
     phases.assert_()
     assert response.status_code == 200
@@ -160,9 +221,10 @@ def test_get_timeline_by_user_id_with_valid_request_returns_200(phases: Phases):
     assert data["posts"][0]["isRepostedByCurrentUser"] is None
 
 
-def test_get_timeline_by_user_id_with_another_users_post_returns_only_that_users_posts(phases: Phases):
+def test_get_timeline_by_user_id_with_another_users_post_returns_only_that_users_posts(
+    phases: Phases, client: Client, http: requests.Session
+):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response1 = post_auth_login.sync(client=client)
     user_id1 = str(auth_response1.user_id)
     auth_response2 = post_auth_login.sync(client=client)
@@ -179,7 +241,7 @@ def test_get_timeline_by_user_id_with_another_users_post_returns_only_that_users
     other_post_id = str(other_create_response.post_id)
 
     phases.act()
-    response = requests.get(f"{BASE_URL}/timeline/users/{user_id1}", params={"limit": 10})
+    response = http.get(f"{BASE_URL}/timeline/users/{user_id1}", params={"limit": 10})
 
     phases.assert_()
     assert response.status_code == 200
@@ -192,9 +254,10 @@ def test_get_timeline_by_user_id_with_another_users_post_returns_only_that_users
     assert other_post_id not in post_ids
 
 
-def test_get_timeline_by_user_id_with_deleted_post_returns_empty_posts(phases: Phases):
+def test_get_timeline_by_user_id_with_deleted_post_returns_empty_posts(
+    phases: Phases, client: Client, http: requests.Session
+):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     expected_content = f"Test content {uuid4().hex[:8]}"
@@ -202,11 +265,11 @@ def test_get_timeline_by_user_id_with_deleted_post_returns_empty_posts(phases: P
     create_response = post_posts.sync(client=client, body=body)
     assert create_response is not None
     post_id = str(create_response.post_id)
-    delete_response = requests.delete(f"{BASE_URL}/posts/{post_id}", json={"userId": user_id})
+    delete_response = http.delete(f"{BASE_URL}/posts/{post_id}", json={"userId": user_id})
     assert delete_response.status_code == 204
 
     phases.act()
-    response = requests.get(f"{BASE_URL}/timeline/users/{user_id}")
+    response = http.get(f"{BASE_URL}/timeline/users/{user_id}")
 
     phases.assert_()
     assert response.status_code == 200
@@ -214,9 +277,10 @@ def test_get_timeline_by_user_id_with_deleted_post_returns_empty_posts(phases: P
     assert data["posts"] == []
 
 
-def test_get_timeline_by_user_id_with_reposted_post_and_current_user_id_returns_is_reposted_true(phases: Phases):
+def test_get_timeline_by_user_id_with_reposted_post_and_current_user_id_returns_is_reposted_true(
+    phases: Phases, client: Client, http: requests.Session
+):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     expected_content = f"Test content {uuid4().hex[:8]}"
@@ -224,11 +288,11 @@ def test_get_timeline_by_user_id_with_reposted_post_and_current_user_id_returns_
     create_response = post_posts.sync(client=client, body=body)
     assert create_response is not None
     post_id = str(create_response.post_id)
-    repost_response = requests.post(f"{BASE_URL}/posts/{post_id}/reposts", json={"userId": user_id})
+    repost_response = http.post(f"{BASE_URL}/posts/{post_id}/reposts", json={"userId": user_id})
     assert repost_response.status_code == 201
 
     phases.act()
-    response = requests.get(
+    response = http.get(
         f"{BASE_URL}/timeline/users/{user_id}",
         params={"limit": 1, "currentUserId": user_id},
     )
@@ -242,50 +306,53 @@ def test_get_timeline_by_user_id_with_reposted_post_and_current_user_id_returns_
     assert data["posts"][0]["isRepostedByCurrentUser"] is True
 
 
-def test_get_timeline_global_with_user_id_increments_view_count(phases: Phases):
+@pytest.mark.global_timeline
+def test_get_timeline_global_with_user_id_increments_view_count(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     body = PostPostsBody(user_id=auth_response.user_id, content=f"Test content {uuid4().hex[:8]}")
     create_response = post_posts.sync(client=client, body=body)
     assert create_response is not None
     post_id = str(create_response.post_id)
-    before = requests.get(f"{BASE_URL}/posts/{post_id}")
+    before = http.get(f"{BASE_URL}/posts/{post_id}")
     assert before.json()["viewCount"] == 0
 
     phases.act()
-    timeline_response = requests.get(f"{BASE_URL}/timeline/global", params={"limit": 1, "userId": user_id})
+    timeline_response = http.get(f"{BASE_URL}/timeline/global", params={"limit": 1, "userId": user_id})
     assert timeline_response.status_code == 200
 
     phases.assert_()
-    after = requests.get(f"{BASE_URL}/posts/{post_id}")
+    after = http.get(f"{BASE_URL}/posts/{post_id}")
     assert after.json()["viewCount"] == 1
 
 
-def test_get_timeline_global_without_user_id_does_not_increment_view_count(phases: Phases):
+@pytest.mark.global_timeline
+def test_get_timeline_global_without_user_id_does_not_increment_view_count(
+    phases: Phases, client: Client, http: requests.Session
+):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     body = PostPostsBody(user_id=auth_response.user_id, content=f"Test content {uuid4().hex[:8]}")
     create_response = post_posts.sync(client=client, body=body)
     assert create_response is not None
     post_id = str(create_response.post_id)
-    before = requests.get(f"{BASE_URL}/posts/{post_id}")
+    before = http.get(f"{BASE_URL}/posts/{post_id}")
     assert before.json()["viewCount"] == 0
 
     phases.act()
-    timeline_response = requests.get(f"{BASE_URL}/timeline/global", params={"limit": 1})
+    timeline_response = http.get(f"{BASE_URL}/timeline/global", params={"limit": 1})
     assert timeline_response.status_code == 200
 
     phases.assert_()
-    after = requests.get(f"{BASE_URL}/posts/{post_id}")
+    after = http.get(f"{BASE_URL}/posts/{post_id}")
     assert after.json()["viewCount"] == 0
 
 
-def test_get_timeline_by_user_id_with_current_user_id_increments_view_count(phases: Phases):
+def test_get_timeline_by_user_id_with_current_user_id_increments_view_count(
+    phases: Phases, client: Client, http: requests.Session
+):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     viewer_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
@@ -294,44 +361,46 @@ def test_get_timeline_by_user_id_with_current_user_id_increments_view_count(phas
     create_response = post_posts.sync(client=client, body=body)
     assert create_response is not None
     post_id = str(create_response.post_id)
-    before = requests.get(f"{BASE_URL}/posts/{post_id}")
+    before = http.get(f"{BASE_URL}/posts/{post_id}")
     assert before.json()["viewCount"] == 0
 
     phases.act()
-    timeline_response = requests.get(
+    timeline_response = http.get(
         f"{BASE_URL}/timeline/users/{user_id}", params={"limit": 1, "currentUserId": viewer_id}
     )
     assert timeline_response.status_code == 200
 
     phases.assert_()
-    after = requests.get(f"{BASE_URL}/posts/{post_id}")
+    after = http.get(f"{BASE_URL}/posts/{post_id}")
     assert after.json()["viewCount"] == 1
 
 
-def test_get_timeline_by_user_id_without_current_user_id_does_not_increment_view_count(phases: Phases):
+def test_get_timeline_by_user_id_without_current_user_id_does_not_increment_view_count(
+    phases: Phases, client: Client, http: requests.Session
+):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     body = PostPostsBody(user_id=auth_response.user_id, content=f"Test content {uuid4().hex[:8]}")
     create_response = post_posts.sync(client=client, body=body)
     assert create_response is not None
     post_id = str(create_response.post_id)
-    before = requests.get(f"{BASE_URL}/posts/{post_id}")
+    before = http.get(f"{BASE_URL}/posts/{post_id}")
     assert before.json()["viewCount"] == 0
 
     phases.act()
-    timeline_response = requests.get(f"{BASE_URL}/timeline/users/{user_id}", params={"limit": 1})
+    timeline_response = http.get(f"{BASE_URL}/timeline/users/{user_id}", params={"limit": 1})
     assert timeline_response.status_code == 200
 
     phases.assert_()
-    after = requests.get(f"{BASE_URL}/posts/{post_id}")
+    after = http.get(f"{BASE_URL}/posts/{post_id}")
     assert after.json()["viewCount"] == 0
 
 
-def test_get_timeline_by_user_id_with_limit_and_cursor_returns_paginated_results(phases: Phases):
+def test_get_timeline_by_user_id_with_limit_and_cursor_returns_paginated_results(
+    phases: Phases, client: Client, http: requests.Session
+):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     post1 = post_posts.sync(
@@ -346,7 +415,7 @@ def test_get_timeline_by_user_id_with_limit_and_cursor_returns_paginated_results
     assert post1 is not None and post2 is not None and post3 is not None
 
     phases.act()
-    page1 = requests.get(f"{BASE_URL}/timeline/users/{user_id}", params={"limit": 2})
+    page1 = http.get(f"{BASE_URL}/timeline/users/{user_id}", params={"limit": 2})
 
     phases.assert_()
     assert page1.status_code == 200
@@ -357,7 +426,157 @@ def test_get_timeline_by_user_id_with_limit_and_cursor_returns_paginated_results
     assert page1_data["posts"][1]["postId"] == str(post2.post_id)
 
     cursor = page1_data["posts"][-1]["postId"]
-    page2 = requests.get(f"{BASE_URL}/timeline/users/{user_id}", params={"limit": 2, "afterPostId": cursor})
+    page2 = http.get(f"{BASE_URL}/timeline/users/{user_id}", params={"limit": 2, "afterPostId": cursor})
     assert page2.status_code == 200
     page2_data = page2.json()
     assert page2_data["posts"][0]["postId"] == str(post1.post_id)
+
+
+def test_get_timeline_by_user_id_with_next_cursor_returns_next_page(
+    phases: Phases, client: Client, http: requests.Session
+):
+    phases.arrange()
+    auth_response = post_auth_login.sync(client=client)
+    user_id = str(auth_response.user_id)
+    post1 = post_posts.sync(
+        client=client, body=PostPostsBody(user_id=auth_response.user_id, content=f"Test content {uuid4().hex[:8]}")
+    )
+    post2 = post_posts.sync(
+        client=client, body=PostPostsBody(user_id=auth_response.user_id, content=f"Test content {uuid4().hex[:8]}")
+    )
+    post3 = post_posts.sync(
+        client=client, body=PostPostsBody(user_id=auth_response.user_id, content=f"Test content {uuid4().hex[:8]}")
+    )
+    assert post1 is not None and post2 is not None and post3 is not None
+    page1 = http.get(f"{BASE_URL}/timeline/users/{user_id}", params={"limit": 2})
+    assert page1.status_code == 200
+    next_cursor = page1.json()["nextCursor"]
+
+    phases.act()
+    page2 = http.get(f"{BASE_URL}/timeline/users/{user_id}", params={"limit": 2, "cursor": next_cursor})
+
+    phases.assert_()
+    assert page2.status_code == 200
+    page2_data = page2.json()
+    assert [p["postId"] for p in page2_data["posts"]] == [str(post1.post_id)]
+    assert page2_data.get("nextCursor") is None
+
+
+def test_get_timeline_by_user_id_with_cursor_for_another_user_returns_400(
+    phases: Phases, client: Client, http: requests.Session
+):
+    phases.arrange()
+    auth_response1 = post_auth_login.sync(client=client)
+    auth_response2 = post_auth_login.sync(client=client)
+    for _ in range(2):
+        create_response = post_posts.sync(
+            client=client,
+            body=PostPostsBody(user_id=auth_response2.user_id, content=f"Test content {uuid4().hex[:8]}"),
+        )
+        assert create_response is not None
+    other_page = http.get(f"{BASE_URL}/timeline/users/{auth_response2.user_id}", params={"limit": 1})
+    assert other_page.status_code == 200
+    other_cursor = other_page.json()["nextCursor"]
+
+    phases.act()
+    response = http.get(f"{BASE_URL}/timeline/users/{auth_response1.user_id}", params={"cursor": other_cursor})
+
+    phases.assert_()
+    assert response.status_code == 400
+
+
+def test_get_timeline_by_user_id_with_matching_if_none_match_returns_304(
+    phases: Phases, client: Client, http: requests.Session
+):
+    phases.arrange()
+    auth_response = post_auth_login.sync(client=client)
+    user_id = str(auth_response.user_id)
+    create_response = post_posts.sync(
+        client=client, body=PostPostsBody(user_id=auth_response.user_id, content=f"Test content {uuid4().hex[:8]}")
+    )
+    assert create_response is not None
+    first = http.get(f"{BASE_URL}/timeline/users/{user_id}")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    phases.act()
+    response = http.get(f"{BASE_URL}/timeline/users/{user_id}", headers={"If-None-Match": etag})
+
+    phases.assert_()
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+def test_get_timeline_by_user_id_with_if_none_match_after_new_post_returns_200(
+    phases: Phases, client: Client, http: requests.Session
+):
+    phases.arrange()
+    auth_response = post_auth_login.sync(client=client)
+    user_id = str(auth_response.user_id)
+    first_post = post_posts.sync(
+        client=client, body=PostPostsBody(user_id=auth_response.user_id, content=f"Test content {uuid4().hex[:8]}")
+    )
+    assert first_post is not None
+    first = http.get(f"{BASE_URL}/timeline/users/{user_id}")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    second_post = post_posts.sync(
+        client=client, body=PostPostsBody(user_id=auth_response.user_id, content=f"Test content {uuid4().hex[:8]}")
+    )
+    assert second_post is not None
+
+    phases.act()
+    response = http.get(f"{BASE_URL}/timeline/users/{user_id}", headers={"If-None-Match": etag})
+
+    phases.assert_()
+    assert response.status_code == 200
+    assert response.json()["posts"][0]["postId"] == str(second_post.post_id)
+
+
+def test_get_timeline_by_user_id_with_current_user_id_returns_no_etag(
+    phases: Phases, client: Client, http: requests.Session
+):
+    phases.arrange()
+    auth_response = post_auth_login.sync(client=client)
+    viewer_response = post_auth_login.sync(client=client)
+    user_id = str(auth_response.user_id)
+    create_response = post_posts.sync(
+        client=client, body=PostPostsBody(user_id=auth_response.user_id, content=f"Test content {uuid4().hex[:8]}")
+    )
+    assert create_response is not None
+
+    phases.act()
+    response = http.get(f"{BASE_URL}/timeline/users/{user_id}", params={"currentUserId": str(viewer_response.user_id)})
+
+    phases.assert_()
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+
+
+def test_get_timeline_by_user_id_export_returns_all_posts_as_ndjson(
+    phases: Phases, client: Client, http: requests.Session
+):
+    phases.arrange()
+    auth_response = post_auth_login.sync(client=client)
+    user_id = str(auth_response.user_id)
+    post_ids = []
+    for _ in range(3):
+        create_response = post_posts.sync(
+            client=client,
+            body=PostPostsBody(user_id=auth_response.user_id, content=f"Test content {uuid4().hex[:8]}"),
+        )
+        assert create_response is not None
+        post_ids.append(str(create_response.post_id))
+    delete_response = http.delete(f"{BASE_URL}/posts/{post_ids[0]}", json={"userId": user_id})
+    assert delete_response.status_code == 204
+
+    phases.act()
+    response = http.get(f"{BASE_URL}/timeline/users/{user_id}/export")
+
+    phases.assert_()
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["postId"] for row in rows] == [post_ids[2], post_ids[1]]
+    assert all(row["userId"] == user_id for row in rows)
+    assert all(ISO8601_PATTERN.match(row["createdAt"]) for row in rows)
@@ -14,9 +14,8 @@ UUID_PATTERN = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-
 ISO8601_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})$")
 
 
-def test_post_views_with_valid_request_returns_201(phases: Phases):
+def test_post_views_with_valid_request_returns_201(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     expected_content = f"Test content {uuid4().hex[:8]}"
@@ -26,7 +25,7 @@ def test_post_views_with_valid_request_returns_201(phases: Phases):
     post_id = str(create_response.post_id)
 
     phases.act()
-    response = requests.post(
+    response = http.post(
         f"{BASE_URL}/posts/{post_id}/views",
         json={"userId": user_id},
     )
@@ -41,9 +40,8 @@ def test_post_views_with_valid_request_returns_201(phases: Phases):
     assert ISO8601_PATTERN.match(data["viewedAt"])
 
 
-def test_post_views_increments_view_count(phases: Phases):
+def test_post_views_increments_view_count(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
     expected_content = f"Test content {uuid4().hex[:8]}"
@@ -51,31 +49,54 @@ def test_post_views_increments_view_count(phases: Phases):
     create_response = post_posts.sync(client=client, body=body)
     assert create_response is not None
     post_id = str(create_response.post_id)
-    before = requests.get(f"{BASE_URL}/posts/{post_id}")
+    before = http.get(f"{BASE_URL}/posts/{post_id}")
     assert before.status_code == 200
     assert before.json()["viewCount"] == 0
 
     phases.act()
-    view_response = requests.post(
+    view_response = http.post(
         f"{BASE_URL}/posts/{post_id}/views",
         json={"userId": user_id},
     )
     assert view_response.status_code == 201
 
     phases.assert_()
-    after = requests.get(f"{BASE_URL}/posts/{post_id}")
+    after = http.get(f"{BASE_URL}/posts/{post_id}")
     assert after.status_code == 200
     assert after.json()["viewCount"] == 1
 
 
-def test_post_views_with_nonexistent_post_returns_404(phases: Phases):
+def test_post_views_counts_repeat_viewers_once_in_unique_view_count(
+    phases: Phases, client: Client, http: requests.Session
+):
+    phases.arrange()
+    auth_response = post_auth_login.sync(client=client)
+    body = PostPostsBody(user_id=auth_response.user_id, content=f"Test content {uuid4().hex[:8]}")
+    create_response = post_posts.sync(client=client, body=body)
+    assert create_response is not None
+    post_id = str(create_response.post_id)
+    viewer_ids = [str(post_auth_login.sync(client=client).user_id) for _ in range(2)]
+
+    phases.act()
+    for _ in range(2):
+        for viewer_id in viewer_ids:
+            view_response = http.post(f"{BASE_URL}/posts/{post_id}/views", json={"userId": viewer_id})
+            assert view_response.status_code == 201
+
+    phases.assert_()
+    after = http.get(f"{BASE_URL}/posts/{post_id}")
+    assert after.status_code == 200
+    assert after.json()["viewCount"] == 4
+    assert after.json()["uniqueViewCount"] == 2
+
+
+def test_post_views_with_nonexistent_post_returns_404(phases: Phases, client: Client, http: requests.Session):
     phases.arrange()
-    client = Client(base_url=BASE_URL)
     auth_response = post_auth_login.sync(client=client)
     user_id = str(auth_response.user_id)
 
     phases.act()
-    response = requests.post(
+    response = http.post(
         f"{BASE_URL}/posts/00000000-0000-0000-0000-000000000000/views",
         json={"userId": user_id},
     )
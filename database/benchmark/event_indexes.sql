@@ -0,0 +1,138 @@
+-- Insert benchmark for the event table index sets: the B-tree per column layout the
+-- event tables used to have against the composite + BRIN layout in ../schema.
+--
+-- Appends like events in committed batches into one table per layout and reports
+-- insert throughput, WAL written and index size. Runs in a scratch schema that is
+-- dropped at the end; the CHECKPOINT before each run needs a superuser.
+--
+--   docker compose exec -T database psql -U chirpuser -d chirpdb \
+--     -v rows=1000000 -v batch=1000 -v posts=100000 -v users=100000 < database/benchmark/event_indexes.sql
+
+\set ON_ERROR_STOP on
+\if :{?rows}
+\else
+    \set rows 1000000
+\endif
+\if :{?batch}
+\else
+    \set batch 1000
+\endif
+\if :{?posts}
+\else
+    \set posts 100000
+\endif
+\if :{?users}
+\else
+    \set users 100000
+\endif
+
+SELECT
+    set_config('bench.rows', :'rows', false),
+    set_config('bench.batch', :'batch', false),
+    set_config('bench.posts', :'posts', false),
+    set_config('bench.users', :'users', false);
+
+DROP SCHEMA IF EXISTS event_index_bench CASCADE;
+CREATE SCHEMA event_index_bench;
+SET search_path TO event_index_bench;
+
+CREATE TABLE results (
+    layout text PRIMARY KEY,
+    rows_inserted bigint NOT NULL,
+    seconds numeric NOT NULL,
+    wal_bytes numeric NOT NULL,
+    index_bytes bigint NOT NULL
+);
+
+-- Post and user ids are drawn from fixed pools, like engagement spread over existing posts
+CREATE TABLE post_ids AS
+SELECT n, uuidv7() AS id FROM generate_series(1, current_setting('bench.posts')::int) AS n;
+CREATE TABLE user_ids AS
+SELECT n, uuidv7() AS id FROM generate_series(1, current_setting('bench.users')::int) AS n;
+CREATE UNIQUE INDEX ON post_ids (n);
+CREATE UNIQUE INDEX ON user_ids (n);
+
+CREATE TABLE like_events_btree (
+    event_id uuid PRIMARY KEY DEFAULT uuidv7(),
+    post_id uuid NOT NULL,
+    user_id uuid NOT NULL,
+    event_type varchar(50) NOT NULL,
+    occurred_at timestamptz NOT NULL DEFAULT current_timestamp
+);
+CREATE INDEX ON like_events_btree (post_id);
+CREATE INDEX ON like_events_btree (user_id);
+CREATE INDEX ON like_events_btree (post_id, user_id);
+CREATE INDEX ON like_events_btree (occurred_at);
+
+CREATE TABLE like_events_brin (
+    event_id uuid PRIMARY KEY DEFAULT uuidv7(),
+    post_id uuid NOT NULL,
+    user_id uuid NOT NULL,
+    event_type varchar(50) NOT NULL,
+    occurred_at timestamptz NOT NULL DEFAULT current_timestamp
+);
+CREATE INDEX ON like_events_brin (post_id, user_id, occurred_at);
+CREATE INDEX ON like_events_brin USING brin (occurred_at) WITH (autosummarize = on);
+
+CREATE PROCEDURE run_layout(layout text)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    total int := current_setting('bench.rows')::int;
+    batch int := current_setting('bench.batch')::int;
+    posts int := current_setting('bench.posts')::int;
+    users int := current_setting('bench.users')::int;
+    target regclass := format('event_index_bench.like_events_%s', layout)::regclass;
+    started_at timestamptz;
+    start_lsn pg_lsn;
+    inserted int := 0;
+BEGIN
+    started_at := clock_timestamp();
+    start_lsn := pg_current_wal_insert_lsn();
+
+    WHILE inserted < total LOOP
+        EXECUTE format(
+            'INSERT INTO %s (post_id, user_id, event_type, occurred_at)
+             SELECT p.id, u.id, ''liked'', clock_timestamp()
+             FROM (
+                 SELECT 1 + floor(random() * $2)::int AS post_n, 1 + floor(random() * $3)::int AS user_n
+                 FROM generate_series(1, $1)
+             ) AS g
+             JOIN event_index_bench.post_ids p ON p.n = g.post_n
+             JOIN event_index_bench.user_ids u ON u.n = g.user_n',
+            target
+        ) USING least(batch, total - inserted), posts, users;
+        inserted := inserted + least(batch, total - inserted);
+        COMMIT;
+    END LOOP;
+
+    INSERT INTO event_index_bench.results
+    SELECT
+        layout,
+        inserted,
+        extract(EPOCH FROM clock_timestamp() - started_at),
+        pg_wal_lsn_diff(pg_current_wal_insert_lsn(), start_lsn),
+        pg_indexes_size(target);
+    COMMIT;
+END;
+$$;
+
+-- Starts each run right after a checkpoint, so both include the full-page writes that follow one
+CHECKPOINT;
+CALL run_layout('btree');
+CHECKPOINT;
+CALL run_layout('brin');
+
+SELECT
+    layout,
+    rows_inserted,
+    round(seconds, 1) AS seconds,
+    round(rows_inserted / seconds) AS rows_per_second,
+    pg_size_pretty(wal_bytes) AS wal,
+    round(wal_bytes / rows_inserted) AS wal_bytes_per_row,
+    pg_size_pretty(index_bytes) AS index_size
+FROM results
+ORDER BY layout DESC;
+
+RESET search_path;
+DROP SCHEMA event_index_bench CASCADE;
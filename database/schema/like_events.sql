@@ -1,11 +1,14 @@
 CREATE TABLE like_events (
-    event_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    event_id UUID PRIMARY KEY DEFAULT uuidv7(),
     post_id UUID NOT NULL,
     user_id UUID NOT NULL,
     event_type VARCHAR(50) NOT NULL,
     occurred_at TIMESTAMPTZ NOT NULL DEFAULT current_timestamp
 );
 
-CREATE INDEX idx_like_events_post_id ON like_events (post_id);
-CREATE INDEX idx_like_events_user_id ON like_events (user_id);
-CREATE INDEX idx_like_events_post_user ON like_events (post_id, user_id);
+-- Serves lookups by post, the latest event per (post, user) and their occurred_at ordering
+CREATE INDEX idx_like_events_post_user ON like_events (post_id, user_id, occurred_at);
+-- Finds a post's newest event without reading the rest, which versions its engagement for entity tags
+CREATE INDEX idx_like_events_post_occurred_at ON like_events (post_id, occurred_at, event_id);
+-- Rows are appended in occurred_at order, so block ranges summarize it tightly for replay and delta scans
+CREATE INDEX idx_like_events_occurred_at ON like_events USING brin (occurred_at) WITH (autosummarize = on);
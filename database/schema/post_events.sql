@@ -1,5 +1,5 @@
 CREATE TABLE post_events (
-    event_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    event_id UUID PRIMARY KEY DEFAULT uuidv7(),
     post_id UUID NOT NULL,
     reply_to_post_id UUID NULL,
     event_type VARCHAR(50) NOT NULL,
@@ -8,7 +8,10 @@ CREATE TABLE post_events (
     CONSTRAINT unique_post_event_type UNIQUE (post_id, event_type)
 );
 
-CREATE INDEX idx_post_events_post_id ON post_events (post_id);
+-- Lookups by post use unique_post_event_type, whose leading column is post_id
+-- Unlike the other event tables a B-tree: every timeline request and the posts_mv refresh check read the tail since
+-- the last refresh, which it returns in occurred_at order without a bitmap scan over whole block ranges and a sort
 CREATE INDEX idx_post_events_occurred_at ON post_events (occurred_at);
-CREATE INDEX idx_post_events_event_type ON post_events (event_type);
-CREATE INDEX idx_post_events_reply_to_post_id ON post_events (reply_to_post_id);
+-- Only post_created events carry reply_to_post_id; a post's replies are read oldest first, and thread traversal
+-- takes the first few per post from this index alone
+CREATE INDEX idx_post_events_reply_to_post_id ON post_events (reply_to_post_id, occurred_at, post_id);
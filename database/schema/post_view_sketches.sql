@@ -0,0 +1,7 @@
+-- 2^11 one-byte HyperLogLog registers of viewer ids per post and UTC day
+CREATE TABLE IF NOT EXISTS post_view_sketches (
+    post_id uuid NOT NULL,
+    bucket_start timestamptz NOT NULL,
+    registers bytea NOT NULL,
+    PRIMARY KEY (post_id, bucket_start)
+);
@@ -0,0 +1,56 @@
+ALTER TABLE mv_refresh_log
+ADD COLUMN IF NOT EXISTS last_refresh_duration_ms bigint NULL;
+
+-- Refreshes posts_mv only when it is behind post_events, and early once the
+-- pending delta reaches max_pending_rows. Returns 'skipped' when nothing is
+-- pending, 'deferred' when the delta is still small and young, 'refreshed' otherwise.
+CREATE OR REPLACE FUNCTION refresh_posts_mv_if_needed(
+    max_pending_rows integer DEFAULT 1000,
+    max_age interval DEFAULT INTERVAL '1 minute'
+) RETURNS text
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    refreshed_at timestamptz;
+    pending_rows integer;
+    started_at timestamptz;
+BEGIN
+    INSERT INTO mv_refresh_log (view_name, last_refreshed_at)
+    VALUES ('posts_mv', '-infinity') ON CONFLICT DO NOTHING;
+
+    -- Serializes overlapping runs; readers of the log are not blocked
+    SELECT last_refreshed_at INTO refreshed_at
+    FROM mv_refresh_log
+    WHERE view_name = 'posts_mv'
+    FOR UPDATE;
+
+    SELECT COUNT(*) INTO pending_rows
+    FROM (
+        SELECT 1
+        FROM post_events
+        WHERE occurred_at > refreshed_at
+        LIMIT max_pending_rows
+    ) AS pending;
+
+    IF pending_rows = 0 THEN
+        RETURN 'skipped';
+    END IF;
+
+    IF pending_rows < max_pending_rows AND now() - refreshed_at < max_age THEN
+        RETURN 'deferred';
+    END IF;
+
+    started_at := clock_timestamp();
+    REFRESH MATERIALIZED VIEW CONCURRENTLY posts_mv;
+
+    UPDATE mv_refresh_log
+    SET
+        last_refreshed_at = now(),
+        last_refresh_duration_ms = (
+            EXTRACT(EPOCH FROM clock_timestamp() - started_at) * 1000
+        )::bigint
+    WHERE view_name = 'posts_mv';
+
+    RETURN 'refreshed';
+END;
+$$;
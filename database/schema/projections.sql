@@ -0,0 +1,32 @@
+CREATE TABLE IF NOT EXISTS projection_checkpoints (
+    projection_name varchar(100) NOT NULL,
+    stream varchar(50) NOT NULL,
+    partition_no integer NOT NULL,
+    last_occurred_at timestamptz NOT NULL,
+    last_event_id uuid NOT NULL,
+    updated_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (projection_name, stream, partition_no)
+);
+
+CREATE TABLE IF NOT EXISTS post_like_status (
+    post_id uuid NOT NULL,
+    user_id uuid NOT NULL,
+    liked boolean NOT NULL,
+    occurred_at timestamptz NOT NULL,
+    PRIMARY KEY (post_id, user_id)
+);
+
+CREATE TABLE IF NOT EXISTS post_view_counts (
+    post_id uuid PRIMARY KEY,
+    view_count bigint NOT NULL
+);
+
+-- log_score is ln of the decayed engagement, see TrendingScore.kt
+CREATE TABLE IF NOT EXISTS post_trending_scores (
+    post_id uuid PRIMARY KEY,
+    log_score double precision NOT NULL,
+    updated_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_post_trending_scores_rank
+ON post_trending_scores (log_score DESC, post_id DESC);
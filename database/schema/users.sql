@@ -0,0 +1,4 @@
+CREATE TABLE users (
+    id UUID PRIMARY KEY,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT current_timestamp
+);
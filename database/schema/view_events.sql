@@ -1,10 +1,11 @@
 CREATE TABLE view_events (
-    event_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    event_id UUID PRIMARY KEY DEFAULT uuidv7(),
     post_id UUID NOT NULL,
     user_id UUID NOT NULL,
     occurred_at TIMESTAMPTZ NOT NULL DEFAULT current_timestamp
 );
 
-CREATE INDEX idx_view_events_post_id ON view_events (post_id);
-CREATE INDEX idx_view_events_user_id ON view_events (user_id);
-CREATE INDEX idx_view_events_post_user ON view_events (post_id, user_id);
+-- Views are only looked up and counted by post
+CREATE INDEX idx_view_events_post_id ON view_events (post_id, occurred_at);
+-- Rows are appended in occurred_at order, so block ranges summarize it tightly for replay and delta scans
+CREATE INDEX idx_view_events_occurred_at ON view_events USING brin (occurred_at) WITH (autosummarize = on);
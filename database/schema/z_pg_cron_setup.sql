@@ -1,10 +1,12 @@
 CREATE EXTENSION IF NOT EXISTS pg_cron ;
 
+-- Checks every 5 seconds; refreshes once 1000 post events are pending or the
+-- last refresh is a minute old, and skips entirely while nothing is pending.
+-- Tune with: SELECT cron.alter_job(jobid, command := 'SELECT refresh_posts_mv_if_needed(<rows>, INTERVAL ''<age>'')')
 SELECT cron.schedule (
 'refresh-posts-mv',
-'* * * * *',
+'5 seconds',
 $$
-    REFRESH MATERIALIZED VIEW CONCURRENTLY posts_mv;
-    UPDATE mv_refresh_log SET last_refreshed_at = CURRENT_TIMESTAMP WHERE view_name = 'posts_mv';
+    SELECT refresh_posts_mv_if_needed(1000, INTERVAL '1 minute');
     $$
 ) ;
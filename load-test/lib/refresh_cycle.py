@@ -0,0 +1,146 @@
+import math
+import os
+import threading
+import time
+
+import requests
+
+_POSITION_HEADER = "Cycle position (s)"
+_COUNT_HEADER = "Count"
+_MEAN_HEADER = "Mean (ms)"
+_P50_HEADER = "p50 (ms)"
+_P95_HEADER = "p95 (ms)"
+_MAX_BAR_WIDTH = 40
+
+
+_LAST_REFRESHED_AT_METRIC = "/actuator/metrics/app.posts_mv.last_refreshed_at"
+
+_last_refreshed_at: float | None = None
+
+
+def refresh_period_seconds() -> float:
+    return float(os.getenv("MV_REFRESH_PERIOD_SECONDS", "60"))
+
+
+def poll_last_refresh(host: str) -> None:
+    """Keep track of the last posts_mv refresh; runs until the process exits, so start it in a greenlet.
+
+    The pg_cron job `refresh-posts-mv` checks every few seconds and refreshes
+    whenever the pending delta grows past its row limit or age, so refreshes
+    follow no fixed period. The server publishes `mv_refresh_log` as the
+    `app.posts_mv.last_refreshed_at` gauge, which is polled every
+    MV_REFRESH_POLL_SECONDS.
+    """
+    global _last_refreshed_at
+    interval = float(os.getenv("MV_REFRESH_POLL_SECONDS", "1"))
+    session = requests.Session()
+    while True:
+        try:
+            response = session.get(f"{host}{_LAST_REFRESHED_AT_METRIC}", timeout=interval)
+            response.raise_for_status()
+            value = response.json()["measurements"][0]["value"]
+            if math.isfinite(value):
+                _last_refreshed_at = value
+        except (requests.RequestException, ValueError, KeyError, IndexError):
+            pass
+        time.sleep(interval)
+
+
+def refresh_cycle_position(now: float | None = None) -> float | None:
+    """Return how many seconds have passed since the last posts_mv refresh, or None before one has been seen.
+
+    Set MV_REFRESH_OFFSET_SECONDS when the load generator clock is skewed
+    against the database.
+    """
+    if _last_refreshed_at is None:
+        return None
+    offset = float(os.getenv("MV_REFRESH_OFFSET_SECONDS", "0"))
+    return max(0.0, (time.time() if now is None else now) - offset - _last_refreshed_at)
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class RefreshCycleHistogram:
+    """Latency samples bucketed by position in the posts_mv refresh cycle."""
+
+    def __init__(self, bucket_seconds: float | None = None) -> None:
+        self._period = refresh_period_seconds()
+        self._bucket_seconds = bucket_seconds or float(os.getenv("MV_REFRESH_BUCKET_SECONDS", "5"))
+        self._bucket_count = max(1, int(-(-self._period // self._bucket_seconds)))
+        self._samples: list[list[float]] = [[] for _ in range(self._bucket_count)]
+        self._lock = threading.Lock()
+
+    def record(self, position: float, value_ms: float) -> None:
+        index = min(self._bucket_count - 1, int(position // self._bucket_seconds))
+        with self._lock:
+            self._samples[index].append(value_ms)
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return not any(self._samples)
+
+    def render_table(self, title: str) -> str:
+        with self._lock:
+            buckets = [sorted(samples) for samples in self._samples]
+
+        def fmt(value: float) -> str:
+            return f"{value:.2f}"
+
+        rows = []
+        for index, samples in enumerate(buckets):
+            start = index * self._bucket_seconds
+            end = min(self._period, start + self._bucket_seconds)
+            if samples:
+                mean = sum(samples) / len(samples)
+                rows.append(
+                    {
+                        "position": f"{start:g}-{end:g}",
+                        "count": str(len(samples)),
+                        "mean": fmt(mean),
+                        "p50": fmt(_percentile(samples, 0.50)),
+                        "p95": fmt(_percentile(samples, 0.95)),
+                        "mean_value": mean,
+                    }
+                )
+            else:
+                rows.append(
+                    {
+                        "position": f"{start:g}-{end:g}",
+                        "count": "0",
+                        "mean": "-",
+                        "p50": "-",
+                        "p95": "-",
+                        "mean_value": 0.0,
+                    }
+                )
+
+        position_width = max(len(_POSITION_HEADER), max(len(r["position"]) for r in rows))
+        count_width = max(len(_COUNT_HEADER), max(len(r["count"]) for r in rows))
+        mean_width = max(len(_MEAN_HEADER), max(len(r["mean"]) for r in rows))
+        p50_width = max(len(_P50_HEADER), max(len(r["p50"]) for r in rows))
+        p95_width = max(len(_P95_HEADER), max(len(r["p95"]) for r in rows))
+        peak = max(r["mean_value"] for r in rows) or 1.0
+
+        def make_row(position: str, count: str, mean: str, p50: str, p95: str, bar: str) -> str:
+            return (
+                f"{position:<{position_width}} | {count:>{count_width}} | {mean:>{mean_width}} | "
+                f"{p50:>{p50_width}} | {p95:>{p95_width}} | {bar}"
+            )
+
+        header = make_row(_POSITION_HEADER, _COUNT_HEADER, _MEAN_HEADER, _P50_HEADER, _P95_HEADER, "")
+        separator = "".join("+" if c == "|" else "-" for c in header) + "-" * _MAX_BAR_WIDTH
+        body = [
+            make_row(
+                r["position"],
+                r["count"],
+                r["mean"],
+                r["p50"],
+                r["p95"],
+                "#" * int(round(r["mean_value"] / peak * _MAX_BAR_WIDTH)),
+            )
+            for r in rows
+        ]
+        return "\n".join([title, header, separator] + body)
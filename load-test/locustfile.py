@@ -1,6 +1,7 @@
 from scenarios.likes import LikePostAPI, UnlikePostAPI
 from scenarios.posts import CreatePostAPI, DeletePostAPI, GetPostAPI
 from scenarios.replies import ReplyPostAPI
+from scenarios.staleness import ReadYourWritesAPI
 from scenarios.timeline import GetGlobalTimelineAPI, GetGlobalTimelineWithPaginationAPI, GetUserTimelineAPI
 
 __all__ = [
@@ -13,4 +14,5 @@ __all__ = [
     "GetGlobalTimelineAPI",
     "GetGlobalTimelineWithPaginationAPI",
     "GetUserTimelineAPI",
+    "ReadYourWritesAPI",
 ]
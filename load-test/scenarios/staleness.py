@@ -0,0 +1,219 @@
+import os
+import time
+from pathlib import Path
+from typing import Callable
+
+import gevent
+from locust import HttpUser, between, events, task
+
+from lib.refresh_cycle import RefreshCycleHistogram, poll_last_refresh, refresh_cycle_position
+from lib.utils import random_string
+from openapi_gen.micro_chirp_api_client.api.auth import post_auth_login
+from openapi_gen.micro_chirp_api_client.client import Client
+
+_REPORT_FILE = Path("reports/staleness/refresh_cycle.txt")
+_VISIBILITY_REQUEST_TYPE = "VISIBILITY"
+_READ_PATH_PREFIXES = ("/timeline/", "/posts/")
+
+read_latency_by_cycle = RefreshCycleHistogram()
+visibility_lag_by_cycle = RefreshCycleHistogram()
+_reporting = False
+
+
+class ReadYourWritesAPI(HttpUser):
+    """Measure how long a write takes to become visible through posts_mv + delta aggregation
+
+    Each task performs a write (post creation, like, post deletion), timestamps it and then
+    polls GET /posts/{postId} and a timeline until the write is observed. Deletions are checked
+    on the author's own timeline, where the post is the newest one and so cannot drop off the
+    page for reasons other than the deletion.
+    The visibility lag is reported to Locust as a custom request type "VISIBILITY", so it shows
+    up in the statistics next to the HTTP requests.
+
+    A consistency violation is reported as a failed VISIBILITY request when:
+    - the write is not observed within STALENESS_TIMEOUT_SECONDS (default: 90)
+    - the write was observed and then disappears again on a later poll (non-monotonic read)
+
+    Poll interval and global timeline page size can be configured via
+    STALENESS_POLL_INTERVAL_SECONDS (default: 0.5) and STALENESS_TIMELINE_LIMIT (default: 100).
+    """
+
+    wait_time = between(1, 5)
+
+    def on_start(self):
+        client = Client(base_url=self.host)
+        auth_response = post_auth_login.sync(client=client)
+        self.user_id = str(auth_response.user_id)
+        self.timeout = float(os.getenv("STALENESS_TIMEOUT_SECONDS", "90"))
+        self.poll_interval = float(os.getenv("STALENESS_POLL_INTERVAL_SECONDS", "0.5"))
+        self.timeline_limit = int(os.getenv("STALENESS_TIMELINE_LIMIT", "100"))
+
+    @task(3)
+    def post_visibility(self):
+        post_id = self._create_post()
+        if post_id is None:
+            return
+        written_at = time.time()
+
+        self._await_visible(
+            "post_created -> /posts/[postId]",
+            written_at,
+            lambda: self._get_post(post_id) is not None,
+        )
+        self._await_visible(
+            "post_created -> /timeline/global",
+            written_at,
+            lambda: post_id in self._global_timeline_post_ids(),
+        )
+
+    @task(2)
+    def like_visibility(self):
+        post_id = self._create_post()
+        if post_id is None:
+            return
+        response = self.client.post(
+            f"/posts/{post_id}/likes", json={"userId": self.user_id}, name="/posts/[postId]/likes"
+        )
+        if response.status_code != 201:
+            return
+        written_at = time.time()
+
+        def liked() -> bool:
+            post = self._get_post(post_id, user_id=self.user_id)
+            return post is not None and post["likeCount"] >= 1 and post.get("isLikedByCurrentUser") is True
+
+        self._await_visible("liked -> /posts/[postId]", written_at, liked)
+
+    @task(1)
+    def delete_visibility(self):
+        post_id = self._create_post()
+        if post_id is None:
+            return
+        self._await_visible(
+            "post_created -> /timeline/users/[userId]",
+            time.time(),
+            lambda: post_id in (self._user_timeline_post_ids() or []),
+        )
+        response = self.client.delete(f"/posts/{post_id}", json={"userId": self.user_id}, name="/posts/[postId]")
+        if response.status_code != 204:
+            return
+        written_at = time.time()
+
+        def timeline_without_post() -> bool:
+            post_ids = self._user_timeline_post_ids()
+            return post_ids is not None and post_id not in post_ids
+
+        self._await_visible(
+            "post_deleted -> /posts/[postId]",
+            written_at,
+            lambda: self._get_post_status(post_id) == 404,
+        )
+        self._await_visible(
+            "post_deleted -> /timeline/users/[userId]",
+            written_at,
+            timeline_without_post,
+        )
+
+    def _create_post(self) -> str | None:
+        response = self.client.post(
+            "/posts",
+            json={"userId": self.user_id, "content": f"Staleness load test post {random_string(20)}"},
+        )
+        if response.status_code != 201:
+            return None
+        return response.json()["postId"]
+
+    def _get_post(self, post_id: str, user_id: str | None = None) -> dict | None:
+        params = {"userId": user_id} if user_id else None
+        response = self.client.get(f"/posts/{post_id}", params=params, name="/posts/[postId]")
+        if response.status_code != 200:
+            return None
+        return response.json()
+
+    def _get_post_status(self, post_id: str) -> int:
+        with self.client.get(f"/posts/{post_id}", name="/posts/[postId]", catch_response=True) as response:
+            if response.status_code == 404:
+                response.success()
+            return response.status_code
+
+    def _global_timeline_post_ids(self) -> list[str]:
+        response = self.client.get("/timeline/global", params={"limit": self.timeline_limit})
+        if response.status_code != 200:
+            return []
+        return [post["postId"] for post in response.json().get("posts", [])]
+
+    def _user_timeline_post_ids(self) -> list[str] | None:
+        response = self.client.get(
+            f"/timeline/users/{self.user_id}", params={"limit": 1}, name="/timeline/users/[userId]"
+        )
+        if response.status_code != 200:
+            return None
+        return [post["postId"] for post in response.json().get("posts", [])]
+
+    def _await_visible(self, name: str, written_at: float, observed: Callable[[], bool]) -> None:
+        cycle_position = refresh_cycle_position(written_at)
+        deadline = written_at + self.timeout
+
+        while not observed():
+            if time.time() >= deadline:
+                self._report(name, written_at, AssertionError(f"not visible after {self.timeout:g}s"))
+                return
+            time.sleep(self.poll_interval)
+
+        lag_ms = (time.time() - written_at) * 1000
+        if cycle_position is not None:
+            visibility_lag_by_cycle.record(cycle_position, lag_ms)
+
+        if not observed():
+            self._report(name, written_at, AssertionError("visible write disappeared on re-read"))
+            return
+        self._report(name, written_at, None, lag_ms)
+
+    def _report(self, name: str, written_at: float, exception: Exception | None, lag_ms: float | None = None) -> None:
+        self.environment.events.request.fire(
+            request_type=_VISIBILITY_REQUEST_TYPE,
+            name=name,
+            response_time=lag_ms if lag_ms is not None else (time.time() - written_at) * 1000,
+            response_length=0,
+            exception=exception,
+            context={},
+        )
+
+
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    """Collect the refresh cycle report only when ReadYourWritesAPI is part of the run"""
+    global _reporting
+    if _reporting or ReadYourWritesAPI not in environment.user_classes:
+        return
+    _reporting = True
+    gevent.spawn(poll_last_refresh, environment.host or "http://localhost:8080")
+    environment.events.request.add_listener(on_request)
+    environment.events.test_stop.add_listener(on_test_stop)
+
+
+def on_request(request_type, name, response_time, exception, **kwargs):
+    """Bucket read latencies by their position in the posts_mv refresh cycle"""
+    if request_type != "GET" or exception is not None or not name.startswith(_READ_PATH_PREFIXES):
+        return
+    cycle_position = refresh_cycle_position()
+    if cycle_position is not None:
+        read_latency_by_cycle.record(cycle_position, response_time)
+
+
+def on_test_stop(environment, **kwargs):
+    """Write read latency and visibility lag against refresh cycle position"""
+    tables = [
+        histogram.render_table(title)
+        for title, histogram in (
+            ("GET latency by posts_mv refresh cycle position", read_latency_by_cycle),
+            ("Visibility lag by posts_mv refresh cycle position (write time)", visibility_lag_by_cycle),
+        )
+        if not histogram.is_empty()
+    ]
+    if not tables:
+        return
+    report = "\n\n".join(tables)
+    print(f"\n{report}")
+    _REPORT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    _REPORT_FILE.write_text(report)
@@ -49,16 +49,14 @@ class GetGlobalTimelineWithPaginationAPI(HttpUser):
         if response.status_code != 200:
             return
 
-        data = response.json()
-        posts = data.get("posts", [])
-        if not posts:
+        cursor = response.json().get("nextCursor")
+        if not cursor:
             return
 
-        cursor = posts[-1]["postId"]
         self.client.get(
             "/timeline/global",
-            params={"limit": 20, "afterPostId": cursor},
-            name="/timeline/global?afterPostId=[cursor]",
+            params={"limit": 20, "cursor": cursor},
+            name="/timeline/global?cursor=[cursor]",
         )
 
 
@@ -6,6 +6,7 @@ plugins {
     kotlin("plugin.jpa") version "2.2.21"
     id("org.openapi.generator") version "7.12.0"
     id("com.diffplug.spotless") version "7.0.2"
+    id("me.champeau.jmh") version "0.7.3"
 }
 
 group = "com.example"
@@ -40,6 +41,7 @@ val integrationTestRuntimeOnly by configurations.getting {
 
 dependencies {
     // Spring Boot Starters
+    implementation("org.springframework.boot:spring-boot-starter-actuator")
     implementation("org.springframework.boot:spring-boot-starter-data-jpa")
     implementation("org.springframework.boot:spring-boot-starter-validation")
     implementation("org.springframework.boot:spring-boot-starter-webmvc")
@@ -55,6 +57,7 @@ dependencies {
     implementation(platform("io.opentelemetry.instrumentation:opentelemetry-instrumentation-bom:2.22.0"))
     implementation("io.opentelemetry.instrumentation:opentelemetry-spring-boot-starter")
     implementation("io.opentelemetry.instrumentation:opentelemetry-instrumentation-annotations")
+    implementation("io.opentelemetry:opentelemetry-exporter-logging-otlp")
 
     // Database
     runtimeOnly("org.postgresql:postgresql")
@@ -137,6 +140,127 @@ tasks.named("check") {
     dependsOn(integrationTest)
 }
 
+// The app refuses to start without TIMELINE_CURSOR_SECRET; runs launched from this build fall back to a local one
+val localCursorSecret = System.getenv("TIMELINE_CURSOR_SECRET") ?: "micro-chirp-local-cursor-secret"
+
+tasks.bootRun {
+    environment("TIMELINE_CURSOR_SECRET", localCursorSecret)
+}
+
+jmh {
+    jmhVersion = "1.37"
+    benchmarkMode = listOf("thrpt")
+    timeUnit = "s"
+    fork = 1
+    warmupIterations = 3
+    iterations = 5
+    profilers = listOf("gc")
+    jvmArgs = listOf("-Xms4g", "-Xmx4g")
+    resultFormat = "JSON"
+    providers.gradleProperty("jmhIncludes").orNull?.let { includes = listOf(it) }
+    providers.gradleProperty("jmhEventCounts").orNull?.let { eventCounts ->
+        benchmarkParameters.put("eventCount", objects.listProperty<String>().value(eventCounts.split(",")))
+    }
+}
+
+// Cold start: an AOT cache (JEP 483) trained on the extracted boot jar, and a benchmark of time to a started context
+val javaExecutable = javaToolchains.launcherFor(java.toolchain).map { it.executablePath.asFile.absolutePath }
+val extractedDir = layout.buildDirectory.dir("extracted")
+val aotCacheFile = layout.buildDirectory.file("aot/${project.name}.aot")
+
+val extractBootJar =
+    tasks.register<Exec>("extractBootJar") {
+        description = "Extracts the boot jar into the layout the AOT cache is trained on and run from."
+        group = "build"
+        val bootJar = tasks.bootJar.flatMap { it.archiveFile }
+        inputs.file(bootJar)
+        outputs.dir(extractedDir)
+        commandLine(
+            javaExecutable.get(),
+            "-Djarmode=tools",
+            "-jar",
+            bootJar.get().asFile,
+            "extract",
+            "--destination",
+            extractedDir.get().asFile,
+            "--application-filename",
+            "${project.name}.jar",
+            "--force",
+        )
+    }
+
+val aotCache =
+    tasks.register<Exec>("aotCache") {
+        description = "Records an AOT cache from a prod profile training run, against the database at DB_HOST, that exits after refresh."
+        group = "build"
+        dependsOn(extractBootJar)
+        inputs.dir(extractedDir)
+        outputs.file(aotCacheFile)
+        workingDir = extractedDir.get().asFile
+        environment("TIMELINE_CURSOR_SECRET", localCursorSecret)
+        commandLine(
+            javaExecutable.get(),
+            "-XX:AOTCacheOutput=${aotCacheFile.get().asFile}",
+            "-Dspring.context.exit=onRefresh",
+            "-Dspring.profiles.active=prod",
+            "-jar",
+            "${project.name}.jar",
+        )
+    }
+
+tasks.register("startupBenchmark") {
+    description = "Measures time to a started prod context against DB_HOST, with and without the AOT cache (-PstartupRuns, default 5)."
+    group = "verification"
+    dependsOn(aotCache)
+    val runs = providers.gradleProperty("startupRuns").map(String::toInt).orElse(5)
+    val report = layout.buildDirectory.file("reports/startup/startup.txt")
+    outputs.file(report)
+    outputs.upToDateWhen { false }
+    doLast {
+        val variants =
+            linkedMapOf(
+                "baseline" to emptyList(),
+                "aot-cache" to listOf("-XX:AOTCache=${aotCacheFile.get().asFile}"),
+            )
+        val lines =
+            variants.map { (name, jvmArgs) ->
+                val seconds = List(runs.get()) { measureStartup(javaExecutable.get(), extractedDir.get().asFile, jvmArgs) }.sorted()
+                "%-10s median %.2fs  min %.2fs  max %.2fs".format(name, seconds[seconds.size / 2], seconds.first(), seconds.last())
+            }
+        report.get().asFile.apply {
+            parentFile.mkdirs()
+            writeText(lines.joinToString("\n", postfix = "\n"))
+        }
+        lines.forEach { logger.lifecycle(it) }
+    }
+}
+
+/** Starts the extracted app and returns the JVM uptime Spring Boot reports once the context has started. */
+fun measureStartup(
+    java: String,
+    workingDir: File,
+    jvmArgs: List<String>,
+): Double {
+    val command = listOf(java) + jvmArgs + listOf("-Dspring.profiles.active=prod", "-jar", "${project.name}.jar", "--server.port=0")
+    val process =
+        ProcessBuilder(command)
+            .directory(workingDir)
+            .redirectErrorStream(true)
+            .apply { environment()["TIMELINE_CURSOR_SECRET"] = localCursorSecret }
+            .start()
+    try {
+        val started = Regex("""Started \S+ in [\d.]+ seconds \(process running for ([\d.]+)\)""")
+        return process.inputStream.bufferedReader().useLines { lines -> lines.firstNotNullOfOrNull { started.find(it) } }
+            ?.groupValues
+            ?.get(1)
+            ?.toDouble()
+            ?: throw GradleException("Server exited before reporting startup")
+    } finally {
+        process.destroy()
+        process.waitFor()
+    }
+}
+
 // OpenAPI Generator Configuration
 openApiGenerate {
     generatorName.set("kotlin-spring")
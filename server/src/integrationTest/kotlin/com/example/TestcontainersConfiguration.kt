@@ -6,6 +6,7 @@ import org.springframework.boot.testcontainers.service.connection.ServiceConnect
 import org.springframework.context.annotation.Bean
 import org.springframework.core.io.ClassPathResource
 import org.springframework.jdbc.datasource.init.ResourceDatabasePopulator
+import org.springframework.jdbc.datasource.init.ScriptUtils
 import org.testcontainers.postgresql.PostgreSQLContainer
 import org.testcontainers.utility.DockerImageName
 import javax.sql.DataSource
@@ -20,5 +21,10 @@ class TestcontainersConfiguration {
     fun postsMvInitializer(dataSource: DataSource) =
         ApplicationRunner {
             ResourceDatabasePopulator(ClassPathResource("posts_mv.sql")).execute(dataSource)
+            ResourceDatabasePopulator(ClassPathResource("posts_mv_refresh.sql"))
+                .apply { setSeparator(ScriptUtils.EOF_STATEMENT_SEPARATOR) }
+                .execute(dataSource)
+            ResourceDatabasePopulator(ClassPathResource("post_view_sketches.sql")).execute(dataSource)
+            ResourceDatabasePopulator(ClassPathResource("projections.sql")).execute(dataSource)
         }
 }
@@ -0,0 +1,110 @@
+package com.example.engagement
+
+import com.example.TestcontainersConfiguration
+import com.example.auth.User
+import com.example.auth.UserRepository
+import com.example.like.LikeEventRepository
+import com.example.like.LikeEventType
+import com.example.post.PostCreationResult
+import com.example.post.PostRetrievalResult
+import com.example.post.PostService
+import com.example.test.tracing.SpanTimingExtension
+import com.example.test.tracing.TestPhases
+import org.assertj.core.api.Assertions.assertThat
+import org.junit.jupiter.api.Test
+import org.junit.jupiter.api.extension.ExtendWith
+import org.springframework.beans.factory.annotation.Autowired
+import org.springframework.boot.test.context.SpringBootTest
+import org.springframework.context.annotation.Import
+import java.time.Instant
+import java.util.UUID
+
+@SpringBootTest
+@Import(TestcontainersConfiguration::class)
+@ExtendWith(SpanTimingExtension::class)
+class EngagementServiceTest {
+    @Autowired
+    private lateinit var engagementService: EngagementService
+
+    @Autowired
+    private lateinit var postService: PostService
+
+    @Autowired
+    private lateinit var likeEventRepository: LikeEventRepository
+
+    @Autowired
+    private lateinit var userRepository: UserRepository
+
+    @Test
+    fun `when ingest with mixed events then appends valid events and returns a status per event`(phases: TestPhases) {
+        phases.arrange()
+        val userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+        val postId = (postService.createPost(userId, "Batch target") as PostCreationResult.Success).postId
+        val commands =
+            listOf(
+                EngagementCommand(EngagementType.LIKE, postId, userId),
+                EngagementCommand(EngagementType.REPOST, postId, userId),
+                EngagementCommand(EngagementType.VIEW, postId, userId),
+                EngagementCommand(EngagementType.VIEW, postId, userId),
+                EngagementCommand(EngagementType.UNREPOST, postId, userId),
+                EngagementCommand(EngagementType.UNREPOST, postId, userId),
+                EngagementCommand(EngagementType.LIKE, UUID.randomUUID(), userId),
+                EngagementCommand(EngagementType.LIKE, postId, UUID.randomUUID()),
+            )
+
+        phases.act()
+        val result = engagementService.ingest(commands)
+
+        phases.assert()
+        assertThat(result).isInstanceOf(EngagementBatchResult.Success::class.java)
+        val success = result as EngagementBatchResult.Success
+        assertThat(success.statuses).containsExactly(
+            EngagementStatus.CREATED,
+            EngagementStatus.CREATED,
+            EngagementStatus.CREATED,
+            EngagementStatus.CREATED,
+            EngagementStatus.CREATED,
+            EngagementStatus.UNCHANGED,
+            EngagementStatus.POST_NOT_FOUND,
+            EngagementStatus.USER_NOT_FOUND,
+        )
+        assertThat(success.createdCount).isEqualTo(5)
+
+        val post = postService.getPost(postId, userId) as PostRetrievalResult.Success
+        assertThat(post.likeCount).isEqualTo(1)
+        assertThat(post.repostCount).isEqualTo(0)
+        assertThat(post.viewCount).isEqualTo(2)
+        assertThat(post.isLikedByCurrentUser).isTrue()
+    }
+
+    @Test
+    fun `when ingest with unlike of a previously liked post then appends UNLIKED`(phases: TestPhases) {
+        phases.arrange()
+        val userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+        val postId = (postService.createPost(userId, "Batch unlike target") as PostCreationResult.Success).postId
+        engagementService.ingest(listOf(EngagementCommand(EngagementType.LIKE, postId, userId)))
+
+        phases.act()
+        val result = engagementService.ingest(listOf(EngagementCommand(EngagementType.UNLIKE, postId, userId)))
+
+        phases.assert()
+        assertThat((result as EngagementBatchResult.Success).statuses).containsExactly(EngagementStatus.CREATED)
+        val events = likeEventRepository.findByPostIdOrderByOccurredAtAsc(postId)
+        assertThat(events.map { it.eventType }).containsExactly(LikeEventType.LIKED.value, LikeEventType.UNLIKED.value)
+    }
+
+    @Test
+    fun `when ingest with more than the maximum batch size then returns Failure with EngagementBatchValidationException`(phases: TestPhases) {
+        phases.arrange()
+        val commands = List(EngagementService.MAX_BATCH_SIZE + 1) { EngagementCommand(EngagementType.VIEW, UUID.randomUUID(), UUID.randomUUID()) }
+
+        phases.act()
+        val result = engagementService.ingest(commands)
+
+        phases.assert()
+        assertThat(result).isInstanceOf(EngagementBatchResult.Failure::class.java)
+        assertThat((result as EngagementBatchResult.Failure).exception).isInstanceOf(EngagementBatchValidationException::class.java)
+    }
+}
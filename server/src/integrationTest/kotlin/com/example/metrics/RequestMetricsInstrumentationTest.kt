@@ -0,0 +1,61 @@
+package com.example.metrics
+
+import com.example.TestcontainersConfiguration
+import com.example.auth.User
+import com.example.auth.UserRepository
+import com.example.like.LikeService
+import com.example.post.PostCreationResult
+import com.example.post.PostService
+import com.example.test.tracing.SpanTimingExtension
+import com.example.test.tracing.TestPhases
+import com.example.timeline.TimelineResult
+import com.example.timeline.TimelineService
+import org.assertj.core.api.Assertions.assertThat
+import org.junit.jupiter.api.Test
+import org.junit.jupiter.api.extension.ExtendWith
+import org.springframework.beans.factory.annotation.Autowired
+import org.springframework.boot.test.context.SpringBootTest
+import org.springframework.context.annotation.Import
+import java.time.Instant
+import java.util.UUID
+
+@SpringBootTest
+@Import(TestcontainersConfiguration::class)
+@ExtendWith(SpanTimingExtension::class)
+class RequestMetricsInstrumentationTest {
+    @Autowired
+    private lateinit var timelineService: TimelineService
+
+    @Autowired
+    private lateinit var postService: PostService
+
+    @Autowired
+    private lateinit var likeService: LikeService
+
+    @Autowired
+    private lateinit var userRepository: UserRepository
+
+    @Test
+    fun `when getGlobalTimeline inside collect then records statements rows and event data bytes`(phases: TestPhases) {
+        phases.arrange()
+        val userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+        val post = postService.createPost(userId, "Instrumented post") as PostCreationResult.Success
+        likeService.likePost(post.postId, userId)
+        val metrics = RequestMetrics()
+
+        phases.act()
+        val result = RequestMetrics.collect(metrics) { timelineService.getGlobalTimeline(20, null, null) }
+
+        phases.assert()
+        assertThat(result).isInstanceOf(TimelineResult.Success::class.java)
+        assertThat(metrics.statementCount).isGreaterThanOrEqualTo(metrics.rowsByRepositoryMethod.size)
+        assertThat(metrics.rowsByRepositoryMethod).containsKeys(
+            "PostEventRepository.findByOccurredAtAfterOrderByOccurredAtAsc",
+            "LikeEventJdbcRepository.findByPostIds",
+            "ViewEventJdbcRepository.countByPostIds",
+        )
+        assertThat(metrics.rowsByRepositoryMethod["LikeEventJdbcRepository.findByPostIds"]).isGreaterThanOrEqualTo(1)
+        assertThat(metrics.eventDataBytes).isGreaterThan(0)
+    }
+}
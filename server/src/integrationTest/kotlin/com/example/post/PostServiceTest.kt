@@ -193,6 +193,77 @@ class PostServiceTest {
         assertThat(failure.exception).isInstanceOf(PostNotFoundException::class.java)
     }
 
+    @Test
+    fun `when getPost with ifNoneMatch of the current entity tag then returns NotModified`(phases: TestPhases) {
+        phases.arrange()
+        val userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+        val createResult = postService.createPost(userId, "Test post content") as PostCreationResult.Success
+        val first = postService.getPost(createResult.postId, null) as PostRetrievalResult.Success
+
+        phases.act()
+        val result = postService.getPost(createResult.postId, null, first.entityTag)
+
+        phases.assert()
+        assertThat(result).isEqualTo(PostRetrievalResult.NotModified(first.entityTag))
+    }
+
+    @Test
+    fun `when getPost with ifNoneMatch wildcard for a deleted post then returns Failure with PostNotFoundException`(phases: TestPhases) {
+        phases.arrange()
+        val userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+        val createResult = postService.createPost(userId, "Test post content") as PostCreationResult.Success
+        postService.deletePost(createResult.postId, userId)
+
+        phases.act()
+        val result = postService.getPost(createResult.postId, null, "*")
+
+        phases.assert()
+        assertThat(result).isInstanceOf(PostRetrievalResult.Failure::class.java)
+        assertThat((result as PostRetrievalResult.Failure).exception).isInstanceOf(PostNotFoundException::class.java)
+    }
+
+    @Test
+    fun `when getPost with ifNoneMatch wildcard for a missing post then returns Failure with PostNotFoundException`(phases: TestPhases) {
+        phases.arrange()
+        val postId = UUID.randomUUID()
+
+        phases.act()
+        val result = postService.getPost(postId, null, "*")
+
+        phases.assert()
+        assertThat(result).isInstanceOf(PostRetrievalResult.Failure::class.java)
+        assertThat((result as PostRetrievalResult.Failure).exception).isInstanceOf(PostNotFoundException::class.java)
+    }
+
+    @Test
+    fun `when getPost with ifNoneMatch after a like then returns Success with a new entity tag`(phases: TestPhases) {
+        phases.arrange()
+        val userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+        val createResult = postService.createPost(userId, "Test post content") as PostCreationResult.Success
+        val first = postService.getPost(createResult.postId, null) as PostRetrievalResult.Success
+        likeEventRepository.save(
+            LikeEvent(
+                eventId = UUID.randomUUID(),
+                postId = createResult.postId,
+                userId = userId,
+                eventType = LikeEventType.LIKED.value,
+                occurredAt = Instant.now(),
+            ),
+        )
+
+        phases.act()
+        val result = postService.getPost(createResult.postId, null, first.entityTag)
+
+        phases.assert()
+        assertThat(result).isInstanceOf(PostRetrievalResult.Success::class.java)
+        val success = result as PostRetrievalResult.Success
+        assertThat(success.likeCount).isEqualTo(1)
+        assertThat(success.entityTag).isNotEqualTo(first.entityTag)
+    }
+
     @Test
     fun `when deletePost with valid request then returns Success and creates delete event`(phases: TestPhases) {
         phases.arrange()
@@ -0,0 +1,135 @@
+package com.example.post
+
+import com.example.TestcontainersConfiguration
+import com.example.auth.User
+import com.example.auth.UserRepository
+import com.example.like.LikeEvent
+import com.example.like.LikeEventRepository
+import com.example.like.LikeEventType
+import com.example.test.tracing.SpanTimingExtension
+import com.example.test.tracing.TestPhases
+import org.assertj.core.api.Assertions.assertThat
+import org.junit.jupiter.api.BeforeAll
+import org.junit.jupiter.api.Test
+import org.junit.jupiter.api.extension.ExtendWith
+import org.springframework.beans.factory.annotation.Autowired
+import org.springframework.boot.test.context.SpringBootTest
+import org.springframework.context.annotation.Import
+import org.springframework.core.io.ClassPathResource
+import org.springframework.jdbc.core.JdbcTemplate
+import org.springframework.jdbc.datasource.SimpleDriverDataSource
+import org.springframework.jdbc.datasource.init.ResourceDatabasePopulator
+import org.testcontainers.jdbc.ContainerDatabaseDriver
+import java.time.Instant
+import java.util.UUID
+
+// The read datasource is a second database that only sees what a test copies into it, like a replica lagging behind
+@SpringBootTest(properties = ["app.datasource.read.url=$REPLICA_URL"])
+@Import(TestcontainersConfiguration::class)
+@ExtendWith(SpanTimingExtension::class)
+class ReadReplicaPostServiceTest {
+    @Autowired
+    private lateinit var postService: PostService
+
+    @Autowired
+    private lateinit var userRepository: UserRepository
+
+    @Autowired
+    private lateinit var likeEventRepository: LikeEventRepository
+
+    @Autowired
+    private lateinit var jdbcTemplate: JdbcTemplate
+
+    @Test
+    fun `when getPost after a like the replica has not seen then counts from the replica and flags the caller's like`(phases: TestPhases) {
+        phases.arrange()
+        val userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+        val post = postService.createPost(userId, "Post") as PostCreationResult.Success
+        copyPostEventsToReplica(post.postId)
+        likeEventRepository.save(
+            LikeEvent(
+                eventId = UUID.randomUUID(),
+                postId = post.postId,
+                userId = userId,
+                eventType = LikeEventType.LIKED.value,
+                occurredAt = Instant.now(),
+            ),
+        )
+
+        phases.act()
+        val result = postService.getPost(post.postId, userId)
+
+        phases.assert()
+        assertThat(result).isInstanceOf(PostRetrievalResult.Success::class.java)
+        val success = result as PostRetrievalResult.Success
+        assertThat(success.likeCount).isEqualTo(0)
+        assertThat(success.isLikedByCurrentUser).isTrue()
+    }
+
+    @Test
+    fun `when getPosts after a like the replica has not seen then counts from the replica and flags the caller's like`(phases: TestPhases) {
+        phases.arrange()
+        val userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+        val post = postService.createPost(userId, "Post") as PostCreationResult.Success
+        copyPostEventsToReplica(post.postId)
+        likeEventRepository.save(
+            LikeEvent(
+                eventId = UUID.randomUUID(),
+                postId = post.postId,
+                userId = userId,
+                eventType = LikeEventType.LIKED.value,
+                occurredAt = Instant.now(),
+            ),
+        )
+
+        phases.act()
+        val result = postService.getPosts(listOf(post.postId), userId, 20, 0)
+
+        phases.assert()
+        assertThat(result).isInstanceOf(PostsRetrievalResult.Success::class.java)
+        val success = result as PostsRetrievalResult.Success
+        assertThat(success.posts.single().likeCount).isEqualTo(0)
+        assertThat(success.posts.single().isLikedByCurrentUser).isTrue()
+    }
+
+    private fun copyPostEventsToReplica(postId: UUID) {
+        jdbcTemplate
+            .queryForList(
+                """
+                SELECT event_id, post_id, event_type, event_data::text AS event_data, occurred_at
+                FROM post_events WHERE post_id = ?::uuid
+                """.trimIndent(),
+                postId.toString(),
+            ).forEach { row ->
+                replica.update(
+                    "INSERT INTO post_events (event_id, post_id, event_type, event_data, occurred_at) VALUES (?, ?, ?, ?::jsonb, ?)",
+                    row["event_id"],
+                    row["post_id"],
+                    row["event_type"],
+                    row["event_data"],
+                    row["occurred_at"],
+                )
+            }
+    }
+
+    companion object {
+        private val replica = JdbcTemplate(SimpleDriverDataSource(ContainerDatabaseDriver(), REPLICA_URL))
+
+        @JvmStatic
+        @BeforeAll
+        fun createReplicaSchema() {
+            ResourceDatabasePopulator(
+                ClassPathResource("post_events.sql"),
+                ClassPathResource("like_events.sql"),
+                ClassPathResource("repost_events.sql"),
+                ClassPathResource("view_events.sql"),
+                ClassPathResource("post_view_sketches.sql"),
+            ).execute(replica.dataSource!!)
+        }
+    }
+}
+
+// Kept running across connections, so the application's read pool and the test's own connections share it
+private const val REPLICA_URL = "jdbc:tc:postgresql:18:///replica?TC_DAEMON=true"
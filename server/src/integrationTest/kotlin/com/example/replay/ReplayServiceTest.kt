@@ -0,0 +1,208 @@
+package com.example.replay
+
+import com.example.TestcontainersConfiguration
+import com.example.like.LikeEvent
+import com.example.like.LikeEventRepository
+import com.example.like.LikeEventType
+import com.example.test.tracing.SpanTimingExtension
+import com.example.test.tracing.TestPhases
+import com.example.view.ViewEvent
+import com.example.view.ViewEventRepository
+import org.assertj.core.api.Assertions.assertThat
+import org.junit.jupiter.api.Test
+import org.junit.jupiter.api.extension.ExtendWith
+import org.springframework.beans.factory.annotation.Autowired
+import org.springframework.boot.test.context.SpringBootTest
+import org.springframework.context.annotation.Import
+import org.springframework.jdbc.core.JdbcTemplate
+import org.springframework.transaction.support.TransactionTemplate
+import java.sql.Timestamp
+import java.time.Instant
+import java.util.UUID
+import java.util.concurrent.CountDownLatch
+import kotlin.concurrent.thread
+
+@SpringBootTest
+@Import(TestcontainersConfiguration::class)
+@ExtendWith(SpanTimingExtension::class)
+class ReplayServiceTest {
+    @Autowired
+    private lateinit var replayService: ReplayService
+
+    @Autowired
+    private lateinit var likeEventRepository: LikeEventRepository
+
+    @Autowired
+    private lateinit var viewEventRepository: ViewEventRepository
+
+    @Autowired
+    private lateinit var jdbcTemplate: JdbcTemplate
+
+    @Autowired
+    private lateinit var transactionTemplate: TransactionTemplate
+
+    @Test
+    fun `when replay rebuilds post_like_status then each pair holds its latest like event`(phases: TestPhases) {
+        phases.arrange()
+        val postId = UUID.randomUUID()
+        val likedUserId = UUID.randomUUID()
+        val unlikedUserId = UUID.randomUUID()
+        val base = Instant.now().minusSeconds(60)
+        likeEventRepository.saveAll(
+            listOf(
+                likeEvent(postId, likedUserId, LikeEventType.LIKED, base),
+                likeEvent(postId, unlikedUserId, LikeEventType.LIKED, base.plusMillis(1)),
+                likeEvent(postId, likedUserId, LikeEventType.UNLIKED, base.plusMillis(2)),
+                likeEvent(postId, unlikedUserId, LikeEventType.UNLIKED, base.plusMillis(3)),
+                likeEvent(postId, likedUserId, LikeEventType.LIKED, base.plusMillis(4)),
+            ),
+        )
+
+        phases.act()
+        val result = replayService.replay("post_like_status", rebuild = true, partitions = 4, chunkSize = 2)
+
+        phases.assert()
+        assertThat(result).isInstanceOf(ReplayResult.Success::class.java)
+        assertThat(likedStatus(postId, likedUserId)).isTrue()
+        assertThat(likedStatus(postId, unlikedUserId)).isFalse()
+    }
+
+    @Test
+    fun `when replay resumes from checkpoints then applies only events after them`(phases: TestPhases) {
+        phases.arrange()
+        val postId = UUID.randomUUID()
+        val otherPostId = UUID.randomUUID()
+        val base = Instant.now().minusSeconds(60)
+        viewEventRepository.saveAll(
+            listOf(postId, postId, postId, otherPostId).mapIndexed { i, id -> viewEvent(id, base.plusMillis(i.toLong())) },
+        )
+        replayService.replay("post_view_counts", rebuild = true, partitions = 4, chunkSize = 3)
+        viewEventRepository.saveAll(
+            listOf(postId, otherPostId).mapIndexed { i, id -> viewEvent(id, base.plusSeconds(30).plusMillis(i.toLong())) },
+        )
+
+        phases.act()
+        val result = replayService.replay("post_view_counts", rebuild = false, partitions = 4, chunkSize = 3)
+
+        phases.assert()
+        assertThat(result).isInstanceOf(ReplayResult.Success::class.java)
+        assertThat(viewCount(postId)).isEqualTo(4)
+        assertThat(viewCount(otherPostId)).isEqualTo(2)
+    }
+
+    @Test
+    fun `when replay resumes with a different partition count then returns Failure with ReplayPartitionMismatchException`(
+        phases: TestPhases,
+    ) {
+        phases.arrange()
+        replayService.replay("post_view_counts", rebuild = true, partitions = 4)
+
+        phases.act()
+        val result = replayService.replay("post_view_counts", rebuild = false, partitions = 2)
+
+        phases.assert()
+        assertThat(result).isInstanceOf(ReplayResult.Failure::class.java)
+        assertThat((result as ReplayResult.Failure).exception).isInstanceOf(ReplayPartitionMismatchException::class.java)
+    }
+
+    @Test
+    fun `when two replays race on one partition then the loser returns Failure with ReplayCheckpointConflictException`(
+        phases: TestPhases,
+    ) {
+        phases.arrange()
+        val base = Instant.now().minusSeconds(60)
+        replayService.replay("post_view_counts", rebuild = true, partitions = 1)
+        // Moves the checkpoint behind the new event whatever other tests left in the stream
+        jdbcTemplate.update(
+            "UPDATE projection_checkpoints SET last_occurred_at = ? WHERE projection_name = 'post_view_counts'",
+            Timestamp.from(base),
+        )
+        viewEventRepository.save(viewEvent(UUID.randomUUID(), base.plusSeconds(30)))
+        val checkpointLocked = CountDownLatch(1)
+        val advanceCheckpoint = CountDownLatch(1)
+        val otherReplay =
+            thread {
+                transactionTemplate.executeWithoutResult {
+                    jdbcTemplate.queryForList(
+                        "SELECT 1 FROM projection_checkpoints WHERE projection_name = 'post_view_counts' FOR UPDATE",
+                    )
+                    checkpointLocked.countDown()
+                    advanceCheckpoint.await()
+                    jdbcTemplate.update(
+                        "UPDATE projection_checkpoints SET last_event_id = uuidv7() WHERE projection_name = 'post_view_counts'",
+                    )
+                }
+            }
+        checkpointLocked.await()
+
+        phases.act()
+        var result: ReplayResult? = null
+        val replay = thread { result = replayService.replay("post_view_counts", rebuild = false, partitions = 1) }
+        try {
+            awaitCheckpointLockWaiter()
+        } finally {
+            advanceCheckpoint.countDown()
+        }
+        otherReplay.join()
+        replay.join()
+
+        phases.assert()
+        assertThat(result).isInstanceOf(ReplayResult.Failure::class.java)
+        assertThat((result as ReplayResult.Failure).exception).isInstanceOf(ReplayCheckpointConflictException::class.java)
+    }
+
+    @Test
+    fun `when replay with unknown projection then returns Failure with ProjectionNotFoundException`(phases: TestPhases) {
+        phases.arrange()
+        val projectionName = "no_such_projection"
+
+        phases.act()
+        val result = replayService.replay(projectionName, rebuild = true)
+
+        phases.assert()
+        assertThat(result).isInstanceOf(ReplayResult.Failure::class.java)
+        assertThat((result as ReplayResult.Failure).exception).isInstanceOf(ProjectionNotFoundException::class.java)
+    }
+
+    private fun awaitCheckpointLockWaiter() {
+        val deadline = Instant.now().plusSeconds(10)
+        while (
+            jdbcTemplate.queryForObject(
+                """
+                SELECT count(*) FROM pg_stat_activity
+                WHERE wait_event_type = 'Lock' AND query LIKE 'UPDATE projection_checkpoints%'
+                """.trimIndent(),
+                Long::class.java,
+            ) == 0L
+        ) {
+            check(Instant.now() < deadline) { "No replay is waiting on the checkpoint lock" }
+            Thread.sleep(10)
+        }
+    }
+
+    private fun likeEvent(
+        postId: UUID,
+        userId: UUID,
+        type: LikeEventType,
+        occurredAt: Instant,
+    ) = LikeEvent(eventId = UUID.randomUUID(), postId = postId, userId = userId, eventType = type.value, occurredAt = occurredAt)
+
+    private fun viewEvent(
+        postId: UUID,
+        occurredAt: Instant,
+    ) = ViewEvent(eventId = UUID.randomUUID(), postId = postId, userId = UUID.randomUUID(), occurredAt = occurredAt)
+
+    private fun likedStatus(
+        postId: UUID,
+        userId: UUID,
+    ): Boolean? =
+        jdbcTemplate.queryForObject(
+            "SELECT liked FROM post_like_status WHERE post_id = ?::uuid AND user_id = ?::uuid",
+            Boolean::class.java,
+            postId.toString(),
+            userId.toString(),
+        )
+
+    private fun viewCount(postId: UUID): Long? =
+        jdbcTemplate.queryForObject("SELECT view_count FROM post_view_counts WHERE post_id = ?::uuid", Long::class.java, postId.toString())
+}
@@ -146,4 +146,61 @@ class ReplyServiceTest {
         assertThat(replies[0].postId).isEqualTo(reply1.replyPostId)
         assertThat(replies[1].postId).isEqualTo(reply2.replyPostId)
     }
+
+    @Test
+    fun `when getThread then returns ancestors root first and replies breadth first within depth and breadth`(phases: TestPhases) {
+        phases.arrange()
+        val userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+        val root = postService.createPost(userId, "Root") as PostCreationResult.Success
+        val parent = replyService.replyToPost(root.postId, userId, "Parent") as ReplyCreationResult.Success
+        val first = replyService.replyToPost(parent.replyPostId, userId, "First") as ReplyCreationResult.Success
+        val second = replyService.replyToPost(parent.replyPostId, userId, "Second") as ReplyCreationResult.Success
+        replyService.replyToPost(parent.replyPostId, userId, "Third beyond breadth")
+        val nested = replyService.replyToPost(first.replyPostId, userId, "Nested") as ReplyCreationResult.Success
+        replyService.replyToPost(nested.replyPostId, userId, "Beyond depth")
+
+        phases.act()
+        val result = replyService.getThread(parent.replyPostId, userId, depth = 2, breadth = 2)
+
+        phases.assert()
+        assertThat(result).isInstanceOf(ThreadRetrievalResult.Success::class.java)
+        val thread = result as ThreadRetrievalResult.Success
+        assertThat(thread.post.postId).isEqualTo(parent.replyPostId)
+        assertThat(thread.post.replyCount).isEqualTo(3)
+        assertThat(thread.ancestors.map { it.postId }).containsExactly(root.postId)
+        assertThat(thread.descendants.map { it.postId }).containsExactly(first.replyPostId, second.replyPostId, nested.replyPostId)
+        assertThat(thread.descendants.map { it.isLikedByCurrentUser }).containsOnly(false)
+    }
+
+    @Test
+    fun `when getThread through a deleted reply then leaves it out and keeps its replies`(phases: TestPhases) {
+        phases.arrange()
+        val userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+        val root = postService.createPost(userId, "Root") as PostCreationResult.Success
+        val deleted = replyService.replyToPost(root.postId, userId, "Deleted") as ReplyCreationResult.Success
+        val orphan = replyService.replyToPost(deleted.replyPostId, userId, "Orphan") as ReplyCreationResult.Success
+        postService.deletePost(deleted.replyPostId, userId)
+
+        phases.act()
+        val fromRoot = replyService.getThread(root.postId, null, depth = 2, breadth = 10)
+        val fromOrphan = replyService.getThread(orphan.replyPostId, null, depth = 2, breadth = 10)
+
+        phases.assert()
+        assertThat((fromRoot as ThreadRetrievalResult.Success).descendants.map { it.postId }).containsExactly(orphan.replyPostId)
+        assertThat((fromOrphan as ThreadRetrievalResult.Success).ancestors.map { it.postId }).containsExactly(root.postId)
+    }
+
+    @Test
+    fun `when getThread with non-existent post then returns PostNotFound`(phases: TestPhases) {
+        phases.arrange()
+        val nonExistentPostId = UUID.randomUUID()
+
+        phases.act()
+        val result = replyService.getThread(nonExistentPostId, null, depth = 2, breadth = 10)
+
+        phases.assert()
+        assertThat(result).isEqualTo(ThreadRetrievalResult.PostNotFound)
+    }
 }
@@ -0,0 +1,123 @@
+package com.example.timeline
+
+import com.example.TestcontainersConfiguration
+import com.example.auth.User
+import com.example.auth.UserRepository
+import com.example.post.PostCreationResult
+import com.example.post.PostService
+import com.example.test.tracing.SpanTimingExtension
+import com.example.test.tracing.TestPhases
+import org.assertj.core.api.Assertions.assertThat
+import org.junit.jupiter.api.BeforeEach
+import org.junit.jupiter.api.Test
+import org.junit.jupiter.api.extension.ExtendWith
+import org.springframework.beans.factory.annotation.Autowired
+import org.springframework.boot.test.context.SpringBootTest
+import org.springframework.context.annotation.Import
+import org.springframework.jdbc.core.JdbcTemplate
+import java.time.Instant
+import java.util.UUID
+
+@SpringBootTest
+@Import(TestcontainersConfiguration::class)
+@ExtendWith(SpanTimingExtension::class)
+class PostsMvRefreshTest {
+    @Autowired
+    private lateinit var postService: PostService
+
+    @Autowired
+    private lateinit var userRepository: UserRepository
+
+    @Autowired
+    private lateinit var mvRefreshLogRepository: MvRefreshLogRepository
+
+    @Autowired
+    private lateinit var jdbcTemplate: JdbcTemplate
+
+    private lateinit var userId: UUID
+
+    @BeforeEach
+    fun catchUpRefreshLog() {
+        jdbcTemplate.execute("REFRESH MATERIALIZED VIEW posts_mv")
+        jdbcTemplate.update(
+            "UPDATE mv_refresh_log SET last_refreshed_at = (SELECT COALESCE(MAX(occurred_at), now()) FROM post_events) WHERE view_name = ?",
+            TimelineService.POSTS_MV_NAME,
+        )
+        userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+    }
+
+    @Test
+    fun `when no post events are newer than the last refresh then skips the refresh`(phases: TestPhases) {
+        phases.arrange()
+        val before = mvRefreshLog()
+
+        phases.act()
+        val outcome = refreshIfNeeded(1, "0 seconds")
+
+        phases.assert()
+        assertThat(outcome).isEqualTo("skipped")
+        assertThat(mvRefreshLog().lastRefreshedAt).isEqualTo(before.lastRefreshedAt)
+    }
+
+    @Test
+    fun `when the pending delta is below the row limit and younger than max age then defers the refresh`(phases: TestPhases) {
+        phases.arrange()
+        val post = postService.createPost(userId, "Deferred") as PostCreationResult.Success
+        val before = mvRefreshLog()
+
+        phases.act()
+        val outcome = refreshIfNeeded(1000, "1 hour")
+
+        phases.assert()
+        assertThat(outcome).isEqualTo("deferred")
+        assertThat(mvRefreshLog().lastRefreshedAt).isEqualTo(before.lastRefreshedAt)
+        assertThat(postsMvContains(post.postId)).isFalse()
+    }
+
+    @Test
+    fun `when the pending delta reaches the row limit then refreshes early and records the duration`(phases: TestPhases) {
+        phases.arrange()
+        val posts = List(3) { i -> postService.createPost(userId, "Burst $i") as PostCreationResult.Success }
+        val before = mvRefreshLog()
+
+        phases.act()
+        val outcome = refreshIfNeeded(3, "1 hour")
+
+        phases.assert()
+        assertThat(outcome).isEqualTo("refreshed")
+        val after = mvRefreshLog()
+        assertThat(after.lastRefreshedAt).isAfter(before.lastRefreshedAt)
+        assertThat(after.lastRefreshDurationMs).isNotNull().isGreaterThanOrEqualTo(0)
+        assertThat(posts.map { postsMvContains(it.postId) }).containsOnly(true)
+    }
+
+    @Test
+    fun `when a pending delta is older than max age then refreshes below the row limit`(phases: TestPhases) {
+        phases.arrange()
+        val post = postService.createPost(userId, "Aged") as PostCreationResult.Success
+
+        phases.act()
+        val outcome = refreshIfNeeded(1000, "0 seconds")
+
+        phases.assert()
+        assertThat(outcome).isEqualTo("refreshed")
+        assertThat(postsMvContains(post.postId)).isTrue()
+    }
+
+    private fun refreshIfNeeded(
+        maxPendingRows: Int,
+        maxAge: String,
+    ): String? =
+        jdbcTemplate.queryForObject(
+            "SELECT refresh_posts_mv_if_needed(?, ?::interval)",
+            String::class.java,
+            maxPendingRows,
+            maxAge,
+        )
+
+    private fun mvRefreshLog(): MvRefreshLog = mvRefreshLogRepository.findById(TimelineService.POSTS_MV_NAME).orElseThrow()
+
+    private fun postsMvContains(postId: UUID): Boolean =
+        jdbcTemplate.queryForObject("SELECT EXISTS (SELECT 1 FROM posts_mv WHERE post_id = ?)", Boolean::class.java, postId) == true
+}
@@ -0,0 +1,67 @@
+package com.example.timeline
+
+import com.example.TestcontainersConfiguration
+import com.example.auth.User
+import com.example.auth.UserRepository
+import com.example.post.PostCreationResult
+import com.example.post.PostService
+import com.example.test.tracing.SpanTimingExtension
+import com.example.test.tracing.TestPhases
+import org.assertj.core.api.Assertions.assertThat
+import org.junit.jupiter.api.Test
+import org.junit.jupiter.api.extension.ExtendWith
+import org.springframework.beans.factory.annotation.Autowired
+import org.springframework.boot.test.context.SpringBootTest
+import org.springframework.context.annotation.Import
+import org.springframework.jdbc.core.JdbcTemplate
+import java.time.Instant
+import java.util.UUID
+
+// Any delta read trips degradation, so the first timeline read loads the delta and the following ones skip it
+@SpringBootTest(
+    properties = [
+        "app.degradation.latency-threshold.timeline-delta=PT0S",
+        "app.degradation.min-samples=1",
+        "app.degradation.cooldown=PT1H",
+    ],
+)
+@Import(TestcontainersConfiguration::class)
+@ExtendWith(SpanTimingExtension::class)
+class TimelineDegradationTest {
+    @Autowired
+    private lateinit var timelineService: TimelineService
+
+    @Autowired
+    private lateinit var postService: PostService
+
+    @Autowired
+    private lateinit var userRepository: UserRepository
+
+    @Autowired
+    private lateinit var mvRefreshLogRepository: MvRefreshLogRepository
+
+    @Autowired
+    private lateinit var jdbcTemplate: JdbcTemplate
+
+    @Test
+    fun `when getGlobalTimeline is degraded after a post was deleted then still excludes it from results`(phases: TestPhases) {
+        phases.arrange()
+        val userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+        val post = postService.createPost(userId, "Deleted while degraded") as PostCreationResult.Success
+        jdbcTemplate.execute("REFRESH MATERIALIZED VIEW posts_mv")
+        mvRefreshLogRepository.findById(TimelineService.POSTS_MV_NAME).ifPresent { log ->
+            log.lastRefreshedAt = Instant.now()
+            mvRefreshLogRepository.save(log)
+        }
+        postService.deletePost(post.postId, userId)
+        timelineService.getGlobalTimeline(100, null, null)
+
+        phases.act()
+        val result = timelineService.getGlobalTimeline(100, null, null) as TimelineResult.Success
+
+        phases.assert()
+        assertThat(result.degraded).isTrue()
+        assertThat(result.posts.map { it.postId }).doesNotContain(post.postId)
+    }
+}
@@ -8,8 +8,11 @@ import com.example.like.LikeEventRepository
 import com.example.like.LikeEventType
 import com.example.post.PostCreationResult
 import com.example.post.PostService
+import com.example.replay.ReplayResult
+import com.example.replay.ReplayService
 import com.example.test.tracing.SpanTimingExtension
 import com.example.test.tracing.TestPhases
+import com.example.trending.TrendingScoreProjection
 import com.example.view.ViewEventRepository
 import org.assertj.core.api.Assertions.assertThat
 import org.junit.jupiter.api.BeforeEach
@@ -44,6 +47,9 @@ class TimelineServiceTest {
     @Autowired
     private lateinit var mvRefreshLogRepository: MvRefreshLogRepository
 
+    @Autowired
+    private lateinit var replayService: ReplayService
+
     @Autowired
     private lateinit var jdbcTemplate: JdbcTemplate
 
@@ -131,6 +137,44 @@ class TimelineServiceTest {
         assertThat(page1.posts.map { it.postId }).doesNotContainAnyElementsOf(page2.posts.map { it.postId })
     }
 
+    @Test
+    fun `when getGlobalTimeline with nextCursor then returns the following page`(phases: TestPhases) {
+        phases.arrange()
+        val userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+
+        repeat(5) { i -> postService.createPost(userId, "Opaque cursor post $i") }
+
+        jdbcTemplate.execute("REFRESH MATERIALIZED VIEW posts_mv")
+        mvRefreshLogRepository.findById(TimelineService.POSTS_MV_NAME).ifPresent { log ->
+            log.lastRefreshedAt = Instant.now()
+            mvRefreshLogRepository.save(log)
+        }
+
+        phases.act()
+        val page1 = timelineService.getGlobalTimeline(2, null, null) as TimelineResult.Success
+        val byCursor = timelineService.getGlobalTimeline(2, null, null, page1.nextCursor) as TimelineResult.Success
+        val byPostId = timelineService.getGlobalTimeline(2, page1.posts.last().postId, null) as TimelineResult.Success
+
+        phases.assert()
+        assertThat(page1.nextCursor).isNotNull()
+        assertThat(byCursor.posts.map { it.postId }).isEqualTo(byPostId.posts.map { it.postId })
+        assertThat(page1.posts.map { it.postId }).doesNotContainAnyElementsOf(byCursor.posts.map { it.postId })
+    }
+
+    @Test
+    fun `when getGlobalTimeline with tampered cursor then returns Failure with InvalidTimelineCursorException`(phases: TestPhases) {
+        phases.arrange()
+        val tampered = "not-a-valid-cursor"
+
+        phases.act()
+        val result = timelineService.getGlobalTimeline(20, null, null, tampered)
+
+        phases.assert()
+        assertThat(result).isInstanceOf(TimelineResult.Failure::class.java)
+        assertThat((result as TimelineResult.Failure).exception).isInstanceOf(InvalidTimelineCursorException::class.java)
+    }
+
     @Test
     fun `when getGlobalTimeline with liked post then returns its like count`(phases: TestPhases) {
         phases.arrange()
@@ -209,6 +253,62 @@ class TimelineServiceTest {
         assertThat(result.posts.map { it.postId }).doesNotContain(post.postId)
     }
 
+    @Test
+    fun `when getTrendingTimeline after replaying engagement then ranks the more engaged post first`(phases: TestPhases) {
+        phases.arrange()
+        val userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+
+        val hotPost = postService.createPost(userId, "Hot post") as PostCreationResult.Success
+        val coldPost = postService.createPost(userId, "Cold post") as PostCreationResult.Success
+        // Older than the replay's commit lag so the incremental replay picks them up
+        val occurredAt = Instant.now().minusSeconds(60)
+        repeat(5) { saveLike(hotPost.postId, occurredAt) }
+        saveLike(coldPost.postId, occurredAt)
+
+        jdbcTemplate.execute("REFRESH MATERIALIZED VIEW posts_mv")
+        mvRefreshLogRepository.findById(TimelineService.POSTS_MV_NAME).ifPresent { log ->
+            log.lastRefreshedAt = Instant.now()
+            mvRefreshLogRepository.save(log)
+        }
+        assertThat(replayService.replay(TrendingScoreProjection.NAME, rebuild = false)).isInstanceOf(ReplayResult.Success::class.java)
+
+        phases.act()
+        val result = timelineService.getTrendingTimeline(100, null) as TimelineResult.Success
+
+        phases.assert()
+        val returnedIds = result.posts.map { it.postId }
+        val hotIndex = returnedIds.indexOf(hotPost.postId)
+        val coldIndex = returnedIds.indexOf(coldPost.postId)
+        assertThat(hotIndex).isNotEqualTo(-1)
+        assertThat(coldIndex == -1 || hotIndex < coldIndex).isTrue()
+        assertThat(result.nextCursor).isNull()
+    }
+
+    @Test
+    fun `when getTrendingTimeline with post deleted after scoring then excludes it from results`(phases: TestPhases) {
+        phases.arrange()
+        val userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+
+        val post = postService.createPost(userId, "Trending then deleted") as PostCreationResult.Success
+        repeat(5) { saveLike(post.postId, Instant.now().minusSeconds(60)) }
+
+        jdbcTemplate.execute("REFRESH MATERIALIZED VIEW posts_mv")
+        mvRefreshLogRepository.findById(TimelineService.POSTS_MV_NAME).ifPresent { log ->
+            log.lastRefreshedAt = Instant.now()
+            mvRefreshLogRepository.save(log)
+        }
+        assertThat(replayService.replay(TrendingScoreProjection.NAME, rebuild = false)).isInstanceOf(ReplayResult.Success::class.java)
+        postService.deletePost(post.postId, userId)
+
+        phases.act()
+        val result = timelineService.getTrendingTimeline(100, null) as TimelineResult.Success
+
+        phases.assert()
+        assertThat(result.posts.map { it.postId }).doesNotContain(post.postId)
+    }
+
     @Test
     fun `when getUserTimeline with target user then returns only posts by that user`(phases: TestPhases) {
         phases.arrange()
@@ -355,6 +455,121 @@ class TimelineServiceTest {
         assertThat((result as TimelineResult.Failure).exception).isInstanceOf(IllegalArgumentException::class.java)
     }
 
+    @Test
+    fun `when getUserTimeline with nextCursor then returns the following page`(phases: TestPhases) {
+        phases.arrange()
+        val userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+
+        repeat(3) { i -> postService.createPost(userId, "User opaque cursor post $i") }
+
+        phases.act()
+        val page1 = timelineService.getUserTimeline(userId, 2, null, null) as TimelineResult.Success
+        val page2 = timelineService.getUserTimeline(userId, 2, null, null, page1.nextCursor) as TimelineResult.Success
+
+        phases.assert()
+        assertThat(page1.posts).hasSize(2)
+        assertThat(page2.posts).hasSize(1)
+        assertThat(page2.nextCursor).isNull()
+        assertThat(page1.posts.map { it.postId }).doesNotContainAnyElementsOf(page2.posts.map { it.postId })
+    }
+
+    @Test
+    fun `when getUserTimeline with cursor issued for another user then returns Failure with InvalidTimelineCursorException`(phases: TestPhases) {
+        phases.arrange()
+        val user1 = UUID.randomUUID()
+        val user2 = UUID.randomUUID()
+        userRepository.save(User(user1, Instant.now()))
+        userRepository.save(User(user2, Instant.now()))
+
+        repeat(2) { i -> postService.createPost(user2, "User2 post $i") }
+        val user2Page = timelineService.getUserTimeline(user2, 1, null, null) as TimelineResult.Success
+
+        phases.act()
+        val result = timelineService.getUserTimeline(user1, 10, null, null, user2Page.nextCursor)
+
+        phases.assert()
+        assertThat(result).isInstanceOf(TimelineResult.Failure::class.java)
+        assertThat((result as TimelineResult.Failure).exception).isInstanceOf(InvalidTimelineCursorException::class.java)
+    }
+
+    @Test
+    fun `when getUserTimeline with ifNoneMatch of the current entity tag then returns NotModified`(phases: TestPhases) {
+        phases.arrange()
+        val userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+        repeat(2) { i -> postService.createPost(userId, "Conditional post $i") }
+        val first = timelineService.getUserTimeline(userId, 20, null, null) as TimelineResult.Success
+
+        phases.act()
+        val result = timelineService.getUserTimeline(userId, 20, null, null, ifNoneMatch = first.entityTag)
+
+        phases.assert()
+        assertThat(first.entityTag).isNotNull()
+        assertThat(result).isEqualTo(TimelineResult.NotModified(first.entityTag!!))
+    }
+
+    @Test
+    fun `when getUserTimeline with ifNoneMatch after a like on the page then returns Success with a new entity tag`(phases: TestPhases) {
+        phases.arrange()
+        val userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+        val post = postService.createPost(userId, "Conditional liked post") as PostCreationResult.Success
+        val first = timelineService.getUserTimeline(userId, 20, null, null) as TimelineResult.Success
+        likeEventRepository.save(
+            LikeEvent(
+                eventId = UUID.randomUUID(),
+                postId = post.postId,
+                userId = userId,
+                eventType = LikeEventType.LIKED.value,
+                occurredAt = Instant.now(),
+            ),
+        )
+
+        phases.act()
+        val result = timelineService.getUserTimeline(userId, 20, null, null, ifNoneMatch = first.entityTag)
+
+        phases.assert()
+        assertThat(result).isInstanceOf(TimelineResult.Success::class.java)
+        val success = result as TimelineResult.Success
+        assertThat(success.posts.single().likeCount).isEqualTo(1)
+        assertThat(success.entityTag).isNotEqualTo(first.entityTag)
+    }
+
+    @Test
+    fun `when getUserTimeline with currentUserId then returns no entity tag`(phases: TestPhases) {
+        phases.arrange()
+        val userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+        postService.createPost(userId, "Viewed post")
+
+        phases.act()
+        val result = timelineService.getUserTimeline(userId, 20, null, UUID.randomUUID()) as TimelineResult.Success
+
+        phases.assert()
+        assertThat(result.entityTag).isNull()
+    }
+
+    @Test
+    fun `when exportUserTimeline with MV and delta posts then streams every active post newest first in chunks`(phases: TestPhases) {
+        phases.arrange()
+        val userId = UUID.randomUUID()
+        userRepository.save(User(userId, Instant.now()))
+        val mvPosts = (0 until 3).map { i -> postService.createPost(userId, "Export MV post $i") as PostCreationResult.Success }
+        refreshMv()
+        val deltaPosts = (0 until 2).map { i -> postService.createPost(userId, "Export delta post $i") as PostCreationResult.Success }
+        postService.deletePost(mvPosts[1].postId, userId)
+
+        phases.act()
+        val result = timelineService.exportUserTimeline(userId, chunkSize = 2) as TimelineExportResult.Success
+        val chunks = result.chunks.toList()
+
+        phases.assert()
+        val expected = (mvPosts + deltaPosts).filter { it.postId != mvPosts[1].postId }.reversed().map { it.postId }
+        assertThat(chunks.map { it.size }).containsExactly(2, 2)
+        assertThat(chunks.flatten().map { it.postId }).containsExactlyElementsOf(expected)
+    }
+
     @Test
     fun `when getGlobalTimeline with currentUserId then returns isLikedByCurrentUser`(phases: TestPhases) {
         phases.arrange()
@@ -479,4 +694,21 @@ class TimelineServiceTest {
         val after = viewEventRepository.countByPostId(post.postId)
         assertThat(after).isEqualTo(before)
     }
+
+    private fun saveLike(
+        postId: UUID,
+        occurredAt: Instant,
+    ) {
+        val likerId = UUID.randomUUID()
+        userRepository.save(User(likerId, Instant.now()))
+        likeEventRepository.save(
+            LikeEvent(
+                eventId = UUID.randomUUID(),
+                postId = postId,
+                userId = likerId,
+                eventType = LikeEventType.LIKED.value,
+                occurredAt = occurredAt,
+            ),
+        )
+    }
 }
@@ -4,6 +4,7 @@ import com.example.TestcontainersConfiguration
 import com.example.auth.User
 import com.example.auth.UserRepository
 import com.example.post.PostCreationResult
+import com.example.post.PostRetrievalResult
 import com.example.post.PostService
 import com.example.test.tracing.SpanTimingExtension
 import com.example.test.tracing.TestPhases
@@ -13,6 +14,7 @@ import org.junit.jupiter.api.extension.ExtendWith
 import org.springframework.beans.factory.annotation.Autowired
 import org.springframework.boot.test.context.SpringBootTest
 import org.springframework.context.annotation.Import
+import org.springframework.jdbc.core.JdbcTemplate
 import java.time.Instant
 import java.util.UUID
 
@@ -32,6 +34,9 @@ class ViewServiceTest {
     @Autowired
     private lateinit var userRepository: UserRepository
 
+    @Autowired
+    private lateinit var jdbcTemplate: JdbcTemplate
+
     @Test
     fun `when recordView with valid request then returns Success and persists event`(phases: TestPhases) {
         phases.arrange()
@@ -56,6 +61,39 @@ class ViewServiceTest {
         assertThat(events[0].userId).isEqualTo(userId)
     }
 
+    @Test
+    fun `when recordView repeatedly by the same users then uniqueViewCount counts each viewer once`(phases: TestPhases) {
+        phases.arrange()
+        val authorId = UUID.randomUUID()
+        val viewerIds = List(3) { UUID.randomUUID() }
+        (viewerIds + authorId).forEach { userRepository.save(User(it, Instant.now())) }
+        val postId = (postService.createPost(authorId, "Viewed post") as PostCreationResult.Success).postId
+
+        phases.act()
+        repeat(2) { viewerIds.forEach { viewService.recordView(postId, it) } }
+
+        phases.assert()
+        val post = postService.getPost(postId, null) as PostRetrievalResult.Success
+        assertThat(post.viewCount).isEqualTo(6)
+        assertThat(post.uniqueViewCount).isEqualTo(3)
+    }
+
+    @Test
+    fun `when recordView by a viewer already counted then leaves the sketch row unlocked`(phases: TestPhases) {
+        phases.arrange()
+        val viewerId = UUID.randomUUID()
+        userRepository.save(User(viewerId, Instant.now()))
+        val postId = (postService.createPost(viewerId, "Viewed post") as PostCreationResult.Success).postId
+        viewService.recordView(postId, viewerId)
+
+        phases.act()
+        val result = viewService.recordView(postId, viewerId)
+
+        phases.assert()
+        assertThat(result).isInstanceOf(ViewResult.Success::class.java)
+        assertThat(sketchRowLocker(postId)).isEqualTo("0")
+    }
+
     @Test
     fun `when recordView with non-existent post then returns Failure with ViewPostNotFoundException`(phases: TestPhases) {
         phases.arrange()
@@ -111,4 +149,12 @@ class ViewServiceTest {
         val getPostResult = postService.getPost(postId, null) as com.example.post.PostRetrievalResult.Success
         assertThat(getPostResult.viewCount).isEqualTo(2)
     }
+
+    // An upsert whose update is skipped still locks the row, which leaves its transaction id in xmax
+    private fun sketchRowLocker(postId: UUID): String =
+        jdbcTemplate.queryForObject(
+            "SELECT xmax::text FROM post_view_sketches WHERE post_id = ?::uuid",
+            String::class.java,
+            postId.toString(),
+        )!!
 }
@@ -0,0 +1,66 @@
+package com.example.like
+
+import org.openjdk.jmh.annotations.Benchmark
+import org.openjdk.jmh.annotations.Param
+import org.openjdk.jmh.annotations.Scope
+import org.openjdk.jmh.annotations.Setup
+import org.openjdk.jmh.annotations.State
+import java.util.Random
+import java.util.UUID
+
+/**
+ * Folds the like events of a single post.
+ *
+ * `viral` gives every event a distinct user, so the set of liked users grows with [eventCount].
+ * `churn` lets [CHURN_USER_COUNT] users like and unlike repeatedly, so the state stays small.
+ */
+@State(Scope.Benchmark)
+open class AggregatedLikesBenchmark {
+    @Param("10", "1000", "100000", "1000000")
+    @JvmField
+    var eventCount: Int = 0
+
+    @Param("viral", "churn")
+    @JvmField
+    var shape: String = ""
+
+    private lateinit var events: List<LikeRow>
+    private lateinit var lastUserId: UUID
+
+    @Setup
+    fun setUp() {
+        events = syntheticLikeEvents(eventCount, shape)
+        lastUserId = events.last().userId
+    }
+
+    @Benchmark
+    fun aggregate(): AggregatedLikes = aggregateLikeEvents(events)
+
+    @Benchmark
+    fun userLikeStatus(): UserLikeStatus = UserLikeStatus.fromEvents(events, lastUserId)
+}
+
+private const val CHURN_USER_COUNT = 1000
+
+private fun syntheticLikeEvents(
+    eventCount: Int,
+    shape: String,
+): List<LikeRow> {
+    val random = Random(42)
+    val postId = UUID(random.nextLong(), random.nextLong())
+    val churnUserIds = List(CHURN_USER_COUNT) { UUID(random.nextLong(), random.nextLong()) }
+    return List(eventCount) {
+        val (userId, eventType) =
+            if (shape == "viral") {
+                UUID(random.nextLong(), random.nextLong()) to LikeEventType.LIKED
+            } else {
+                churnUserIds[random.nextInt(CHURN_USER_COUNT)] to
+                    if (random.nextBoolean()) LikeEventType.LIKED else LikeEventType.UNLIKED
+            }
+        LikeRow(
+            postId = postId,
+            userId = userId,
+            type = eventType,
+        )
+    }
+}
@@ -0,0 +1,36 @@
+package com.example.post
+
+import org.openjdk.jmh.annotations.Benchmark
+import org.openjdk.jmh.annotations.Param
+import org.openjdk.jmh.annotations.Scope
+import org.openjdk.jmh.annotations.Setup
+import org.openjdk.jmh.annotations.State
+import org.openjdk.jmh.infra.Blackhole
+import tools.jackson.databind.ObjectMapper
+import java.util.UUID
+
+/**
+ * Aggregates the replies of a single viral post, as the timeline and post detail do when counting replies.
+ */
+@State(Scope.Benchmark)
+open class AggregatedPostBenchmark {
+    @Param("10", "1000", "100000", "1000000")
+    @JvmField
+    var eventCount: Int = 0
+
+    private val objectMapper = ObjectMapper()
+    private lateinit var replyEventsByPostId: Map<UUID, List<PostEvent>>
+
+    @Setup
+    fun setUp() {
+        replyEventsByPostId = syntheticPostEventsByPostId(eventCount, objectMapper, replyToPostId = UUID(0, 1))
+    }
+
+    @Benchmark
+    fun activeReplies(): Int = countActiveReplies(replyEventsByPostId, objectMapper)
+
+    @Benchmark
+    fun aggregateEachPost(blackhole: Blackhole) {
+        replyEventsByPostId.values.forEach { blackhole.consume(aggregatePostEvents(it, objectMapper)) }
+    }
+}
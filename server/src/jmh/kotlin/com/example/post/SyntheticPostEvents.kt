@@ -0,0 +1,65 @@
+package com.example.post
+
+import tools.jackson.databind.ObjectMapper
+import java.time.Instant
+import java.util.Random
+import java.util.UUID
+
+/**
+ * Generates about [eventCount] post events, grouped by post and ordered by occurredAt.
+ *
+ * Every post gets a `post_created` event, [DELETED_PERCENT]% are also deleted, and
+ * [DELETE_ONLY_PERCENT]% only have a `post_deleted` event, like posts whose creation is
+ * already in posts_mv. Posts are spread over [userCount] authors.
+ */
+fun syntheticPostEventsByPostId(
+    eventCount: Int,
+    objectMapper: ObjectMapper,
+    userCount: Int = 1000,
+    replyToPostId: UUID? = null,
+): Map<UUID, List<PostEvent>> {
+    val random = Random(42)
+    val userIds = List(userCount) { UUID(random.nextLong(), random.nextLong()) }
+    val start = Instant.parse("2025-01-01T00:00:00Z")
+    val eventsByPostId = LinkedHashMap<UUID, List<PostEvent>>()
+    var generated = 0
+    while (generated < eventCount) {
+        val postId = UUID(random.nextLong(), random.nextLong())
+        val userId = userIds[random.nextInt(userCount)]
+        val createdAt = start.plusMillis(generated.toLong())
+        val roll = random.nextInt(100)
+        val created =
+            PostEvent(
+                eventId = UUID(random.nextLong(), random.nextLong()),
+                postId = postId,
+                replyToPostId = replyToPostId,
+                eventType = PostEventType.POST_CREATED.value,
+                eventData =
+                    objectMapper.writeValueAsString(
+                        mapOf("userId" to userId.toString(), "content" to "Synthetic post $generated"),
+                    ),
+                occurredAt = createdAt,
+            )
+        val deleted =
+            PostEvent(
+                eventId = UUID(random.nextLong(), random.nextLong()),
+                postId = postId,
+                replyToPostId = replyToPostId,
+                eventType = PostEventType.POST_DELETED.value,
+                eventData = objectMapper.writeValueAsString(mapOf("userId" to userId.toString())),
+                occurredAt = createdAt.plusSeconds(1),
+            )
+        val events =
+            when {
+                roll < DELETE_ONLY_PERCENT -> listOf(deleted)
+                roll < DELETE_ONLY_PERCENT + DELETED_PERCENT -> listOf(created, deleted)
+                else -> listOf(created)
+            }
+        eventsByPostId[postId] = events
+        generated += events.size
+    }
+    return eventsByPostId
+}
+
+private const val DELETED_PERCENT = 10
+private const val DELETE_ONLY_PERCENT = 5
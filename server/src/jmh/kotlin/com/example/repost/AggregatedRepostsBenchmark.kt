@@ -0,0 +1,66 @@
+package com.example.repost
+
+import org.openjdk.jmh.annotations.Benchmark
+import org.openjdk.jmh.annotations.Param
+import org.openjdk.jmh.annotations.Scope
+import org.openjdk.jmh.annotations.Setup
+import org.openjdk.jmh.annotations.State
+import java.util.Random
+import java.util.UUID
+
+/**
+ * Folds the repost events of a single post.
+ *
+ * `viral` gives every event a distinct user, so the set of reposted users grows with [eventCount].
+ * `churn` lets [CHURN_USER_COUNT] users repost and unrepost repeatedly, so the state stays small.
+ */
+@State(Scope.Benchmark)
+open class AggregatedRepostsBenchmark {
+    @Param("10", "1000", "100000", "1000000")
+    @JvmField
+    var eventCount: Int = 0
+
+    @Param("viral", "churn")
+    @JvmField
+    var shape: String = ""
+
+    private lateinit var events: List<RepostRow>
+    private lateinit var lastUserId: UUID
+
+    @Setup
+    fun setUp() {
+        events = syntheticRepostEvents(eventCount, shape)
+        lastUserId = events.last().userId
+    }
+
+    @Benchmark
+    fun aggregate(): AggregatedReposts = aggregateRepostEvents(events)
+
+    @Benchmark
+    fun userRepostStatus(): UserRepostStatus = UserRepostStatus.fromEvents(events, lastUserId)
+}
+
+private const val CHURN_USER_COUNT = 1000
+
+private fun syntheticRepostEvents(
+    eventCount: Int,
+    shape: String,
+): List<RepostRow> {
+    val random = Random(42)
+    val postId = UUID(random.nextLong(), random.nextLong())
+    val churnUserIds = List(CHURN_USER_COUNT) { UUID(random.nextLong(), random.nextLong()) }
+    return List(eventCount) {
+        val (userId, eventType) =
+            if (shape == "viral") {
+                UUID(random.nextLong(), random.nextLong()) to RepostEventType.REPOSTED
+            } else {
+                churnUserIds[random.nextInt(CHURN_USER_COUNT)] to
+                    if (random.nextBoolean()) RepostEventType.REPOSTED else RepostEventType.UNREPOSTED
+            }
+        RepostRow(
+            postId = postId,
+            userId = userId,
+            type = eventType,
+        )
+    }
+}
@@ -0,0 +1,42 @@
+package com.example.timeline
+
+import com.example.post.PostEvent
+import com.example.post.syntheticPostEventsByPostId
+import org.openjdk.jmh.annotations.Benchmark
+import org.openjdk.jmh.annotations.Param
+import org.openjdk.jmh.annotations.Scope
+import org.openjdk.jmh.annotations.Setup
+import org.openjdk.jmh.annotations.State
+import tools.jackson.databind.ObjectMapper
+import java.util.UUID
+
+/**
+ * Builds the timeline delta from every post event since the last posts_mv refresh.
+ *
+ * A large [eventCount] models a refresh that is late or a burst of writes between refreshes.
+ */
+@State(Scope.Benchmark)
+open class TimelineDeltaBenchmark {
+    @Param("10", "1000", "100000", "1000000")
+    @JvmField
+    var eventCount: Int = 0
+
+    private val objectMapper = ObjectMapper()
+    private lateinit var deltaByPostId: Map<UUID, List<PostEvent>>
+    private lateinit var targetUserId: UUID
+
+    @Setup
+    fun setUp() {
+        deltaByPostId = syntheticPostEventsByPostId(eventCount, objectMapper)
+        targetUserId = aggregateAuthor(deltaByPostId.values.first())
+    }
+
+    @Benchmark
+    fun globalDelta(): TimelineDelta = buildTimelineDelta(deltaByPostId, { _ -> true }, objectMapper)
+
+    @Benchmark
+    fun userDelta(): TimelineDelta = buildTimelineDelta(deltaByPostId, { userId -> userId == targetUserId }, objectMapper)
+
+    private fun aggregateAuthor(events: List<PostEvent>): UUID =
+        UUID.fromString(objectMapper.readValue(events.first().eventData, Map::class.java)["userId"] as String)
+}
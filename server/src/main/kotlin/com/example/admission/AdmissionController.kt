@@ -0,0 +1,200 @@
+package com.example.admission
+
+import io.micrometer.core.instrument.Counter
+import io.micrometer.core.instrument.Gauge
+import io.micrometer.core.instrument.MeterRegistry
+import org.springframework.core.env.Environment
+import org.springframework.core.env.getProperty
+import org.springframework.stereotype.Component
+import java.time.Duration
+import java.util.concurrent.Semaphore
+import java.util.concurrent.TimeUnit
+import java.util.concurrent.atomic.AtomicInteger
+
+/**
+ * Endpoint classes in priority order. A class is refused outright once the requests queued across all classes reach
+ * its shedding depth, so view ingestion is dropped at the first sign of queueing while post writes and reads are
+ * only refused when their own queue is full or they have waited too long.
+ *
+ * Every class needs a database connection, so together the classes run no more requests than the Hikari pool has
+ * connections; otherwise reads could take them all and post writes would wait for one inside the pool, out of sight
+ * of the queue limits. Admitted and queued requests all hold a Tomcat thread, and together the defaults stay well
+ * below Tomcat's 200.
+ */
+enum class AdmissionClass(
+    val value: String,
+    val defaultLimits: AdmissionLimits,
+) {
+    POST_WRITE("post_write", AdmissionLimits(maxConcurrent = 3, maxQueued = 40, maxWait = Duration.ofSeconds(2))),
+    READ("read", AdmissionLimits(maxConcurrent = 4, maxQueued = 60, maxWait = Duration.ofSeconds(1))),
+    ENGAGEMENT("engagement", AdmissionLimits(maxConcurrent = 2, maxQueued = 20, maxWait = Duration.ofMillis(500), shedAtQueued = 40)),
+    BULK("bulk", AdmissionLimits(maxConcurrent = 1, maxQueued = 0, maxWait = Duration.ZERO, shedAtQueued = 1)),
+}
+
+data class AdmissionLimits(
+    val maxConcurrent: Int,
+    val maxQueued: Int,
+    val maxWait: Duration,
+    val shedAtQueued: Int = Int.MAX_VALUE,
+)
+
+enum class RejectionReason(
+    val value: String,
+) {
+    SHED("shed"),
+    QUEUE_FULL("queue_full"),
+    TIMEOUT("timeout"),
+}
+
+sealed interface Admission {
+    data class Admitted(
+        val admissionClass: AdmissionClass,
+    ) : Admission
+
+    data class Rejected(
+        val admissionClass: AdmissionClass,
+        val reason: RejectionReason,
+    ) : Admission
+}
+
+/**
+ * Classifies a request by method and path, or returns null for paths outside the API such as actuator endpoints.
+ *
+ * Post creation, replies, deletion and login are [AdmissionClass.POST_WRITE]; likes and reposts are
+ * [AdmissionClass.ENGAGEMENT]; views, batch ingestion and exports are [AdmissionClass.BULK]; other GETs are reads.
+ */
+fun admissionClassOf(
+    method: String,
+    path: String,
+): AdmissionClass? {
+    val segments = path.split('/').filter { it.isNotEmpty() }
+    return when {
+        segments.firstOrNull() !in API_ROOTS -> null
+        segments.first() == "engagement" || segments.last() in BULK_RESOURCES -> AdmissionClass.BULK
+        segments.first() == "posts" && segments.size == 3 && segments[2] in ENGAGEMENT_RESOURCES -> AdmissionClass.ENGAGEMENT
+        method == "GET" -> AdmissionClass.READ
+        else -> AdmissionClass.POST_WRITE
+    }
+}
+
+private val API_ROOTS = setOf("auth", "posts", "timeline", "engagement")
+private val BULK_RESOURCES = setOf("views", "export")
+private val ENGAGEMENT_RESOURCES = setOf("likes", "reposts")
+
+/**
+ * Per-class concurrency limits with bounded waiting. Limits default to [AdmissionClass.defaultLimits] and can be set
+ * per class with `app.admission.<class>.max-concurrent`, `max-queued`, `max-wait` and `shed-at-queued`.
+ *
+ * Startup fails when the classes together could admit more requests than `spring.datasource.hikari.maximum-pool-size`,
+ * or when their admitted and queued requests could take every one of `server.tomcat.threads.max`.
+ */
+@Component
+class AdmissionController(
+    environment: Environment,
+    meterRegistry: MeterRegistry,
+) {
+    private val gates =
+        AdmissionClass.entries.associateWith { admissionClass ->
+            val prefix = "app.admission.${admissionClass.value.replace('_', '-')}"
+            val defaults = admissionClass.defaultLimits
+            Gate(
+                AdmissionLimits(
+                    maxConcurrent = environment.getProperty<Int>("$prefix.max-concurrent") ?: defaults.maxConcurrent,
+                    maxQueued = environment.getProperty<Int>("$prefix.max-queued") ?: defaults.maxQueued,
+                    maxWait = environment.getProperty<Duration>("$prefix.max-wait") ?: defaults.maxWait,
+                    shedAtQueued = environment.getProperty<Int>("$prefix.shed-at-queued") ?: defaults.shedAtQueued,
+                ),
+            )
+        }
+
+    private val totalQueued = AtomicInteger()
+
+    private val rejections =
+        AdmissionClass.entries.associateWith { admissionClass ->
+            RejectionReason.entries.associateWith { reason ->
+                Counter
+                    .builder("app.admission.rejected")
+                    .tags("class", admissionClass.value, "reason", reason.value)
+                    .register(meterRegistry)
+            }
+        }
+
+    init {
+        val poolSize = environment.getProperty<Int>("spring.datasource.hikari.maximum-pool-size") ?: DEFAULT_POOL_SIZE
+        val admitted = gates.values.sumOf { it.limits.maxConcurrent }
+        check(admitted <= poolSize) {
+            "Admission limits admit $admitted concurrent requests, more than spring.datasource.hikari.maximum-pool-size ($poolSize)"
+        }
+        val requestThreads = environment.getProperty<Int>("server.tomcat.threads.max") ?: DEFAULT_REQUEST_THREADS
+        val heldThreads = gates.values.sumOf { it.limits.maxConcurrent + it.limits.maxQueued }
+        check(heldThreads < requestThreads) {
+            "Admission limits let $heldThreads requests hold a thread, which must stay below server.tomcat.threads.max ($requestThreads)"
+        }
+        gates.forEach { (admissionClass, gate) ->
+            Gauge
+                .builder("app.admission.in_flight") { gate.inFlight.toDouble() }
+                .tags("class", admissionClass.value)
+                .register(meterRegistry)
+            Gauge
+                .builder("app.admission.queued") { gate.queued.get().toDouble() }
+                .tags("class", admissionClass.value)
+                .register(meterRegistry)
+        }
+    }
+
+    /** Admits the request, waiting up to the class's max wait for a slot; every [Admission.Admitted] must be released. */
+    fun admit(admissionClass: AdmissionClass): Admission {
+        val gate = gates.getValue(admissionClass)
+        val admission =
+            when {
+                totalQueued.get() >= gate.limits.shedAtQueued -> Admission.Rejected(admissionClass, RejectionReason.SHED)
+                // The timed form, unlike tryAcquire(), does not barge ahead of requests already waiting
+                gate.permits.tryAcquire(0, TimeUnit.NANOSECONDS) -> Admission.Admitted(admissionClass)
+                else -> awaitSlot(admissionClass, gate)
+            }
+        if (admission is Admission.Rejected) rejections.getValue(admissionClass).getValue(admission.reason).increment()
+        return admission
+    }
+
+    fun release(admission: Admission.Admitted) {
+        gates.getValue(admission.admissionClass).permits.release()
+    }
+
+    private fun awaitSlot(
+        admissionClass: AdmissionClass,
+        gate: Gate,
+    ): Admission {
+        if (gate.queued.incrementAndGet() > gate.limits.maxQueued) {
+            gate.queued.decrementAndGet()
+            return Admission.Rejected(admissionClass, RejectionReason.QUEUE_FULL)
+        }
+        totalQueued.incrementAndGet()
+        return try {
+            if (gate.permits.tryAcquire(gate.limits.maxWait.toNanos(), TimeUnit.NANOSECONDS)) {
+                Admission.Admitted(admissionClass)
+            } else {
+                Admission.Rejected(admissionClass, RejectionReason.TIMEOUT)
+            }
+        } finally {
+            totalQueued.decrementAndGet()
+            gate.queued.decrementAndGet()
+        }
+    }
+
+    private class Gate(
+        val limits: AdmissionLimits,
+    ) {
+        // Fair, so waiting requests are admitted in arrival order
+        val permits = Semaphore(limits.maxConcurrent, true)
+        val queued = AtomicInteger()
+
+        val inFlight: Int
+            get() = limits.maxConcurrent - permits.availablePermits()
+    }
+
+    companion object {
+        // Defaults of HikariCP's maximumPoolSize and Tomcat's threads.max
+        const val DEFAULT_POOL_SIZE = 10
+        const val DEFAULT_REQUEST_THREADS = 200
+    }
+}
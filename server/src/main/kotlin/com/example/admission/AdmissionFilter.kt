@@ -0,0 +1,49 @@
+package com.example.admission
+
+import jakarta.servlet.FilterChain
+import jakarta.servlet.http.HttpServletRequest
+import jakarta.servlet.http.HttpServletResponse
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty
+import org.springframework.core.Ordered
+import org.springframework.core.annotation.Order
+import org.springframework.http.HttpHeaders
+import org.springframework.http.HttpStatus
+import org.springframework.stereotype.Component
+import org.springframework.web.filter.OncePerRequestFilter
+
+/** Runs ahead of the other filters so a refused request costs no more than its classification. */
+@Component
+@Order(Ordered.HIGHEST_PRECEDENCE)
+@ConditionalOnProperty("app.admission.enabled", matchIfMissing = true)
+class AdmissionFilter(
+    private val admissionController: AdmissionController,
+) : OncePerRequestFilter() {
+    override fun doFilterInternal(
+        request: HttpServletRequest,
+        response: HttpServletResponse,
+        filterChain: FilterChain,
+    ) {
+        val admissionClass = admissionClassOf(request.method, request.requestURI.removePrefix(request.contextPath))
+        if (admissionClass == null) {
+            filterChain.doFilter(request, response)
+            return
+        }
+
+        when (val admission = admissionController.admit(admissionClass)) {
+            is Admission.Admitted ->
+                try {
+                    filterChain.doFilter(request, response)
+                } finally {
+                    admissionController.release(admission)
+                }
+            is Admission.Rejected -> {
+                response.status = HttpStatus.SERVICE_UNAVAILABLE.value()
+                response.setHeader(HttpHeaders.RETRY_AFTER, RETRY_AFTER_SECONDS)
+            }
+        }
+    }
+
+    companion object {
+        const val RETRY_AFTER_SECONDS = "1"
+    }
+}
@@ -1,5 +1,6 @@
 package com.example.auth
 
+import com.example.id.timeOrderedUuid
 import io.opentelemetry.instrumentation.annotations.WithSpan
 import org.springframework.dao.DataAccessException
 import org.springframework.stereotype.Service
@@ -22,7 +23,7 @@ class AuthService(
 ) {
     @WithSpan
     fun generateUserId(): AuthResult {
-        val userId = UUID.randomUUID()
+        val userId = timeOrderedUuid()
         val user = User(id = userId, createdAt = Instant.now())
 
         return try {
@@ -0,0 +1,46 @@
+package com.example.coalescing
+
+import com.example.datasource.DataSourceRoute
+import com.example.metrics.RequestMetrics
+import java.util.concurrent.CompletableFuture
+import java.util.concurrent.CompletionException
+import java.util.concurrent.ConcurrentHashMap
+
+/**
+ * Coalesces concurrent computations of the same key: the first caller runs the block, callers arriving while it runs
+ * wait for and share its value or exception, and the key is released as soon as the block returns, so a caller that
+ * arrives afterwards computes afresh. Nothing is cached beyond the lifetime of one computation.
+ *
+ * Keys are scoped to the caller's [DataSourceRoute], so a primary read never receives a value read from the replica.
+ */
+class SingleFlight<K : Any, V> {
+    private val inFlight = ConcurrentHashMap<Pair<K, DataSourceRoute>, CompletableFuture<V>>()
+
+    fun execute(
+        key: K,
+        block: () -> V,
+    ): V {
+        val flightKey = key to DataSourceRoute.current()
+        val flight = CompletableFuture<V>()
+        val existing = inFlight.putIfAbsent(flightKey, flight)
+        if (existing != null) {
+            RequestMetrics.current()?.recordCoalescedRead()
+            return try {
+                existing.join()
+            } catch (e: CompletionException) {
+                throw e.cause ?: e
+            }
+        }
+
+        return try {
+            block().also {
+                inFlight.remove(flightKey, flight)
+                flight.complete(it)
+            }
+        } catch (e: Throwable) {
+            inFlight.remove(flightKey, flight)
+            flight.completeExceptionally(e)
+            throw e
+        }
+    }
+}
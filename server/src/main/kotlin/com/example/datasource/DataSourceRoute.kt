@@ -0,0 +1,38 @@
+package com.example.datasource
+
+enum class DataSourceRoute {
+    PRIMARY,
+    REPLICA,
+    ;
+
+    companion object {
+        private val current = ThreadLocal<DataSourceRoute>()
+
+        fun current(): DataSourceRoute = current.get() ?: PRIMARY
+
+        fun <T> use(
+            route: DataSourceRoute,
+            block: () -> T,
+        ): T {
+            val previous = current.get()
+            current.set(route)
+            return try {
+                block()
+            } finally {
+                if (previous == null) current.remove() else current.set(previous)
+            }
+        }
+    }
+}
+
+/**
+ * Marks a read-only service method whose queries may be served by the read datasource.
+ * Queries that must see the caller's own writes opt back out with [onPrimary].
+ */
+@Target(AnnotationTarget.FUNCTION)
+@Retention(AnnotationRetention.RUNTIME)
+annotation class ReadReplica
+
+fun <T> onPrimary(block: () -> T): T = DataSourceRoute.use(DataSourceRoute.PRIMARY, block)
+
+fun <T> onReplica(block: () -> T): T = DataSourceRoute.use(DataSourceRoute.REPLICA, block)
@@ -0,0 +1,37 @@
+package com.example.datasource
+
+import com.zaxxer.hikari.HikariDataSource
+import org.springframework.beans.factory.annotation.Qualifier
+import org.springframework.boot.autoconfigure.condition.ConditionalOnExpression
+import org.springframework.boot.jdbc.DataSourceBuilder
+import org.springframework.context.annotation.Bean
+import org.springframework.context.annotation.Configuration
+import org.springframework.core.env.Environment
+
+/**
+ * The read replica's pool, configured under `app.datasource.read`. As a bean it is closed with the context and
+ * visible to the datasource health and pool metrics; it is not a default candidate, so the primary datasource is
+ * still auto-configured and injected everywhere else.
+ */
+@Configuration(proxyBeanMethods = false)
+@ConditionalOnExpression("!'\${app.datasource.read.url:}'.isBlank()")
+class ReadReplicaConfiguration {
+    @Bean(READ_REPLICA_DATA_SOURCE, defaultCandidate = false)
+    @Qualifier(READ_REPLICA_DATA_SOURCE)
+    fun readReplicaDataSource(environment: Environment): HikariDataSource =
+        DataSourceBuilder
+            .create()
+            .type(HikariDataSource::class.java)
+            .url(environment.getProperty("app.datasource.read.url"))
+            .username(environment.getProperty("app.datasource.read.username"))
+            .password(environment.getProperty("app.datasource.read.password"))
+            .build()
+            .apply {
+                poolName = "read-replica"
+                isReadOnly = true
+            }
+
+    companion object {
+        const val READ_REPLICA_DATA_SOURCE = "readReplicaDataSource"
+    }
+}
@@ -0,0 +1,18 @@
+package com.example.datasource
+
+import org.aopalliance.intercept.MethodInterceptor
+import org.aopalliance.intercept.MethodInvocation
+import org.springframework.aop.support.AopUtils
+import org.springframework.core.annotation.AnnotationUtils
+
+class ReadReplicaInterceptor(
+    private val targetClass: Class<*>,
+) : MethodInterceptor {
+    override fun invoke(invocation: MethodInvocation): Any? {
+        val method = AopUtils.getMostSpecificMethod(invocation.method, targetClass)
+        if (AnnotationUtils.findAnnotation(method, ReadReplica::class.java) == null) {
+            return invocation.proceed()
+        }
+        return onReplica { invocation.proceed() }
+    }
+}
@@ -0,0 +1,17 @@
+package com.example.datasource
+
+import org.springframework.jdbc.datasource.lookup.AbstractRoutingDataSource
+import javax.sql.DataSource
+
+class ReadWriteRoutingDataSource(
+    primary: DataSource,
+    replica: DataSource,
+) : AbstractRoutingDataSource() {
+    init {
+        setTargetDataSources(mapOf<Any, Any>(DataSourceRoute.PRIMARY to primary, DataSourceRoute.REPLICA to replica))
+        setDefaultTargetDataSource(primary)
+        afterPropertiesSet()
+    }
+
+    override fun determineCurrentLookupKey(): Any = DataSourceRoute.current()
+}
@@ -0,0 +1,56 @@
+package com.example.datasource
+
+import com.example.datasource.ReadReplicaConfiguration.Companion.READ_REPLICA_DATA_SOURCE
+import com.zaxxer.hikari.HikariDataSource
+import org.springframework.aop.framework.Advised
+import org.springframework.aop.framework.ProxyFactory
+import org.springframework.aop.support.AopUtils
+import org.springframework.beans.factory.BeanFactory
+import org.springframework.beans.factory.config.BeanPostProcessor
+import org.springframework.core.Ordered
+import org.springframework.core.annotation.AnnotationUtils
+import org.springframework.core.env.Environment
+import org.springframework.stereotype.Component
+import javax.sql.DataSource
+
+/**
+ * Routes `@ReadReplica` service methods to the [ReadReplicaConfiguration] datasource.
+ *
+ * Without `app.datasource.read.url` every bean is left untouched and all queries go to the primary.
+ * Runs before [com.example.metrics.RequestMetricsPostProcessor] so statements on either datasource are counted.
+ */
+@Component
+class ReadWriteRoutingPostProcessor(
+    environment: Environment,
+    private val beanFactory: BeanFactory,
+) : BeanPostProcessor,
+    Ordered {
+    private val readUrl = environment.getProperty("app.datasource.read.url").orEmpty()
+
+    override fun getOrder(): Int = Ordered.HIGHEST_PRECEDENCE
+
+    override fun postProcessAfterInitialization(
+        bean: Any,
+        beanName: String,
+    ): Any {
+        if (readUrl.isBlank()) return bean
+        val targetClass = AopUtils.getTargetClass(bean)
+        return when {
+            bean is ReadWriteRoutingDataSource || beanName == READ_REPLICA_DATA_SOURCE -> bean
+            bean is DataSource -> ReadWriteRoutingDataSource(bean, readDataSource())
+            targetClass.declaredMethods.none { AnnotationUtils.findAnnotation(it, ReadReplica::class.java) != null } -> bean
+            bean is Advised -> bean.apply { addAdvice(0, ReadReplicaInterceptor(targetClass)) }
+            else ->
+                ProxyFactory(bean)
+                    .apply {
+                        isProxyTargetClass = true
+                        addAdvice(ReadReplicaInterceptor(targetClass))
+                    }.proxy
+        }
+    }
+
+    // The replica bean is itself wrapped for statement counting, like any datasource; routing to the pool underneath
+    // it counts each statement once, when the routing datasource is wrapped as a whole
+    private fun readDataSource(): DataSource =
+        beanFactory.getBean(READ_REPLICA_DATA_SOURCE, DataSource::class.java).unwrap(HikariDataSource::class.java)
+}
@@ -0,0 +1,127 @@
+package com.example.degradation
+
+import io.micrometer.core.instrument.Gauge
+import io.micrometer.core.instrument.MeterRegistry
+import org.slf4j.LoggerFactory
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.stereotype.Component
+import java.time.Duration
+import java.time.Instant
+
+/** Read-path queries that can be skipped, serving staler or approximate data, while they are slow or failing. */
+enum class DegradableQuery(
+    val value: String,
+) {
+    TIMELINE_DELTA("timeline_delta"),
+    ENRICHMENT("enrichment"),
+}
+
+data class DegradationThresholds(
+    val latency: Duration,
+    val errorRate: Double,
+    val minSamples: Int,
+    val cooldown: Duration,
+)
+
+/**
+ * Health of one query as exponentially weighted moving averages of its latency and error rate.
+ *
+ * Once at least [DegradationThresholds.minSamples] samples have been taken and either average is past its threshold,
+ * the query is degraded for [DegradationThresholds.cooldown]. The averages restart from scratch when it trips, so after
+ * the cooldown the query is tried again and judged on fresh samples only.
+ */
+class QueryHealth(
+    private val thresholds: DegradationThresholds,
+) {
+    private var samples = 0
+    private var latencyMillis = 0.0
+    private var errorRate = 0.0
+    private var degradedUntil: Instant? = null
+
+    @Synchronized
+    fun isDegraded(now: Instant): Boolean = degradedUntil?.let { now < it } ?: false
+
+    /** Records one execution; returns true when this sample trips the query into degraded mode. */
+    @Synchronized
+    fun record(
+        latency: Duration,
+        failed: Boolean,
+        now: Instant,
+    ): Boolean {
+        // Executions that started before the trip finish afterwards; they describe the state that caused it
+        if (isDegraded(now)) return false
+
+        val weight = if (samples == 0) 1.0 else EWMA_WEIGHT
+        latencyMillis += weight * (latency.toNanos() / 1_000_000.0 - latencyMillis)
+        errorRate += weight * ((if (failed) 1.0 else 0.0) - errorRate)
+        samples++
+
+        val tripped =
+            samples >= thresholds.minSamples &&
+                (latencyMillis > thresholds.latency.toMillis() || errorRate > thresholds.errorRate)
+        if (tripped) {
+            degradedUntil = now.plus(thresholds.cooldown)
+            samples = 0
+            latencyMillis = 0.0
+            errorRate = 0.0
+        }
+        return tripped
+    }
+
+    companion object {
+        // Weight of the newest sample; the averages mostly reflect the last ten or so executions
+        const val EWMA_WEIGHT = 0.2
+    }
+}
+
+/**
+ * Watches the latency and error rate of the [DegradableQuery] executions and tells callers when to skip them, so a
+ * slow delta or enrichment path serves slightly stale timelines instead of piling up request threads.
+ */
+@Component
+class DegradationController(
+    @Value("\${app.degradation.latency-threshold.timeline-delta:PT0.2S}") deltaLatencyThreshold: Duration,
+    @Value("\${app.degradation.latency-threshold.enrichment:PT0.5S}") enrichmentLatencyThreshold: Duration,
+    @Value("\${app.degradation.error-rate-threshold:0.5}") errorRateThreshold: Double,
+    @Value("\${app.degradation.min-samples:20}") minSamples: Int,
+    @Value("\${app.degradation.cooldown:PT30S}") cooldown: Duration,
+    meterRegistry: MeterRegistry,
+) {
+    private val logger = LoggerFactory.getLogger(DegradationController::class.java)
+
+    private val health =
+        mapOf(
+            DegradableQuery.TIMELINE_DELTA to
+                QueryHealth(DegradationThresholds(deltaLatencyThreshold, errorRateThreshold, minSamples, cooldown)),
+            DegradableQuery.ENRICHMENT to
+                QueryHealth(DegradationThresholds(enrichmentLatencyThreshold, errorRateThreshold, minSamples, cooldown)),
+        )
+
+    init {
+        DegradableQuery.entries.forEach { query ->
+            Gauge
+                .builder("app.degradation.degraded") { if (isDegraded(query)) 1.0 else 0.0 }
+                .tags("query", query.value)
+                .register(meterRegistry)
+        }
+    }
+
+    fun isDegraded(query: DegradableQuery): Boolean = health.getValue(query).isDegraded(Instant.now())
+
+    /** Runs the query, recording its latency and whether it threw. */
+    fun <T> measure(
+        query: DegradableQuery,
+        block: () -> T,
+    ): T {
+        val startedAt = System.nanoTime()
+        var failed = true
+        try {
+            return block().also { failed = false }
+        } finally {
+            val latency = Duration.ofNanos(System.nanoTime() - startedAt)
+            if (health.getValue(query).record(latency, failed, Instant.now())) {
+                logger.warn("Degrading {} reads after sustained latency or errors, latest took {} ms", query.value, latency.toMillis())
+            }
+        }
+    }
+}
@@ -0,0 +1,70 @@
+package com.example.engagement
+
+import com.example.api.EngagementApi
+import com.example.model.EngagementEventResult
+import com.example.model.EngagementEventStatus
+import com.example.model.PostEngagementBatch200Response
+import com.example.model.PostEngagementBatchRequest
+import org.slf4j.LoggerFactory
+import org.springframework.http.HttpStatus
+import org.springframework.http.ResponseEntity
+import org.springframework.web.bind.MethodArgumentNotValidException
+import org.springframework.web.bind.annotation.ExceptionHandler
+import org.springframework.web.bind.annotation.RestController
+
+@RestController
+class EngagementController(
+    private val engagementService: EngagementService,
+) : EngagementApi {
+    private val logger = LoggerFactory.getLogger(EngagementController::class.java)
+
+    override fun postEngagementBatch(postEngagementBatchRequest: PostEngagementBatchRequest): ResponseEntity<PostEngagementBatch200Response> {
+        val commands =
+            postEngagementBatchRequest.events.map { event ->
+                EngagementCommand(
+                    type =
+                        EngagementType.fromString(event.type.value)
+                            ?: throw EngagementBatchValidationException("Unknown engagement type: ${event.type.value}"),
+                    postId = event.postId,
+                    userId = event.userId,
+                )
+            }
+        return when (val result = engagementService.ingest(commands)) {
+            is EngagementBatchResult.Success -> {
+                val response =
+                    PostEngagementBatch200Response(
+                        results =
+                            result.statuses.mapIndexed { index, status ->
+                                EngagementEventResult(
+                                    index = index,
+                                    status = EngagementEventStatus.entries.first { it.value == status.value },
+                                )
+                            },
+                        createdCount = result.createdCount,
+                    )
+                ResponseEntity.ok(response)
+            }
+            is EngagementBatchResult.Failure -> {
+                throw result.exception
+            }
+        }
+    }
+
+    @ExceptionHandler(EngagementBatchValidationException::class)
+    fun handleEngagementBatchValidationException(e: EngagementBatchValidationException): ResponseEntity<Map<String, String>> {
+        logger.info("Invalid engagement batch: {}", e.message)
+        return ResponseEntity.status(HttpStatus.BAD_REQUEST).body(mapOf("error" to (e.message ?: "")))
+    }
+
+    @ExceptionHandler(MethodArgumentNotValidException::class)
+    fun handleMethodArgumentNotValidException(e: MethodArgumentNotValidException): ResponseEntity<Map<String, String>> {
+        logger.info("Invalid engagement batch: {}", e.message)
+        return ResponseEntity.status(HttpStatus.BAD_REQUEST).body(mapOf("error" to "Batch must contain 1 to ${EngagementService.MAX_BATCH_SIZE} events"))
+    }
+
+    @ExceptionHandler(Exception::class)
+    fun handleException(e: Exception): ResponseEntity<Void> {
+        logger.warn("An unexpected error occurred", e)
+        return ResponseEntity.status(HttpStatus.INTERNAL_SERVER_ERROR).build()
+    }
+}
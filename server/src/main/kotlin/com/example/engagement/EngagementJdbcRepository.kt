@@ -0,0 +1,114 @@
+package com.example.engagement
+
+import com.example.like.LikeEvent
+import com.example.like.LikeEventType
+import com.example.repost.RepostEvent
+import com.example.repost.RepostEventType
+import com.example.view.ViewEvent
+import org.springframework.jdbc.core.JdbcTemplate
+import org.springframework.jdbc.core.PreparedStatementCreator
+import org.springframework.stereotype.Repository
+import java.sql.Connection
+import java.util.UUID
+
+@Repository
+class EngagementJdbcRepository(
+    private val jdbcTemplate: JdbcTemplate,
+) {
+    fun findLikedPairs(pairs: Collection<Pair<UUID, UUID>>): Set<Pair<UUID, UUID>> =
+        findActivePairs("like_events", LikeEventType.LIKED.value, pairs)
+
+    fun findRepostedPairs(pairs: Collection<Pair<UUID, UUID>>): Set<Pair<UUID, UUID>> =
+        findActivePairs("repost_events", RepostEventType.REPOSTED.value, pairs)
+
+    /**
+     * Appends all events in a single statement, one `unnest` insert per table, so the batch is written atomically
+     * in one round trip. Returns the number of rows inserted.
+     */
+    fun insertAll(
+        likeEvents: List<LikeEvent>,
+        repostEvents: List<RepostEvent>,
+        viewEvents: List<ViewEvent>,
+    ): Int =
+        jdbcTemplate
+            .query(
+                PreparedStatementCreator { connection ->
+                    connection
+                        .prepareStatement(
+                            """
+                            WITH inserted_likes AS (
+                                INSERT INTO like_events (event_id, post_id, user_id, event_type, occurred_at)
+                                SELECT * FROM unnest(?::uuid[], ?::uuid[], ?::uuid[], ?::varchar[], ?::timestamptz[])
+                                RETURNING 1
+                            ), inserted_reposts AS (
+                                INSERT INTO repost_events (event_id, post_id, user_id, event_type, occurred_at)
+                                SELECT * FROM unnest(?::uuid[], ?::uuid[], ?::uuid[], ?::varchar[], ?::timestamptz[])
+                                RETURNING 1
+                            ), inserted_views AS (
+                                INSERT INTO view_events (event_id, post_id, user_id, occurred_at)
+                                SELECT * FROM unnest(?::uuid[], ?::uuid[], ?::uuid[], ?::timestamptz[])
+                                RETURNING 1
+                            )
+                            SELECT (SELECT count(*) FROM inserted_likes)
+                                + (SELECT count(*) FROM inserted_reposts)
+                                + (SELECT count(*) FROM inserted_views) AS inserted
+                            """.trimIndent(),
+                        ).apply {
+                            val columns =
+                                listOf(
+                                    connection.uuids(likeEvents.map { it.eventId }),
+                                    connection.uuids(likeEvents.map { it.postId }),
+                                    connection.uuids(likeEvents.map { it.userId }),
+                                    connection.texts(likeEvents.map { it.eventType }),
+                                    connection.texts(likeEvents.map { it.occurredAt.toString() }),
+                                    connection.uuids(repostEvents.map { it.eventId }),
+                                    connection.uuids(repostEvents.map { it.postId }),
+                                    connection.uuids(repostEvents.map { it.userId }),
+                                    connection.texts(repostEvents.map { it.eventType }),
+                                    connection.texts(repostEvents.map { it.occurredAt.toString() }),
+                                    connection.uuids(viewEvents.map { it.eventId }),
+                                    connection.uuids(viewEvents.map { it.postId }),
+                                    connection.uuids(viewEvents.map { it.userId }),
+                                    connection.texts(viewEvents.map { it.occurredAt.toString() }),
+                                )
+                            columns.forEachIndexed { index, array -> setArray(index + 1, array) }
+                        }
+                },
+                { rs, _ -> rs.getInt("inserted") },
+            ).single()
+
+    private fun findActivePairs(
+        table: String,
+        activeEventType: String,
+        pairs: Collection<Pair<UUID, UUID>>,
+    ): Set<Pair<UUID, UUID>> {
+        if (pairs.isEmpty()) return emptySet()
+        return jdbcTemplate
+            .query(
+                PreparedStatementCreator { connection ->
+                    connection
+                        .prepareStatement(
+                            """
+                            SELECT post_id, user_id, event_type FROM (
+                                SELECT DISTINCT ON (e.post_id, e.user_id) e.post_id, e.user_id, e.event_type
+                                FROM $table e
+                                JOIN unnest(?::uuid[], ?::uuid[]) AS p(post_id, user_id)
+                                ON e.post_id = p.post_id AND e.user_id = p.user_id
+                                ORDER BY e.post_id, e.user_id, e.occurred_at DESC
+                            ) latest
+                            WHERE event_type = ?
+                            """.trimIndent(),
+                        ).apply {
+                            setArray(1, connection.uuids(pairs.map { it.first }))
+                            setArray(2, connection.uuids(pairs.map { it.second }))
+                            setString(3, activeEventType)
+                        }
+                },
+                { rs, _ -> UUID.fromString(rs.getString("post_id")) to UUID.fromString(rs.getString("user_id")) },
+            ).toSet()
+    }
+
+    private fun Connection.uuids(values: List<UUID>) = createArrayOf("uuid", values.toTypedArray())
+
+    private fun Connection.texts(values: List<String>) = createArrayOf("text", values.toTypedArray())
+}
@@ -0,0 +1,116 @@
+package com.example.engagement
+
+import com.example.id.timeOrderedUuid
+import com.example.like.LikeEvent
+import com.example.like.LikeEventType
+import com.example.repost.RepostEvent
+import com.example.repost.RepostEventType
+import com.example.view.ViewEvent
+import java.time.Instant
+import java.time.temporal.ChronoUnit
+import java.util.UUID
+
+data class EngagementCommand(
+    val type: EngagementType,
+    val postId: UUID,
+    val userId: UUID,
+)
+
+data class EngagementPlan(
+    val statuses: List<EngagementStatus>,
+    val likeEvents: List<LikeEvent>,
+    val repostEvents: List<RepostEvent>,
+    val viewEvents: List<ViewEvent>,
+)
+
+/**
+ * Decides the outcome of each command in order, as the single-event endpoints would, and collects the events to append.
+ *
+ * Unlike and unrepost only append when the pair is active at that point of the batch, taking earlier commands into account.
+ * Each command gets its own microsecond so that replaying the events orders them as they were submitted.
+ */
+fun planEngagementBatch(
+    commands: List<EngagementCommand>,
+    existingUserIds: Set<UUID>,
+    activePostIds: Set<UUID>,
+    likedPairs: Set<Pair<UUID, UUID>>,
+    repostedPairs: Set<Pair<UUID, UUID>>,
+    now: Instant,
+): EngagementPlan {
+    val liked = likedPairs.toMutableSet()
+    val reposted = repostedPairs.toMutableSet()
+    val likeEvents = mutableListOf<LikeEvent>()
+    val repostEvents = mutableListOf<RepostEvent>()
+    val viewEvents = mutableListOf<ViewEvent>()
+
+    val statuses =
+        commands.mapIndexed { index, command ->
+            val pair = command.postId to command.userId
+            val occurredAt = now.plus(index.toLong(), ChronoUnit.MICROS)
+            when {
+                command.userId !in existingUserIds -> EngagementStatus.USER_NOT_FOUND
+                command.postId !in activePostIds -> EngagementStatus.POST_NOT_FOUND
+                else ->
+                    when (command.type) {
+                        EngagementType.LIKE -> {
+                            liked += pair
+                            likeEvents +=
+                                LikeEvent(
+                                    eventId = timeOrderedUuid(),
+                                    postId = command.postId,
+                                    userId = command.userId,
+                                    eventType = LikeEventType.LIKED.value,
+                                    occurredAt = occurredAt,
+                                )
+                            EngagementStatus.CREATED
+                        }
+                        EngagementType.UNLIKE ->
+                            if (liked.remove(pair)) {
+                                likeEvents +=
+                                    LikeEvent(
+                                        eventId = timeOrderedUuid(),
+                                        postId = command.postId,
+                                        userId = command.userId,
+                                        eventType = LikeEventType.UNLIKED.value,
+                                        occurredAt = occurredAt,
+                                    )
+                                EngagementStatus.CREATED
+                            } else {
+                                EngagementStatus.UNCHANGED
+                            }
+                        EngagementType.REPOST -> {
+                            reposted += pair
+                            repostEvents +=
+                                RepostEvent(
+                                    eventId = timeOrderedUuid(),
+                                    postId = command.postId,
+                                    userId = command.userId,
+                                    eventType = RepostEventType.REPOSTED.value,
+                                    occurredAt = occurredAt,
+                                )
+                            EngagementStatus.CREATED
+                        }
+                        EngagementType.UNREPOST ->
+                            if (reposted.remove(pair)) {
+                                repostEvents +=
+                                    RepostEvent(
+                                        eventId = timeOrderedUuid(),
+                                        postId = command.postId,
+                                        userId = command.userId,
+                                        eventType = RepostEventType.UNREPOSTED.value,
+                                        occurredAt = occurredAt,
+                                    )
+                                EngagementStatus.CREATED
+                            } else {
+                                EngagementStatus.UNCHANGED
+                            }
+                        EngagementType.VIEW -> {
+                            viewEvents += ViewEvent(eventId = timeOrderedUuid(), postId = command.postId, userId = command.userId, occurredAt = occurredAt)
+                            EngagementStatus.CREATED
+                        }
+                    }
+            }
+        }
+
+    return EngagementPlan(statuses, likeEvents, repostEvents, viewEvents)
+}
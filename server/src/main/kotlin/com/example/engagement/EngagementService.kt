@@ -0,0 +1,102 @@
+package com.example.engagement
+
+import com.example.auth.UserRepository
+import com.example.post.PostEventJdbcRepository
+import com.example.post.aggregatePostEvents
+import com.example.view.ViewSketchRepository
+import io.opentelemetry.instrumentation.annotations.WithSpan
+import org.springframework.dao.DataAccessException
+import org.springframework.stereotype.Service
+import tools.jackson.databind.ObjectMapper
+import java.time.Instant
+import java.time.temporal.ChronoUnit
+
+sealed interface EngagementBatchResult {
+    data class Success(
+        val statuses: List<EngagementStatus>,
+        val createdCount: Int,
+    ) : EngagementBatchResult
+
+    data class Failure(
+        val exception: Exception,
+    ) : EngagementBatchResult
+}
+
+class EngagementBatchValidationException(
+    message: String,
+) : Exception(message)
+
+@Service
+class EngagementService(
+    private val engagementJdbcRepository: EngagementJdbcRepository,
+    private val viewSketchRepository: ViewSketchRepository,
+    private val postEventJdbcRepository: PostEventJdbcRepository,
+    private val userRepository: UserRepository,
+    private val objectMapper: ObjectMapper,
+) {
+    @WithSpan
+    fun ingest(commands: List<EngagementCommand>): EngagementBatchResult {
+        if (commands.isEmpty() || commands.size > MAX_BATCH_SIZE) {
+            return EngagementBatchResult.Failure(EngagementBatchValidationException("Batch must contain 1 to $MAX_BATCH_SIZE events"))
+        }
+
+        val existingUserIds =
+            try {
+                userRepository.findAllById(commands.map { it.userId }.distinct()).map { it.id }.toSet()
+            } catch (e: DataAccessException) {
+                return EngagementBatchResult.Failure(e)
+            }
+
+        val activePostIds =
+            try {
+                postEventJdbcRepository
+                    .findByPostIds(commands.map { it.postId }.distinct())
+                    .groupBy { it.postId }
+                    .filterValues { aggregatePostEvents(it, objectMapper) != null }
+                    .keys
+            } catch (e: DataAccessException) {
+                return EngagementBatchResult.Failure(e)
+            }
+
+        val likedPairs =
+            try {
+                engagementJdbcRepository.findLikedPairs(commands.pairsOf(EngagementType.UNLIKE))
+            } catch (e: DataAccessException) {
+                return EngagementBatchResult.Failure(e)
+            }
+
+        val repostedPairs =
+            try {
+                engagementJdbcRepository.findRepostedPairs(commands.pairsOf(EngagementType.UNREPOST))
+            } catch (e: DataAccessException) {
+                return EngagementBatchResult.Failure(e)
+            }
+
+        val plan =
+            planEngagementBatch(
+                commands,
+                existingUserIds,
+                activePostIds,
+                likedPairs,
+                repostedPairs,
+                Instant.now().truncatedTo(ChronoUnit.MICROS),
+            )
+
+        val createdCount =
+            try {
+                val insertedCount = engagementJdbcRepository.insertAll(plan.likeEvents, plan.repostEvents, plan.viewEvents)
+                viewSketchRepository.recordViews(plan.viewEvents)
+                insertedCount
+            } catch (e: DataAccessException) {
+                return EngagementBatchResult.Failure(e)
+            }
+
+        return EngagementBatchResult.Success(plan.statuses, createdCount)
+    }
+
+    private fun List<EngagementCommand>.pairsOf(type: EngagementType) = filter { it.type == type }.map { it.postId to it.userId }.toSet()
+
+    companion object {
+        const val MAX_BATCH_SIZE = 500
+    }
+}
@@ -0,0 +1,27 @@
+package com.example.engagement
+
+enum class EngagementType(
+    val value: String,
+) {
+    LIKE("like"),
+    UNLIKE("unlike"),
+    REPOST("repost"),
+    UNREPOST("unrepost"),
+    VIEW("view"),
+    ;
+
+    companion object {
+        private val byValue = entries.associateBy { it.value }
+
+        fun fromString(value: String): EngagementType? = byValue[value]
+    }
+}
+
+enum class EngagementStatus(
+    val value: String,
+) {
+    CREATED("created"),
+    UNCHANGED("unchanged"),
+    USER_NOT_FOUND("user_not_found"),
+    POST_NOT_FOUND("post_not_found"),
+}
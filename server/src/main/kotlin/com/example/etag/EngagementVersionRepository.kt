@@ -0,0 +1,89 @@
+package com.example.etag
+
+import org.springframework.jdbc.core.JdbcTemplate
+import org.springframework.jdbc.core.PreparedStatementCreator
+import org.springframework.stereotype.Repository
+import java.time.Instant
+import java.util.UUID
+
+/**
+ * Newest-event markers for one post's enriched view. Events are append-only, so any change to the view moves at
+ * least one marker; views only move [viewBucket], which is truncated to the minute so they do not revalidate every
+ * cached copy of a busy post.
+ */
+data class EngagementVersion(
+    val postId: UUID,
+    val postCreated: Boolean,
+    val postDeleted: Boolean,
+    val latestLikeEventId: UUID?,
+    val latestRepostEventId: UUID?,
+    val latestReplyId: UUID?,
+    val deletedReplyCount: Long,
+    val viewBucket: Instant?,
+) {
+    val postExists: Boolean get() = postCreated && !postDeleted
+}
+
+@Repository
+class EngagementVersionRepository(
+    private val jdbcTemplate: JdbcTemplate,
+) {
+    /**
+     * Reads the markers of the given posts, in their order. Each one is an index lookup: the post's own events through
+     * `unique_post_event_type`, the newest like and repost through `(post_id, occurred_at, event_id)`, the newest
+     * reply through `idx_post_events_reply_to_post_id` and the newest view through `idx_view_events_post_id`. Only
+     * deleted replies take a lookup per reply, which the full read of the replies does anyway.
+     */
+    fun findByPostIds(postIds: List<UUID>): List<EngagementVersion> =
+        jdbcTemplate.query(
+            PreparedStatementCreator { connection ->
+                connection
+                    .prepareStatement(
+                        """
+                        SELECT
+                            page.post_id,
+                            EXISTS (
+                                SELECT 1 FROM post_events WHERE post_id = page.post_id AND event_type = 'post_created'
+                            ) AS post_created,
+                            EXISTS (
+                                SELECT 1 FROM post_events WHERE post_id = page.post_id AND event_type = 'post_deleted'
+                            ) AS post_deleted,
+                            (
+                                SELECT event_id FROM like_events WHERE post_id = page.post_id
+                                ORDER BY occurred_at DESC, event_id DESC LIMIT 1
+                            ) AS latest_like_event_id,
+                            (
+                                SELECT event_id FROM repost_events WHERE post_id = page.post_id
+                                ORDER BY occurred_at DESC, event_id DESC LIMIT 1
+                            ) AS latest_repost_event_id,
+                            (
+                                SELECT post_id FROM post_events WHERE reply_to_post_id = page.post_id
+                                ORDER BY occurred_at DESC, post_id DESC LIMIT 1
+                            ) AS latest_reply_id,
+                            (
+                                SELECT count(*) FROM post_events AS r
+                                JOIN post_events AS d ON d.post_id = r.post_id AND d.event_type = 'post_deleted'
+                                WHERE r.reply_to_post_id = page.post_id
+                            ) AS deleted_reply_count,
+                            (
+                                SELECT date_trunc('minute', max(occurred_at)) FROM view_events WHERE post_id = page.post_id
+                            ) AS view_bucket
+                        FROM unnest(?::uuid[]) WITH ORDINALITY AS page(post_id, position)
+                        ORDER BY page.position
+                        """.trimIndent(),
+                    ).apply { setArray(1, connection.createArrayOf("uuid", postIds.toTypedArray())) }
+            },
+            { rs, _ ->
+                EngagementVersion(
+                    postId = UUID.fromString(rs.getString("post_id")),
+                    postCreated = rs.getBoolean("post_created"),
+                    postDeleted = rs.getBoolean("post_deleted"),
+                    latestLikeEventId = rs.getString("latest_like_event_id")?.let(UUID::fromString),
+                    latestRepostEventId = rs.getString("latest_repost_event_id")?.let(UUID::fromString),
+                    latestReplyId = rs.getString("latest_reply_id")?.let(UUID::fromString),
+                    deletedReplyCount = rs.getLong("deleted_reply_count"),
+                    viewBucket = rs.getTimestamp("view_bucket")?.toInstant(),
+                )
+            },
+        )
+}
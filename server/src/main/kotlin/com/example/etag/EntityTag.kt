@@ -0,0 +1,24 @@
+package com.example.etag
+
+import java.security.MessageDigest
+
+fun weakEntityTag(vararg parts: Any?): String {
+    val digest = MessageDigest.getInstance("SHA-256")
+    parts.forEach { part ->
+        digest.update(part.toString().toByteArray(Charsets.UTF_8))
+        digest.update(0)
+    }
+    return "W/\"${digest.digest().copyOf(16).toHexString()}\""
+}
+
+fun ifNoneMatchMatches(
+    ifNoneMatch: String?,
+    entityTag: String,
+): Boolean {
+    if (ifNoneMatch.isNullOrBlank()) return false
+    val opaqueTag = entityTag.removePrefix("W/")
+    return ifNoneMatch
+        .split(',')
+        .map { it.trim() }
+        .any { it == "*" || it.removePrefix("W/") == opaqueTag }
+}
@@ -5,28 +5,21 @@ import java.util.UUID
 data class AggregatedLikes(
     val likeCount: Int,
     val likedUserIds: Set<UUID>,
-)
-
-fun aggregateLikeEvents(events: List<LikeEvent>): AggregatedLikes {
-    val applyLiked: (Map<UUID, Boolean>, LikeEvent) -> Map<UUID, Boolean> = { currentState, event ->
-        currentState + (event.userId to true)
-    }
+) {
+    fun statusOf(userId: UUID): UserLikeStatus =
+        if (userId in likedUserIds) UserLikeStatus.Liked else UserLikeStatus.NotLiked
+}
 
-    val applyUnliked: (Map<UUID, Boolean>, LikeEvent) -> Map<UUID, Boolean> = { currentState, event ->
-        currentState + (event.userId to false)
-    }
+fun aggregateLikeEvents(events: List<LikeRow>): AggregatedLikes {
+    val likedUserIds = LinkedHashSet<UUID>()
 
-    val userLikeStatus =
-        events.fold(emptyMap<UUID, Boolean>()) { acc, event ->
-            when (LikeEventType.fromString(event.eventType)) {
-                LikeEventType.LIKED -> applyLiked(acc, event)
-                LikeEventType.UNLIKED -> applyUnliked(acc, event)
-                null -> acc
-            }
+    for (event in events) {
+        when (event.type) {
+            LikeEventType.LIKED -> likedUserIds.add(event.userId)
+            LikeEventType.UNLIKED -> likedUserIds.remove(event.userId)
+            null -> Unit
         }
+    }
 
-    val likedUserIds = userLikeStatus.filter { it.value }.keys
-    val likeCount = likedUserIds.size
-
-    return AggregatedLikes(likeCount, likedUserIds)
+    return AggregatedLikes(likedUserIds.size, likedUserIds)
 }
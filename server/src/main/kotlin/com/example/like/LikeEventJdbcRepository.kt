@@ -0,0 +1,66 @@
+package com.example.like
+
+import org.springframework.jdbc.core.JdbcTemplate
+import org.springframework.jdbc.core.PreparedStatementSetter
+import org.springframework.stereotype.Repository
+import java.sql.ResultSet
+import java.util.UUID
+
+/**
+ * What the like folds read of an event. Mapped straight from JDBC, so no entity is registered in the persistence
+ * context or snapshotted for dirty checking, and the type is resolved to an enum once per row.
+ */
+data class LikeRow(
+    val postId: UUID,
+    val userId: UUID,
+    val type: LikeEventType?,
+)
+
+@Repository
+class LikeEventJdbcRepository(
+    private val jdbcTemplate: JdbcTemplate,
+) {
+    fun findByPostId(postId: UUID): List<LikeRow> =
+        jdbcTemplate.query(
+            "SELECT post_id, user_id, event_type FROM like_events WHERE post_id = ?::uuid ORDER BY occurred_at, event_id",
+            { rs, _ -> rs.toLikeRow() },
+            postId.toString(),
+        )
+
+    /** Binds the ids as one `uuid[]`, so every page size shares a prepared plan. */
+    fun findByPostIds(postIds: Collection<UUID>): List<LikeRow> {
+        if (postIds.isEmpty()) return emptyList()
+        return jdbcTemplate.query(
+            "SELECT post_id, user_id, event_type FROM like_events WHERE post_id = ANY (?) ORDER BY occurred_at, event_id",
+            PreparedStatementSetter { ps -> ps.setArray(1, ps.connection.createArrayOf("uuid", postIds.toTypedArray())) },
+            { rs, _ -> rs.toLikeRow() },
+        )
+    }
+
+    /** One user's events on the given posts, found through `idx_like_events_post_user` without reading other users' rows. */
+    fun findByPostIdsAndUserId(
+        postIds: Collection<UUID>,
+        userId: UUID,
+    ): List<LikeRow> {
+        if (postIds.isEmpty()) return emptyList()
+        return jdbcTemplate.query(
+            """
+            SELECT post_id, user_id, event_type FROM like_events
+            WHERE post_id = ANY (?) AND user_id = ?::uuid
+            ORDER BY occurred_at, event_id
+            """.trimIndent(),
+            PreparedStatementSetter { ps ->
+                ps.setArray(1, ps.connection.createArrayOf("uuid", postIds.toTypedArray()))
+                ps.setString(2, userId.toString())
+            },
+            { rs, _ -> rs.toLikeRow() },
+        )
+    }
+
+    private fun ResultSet.toLikeRow() =
+        LikeRow(
+            postId = getObject("post_id", UUID::class.java),
+            userId = getObject("user_id", UUID::class.java),
+            type = LikeEventType.fromString(getString("event_type")),
+        )
+}
@@ -8,6 +8,8 @@ enum class LikeEventType(
     ;
 
     companion object {
-        fun fromString(value: String): LikeEventType? = entries.find { it.value == value }
+        private val byValue = entries.associateBy { it.value }
+
+        fun fromString(value: String): LikeEventType? = byValue[value]
     }
 }
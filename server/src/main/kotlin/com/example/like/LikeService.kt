@@ -1,6 +1,7 @@
 package com.example.like
 
 import com.example.auth.UserRepository
+import com.example.id.timeOrderedUuid
 import com.example.post.PostEventRepository
 import com.example.post.aggregatePostEvents
 import io.opentelemetry.instrumentation.annotations.WithSpan
@@ -41,6 +42,7 @@ class LikeUserNotFoundException(
 @Service
 class LikeService(
     private val likeEventRepository: LikeEventRepository,
+    private val likeEventJdbcRepository: LikeEventJdbcRepository,
     private val postEventRepository: PostEventRepository,
     private val userRepository: UserRepository,
     private val objectMapper: ObjectMapper,
@@ -69,7 +71,7 @@ class LikeService(
 
         val likeEvent =
             LikeEvent(
-                eventId = UUID.randomUUID(),
+                eventId = timeOrderedUuid(),
                 postId = postId,
                 userId = userId,
                 eventType = LikeEventType.LIKED.value,
@@ -109,7 +111,7 @@ class LikeService(
 
         val likeEvents =
             try {
-                likeEventRepository.findByPostIdOrderByOccurredAtAsc(postId)
+                likeEventJdbcRepository.findByPostId(postId)
             } catch (e: DataAccessException) {
                 return UnlikeResult.Failure(e)
             }
@@ -122,7 +124,7 @@ class LikeService(
 
         val unlikeEvent =
             LikeEvent(
-                eventId = UUID.randomUUID(),
+                eventId = timeOrderedUuid(),
                 postId = postId,
                 userId = userId,
                 eventType = LikeEventType.UNLIKED.value,
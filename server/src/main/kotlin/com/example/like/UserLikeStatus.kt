@@ -9,14 +9,10 @@ sealed interface UserLikeStatus {
 
     companion object {
         fun fromEvents(
-            likeEvents: List<LikeEvent>,
+            likeEvents: List<LikeRow>,
             userId: UUID,
         ): UserLikeStatus {
-            val userLikeEvents = likeEvents.filter { it.userId == userId }
-            val lastEventType =
-                userLikeEvents.lastOrNull()?.let {
-                    LikeEventType.fromString(it.eventType)
-                }
+            val lastEventType = likeEvents.lastOrNull { it.userId == userId }?.type
 
             return when (lastEventType) {
                 LikeEventType.LIKED -> Liked
@@ -0,0 +1,90 @@
+package com.example.metrics
+
+import java.util.Optional
+
+class RequestMetrics {
+    var statementCount: Int = 0
+        private set
+
+    var eventDataBytes: Long = 0
+        private set
+
+    var coalescedReads: Int = 0
+        private set
+
+    private val rows = linkedMapOf<String, Long>()
+
+    val rowsByRepositoryMethod: Map<String, Long>
+        get() = rows
+
+    fun recordStatement() {
+        statementCount++
+    }
+
+    fun recordRows(
+        repositoryMethod: String,
+        count: Int,
+    ) {
+        rows.merge(repositoryMethod, count.toLong(), Long::plus)
+    }
+
+    fun recordEventDataBytes(bytes: Int) {
+        eventDataBytes += bytes
+    }
+
+    fun recordCoalescedRead() {
+        coalescedReads++
+    }
+
+    companion object {
+        private val current = ThreadLocal<RequestMetrics>()
+
+        fun current(): RequestMetrics? = current.get()
+
+        fun <T> collect(
+            metrics: RequestMetrics,
+            block: () -> T,
+        ): T {
+            val previous = current.get()
+            current.set(metrics)
+            return try {
+                block()
+            } finally {
+                if (previous == null) current.remove() else current.set(previous)
+            }
+        }
+
+        fun recordEventData(eventData: String) {
+            current.get()?.recordEventDataBytes(utf8Length(eventData))
+        }
+    }
+}
+
+fun utf8Length(value: String): Int {
+    var length = 0
+    var i = 0
+    while (i < value.length) {
+        val c = value[i]
+        length +=
+            when {
+                c.code < 0x80 -> 1
+                c.code < 0x800 -> 2
+                Character.isHighSurrogate(c) && i + 1 < value.length && Character.isLowSurrogate(value[i + 1]) -> {
+                    i++
+                    4
+                }
+                else -> 3
+            }
+        i++
+    }
+    return length
+}
+
+fun rowCount(result: Any?): Int =
+    when (result) {
+        null, is Unit -> 0
+        is Collection<*> -> result.size
+        is Map<*, *> -> result.size
+        is Optional<*> -> if (result.isPresent) 1 else 0
+        else -> 1
+    }
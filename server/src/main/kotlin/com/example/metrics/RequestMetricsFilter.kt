@@ -0,0 +1,69 @@
+package com.example.metrics
+
+import io.micrometer.core.instrument.DistributionSummary
+import io.micrometer.core.instrument.MeterRegistry
+import io.opentelemetry.api.trace.Span
+import jakarta.servlet.FilterChain
+import jakarta.servlet.http.HttpServletRequest
+import jakarta.servlet.http.HttpServletResponse
+import org.springframework.stereotype.Component
+import org.springframework.web.filter.OncePerRequestFilter
+import org.springframework.web.servlet.HandlerMapping
+
+@Component
+class RequestMetricsFilter(
+    private val meterRegistry: MeterRegistry,
+) : OncePerRequestFilter() {
+    override fun shouldNotFilter(request: HttpServletRequest): Boolean = request.requestURI.startsWith("/actuator")
+
+    override fun doFilterInternal(
+        request: HttpServletRequest,
+        response: HttpServletResponse,
+        filterChain: FilterChain,
+    ) {
+        val metrics = RequestMetrics()
+        try {
+            RequestMetrics.collect(metrics) { filterChain.doFilter(request, response) }
+        } finally {
+            record(request, metrics)
+        }
+    }
+
+    private fun record(
+        request: HttpServletRequest,
+        metrics: RequestMetrics,
+    ) {
+        val span = Span.current()
+        span.setAttribute("app.db.statement_count", metrics.statementCount.toLong())
+        span.setAttribute("app.event_data.bytes", metrics.eventDataBytes)
+        span.setAttribute("app.coalesced_reads", metrics.coalescedReads.toLong())
+        metrics.rowsByRepositoryMethod.forEach { (repositoryMethod, rows) ->
+            span.setAttribute("app.db.rows.$repositoryMethod", rows)
+        }
+
+        val uri = request.getAttribute(HandlerMapping.BEST_MATCHING_PATTERN_ATTRIBUTE) as? String ?: "UNKNOWN"
+        DistributionSummary
+            .builder("app.request.statements")
+            .tags("method", request.method, "uri", uri)
+            .register(meterRegistry)
+            .record(metrics.statementCount.toDouble())
+        DistributionSummary
+            .builder("app.request.event_data")
+            .baseUnit("bytes")
+            .tags("method", request.method, "uri", uri)
+            .register(meterRegistry)
+            .record(metrics.eventDataBytes.toDouble())
+        DistributionSummary
+            .builder("app.request.coalesced_reads")
+            .tags("method", request.method, "uri", uri)
+            .register(meterRegistry)
+            .record(metrics.coalescedReads.toDouble())
+        metrics.rowsByRepositoryMethod.forEach { (repositoryMethod, rows) ->
+            DistributionSummary
+                .builder("app.repository.rows")
+                .tags("method", request.method, "uri", uri, "repository_method", repositoryMethod)
+                .register(meterRegistry)
+                .record(rows.toDouble())
+        }
+    }
+}
@@ -0,0 +1,43 @@
+package com.example.metrics
+
+import org.springframework.aop.framework.ProxyFactory
+import org.springframework.beans.factory.config.BeanPostProcessor
+import org.springframework.core.annotation.AnnotationUtils
+import org.springframework.data.repository.core.support.RepositoryFactoryBeanSupport
+import org.springframework.stereotype.Component
+import org.springframework.stereotype.Repository
+import javax.sql.DataSource
+
+@Component
+class RequestMetricsPostProcessor : BeanPostProcessor {
+    override fun postProcessBeforeInitialization(
+        bean: Any,
+        beanName: String,
+    ): Any {
+        if (bean is RepositoryFactoryBeanSupport<*, *, *>) {
+            bean.addRepositoryFactoryCustomizer { factory ->
+                factory.addRepositoryProxyPostProcessor { proxyFactory, repositoryInformation ->
+                    proxyFactory.addAdvice(RowCountingInterceptor(repositoryInformation.repositoryInterface.simpleName))
+                }
+            }
+        }
+        return bean
+    }
+
+    override fun postProcessAfterInitialization(
+        bean: Any,
+        beanName: String,
+    ): Any =
+        when {
+            bean is StatementCountingDataSource -> bean
+            bean is DataSource -> StatementCountingDataSource(bean)
+            bean is org.springframework.data.repository.Repository<*, *> -> bean
+            AnnotationUtils.findAnnotation(bean.javaClass, Repository::class.java) != null ->
+                ProxyFactory(bean)
+                    .apply {
+                        isProxyTargetClass = true
+                        addAdvice(RowCountingInterceptor(bean.javaClass.simpleName))
+                    }.proxy
+            else -> bean
+        }
+}
@@ -0,0 +1,14 @@
+package com.example.metrics
+
+import org.aopalliance.intercept.MethodInterceptor
+import org.aopalliance.intercept.MethodInvocation
+
+class RowCountingInterceptor(
+    private val repositoryName: String,
+) : MethodInterceptor {
+    override fun invoke(invocation: MethodInvocation): Any? {
+        val result = invocation.proceed()
+        RequestMetrics.current()?.recordRows("$repositoryName.${invocation.method.name}", rowCount(result))
+        return result
+    }
+}
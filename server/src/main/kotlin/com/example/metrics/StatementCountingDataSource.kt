@@ -0,0 +1,34 @@
+package com.example.metrics
+
+import org.springframework.jdbc.datasource.DelegatingDataSource
+import java.lang.reflect.InvocationTargetException
+import java.lang.reflect.Proxy
+import java.sql.Connection
+import javax.sql.DataSource
+
+private val STATEMENT_FACTORY_METHODS = setOf("prepareStatement", "prepareCall", "createStatement")
+
+class StatementCountingDataSource(
+    targetDataSource: DataSource,
+) : DelegatingDataSource(targetDataSource) {
+    override fun getConnection(): Connection = super.getConnection().countingStatements()
+
+    override fun getConnection(
+        username: String?,
+        password: String?,
+    ): Connection = super.getConnection(username, password).countingStatements()
+}
+
+private fun Connection.countingStatements(): Connection {
+    val target = this
+    return Proxy.newProxyInstance(Connection::class.java.classLoader, arrayOf(Connection::class.java)) { _, method, args ->
+        if (method.name in STATEMENT_FACTORY_METHODS) {
+            RequestMetrics.current()?.recordStatement()
+        }
+        try {
+            method.invoke(target, *(args ?: emptyArray()))
+        } catch (e: InvocationTargetException) {
+            throw e.targetException
+        }
+    } as Connection
+}
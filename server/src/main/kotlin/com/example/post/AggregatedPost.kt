@@ -1,5 +1,6 @@
 package com.example.post
 
+import com.example.metrics.RequestMetrics
 import tools.jackson.databind.ObjectMapper
 import java.time.Instant
 import java.util.UUID
@@ -34,6 +35,7 @@ fun aggregatePostEvents(
     val applyPostCreated: (AggregatedPost?, PostEvent) -> AggregatedPost? = { currentState, event ->
         (
             try {
+                RequestMetrics.recordEventData(event.eventData)
                 objectMapper.readValue(event.eventData, Map::class.java) as? Map<*, *>
             } catch (e: Exception) {
                 null
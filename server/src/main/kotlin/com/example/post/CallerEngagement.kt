@@ -0,0 +1,42 @@
+package com.example.post
+
+import com.example.datasource.onPrimary
+import com.example.like.LikeEventJdbcRepository
+import com.example.like.UserLikeStatus
+import com.example.repost.RepostEventJdbcRepository
+import com.example.repost.UserRepostStatus
+import org.springframework.stereotype.Component
+import java.util.UUID
+
+/** Which of some posts one caller currently likes and reposts. */
+data class CallerEngagement(
+    val likedPostIds: Set<UUID>,
+    val repostedPostIds: Set<UUID>,
+) {
+    fun isLiked(postId: UUID): Boolean = postId in likedPostIds
+
+    fun isReposted(postId: UUID): Boolean = postId in repostedPostIds
+}
+
+/**
+ * Reads the caller's own like and repost rows from the primary, so a caller who has just liked or reposted a post
+ * sees it flagged even while the replica lags behind; counts are still read wherever the rest of the post is.
+ */
+@Component
+class CallerEngagementReader(
+    private val likeEventJdbcRepository: LikeEventJdbcRepository,
+    private val repostEventJdbcRepository: RepostEventJdbcRepository,
+) {
+    fun find(
+        postIds: Collection<UUID>,
+        userId: UUID,
+    ): CallerEngagement =
+        onPrimary {
+            val likes = likeEventJdbcRepository.findByPostIdsAndUserId(postIds, userId).groupBy { it.postId }
+            val reposts = repostEventJdbcRepository.findByPostIdsAndUserId(postIds, userId).groupBy { it.postId }
+            CallerEngagement(
+                likedPostIds = likes.filterValues { UserLikeStatus.fromEvents(it, userId) == UserLikeStatus.Liked }.keys,
+                repostedPostIds = reposts.filterValues { UserRepostStatus.fromEvents(it, userId) == UserRepostStatus.Reposted }.keys,
+            )
+        }
+}
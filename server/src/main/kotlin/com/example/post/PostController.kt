@@ -41,6 +41,7 @@ class PostController(
                             repostCount = post.repostCount,
                             replyCount = post.replyCount,
                             viewCount = post.viewCount,
+                            uniqueViewCount = post.uniqueViewCount,
                             isLikedByCurrentUser = post.isLikedByCurrentUser,
                             isRepostedByCurrentUser = post.isRepostedByCurrentUser,
                         )
@@ -77,8 +78,9 @@ class PostController(
     override fun getPostsById(
         postId: UUID,
         userId: UUID?,
+        ifNoneMatch: String?,
     ): ResponseEntity<GetPostsById200Response> =
-        when (val result = postService.getPost(postId, userId)) {
+        when (val result = postService.getPost(postId, userId, ifNoneMatch)) {
             is PostRetrievalResult.Success -> {
                 val response =
                     GetPostsById200Response(
@@ -90,10 +92,14 @@ class PostController(
                         repostCount = result.repostCount,
                         replyCount = result.replyCount,
                         viewCount = result.viewCount,
+                        uniqueViewCount = result.uniqueViewCount,
                         isLikedByCurrentUser = result.isLikedByCurrentUser,
                         isRepostedByCurrentUser = result.isRepostedByCurrentUser,
                     )
-                ResponseEntity.ok(response)
+                ResponseEntity.ok().eTag(result.entityTag).body(response)
+            }
+            is PostRetrievalResult.NotModified -> {
+                ResponseEntity.status(HttpStatus.NOT_MODIFIED).eTag(result.entityTag).build()
             }
             is PostRetrievalResult.Failure -> {
                 throw result.exception
@@ -0,0 +1,47 @@
+package com.example.post
+
+import org.springframework.jdbc.core.JdbcTemplate
+import org.springframework.jdbc.core.PreparedStatementSetter
+import org.springframework.stereotype.Repository
+import java.sql.ResultSet
+import java.util.UUID
+
+/**
+ * Batch lookups bound as a single `uuid[]` parameter, so each query has one SQL string and one prepared plan
+ * whatever the number of ids, unlike a derived `IN (...)` query that expands per list size.
+ */
+@Repository
+class PostEventJdbcRepository(
+    private val jdbcTemplate: JdbcTemplate,
+) {
+    fun findByPostIds(postIds: Collection<UUID>): List<PostEvent> = findWhereAny("post_id", postIds)
+
+    fun findByReplyToPostIds(replyToPostIds: Collection<UUID>): List<PostEvent> = findWhereAny("reply_to_post_id", replyToPostIds)
+
+    private fun findWhereAny(
+        column: String,
+        ids: Collection<UUID>,
+    ): List<PostEvent> {
+        if (ids.isEmpty()) return emptyList()
+        return jdbcTemplate.query(
+            """
+            SELECT event_id, post_id, reply_to_post_id, event_type, event_data::text AS event_data, occurred_at
+            FROM post_events
+            WHERE $column = ANY (?)
+            ORDER BY occurred_at, event_id
+            """.trimIndent(),
+            PreparedStatementSetter { ps -> ps.setArray(1, ps.connection.createArrayOf("uuid", ids.toTypedArray())) },
+            { rs, _ -> rs.toPostEvent() },
+        )
+    }
+
+    private fun ResultSet.toPostEvent() =
+        PostEvent(
+            eventId = UUID.fromString(getString("event_id")),
+            postId = UUID.fromString(getString("post_id")),
+            replyToPostId = getString("reply_to_post_id")?.let(UUID::fromString),
+            eventType = getString("event_type"),
+            eventData = getString("event_data"),
+            occurredAt = getTimestamp("occurred_at").toInstant(),
+        )
+}
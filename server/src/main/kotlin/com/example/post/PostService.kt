@@ -1,5 +1,13 @@
 package com.example.post
 
+import com.example.coalescing.SingleFlight
+import com.example.datasource.ReadReplica
+import com.example.datasource.onPrimary
+import com.example.etag.EngagementVersion
+import com.example.etag.EngagementVersionRepository
+import com.example.etag.ifNoneMatchMatches
+import com.example.etag.weakEntityTag
+import com.example.id.timeOrderedUuid
 import io.opentelemetry.instrumentation.annotations.WithSpan
 import org.springframework.dao.DataAccessException
 import org.springframework.stereotype.Service
@@ -30,8 +38,14 @@ sealed interface PostRetrievalResult {
         val repostCount: Int,
         val replyCount: Int,
         val viewCount: Int,
+        val uniqueViewCount: Int,
         val isLikedByCurrentUser: Boolean?,
         val isRepostedByCurrentUser: Boolean?,
+        val entityTag: String,
+    ) : PostRetrievalResult
+
+    data class NotModified(
+        val entityTag: String,
     ) : PostRetrievalResult
 
     data class Failure(
@@ -50,6 +64,7 @@ sealed interface PostsRetrievalResult {
         val repostCount: Int,
         val replyCount: Int,
         val viewCount: Int,
+        val uniqueViewCount: Int,
         val isLikedByCurrentUser: Boolean?,
         val isRepostedByCurrentUser: Boolean?,
     )
@@ -93,12 +108,22 @@ class PostDeletionForbiddenException(
 @Service
 class PostService(
     private val postEventRepository: PostEventRepository,
+    private val postEventJdbcRepository: PostEventJdbcRepository,
     private val userRepository: com.example.auth.UserRepository,
-    private val likeEventRepository: com.example.like.LikeEventRepository,
-    private val repostEventRepository: com.example.repost.RepostEventRepository,
+    private val likeEventJdbcRepository: com.example.like.LikeEventJdbcRepository,
+    private val repostEventJdbcRepository: com.example.repost.RepostEventJdbcRepository,
     private val viewEventRepository: com.example.view.ViewEventRepository,
+    private val viewEventJdbcRepository: com.example.view.ViewEventJdbcRepository,
+    private val viewSketchRepository: com.example.view.ViewSketchRepository,
+    private val engagementVersionRepository: EngagementVersionRepository,
+    private val callerEngagementReader: CallerEngagementReader,
     private val objectMapper: ObjectMapper,
 ) {
+    // Concurrent reads of the same post share one computation; the caller's flags are overlaid on the shared result.
+    // Snapshots are keyed by the version read before them, so a body is never older than the tag it is sent with.
+    private val versionFlights = SingleFlight<UUID, EngagementVersion>()
+    private val postFlights = SingleFlight<EngagementVersion, PostSnapshot?>()
+
     @WithSpan
     fun createPost(
         userId: UUID,
@@ -112,8 +137,8 @@ class PostService(
             return PostCreationResult.Failure(PostUserNotFoundException("User not found"))
         }
 
-        val postId = UUID.randomUUID()
-        val eventId = UUID.randomUUID()
+        val postId = timeOrderedUuid()
+        val eventId = timeOrderedUuid()
         val occurredAt = Instant.now()
 
         val eventData =
@@ -146,101 +171,85 @@ class PostService(
     }
 
     @WithSpan
+    @ReadReplica
     fun getPost(
         postId: UUID,
         currentUserId: UUID?,
+        ifNoneMatch: String? = null,
     ): PostRetrievalResult {
-        val events =
+        val version =
             try {
-                postEventRepository.findByPostIdOrderByOccurredAtAsc(postId)
+                versionFlights.execute(postId) { engagementVersionRepository.findByPostIds(listOf(postId)).single() }
             } catch (e: DataAccessException) {
                 return PostRetrievalResult.Failure(e)
             }
+        val entityTag = weakEntityTag(currentUserId, version)
+        // A missing or deleted post has no current representation, so not even `*` matches it
+        if (version.postExists && ifNoneMatchMatches(ifNoneMatch, entityTag)) {
+            return PostRetrievalResult.NotModified(entityTag)
+        }
 
-        val aggregatedPost =
-            aggregatePostEvents(events, objectMapper)
-                ?: return PostRetrievalResult.Failure(PostNotFoundException("Post not found"))
-
-        val likeEvents =
+        val snapshot =
             try {
-                likeEventRepository.findByPostIdOrderByOccurredAtAsc(postId)
+                postFlights.execute(version) { loadPostSnapshot(postId) }
+                    ?: return PostRetrievalResult.Failure(PostNotFoundException("Post not found"))
             } catch (e: DataAccessException) {
                 return PostRetrievalResult.Failure(e)
             }
-
-        val aggregatedLikes = com.example.like.aggregateLikeEvents(likeEvents)
-        val likeCount = aggregatedLikes.likeCount
-        val isLikedByCurrentUser =
-            currentUserId?.let { uid ->
-                when (
-                    com.example.like.UserLikeStatus
-                        .fromEvents(likeEvents, uid)
-                ) {
-                    com.example.like.UserLikeStatus.Liked -> true
-                    com.example.like.UserLikeStatus.NotLiked -> false
-                }
-            }
-
-        val repostEvents =
+        val caller =
             try {
-                repostEventRepository.findByPostIdOrderByOccurredAtAsc(postId)
+                currentUserId?.let { callerEngagementReader.find(listOf(postId), it) }
             } catch (e: DataAccessException) {
                 return PostRetrievalResult.Failure(e)
             }
-        val aggregatedReposts = com.example.repost.aggregateRepostEvents(repostEvents)
-        val isRepostedByCurrentUser =
-            currentUserId?.let { uid ->
-                when (
-                    com.example.repost.UserRepostStatus
-                        .fromEvents(repostEvents, uid)
-                ) {
-                    com.example.repost.UserRepostStatus.Reposted -> true
-                    com.example.repost.UserRepostStatus.NotReposted -> false
-                }
-            }
 
-        val replyCreatedEvents =
-            try {
-                postEventRepository.findByReplyToPostIdOrderByOccurredAtAsc(postId)
-            } catch (e: DataAccessException) {
-                return PostRetrievalResult.Failure(e)
-            }
-        val replyPostIds = replyCreatedEvents.map { it.postId }.distinct()
+        return PostRetrievalResult.Success(
+            postId = postId,
+            userId = snapshot.post.userId,
+            content = snapshot.post.content,
+            createdAt = snapshot.post.createdAt,
+            likeCount = snapshot.likes.likeCount,
+            repostCount = snapshot.reposts.repostCount,
+            replyCount = snapshot.replyCount,
+            viewCount = snapshot.viewCount,
+            uniqueViewCount = snapshot.uniqueViewCount,
+            isLikedByCurrentUser = caller?.isLiked(postId),
+            isRepostedByCurrentUser = caller?.isReposted(postId),
+            entityTag = entityTag,
+        )
+    }
+
+    private fun loadPostSnapshot(postId: UUID): PostSnapshot? {
+        // A post the caller has just created may not have reached the replica yet
+        val events =
+            postEventRepository
+                .findByPostIdOrderByOccurredAtAsc(postId)
+                .ifEmpty { onPrimary { postEventRepository.findByPostIdOrderByOccurredAtAsc(postId) } }
+        val aggregatedPost = aggregatePostEvents(events, objectMapper) ?: return null
+
+        val aggregatedLikes = com.example.like.aggregateLikeEvents(likeEventJdbcRepository.findByPostId(postId))
+        val aggregatedReposts = com.example.repost.aggregateRepostEvents(repostEventJdbcRepository.findByPostId(postId))
+
+        val replyPostIds = postEventRepository.findByReplyToPostIdOrderByOccurredAtAsc(postId).map { it.postId }.distinct()
         val replyCount =
             if (replyPostIds.isEmpty()) {
                 0
             } else {
-                val allReplyEvents =
-                    try {
-                        postEventRepository.findByPostIdInOrderByOccurredAtAsc(replyPostIds)
-                    } catch (e: DataAccessException) {
-                        return PostRetrievalResult.Failure(e)
-                    }
-                countActiveReplies(allReplyEvents.groupBy { it.postId }, objectMapper)
-            }
-
-        val viewCount =
-            try {
-                viewEventRepository.countByPostId(postId).coerceAtMost(Int.MAX_VALUE.toLong()).toInt()
-            } catch (e: DataAccessException) {
-                return PostRetrievalResult.Failure(e)
+                countActiveReplies(postEventJdbcRepository.findByPostIds(replyPostIds).groupBy { it.postId }, objectMapper)
             }
 
-        return PostRetrievalResult.Success(
-            postId = postId,
-            userId = aggregatedPost.userId,
-            content = aggregatedPost.content,
-            createdAt = aggregatedPost.createdAt,
-            likeCount = likeCount,
-            repostCount = aggregatedReposts.repostCount,
+        return PostSnapshot(
+            post = aggregatedPost,
+            likes = aggregatedLikes,
+            reposts = aggregatedReposts,
             replyCount = replyCount,
-            viewCount = viewCount,
-            isLikedByCurrentUser = isLikedByCurrentUser,
-            isRepostedByCurrentUser = isRepostedByCurrentUser,
+            viewCount = viewEventRepository.countByPostId(postId).coerceAtMost(Int.MAX_VALUE.toLong()).toInt(),
+            uniqueViewCount = viewSketchRepository.findUniqueViewCounts(listOf(postId))[postId] ?: 0,
         )
     }
 
     @WithSpan
+    @ReadReplica
     fun getPosts(
         ids: List<UUID>?,
         currentUserId: UUID?,
@@ -255,7 +264,13 @@ class PostService(
 
         val allEvents =
             try {
-                postEventRepository.findByPostIdInOrderByOccurredAtAsc(distinctIds)
+                val replicaEvents = postEventJdbcRepository.findByPostIds(distinctIds)
+                val missingIds = distinctIds - replicaEvents.map { it.postId }.toSet()
+                if (missingIds.isEmpty()) {
+                    replicaEvents
+                } else {
+                    replicaEvents + onPrimary { postEventJdbcRepository.findByPostIds(missingIds) }
+                }
             } catch (e: DataAccessException) {
                 return PostsRetrievalResult.Failure(e)
             }
@@ -276,7 +291,7 @@ class PostService(
         val paginatedPostIds = paginated.map { (postId, _, _) -> postId }
         val allLikeEvents =
             try {
-                likeEventRepository.findByPostIdInOrderByOccurredAtAsc(paginatedPostIds)
+                likeEventJdbcRepository.findByPostIds(paginatedPostIds)
             } catch (e: DataAccessException) {
                 return PostsRetrievalResult.Failure(e)
             }
@@ -284,7 +299,7 @@ class PostService(
 
         val allRepostEvents =
             try {
-                repostEventRepository.findByPostIdInOrderByOccurredAtAsc(paginatedPostIds)
+                repostEventJdbcRepository.findByPostIds(paginatedPostIds)
             } catch (e: DataAccessException) {
                 return PostsRetrievalResult.Failure(e)
             }
@@ -292,17 +307,23 @@ class PostService(
 
         val viewCountByPostId =
             try {
-                viewEventRepository.countsByPostIdIn(paginatedPostIds).associate {
-                    it.getPostId() to
-                        it.getCount().coerceAtMost(Int.MAX_VALUE.toLong()).toInt()
+                viewEventJdbcRepository.countByPostIds(paginatedPostIds).mapValues { (_, count) ->
+                    count.coerceAtMost(Int.MAX_VALUE.toLong()).toInt()
                 }
             } catch (e: DataAccessException) {
                 return PostsRetrievalResult.Failure(e)
             }
 
+        val uniqueViewCountByPostId =
+            try {
+                viewSketchRepository.findUniqueViewCounts(paginatedPostIds)
+            } catch (e: DataAccessException) {
+                return PostsRetrievalResult.Failure(e)
+            }
+
         val replyCreatedEvents =
             try {
-                postEventRepository.findByReplyToPostIdInOrderByOccurredAtAsc(paginatedPostIds)
+                postEventJdbcRepository.findByReplyToPostIds(paginatedPostIds)
             } catch (e: DataAccessException) {
                 return PostsRetrievalResult.Failure(e)
             }
@@ -313,12 +334,19 @@ class PostService(
                 emptyMap()
             } else {
                 try {
-                    postEventRepository.findByPostIdInOrderByOccurredAtAsc(allReplyPostIds).groupBy { it.postId }
+                    postEventJdbcRepository.findByPostIds(allReplyPostIds).groupBy { it.postId }
                 } catch (e: DataAccessException) {
                     return PostsRetrievalResult.Failure(e)
                 }
             }
 
+        val caller =
+            try {
+                currentUserId?.let { callerEngagementReader.find(paginatedPostIds, it) }
+            } catch (e: DataAccessException) {
+                return PostsRetrievalResult.Failure(e)
+            }
+
         val enrichedPosts =
             paginated.map { (postId, parentPostId, aggregated) ->
                 val likeEvents = likesByPostId[postId] ?: emptyList()
@@ -339,26 +367,9 @@ class PostService(
                     repostCount = aggregatedReposts.repostCount,
                     replyCount = replyCount,
                     viewCount = viewCount,
-                    isLikedByCurrentUser =
-                        currentUserId?.let { uid ->
-                            when (
-                                com.example.like.UserLikeStatus
-                                    .fromEvents(likeEvents, uid)
-                            ) {
-                                com.example.like.UserLikeStatus.Liked -> true
-                                com.example.like.UserLikeStatus.NotLiked -> false
-                            }
-                        },
-                    isRepostedByCurrentUser =
-                        currentUserId?.let { uid ->
-                            when (
-                                com.example.repost.UserRepostStatus
-                                    .fromEvents(repostEvents, uid)
-                            ) {
-                                com.example.repost.UserRepostStatus.Reposted -> true
-                                com.example.repost.UserRepostStatus.NotReposted -> false
-                            }
-                        },
+                    uniqueViewCount = uniqueViewCountByPostId[postId] ?: 0,
+                    isLikedByCurrentUser = caller?.isLiked(postId),
+                    isRepostedByCurrentUser = caller?.isReposted(postId),
                 )
             }
 
@@ -397,7 +408,7 @@ class PostService(
         return try {
             postEventRepository.save(
                 PostEvent(
-                    eventId = UUID.randomUUID(),
+                    eventId = timeOrderedUuid(),
                     postId = postId,
                     eventType = PostEventType.POST_DELETED.value,
                     eventData = objectMapper.writeValueAsString(mapOf("userId" to userId.toString())),
@@ -410,3 +421,13 @@ class PostService(
         }
     }
 }
+
+/** Everything [PostService.getPost] returns about a post except the caller's own flags. */
+private data class PostSnapshot(
+    val post: AggregatedPost,
+    val likes: com.example.like.AggregatedLikes,
+    val reposts: com.example.repost.AggregatedReposts,
+    val replyCount: Int,
+    val viewCount: Int,
+    val uniqueViewCount: Int,
+)
@@ -0,0 +1,195 @@
+package com.example.profiling
+
+import jdk.jfr.consumer.RecordedEvent
+import jdk.jfr.consumer.RecordedThread
+import jdk.jfr.consumer.RecordingFile
+import java.nio.file.Path
+import java.time.Duration
+import java.time.Instant
+
+data class ProfileSummary(
+    val gc: GcSummary,
+    val methods: List<MethodProfile>,
+)
+
+data class GcSummary(
+    val collections: Int,
+    val totalPauseMillis: Long,
+    val longestPauseMillis: Long,
+)
+
+/**
+ * What one service method spent its time on. [hotMethods] weighs top frames by execution samples, [allocationSites]
+ * by sampled bytes and [waits] by milliseconds blocked on a monitor, parked or reading a socket (JDBC included).
+ */
+data class MethodProfile(
+    val method: String,
+    val calls: Int,
+    val totalMillis: Long,
+    val slowestTraces: List<TraceSample>,
+    val hotMethods: List<WeightedFrame>,
+    val allocationSites: List<WeightedFrame>,
+    val waits: List<WeightedFrame>,
+)
+
+data class TraceSample(
+    val traceId: String,
+    val durationMillis: Long,
+)
+
+data class WeightedFrame(
+    val frame: String,
+    val weight: Long,
+)
+
+/**
+ * Summarizes a JFR recording per service method. Each sample is attributed to the innermost [ServiceSpanEvent] open on
+ * its thread at the time, or to [OUTSIDE_SERVICE_METHODS] when none was.
+ *
+ * The file is streamed twice and folded as it is read, so only span intervals and running totals are held, never the
+ * events: spans are committed when they end, after the samples they cover, so they are all collected first.
+ */
+fun summarizeProfile(recording: Path): ProfileSummary {
+    val spansByThread = hashMapOf<Long, MutableList<SpanInterval>>()
+    val accumulators = linkedMapOf<String, MethodAccumulator>()
+
+    fun accumulatorOf(method: String): MethodAccumulator = accumulators.getOrPut(method) { MethodAccumulator(method) }
+
+    fun accumulatorAt(
+        thread: RecordedThread?,
+        time: Instant,
+    ): MethodAccumulator {
+        val span = thread?.let { spansByThread[it.javaThreadId]?.innermostAt(time) }
+        return accumulatorOf(span?.method ?: OUTSIDE_SERVICE_METHODS)
+    }
+
+    var collections = 0
+    var totalPause = Duration.ZERO
+    var longestPause = Duration.ZERO
+    forEachEvent(recording) { event ->
+        when (event.eventType.name) {
+            ServiceSpanEvent.NAME -> {
+                val method = event.getString("spanName") ?: OUTSIDE_SERVICE_METHODS
+                accumulatorOf(method).recordCall(event.getString("traceId"), event.duration)
+                event.thread?.let { thread ->
+                    val spans = spansByThread.getOrPut(thread.javaThreadId) { mutableListOf() }
+                    spans.add(SpanInterval(event.startTime, event.endTime, method))
+                }
+            }
+            GARBAGE_COLLECTION -> {
+                collections++
+                totalPause += event.getDuration("sumOfPauses")
+                longestPause = maxOf(longestPause, event.getDuration("longestPause"))
+            }
+        }
+    }
+    spansByThread.values.forEach { spans -> spans.sortBy { it.start } }
+
+    forEachEvent(recording) { event ->
+        when (event.eventType.name) {
+            EXECUTION_SAMPLE ->
+                accumulatorAt(event.getThread("sampledThread"), event.startTime).hotMethods.add(topFrame(event), 1)
+            OBJECT_ALLOCATION_SAMPLE ->
+                accumulatorAt(event.thread, event.startTime).allocationSites.add(topFrame(event), event.getLong("weight"))
+            in WAIT_EVENTS ->
+                accumulatorAt(event.thread, event.startTime).waits.add(
+                    "${event.eventType.name.removePrefix("jdk.")} ${topFrame(event)}",
+                    event.duration.toMillis(),
+                )
+        }
+    }
+
+    return ProfileSummary(
+        gc = GcSummary(collections, totalPause.toMillis(), longestPause.toMillis()),
+        methods = accumulators.values.map { it.toProfile() }.sortedByDescending { it.totalMillis },
+    )
+}
+
+const val OUTSIDE_SERVICE_METHODS = "(outside service methods)"
+
+private const val EXECUTION_SAMPLE = "jdk.ExecutionSample"
+private const val OBJECT_ALLOCATION_SAMPLE = "jdk.ObjectAllocationSample"
+private const val GARBAGE_COLLECTION = "jdk.GarbageCollection"
+private val WAIT_EVENTS = setOf("jdk.JavaMonitorEnter", "jdk.ThreadPark", "jdk.SocketRead")
+
+private const val TOP_FRAMES = 10
+private const val SLOWEST_TRACES = 5
+
+private inline fun forEachEvent(
+    recording: Path,
+    action: (RecordedEvent) -> Unit,
+) {
+    RecordingFile(recording).use { file ->
+        while (file.hasMoreEvents()) action(file.readEvent())
+    }
+}
+
+private fun topFrame(event: RecordedEvent): String =
+    event.stackTrace
+        ?.frames
+        ?.firstOrNull()
+        ?.let { "${it.method.type.name}.${it.method.name}:${it.lineNumber}" }
+        ?: "(no stack trace)"
+
+private class SpanInterval(
+    val start: Instant,
+    val end: Instant,
+    val method: String,
+)
+
+/** Spans on one thread nest, so the covering span that started last is the innermost one. */
+private fun List<SpanInterval>.innermostAt(time: Instant): SpanInterval? {
+    val startedBefore = binarySearch { if (it.start <= time) -1 else 1 }.let { -(it + 1) }
+    return subList(0, startedBefore).lastOrNull { it.end >= time }
+}
+
+private class MethodAccumulator(
+    val method: String,
+) {
+    private var calls = 0
+    private var total = Duration.ZERO
+    private val traces = mutableListOf<TraceSample>()
+    val hotMethods = FrameWeights()
+    val allocationSites = FrameWeights()
+    val waits = FrameWeights()
+
+    fun recordCall(
+        traceId: String?,
+        duration: Duration,
+    ) {
+        calls++
+        total += duration
+        if (traceId == null) return
+        // Only the slowest are reported, so the others are dropped as they are read
+        traces += TraceSample(traceId, duration.toMillis())
+        if (traces.size > SLOWEST_TRACES) traces.remove(traces.minBy { it.durationMillis })
+    }
+
+    fun toProfile(): MethodProfile =
+        MethodProfile(
+            method = method,
+            calls = calls,
+            totalMillis = total.toMillis(),
+            slowestTraces = traces.sortedByDescending { it.durationMillis }.take(SLOWEST_TRACES),
+            hotMethods = hotMethods.top(),
+            allocationSites = allocationSites.top(),
+            waits = waits.top(),
+        )
+}
+
+private class FrameWeights {
+    private val weights = hashMapOf<String, Long>()
+
+    fun add(
+        frame: String,
+        weight: Long,
+    ) {
+        weights.merge(frame, weight, Long::plus)
+    }
+
+    fun top(): List<WeightedFrame> =
+        weights.entries
+            .sortedByDescending { it.value }
+            .take(TOP_FRAMES)
+            .map { WeightedFrame(it.key, it.value) }
+}
@@ -0,0 +1,154 @@
+package com.example.profiling
+
+import jdk.jfr.Configuration
+import jdk.jfr.Recording
+import jdk.jfr.RecordingState
+import org.slf4j.LoggerFactory
+import org.springframework.beans.factory.DisposableBean
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.stereotype.Component
+import java.nio.file.Files
+import java.nio.file.Path
+import java.time.Duration
+import java.time.Instant
+
+data class RecordingInfo(
+    val id: Long,
+    val name: String,
+    val state: String,
+    val startedAt: Instant?,
+    val duration: Duration?,
+)
+
+sealed interface ProfilingResult {
+    data class Success(
+        val recording: RecordingInfo,
+        val summary: ProfileSummary?,
+    ) : ProfilingResult
+
+    data class Failure(
+        val exception: Exception,
+    ) : ProfilingResult
+}
+
+class ProfilingInProgressException(
+    message: String,
+) : Exception(message)
+
+class InvalidProfilingDurationException(
+    message: String,
+) : Exception(message)
+
+class RecordingNotFoundException(
+    message: String,
+) : Exception(message)
+
+/**
+ * Starts time-boxed JFR recordings on a live node and, when `app.profiling.rolling.enabled` is set, keeps a rolling
+ * recording with JFR's low-overhead `default` settings. On-demand recordings use the `profile` settings and only one
+ * runs at a time; the last [RETAINED_RECORDINGS] are kept for their summaries.
+ */
+@Component
+class Profiler(
+    @Value("\${app.profiling.max-duration:PT5M}") private val maxDuration: Duration,
+    @Value("\${app.profiling.rolling.enabled:false}") rollingEnabled: Boolean,
+    @Value("\${app.profiling.rolling.max-age:PT10M}") rollingMaxAge: Duration,
+) : DisposableBean {
+    private val logger = LoggerFactory.getLogger(Profiler::class.java)
+
+    private val recordings = linkedMapOf<Long, Recording>()
+
+    private val rolling =
+        if (rollingEnabled) {
+            Recording(Configuration.getConfiguration("default")).apply {
+                name = "rolling"
+                maxAge = rollingMaxAge
+                isToDisk = true
+                enable(ServiceSpanEvent::class.java)
+                start()
+            }
+        } else {
+            null
+        }
+
+    @Synchronized
+    fun start(duration: Duration): ProfilingResult {
+        if (duration <= Duration.ZERO || duration > maxDuration) {
+            return ProfilingResult.Failure(InvalidProfilingDurationException("Duration must be positive and at most $maxDuration"))
+        }
+        if (recordings.values.any { it.state == RecordingState.RUNNING }) {
+            return ProfilingResult.Failure(ProfilingInProgressException("A recording is already running"))
+        }
+
+        val recording =
+            Recording(Configuration.getConfiguration("profile")).apply {
+                name = "on-demand"
+                this.duration = duration
+                destination = Files.createTempFile("profile-", ".jfr")
+                enable(ServiceSpanEvent::class.java)
+                start()
+            }
+        recordings[recording.id] = recording
+        while (recordings.size > RETAINED_RECORDINGS) {
+            recordings.remove(recordings.keys.first())?.let(::discard)
+        }
+        logger.info("Started JFR recording {} for {}", recording.id, duration)
+        return ProfilingResult.Success(recording.info(), summary = null)
+    }
+
+    @Synchronized
+    fun recordings(): List<RecordingInfo> = listOfNotNull(rolling?.info()) + recordings.values.map { it.info() }
+
+    /** Stops the recording early if it is still running and summarizes it. */
+    @Synchronized
+    fun stop(id: Long): ProfilingResult {
+        val recording = recordings[id] ?: return ProfilingResult.Failure(RecordingNotFoundException("Recording not found"))
+        if (recording.state == RecordingState.RUNNING) recording.stop()
+        return summarize(recording)
+    }
+
+    /** Summarizes a finished recording; a running one is reported without a summary. */
+    @Synchronized
+    fun summary(id: Long): ProfilingResult {
+        val recording = recordings[id] ?: return ProfilingResult.Failure(RecordingNotFoundException("Recording not found"))
+        if (recording.state == RecordingState.RUNNING) return ProfilingResult.Success(recording.info(), summary = null)
+        return summarize(recording)
+    }
+
+    /** Summarizes what the rolling recording currently holds, up to its max age. */
+    @Synchronized
+    fun rollingSummary(): ProfilingResult {
+        val recording = rolling ?: return ProfilingResult.Failure(RecordingNotFoundException("Rolling recording is disabled"))
+        val snapshot = Files.createTempFile("rolling-", ".jfr")
+        return try {
+            recording.dump(snapshot)
+            ProfilingResult.Success(recording.info(), summarizeProfile(snapshot))
+        } finally {
+            Files.deleteIfExists(snapshot)
+        }
+    }
+
+    override fun destroy() {
+        synchronized(this) {
+            rolling?.close()
+            recordings.values.forEach(::discard)
+        }
+    }
+
+    private fun summarize(recording: Recording): ProfilingResult {
+        val destination = recording.destination ?: return ProfilingResult.Success(recording.info(), summary = null)
+        return ProfilingResult.Success(recording.info(), summarizeProfile(destination))
+    }
+
+    private fun discard(recording: Recording) {
+        val destination: Path? = recording.destination
+        recording.close()
+        destination?.let(Files::deleteIfExists)
+    }
+
+    private fun Recording.info(): RecordingInfo = RecordingInfo(id, name, state.name.lowercase(), startTime, duration)
+
+    companion object {
+        const val RETAINED_RECORDINGS = 5
+    }
+}
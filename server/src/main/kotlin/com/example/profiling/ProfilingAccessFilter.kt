@@ -0,0 +1,55 @@
+package com.example.profiling
+
+import jakarta.servlet.FilterChain
+import jakarta.servlet.http.HttpServletRequest
+import jakarta.servlet.http.HttpServletResponse
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.http.HttpHeaders
+import org.springframework.http.HttpStatus
+import org.springframework.stereotype.Component
+import org.springframework.web.filter.OncePerRequestFilter
+import org.springframework.web.util.UrlPathHelper
+import java.security.MessageDigest
+
+/**
+ * Admin-only access to `/actuator/profiling`: requests must carry `Authorization: Bearer <app.profiling.admin-token>`.
+ * Without a configured token the endpoint answers 404, so profiling is off unless an operator opts in. The path is
+ * matched the way handler mapping sees it, decoded and without `;` parameters, so no spelling of it skips the check.
+ */
+@Component
+class ProfilingAccessFilter(
+    @Value("\${app.profiling.admin-token:}") private val adminToken: String,
+) : OncePerRequestFilter() {
+    override fun shouldNotFilter(request: HttpServletRequest): Boolean =
+        !lookupPath.getPathWithinApplication(request).replace(REPEATED_SLASHES, "/").startsWith(PROFILING_PATH)
+
+    override fun doFilterInternal(
+        request: HttpServletRequest,
+        response: HttpServletResponse,
+        filterChain: FilterChain,
+    ) {
+        when {
+            adminToken.isBlank() -> response.status = HttpStatus.NOT_FOUND.value()
+            !isAdmin(request.getHeader(HttpHeaders.AUTHORIZATION)) -> {
+                response.status = HttpStatus.UNAUTHORIZED.value()
+                response.setHeader(HttpHeaders.WWW_AUTHENTICATE, "Bearer")
+            }
+            else -> filterChain.doFilter(request, response)
+        }
+    }
+
+    private fun isAdmin(authorization: String?): Boolean {
+        val token = authorization?.removePrefix("Bearer ")?.takeIf { it != authorization } ?: return false
+        return MessageDigest.isEqual(token.toByteArray(), adminToken.toByteArray())
+    }
+
+    companion object {
+        const val PROFILING_PATH = "/actuator/profiling"
+        private val REPEATED_SLASHES = Regex("/{2,}")
+        private val lookupPath =
+            UrlPathHelper().apply {
+                setUrlDecode(true)
+                setRemoveSemicolonContent(true)
+            }
+    }
+}
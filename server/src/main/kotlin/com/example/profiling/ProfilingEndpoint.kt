@@ -0,0 +1,71 @@
+package com.example.profiling
+
+import org.springframework.boot.actuate.endpoint.annotation.DeleteOperation
+import org.springframework.boot.actuate.endpoint.annotation.Endpoint
+import org.springframework.boot.actuate.endpoint.annotation.OptionalParameter
+import org.springframework.boot.actuate.endpoint.annotation.ReadOperation
+import org.springframework.boot.actuate.endpoint.annotation.Selector
+import org.springframework.boot.actuate.endpoint.annotation.WriteOperation
+import org.springframework.boot.actuate.endpoint.web.WebEndpointResponse
+import org.springframework.stereotype.Component
+import java.time.Duration
+
+/**
+ * `/actuator/profiling`: `POST` starts a time-boxed recording (`duration`, default one minute), `GET /{id}` summarizes
+ * it once finished, `DELETE /{id}` stops it early and `GET /rolling` summarizes the rolling recording. Access is
+ * guarded by [ProfilingAccessFilter].
+ */
+@Component
+@Endpoint(id = "profiling")
+class ProfilingEndpoint(
+    private val profiler: Profiler,
+) {
+    @ReadOperation
+    fun recordings(): List<RecordingInfo> = profiler.recordings()
+
+    @WriteOperation
+    fun start(
+        @OptionalParameter duration: Duration?,
+    ): WebEndpointResponse<Any> = response(profiler.start(duration ?: DEFAULT_DURATION))
+
+    @ReadOperation
+    fun summary(
+        @Selector id: String,
+    ): WebEndpointResponse<Any> =
+        if (id == ROLLING) {
+            response(profiler.rollingSummary())
+        } else {
+            id.toLongOrNull()?.let { response(profiler.summary(it)) } ?: notFound()
+        }
+
+    @DeleteOperation
+    fun stop(
+        @Selector id: String,
+    ): WebEndpointResponse<Any> = id.toLongOrNull()?.let { response(profiler.stop(it)) } ?: notFound()
+
+    private fun response(result: ProfilingResult): WebEndpointResponse<Any> =
+        when (result) {
+            is ProfilingResult.Success -> WebEndpointResponse<Any>(result)
+            is ProfilingResult.Failure ->
+                when (result.exception) {
+                    is InvalidProfilingDurationException -> errorResponse(result.exception, WebEndpointResponse.STATUS_BAD_REQUEST)
+                    is ProfilingInProgressException -> errorResponse(result.exception, STATUS_CONFLICT)
+                    is RecordingNotFoundException -> errorResponse(result.exception, WebEndpointResponse.STATUS_NOT_FOUND)
+                    else -> throw result.exception
+                }
+        }
+
+    private fun errorResponse(
+        exception: Exception,
+        status: Int,
+    ): WebEndpointResponse<Any> = WebEndpointResponse<Any>(mapOf("error" to (exception.message ?: "")), status)
+
+    private fun notFound(): WebEndpointResponse<Any> =
+        errorResponse(RecordingNotFoundException("Recording not found"), WebEndpointResponse.STATUS_NOT_FOUND)
+
+    companion object {
+        const val ROLLING = "rolling"
+        private const val STATUS_CONFLICT = 409
+        private val DEFAULT_DURATION = Duration.ofMinutes(1)
+    }
+}
@@ -0,0 +1,72 @@
+package com.example.profiling
+
+import io.opentelemetry.api.trace.SpanKind
+import io.opentelemetry.context.Context
+import io.opentelemetry.sdk.autoconfigure.spi.AutoConfigurationCustomizer
+import io.opentelemetry.sdk.autoconfigure.spi.AutoConfigurationCustomizerProvider
+import io.opentelemetry.sdk.trace.ReadWriteSpan
+import io.opentelemetry.sdk.trace.ReadableSpan
+import io.opentelemetry.sdk.trace.SpanProcessor
+import jdk.jfr.Category
+import jdk.jfr.Event
+import jdk.jfr.Label
+import jdk.jfr.Name
+import jdk.jfr.StackTrace
+import org.springframework.stereotype.Component
+import java.util.concurrent.ConcurrentHashMap
+
+/** One `@WithSpan` service method execution, so JFR samples taken on its thread can be attributed to it. */
+@Name(ServiceSpanEvent.NAME)
+@Label("Service Span")
+@Category("micro-chirp")
+@StackTrace(false)
+class ServiceSpanEvent : Event() {
+    @Label("Span")
+    @JvmField
+    var spanName: String? = null
+
+    @Label("Trace ID")
+    @JvmField
+    var traceId: String? = null
+
+    companion object {
+        const val NAME = "com.example.ServiceSpan"
+    }
+}
+
+/**
+ * Emits a [ServiceSpanEvent] for every internal span, i.e. every `@WithSpan` method, while a recording has the event
+ * enabled. Server and JDBC spans are left out so samples are attributed to the service method that caused them.
+ */
+@Component
+class ServiceSpanRecorder : AutoConfigurationCustomizerProvider {
+    override fun customize(autoConfiguration: AutoConfigurationCustomizer) {
+        autoConfiguration.addTracerProviderCustomizer { builder, _ -> builder.addSpanProcessor(ServiceSpanProcessor()) }
+    }
+
+    private class ServiceSpanProcessor : SpanProcessor {
+        private val events = ConcurrentHashMap<String, ServiceSpanEvent>()
+
+        override fun onStart(
+            parentContext: Context,
+            span: ReadWriteSpan,
+        ) {
+            if (span.kind != SpanKind.INTERNAL) return
+            val event = ServiceSpanEvent()
+            if (!event.isEnabled) return
+            event.begin()
+            events[span.spanContext.spanId] = event
+        }
+
+        override fun isStartRequired(): Boolean = true
+
+        override fun onEnd(span: ReadableSpan) {
+            val event = events.remove(span.spanContext.spanId) ?: return
+            event.spanName = span.name
+            event.traceId = span.spanContext.traceId
+            event.commit()
+        }
+
+        override fun isEndRequired(): Boolean = true
+    }
+}
@@ -0,0 +1,43 @@
+package com.example.replay
+
+import com.example.like.LikeEventType
+import org.springframework.jdbc.core.JdbcTemplate
+import org.springframework.stereotype.Component
+import java.sql.Timestamp
+import java.util.UUID
+
+@Component
+class PostLikeStatusProjection(
+    private val jdbcTemplate: JdbcTemplate,
+) : Projection {
+    override val name = "post_like_status"
+
+    override val streams = listOf(EventStream.LIKE_EVENTS)
+
+    override fun reset() {
+        jdbcTemplate.execute("TRUNCATE post_like_status")
+    }
+
+    override fun apply(events: List<ReplayEvent>) {
+        val latest = LinkedHashMap<Pair<UUID, UUID>, ReplayEvent>()
+        for (event in events) {
+            val userId = event.userId ?: continue
+            if (LikeEventType.fromString(event.eventType) != null) latest[event.postId to userId] = event
+        }
+        jdbcTemplate.batchUpdate(
+            """
+            INSERT INTO post_like_status (post_id, user_id, liked, occurred_at)
+            VALUES (?::uuid, ?::uuid, ?, ?)
+            ON CONFLICT (post_id, user_id) DO UPDATE SET liked = EXCLUDED.liked, occurred_at = EXCLUDED.occurred_at
+            """.trimIndent(),
+            latest.map { (key, event) ->
+                arrayOf<Any>(
+                    key.first.toString(),
+                    key.second.toString(),
+                    LikeEventType.fromString(event.eventType) == LikeEventType.LIKED,
+                    Timestamp.from(event.occurredAt),
+                )
+            },
+        )
+    }
+}
@@ -0,0 +1,31 @@
+package com.example.replay
+
+import org.springframework.jdbc.core.JdbcTemplate
+import org.springframework.stereotype.Component
+
+@Component
+class PostViewCountsProjection(
+    private val jdbcTemplate: JdbcTemplate,
+) : Projection {
+    override val name = "post_view_counts"
+
+    override val streams = listOf(EventStream.VIEW_EVENTS)
+
+    override fun reset() {
+        jdbcTemplate.execute("TRUNCATE post_view_counts")
+    }
+
+    override fun apply(events: List<ReplayEvent>) {
+        jdbcTemplate.batchUpdate(
+            """
+            INSERT INTO post_view_counts (post_id, view_count)
+            VALUES (?::uuid, ?)
+            ON CONFLICT (post_id) DO UPDATE SET view_count = post_view_counts.view_count + EXCLUDED.view_count
+            """.trimIndent(),
+            events
+                .groupingBy { it.postId }
+                .eachCount()
+                .map { (postId, count) -> arrayOf<Any>(postId.toString(), count.toLong()) },
+        )
+    }
+}
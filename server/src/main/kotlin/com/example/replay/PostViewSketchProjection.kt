@@ -0,0 +1,31 @@
+package com.example.replay
+
+import com.example.view.ViewEvent
+import com.example.view.ViewSketchRepository
+import org.springframework.jdbc.core.JdbcTemplate
+import org.springframework.stereotype.Component
+
+/** Backfills `post_view_sketches` from view events recorded before the sketches were maintained on ingestion. */
+@Component
+class PostViewSketchProjection(
+    private val jdbcTemplate: JdbcTemplate,
+    private val viewSketchRepository: ViewSketchRepository,
+) : Projection {
+    override val name = "post_view_sketches"
+
+    override val streams = listOf(EventStream.VIEW_EVENTS)
+
+    override fun reset() {
+        jdbcTemplate.execute("TRUNCATE post_view_sketches")
+    }
+
+    override fun apply(events: List<ReplayEvent>) {
+        viewSketchRepository.recordViews(
+            events.mapNotNull { event ->
+                event.userId?.let { userId ->
+                    ViewEvent(eventId = event.eventId, postId = event.postId, userId = userId, occurredAt = event.occurredAt)
+                }
+            },
+        )
+    }
+}
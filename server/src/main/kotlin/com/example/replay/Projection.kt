@@ -0,0 +1,17 @@
+package com.example.replay
+
+/**
+ * A read model that can be rebuilt from the event streams by [ReplayService].
+ *
+ * [apply] receives one partition's events in stream order; all events of a post land in the same
+ * partition. It runs in the same transaction as that partition's checkpoint, so it is applied exactly once.
+ */
+interface Projection {
+    val name: String
+
+    val streams: List<EventStream>
+
+    fun reset()
+
+    fun apply(events: List<ReplayEvent>)
+}
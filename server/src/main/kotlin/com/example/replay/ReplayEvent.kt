@@ -0,0 +1,81 @@
+package com.example.replay
+
+import java.time.Instant
+import java.util.UUID
+
+enum class EventStream(
+    val value: String,
+    internal val selectSql: String,
+) {
+    POST_EVENTS(
+        "post_events",
+        "SELECT event_id, post_id, NULL::uuid AS user_id, event_type, event_data::text AS event_data, occurred_at FROM post_events",
+    ),
+    LIKE_EVENTS(
+        "like_events",
+        "SELECT event_id, post_id, user_id, event_type, NULL::text AS event_data, occurred_at FROM like_events",
+    ),
+    REPOST_EVENTS(
+        "repost_events",
+        "SELECT event_id, post_id, user_id, event_type, NULL::text AS event_data, occurred_at FROM repost_events",
+    ),
+    VIEW_EVENTS(
+        "view_events",
+        "SELECT event_id, post_id, user_id, 'viewed' AS event_type, NULL::text AS event_data, occurred_at FROM view_events",
+    ),
+}
+
+data class ReplayEvent(
+    val stream: EventStream,
+    val eventId: UUID,
+    val postId: UUID,
+    val userId: UUID?,
+    val eventType: String,
+    val eventData: String?,
+    val occurredAt: Instant,
+) {
+    val key: ReplayKey
+        get() = ReplayKey(occurredAt, eventId)
+}
+
+/**
+ * Position of an event in its stream, ordered like `ORDER BY occurred_at, event_id` in PostgreSQL,
+ * which compares uuids as unsigned bytes rather than as [UUID.compareTo]'s signed longs.
+ */
+data class ReplayKey(
+    val occurredAt: Instant,
+    val eventId: UUID,
+) : Comparable<ReplayKey> {
+    override fun compareTo(other: ReplayKey): Int =
+        occurredAt.compareTo(other.occurredAt).takeIf { it != 0 }
+            ?: java.lang.Long.compareUnsigned(eventId.mostSignificantBits, other.eventId.mostSignificantBits).takeIf { it != 0 }
+            ?: java.lang.Long.compareUnsigned(eventId.leastSignificantBits, other.eventId.leastSignificantBits)
+
+    companion object {
+        val START = ReplayKey(Instant.EPOCH, UUID(0, 0))
+
+        /** Position after every event at [occurredAt]. */
+        fun endOf(occurredAt: Instant): ReplayKey = ReplayKey(occurredAt, UUID(-1, -1))
+    }
+}
+
+fun replayPartitionOf(
+    postId: UUID,
+    partitions: Int,
+): Int = Math.floorMod(postId.hashCode(), partitions)
+
+/**
+ * Splits a chunk read in stream order into per-partition lists keyed by `post_id`, keeping stream order
+ * within each partition and dropping events a partition has already checkpointed past.
+ */
+fun partitionReplayChunk(
+    events: List<ReplayEvent>,
+    partitions: Int,
+    checkpoints: Map<Int, ReplayKey>,
+): Map<Int, List<ReplayEvent>> =
+    events
+        .groupBy { replayPartitionOf(it.postId, partitions) }
+        .mapValues { (partition, partitionEvents) ->
+            val checkpoint = checkpoints[partition] ?: ReplayKey.START
+            partitionEvents.filter { it.key > checkpoint }
+        }.filterValues { it.isNotEmpty() }
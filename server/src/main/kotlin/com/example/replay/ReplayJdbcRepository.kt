@@ -0,0 +1,138 @@
+package com.example.replay
+
+import org.springframework.jdbc.core.JdbcTemplate
+import org.springframework.stereotype.Repository
+import java.sql.ResultSet
+import java.sql.Timestamp
+import java.time.Instant
+import java.util.UUID
+
+@Repository
+class ReplayJdbcRepository(
+    private val jdbcTemplate: JdbcTemplate,
+) {
+    fun findEvents(
+        stream: EventStream,
+        after: ReplayKey,
+        upTo: Instant,
+        limit: Int,
+    ): List<ReplayEvent> =
+        jdbcTemplate.query(
+            """
+            SELECT * FROM (${stream.selectSql}) AS events
+            WHERE occurred_at >= ? AND (occurred_at > ? OR event_id > ?::uuid) AND occurred_at <= ?
+            ORDER BY occurred_at, event_id
+            LIMIT ?
+            """.trimIndent(),
+            { rs, _ -> rs.toReplayEvent(stream) },
+            Timestamp.from(after.occurredAt),
+            Timestamp.from(after.occurredAt),
+            after.eventId.toString(),
+            Timestamp.from(upTo),
+            limit,
+        )
+
+    fun initCheckpoints(
+        projectionName: String,
+        stream: EventStream,
+        partitions: Int,
+    ) {
+        jdbcTemplate.update(
+            """
+            INSERT INTO projection_checkpoints (projection_name, stream, partition_no, last_occurred_at, last_event_id)
+            SELECT ?, ?, partition_no, ?, ?::uuid FROM generate_series(0, ? - 1) AS partition_no
+            ON CONFLICT DO NOTHING
+            """.trimIndent(),
+            projectionName,
+            stream.value,
+            Timestamp.from(ReplayKey.START.occurredAt),
+            ReplayKey.START.eventId.toString(),
+            partitions,
+        )
+    }
+
+    fun findCheckpoints(
+        projectionName: String,
+        stream: EventStream,
+    ): Map<Int, ReplayKey> =
+        jdbcTemplate
+            .query(
+                """
+                SELECT partition_no, last_occurred_at, last_event_id FROM projection_checkpoints
+                WHERE projection_name = ? AND stream = ?
+                """.trimIndent(),
+                { rs, _ ->
+                    rs.getInt("partition_no") to
+                        ReplayKey(rs.getTimestamp("last_occurred_at").toInstant(), UUID.fromString(rs.getString("last_event_id")))
+                },
+                projectionName,
+                stream.value,
+            ).toMap()
+
+    /** Moves a partition's checkpoint from [from] to [to]; false when another replay has moved it in the meantime. */
+    fun advanceCheckpoint(
+        projectionName: String,
+        stream: EventStream,
+        partition: Int,
+        from: ReplayKey,
+        to: ReplayKey,
+    ): Boolean =
+        jdbcTemplate.update(
+            """
+            UPDATE projection_checkpoints
+            SET last_occurred_at = ?, last_event_id = ?::uuid, updated_at = now()
+            WHERE projection_name = ? AND stream = ? AND partition_no = ? AND last_occurred_at = ? AND last_event_id = ?::uuid
+            """.trimIndent(),
+            Timestamp.from(to.occurredAt),
+            to.eventId.toString(),
+            projectionName,
+            stream.value,
+            partition,
+            Timestamp.from(from.occurredAt),
+            from.eventId.toString(),
+        ) == 1
+
+    /** Moves the given partitions' checkpoints forward to [key], leaving any that are already past it. */
+    fun advanceCheckpoints(
+        projectionName: String,
+        stream: EventStream,
+        partitions: Collection<Int>,
+        key: ReplayKey,
+    ) {
+        if (partitions.isEmpty()) return
+        jdbcTemplate.update { connection ->
+            connection
+                .prepareStatement(
+                    """
+                    UPDATE projection_checkpoints
+                    SET last_occurred_at = ?, last_event_id = ?::uuid, updated_at = now()
+                    WHERE projection_name = ? AND stream = ? AND partition_no = ANY (?)
+                    AND (last_occurred_at, last_event_id) < (?, ?::uuid)
+                    """.trimIndent(),
+                ).apply {
+                    setTimestamp(1, Timestamp.from(key.occurredAt))
+                    setString(2, key.eventId.toString())
+                    setString(3, projectionName)
+                    setString(4, stream.value)
+                    setArray(5, connection.createArrayOf("integer", partitions.toTypedArray()))
+                    setTimestamp(6, Timestamp.from(key.occurredAt))
+                    setString(7, key.eventId.toString())
+                }
+        }
+    }
+
+    fun deleteCheckpoints(projectionName: String) {
+        jdbcTemplate.update("DELETE FROM projection_checkpoints WHERE projection_name = ?", projectionName)
+    }
+
+    private fun ResultSet.toReplayEvent(stream: EventStream) =
+        ReplayEvent(
+            stream = stream,
+            eventId = UUID.fromString(getString("event_id")),
+            postId = UUID.fromString(getString("post_id")),
+            userId = getString("user_id")?.let(UUID::fromString),
+            eventType = getString("event_type"),
+            eventData = getString("event_data"),
+            occurredAt = getTimestamp("occurred_at").toInstant(),
+        )
+}
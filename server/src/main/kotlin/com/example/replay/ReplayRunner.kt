@@ -0,0 +1,32 @@
+package com.example.replay
+
+import org.slf4j.LoggerFactory
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.boot.ApplicationArguments
+import org.springframework.boot.ApplicationRunner
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty
+import org.springframework.stereotype.Component
+
+/**
+ * Runs a projection replay on startup when `app.replay.projection` is set, e.g.
+ * `--spring.main.web-application-type=none --app.replay.projection=post_view_counts --app.replay.rebuild=true`.
+ */
+@Component
+@ConditionalOnProperty("app.replay.projection")
+class ReplayRunner(
+    private val replayService: ReplayService,
+    @Value("\${app.replay.projection}") private val projectionName: String,
+    @Value("\${app.replay.rebuild:false}") private val rebuild: Boolean,
+    @Value("\${app.replay.partitions:${ReplayService.DEFAULT_PARTITIONS}}") private val partitions: Int,
+    @Value("\${app.replay.chunk-size:${ReplayService.DEFAULT_CHUNK_SIZE}}") private val chunkSize: Int,
+) : ApplicationRunner {
+    private val logger = LoggerFactory.getLogger(ReplayRunner::class.java)
+
+    override fun run(args: ApplicationArguments) {
+        logger.info("Replaying {} (rebuild={}, partitions={}, chunkSize={})", projectionName, rebuild, partitions, chunkSize)
+        when (val result = replayService.replay(projectionName, rebuild, partitions, chunkSize)) {
+            is ReplayResult.Success -> logger.info("Replayed {}: {}", projectionName, result.appliedEvents.mapKeys { it.key.value })
+            is ReplayResult.Failure -> throw result.exception
+        }
+    }
+}
@@ -0,0 +1,164 @@
+package com.example.replay
+
+import io.opentelemetry.instrumentation.annotations.WithSpan
+import org.slf4j.LoggerFactory
+import org.springframework.dao.DataAccessException
+import org.springframework.stereotype.Service
+import org.springframework.transaction.support.TransactionTemplate
+import java.time.Duration
+import java.time.Instant
+import java.util.concurrent.ExecutionException
+import java.util.concurrent.ExecutorService
+import java.util.concurrent.Executors
+
+sealed interface ReplayResult {
+    data class Success(
+        val appliedEvents: Map<EventStream, Long>,
+    ) : ReplayResult
+
+    data class Failure(
+        val exception: Exception,
+    ) : ReplayResult
+}
+
+class ProjectionNotFoundException(
+    message: String,
+) : Exception(message)
+
+class ReplayPartitionMismatchException(
+    message: String,
+) : Exception(message)
+
+// Unchecked, so TransactionTemplate rethrows it as is instead of wrapping it in UndeclaredThrowableException
+class ReplayCheckpointConflictException(
+    message: String,
+) : RuntimeException(message)
+
+@Service
+class ReplayService(
+    projections: List<Projection>,
+    private val replayJdbcRepository: ReplayJdbcRepository,
+    private val transactionTemplate: TransactionTemplate,
+) {
+    private val logger = LoggerFactory.getLogger(ReplayService::class.java)
+
+    private val projectionsByName = projections.associateBy { it.name }
+
+    /**
+     * Replays the projection's streams from its checkpoints, or from the start after emptying it when [rebuild] is set.
+     *
+     * Chunks are read in `(occurred_at, event_id)` order within adaptive time windows and their partitions applied
+     * in parallel, each in its own transaction together with a compare-and-set of its checkpoint, so concurrent runs
+     * cannot apply an event twice.
+     * Events newer than [COMMIT_LAG] are left for the next run, so appends that commit out of `occurred_at` order
+     * are not skipped.
+     */
+    @WithSpan
+    fun replay(
+        projectionName: String,
+        rebuild: Boolean,
+        partitions: Int = DEFAULT_PARTITIONS,
+        chunkSize: Int = DEFAULT_CHUNK_SIZE,
+    ): ReplayResult {
+        val projection =
+            projectionsByName[projectionName]
+                ?: return ReplayResult.Failure(ProjectionNotFoundException("Projection not found: $projectionName"))
+        val upTo = Instant.now().minus(COMMIT_LAG)
+
+        return try {
+            if (rebuild) {
+                transactionTemplate.executeWithoutResult {
+                    projection.reset()
+                    replayJdbcRepository.deleteCheckpoints(projection.name)
+                }
+            }
+            Executors.newFixedThreadPool(partitions).use { executor ->
+                ReplayResult.Success(
+                    projection.streams.associateWith { stream -> replayStream(projection, stream, upTo, partitions, chunkSize, executor) },
+                )
+            }
+        } catch (e: DataAccessException) {
+            ReplayResult.Failure(e)
+        } catch (e: ReplayPartitionMismatchException) {
+            ReplayResult.Failure(e)
+        } catch (e: ExecutionException) {
+            ReplayResult.Failure(e.cause as? Exception ?: e)
+        }
+    }
+
+    private fun replayStream(
+        projection: Projection,
+        stream: EventStream,
+        upTo: Instant,
+        partitions: Int,
+        chunkSize: Int,
+        executor: ExecutorService,
+    ): Long {
+        replayJdbcRepository.initCheckpoints(projection.name, stream, partitions)
+        val checkpoints = replayJdbcRepository.findCheckpoints(projection.name, stream).toMutableMap()
+        if (checkpoints.keys != (0 until partitions).toSet()) {
+            throw ReplayPartitionMismatchException(
+                "${projection.name} was checkpointed with ${checkpoints.size} partitions on ${stream.value}; rebuild to use $partitions",
+            )
+        }
+
+        var position = checkpoints.values.min()
+        // Bounds each read so an occurred_at BRIN scan covers about a chunk: the window halves when it fills
+        // a chunk and doubles when it does not, which also steps quickly over gaps in the stream
+        var window = INITIAL_WINDOW
+        var applied = 0L
+        while (true) {
+            val windowEnd = minOf(upTo, position.occurredAt.plus(window))
+            val chunk = replayJdbcRepository.findEvents(stream, position, windowEnd, chunkSize)
+            if (chunk.isNotEmpty()) {
+                val chunkEnd = chunk.last().key
+
+                val partitioned = partitionReplayChunk(chunk, partitions, checkpoints)
+                partitioned
+                    .map { (partition, events) ->
+                        val from = checkpoints.getValue(partition)
+                        executor.submit {
+                            transactionTemplate.executeWithoutResult {
+                                // Locks the checkpoint row first, so a concurrent replay of the same partition waits and then conflicts
+                                if (!replayJdbcRepository.advanceCheckpoint(projection.name, stream, partition, from, events.last().key)) {
+                                    throw ReplayCheckpointConflictException(
+                                        "${projection.name} partition $partition of ${stream.value} was advanced by another replay",
+                                    )
+                                }
+                                projection.apply(events)
+                            }
+                        }
+                    }.forEach { it.get() }
+
+                // Partitions with nothing in this chunk have still seen everything up to its end
+                val idlePartitions = (0 until partitions).filter { it !in partitioned.keys && checkpoints.getValue(it) < chunkEnd }
+                replayJdbcRepository.advanceCheckpoints(projection.name, stream, idlePartitions, chunkEnd)
+                partitioned.forEach { (partition, events) -> checkpoints[partition] = events.last().key }
+                idlePartitions.forEach { checkpoints[it] = chunkEnd }
+
+                applied += partitioned.values.sumOf { it.size }
+                position = chunkEnd
+                logger.info("Replayed {} events of {} into {} up to {}", applied, stream.value, projection.name, chunkEnd.occurredAt)
+            }
+
+            if (chunk.size == chunkSize) {
+                window = maxOf(MIN_WINDOW, window.dividedBy(2))
+            } else if (windowEnd < upTo) {
+                // A short read has seen every event up to the window end
+                position = ReplayKey.endOf(windowEnd)
+                window = window.multipliedBy(2)
+            } else {
+                break
+            }
+        }
+        return applied
+    }
+
+    companion object {
+        const val DEFAULT_PARTITIONS = 8
+        const val DEFAULT_CHUNK_SIZE = 10_000
+        val COMMIT_LAG: Duration = Duration.ofSeconds(5)
+        private val INITIAL_WINDOW: Duration = Duration.ofHours(1)
+        private val MIN_WINDOW: Duration = Duration.ofSeconds(1)
+    }
+}
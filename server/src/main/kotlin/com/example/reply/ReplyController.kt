@@ -1,9 +1,12 @@
 package com.example.reply
 
 import com.example.api.RepliesApi
+import com.example.model.EnrichedPost
+import com.example.model.GetPostThread200Response
 import com.example.model.GetReplies200Response
 import com.example.model.PostReplies201Response
 import com.example.model.PostRepliesRequest
+import com.example.post.PostsRetrievalResult
 import org.slf4j.LoggerFactory
 import org.springframework.http.HttpStatus
 import org.springframework.http.ResponseEntity
@@ -26,6 +29,30 @@ class ReplyController(
         userId: UUID?,
     ): ResponseEntity<GetReplies200Response> = TODO("Not yet implemented")
 
+    override fun getPostThread(
+        postId: UUID,
+        depth: Int,
+        breadth: Int,
+        userId: UUID?,
+    ): ResponseEntity<GetPostThread200Response> =
+        when (val result = replyService.getThread(postId, userId, depth, breadth)) {
+            is ThreadRetrievalResult.Success -> {
+                val response =
+                    GetPostThread200Response(
+                        post = result.post.toEnrichedPost(),
+                        ancestors = result.ancestors.map { it.toEnrichedPost() },
+                        descendants = result.descendants.map { it.toEnrichedPost() },
+                    )
+                ResponseEntity.ok(response)
+            }
+            is ThreadRetrievalResult.PostNotFound -> {
+                throw ReplyPostNotFoundException("Post not found")
+            }
+            is ThreadRetrievalResult.DataAccessFailure -> {
+                throw result.exception
+            }
+        }
+
     override fun postReplies(
         postId: UUID,
         postRepliesRequest: PostRepliesRequest,
@@ -71,3 +98,19 @@ class ReplyController(
         return ResponseEntity.status(HttpStatus.INTERNAL_SERVER_ERROR).build()
     }
 }
+
+private fun PostsRetrievalResult.PostItem.toEnrichedPost() =
+    EnrichedPost(
+        postId = postId,
+        replyToPostId = replyToPostId,
+        userId = userId,
+        content = content,
+        createdAt = OffsetDateTime.ofInstant(createdAt, ZoneOffset.UTC),
+        likeCount = likeCount,
+        repostCount = repostCount,
+        replyCount = replyCount,
+        viewCount = viewCount,
+        uniqueViewCount = uniqueViewCount,
+        isLikedByCurrentUser = isLikedByCurrentUser,
+        isRepostedByCurrentUser = isRepostedByCurrentUser,
+    )
@@ -1,9 +1,13 @@
 package com.example.reply
 
 import com.example.auth.UserRepository
+import com.example.datasource.ReadReplica
+import com.example.id.timeOrderedUuid
 import com.example.post.PostEvent
 import com.example.post.PostEventRepository
 import com.example.post.PostEventType
+import com.example.post.PostService
+import com.example.post.PostsRetrievalResult
 import com.example.post.aggregatePostEvents
 import com.example.post.parsePostContent
 import io.opentelemetry.instrumentation.annotations.WithSpan
@@ -33,6 +37,21 @@ sealed interface ReplyCreationResult {
     ) : ReplyCreationResult
 }
 
+sealed interface ThreadRetrievalResult {
+    /** [ancestors] run from the root down to the post's parent; [descendants] are breadth first, oldest first per level. */
+    data class Success(
+        val post: PostsRetrievalResult.PostItem,
+        val ancestors: List<PostsRetrievalResult.PostItem>,
+        val descendants: List<PostsRetrievalResult.PostItem>,
+    ) : ThreadRetrievalResult
+
+    data object PostNotFound : ThreadRetrievalResult
+
+    data class DataAccessFailure(
+        val exception: Exception,
+    ) : ThreadRetrievalResult
+}
+
 class ReplyPostNotFoundException(
     message: String,
 ) : Exception(message)
@@ -44,6 +63,8 @@ class ReplyValidationException(
 @Service
 class ReplyService(
     private val postEventRepository: PostEventRepository,
+    private val replyThreadJdbcRepository: ReplyThreadJdbcRepository,
+    private val postService: PostService,
     private val userRepository: UserRepository,
     private val objectMapper: ObjectMapper,
 ) {
@@ -71,8 +92,8 @@ class ReplyService(
         aggregatePostEvents(postEvents, objectMapper)
             ?: return ReplyCreationResult.PostNotFound
 
-        val replyPostId = UUID.randomUUID()
-        val eventId = UUID.randomUUID()
+        val replyPostId = timeOrderedUuid()
+        val eventId = timeOrderedUuid()
         val occurredAt = Instant.now()
 
         val eventData =
@@ -105,4 +126,46 @@ class ReplyService(
             ReplyCreationResult.DataAccessFailure(e)
         }
     }
+
+    /**
+     * The post with its ancestors up to the root and [depth] levels of replies, at most [breadth] per post. The ids
+     * come from two recursive queries and every post is then enriched in one batch; deleted posts are left out, but
+     * the traversal runs through them, so replies to a deleted post are still shown.
+     */
+    @WithSpan
+    @ReadReplica
+    fun getThread(
+        postId: UUID,
+        currentUserId: UUID?,
+        depth: Int,
+        breadth: Int,
+    ): ThreadRetrievalResult {
+        val (ancestorIds, descendantIds) =
+            try {
+                replyThreadJdbcRepository.findAncestorIds(postId, MAX_ANCESTORS) to
+                    replyThreadJdbcRepository.findDescendantIds(postId, depth, breadth, MAX_DESCENDANTS)
+            } catch (e: DataAccessException) {
+                return ThreadRetrievalResult.DataAccessFailure(e)
+            }
+
+        val threadIds = ancestorIds + postId + descendantIds
+        val postsById =
+            when (val result = postService.getPosts(threadIds, currentUserId, limit = threadIds.size, offset = 0)) {
+                is PostsRetrievalResult.Success -> result.posts.associateBy { it.postId }
+                is PostsRetrievalResult.Failure -> return ThreadRetrievalResult.DataAccessFailure(result.exception)
+            }
+
+        val post = postsById[postId] ?: return ThreadRetrievalResult.PostNotFound
+        return ThreadRetrievalResult.Success(
+            post = post,
+            ancestors = ancestorIds.mapNotNull(postsById::get),
+            descendants = descendantIds.mapNotNull(postsById::get),
+        )
+    }
+
+    companion object {
+        // Bounds a thread whatever depth and breadth are asked for; a longer chain is cut above its nearest ancestors
+        const val MAX_ANCESTORS = 50
+        const val MAX_DESCENDANTS = 200
+    }
 }
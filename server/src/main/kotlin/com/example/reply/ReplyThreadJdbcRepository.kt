@@ -0,0 +1,86 @@
+package com.example.reply
+
+import org.springframework.jdbc.core.JdbcTemplate
+import org.springframework.stereotype.Repository
+import java.util.UUID
+
+/**
+ * Walks reply links in `post_events` with recursive CTEs, one query per direction. Only `post_created` events carry a
+ * `reply_to_post_id`, so ancestors are found through `unique_post_event_type` and each post's oldest replies through
+ * `idx_post_events_reply_to_post_id` on `(reply_to_post_id, occurred_at, post_id)`, without reading the rest.
+ */
+@Repository
+class ReplyThreadJdbcRepository(
+    private val jdbcTemplate: JdbcTemplate,
+) {
+    /** Ids of the posts [postId] replies to, directly or not, root first; at most [maxAncestors] of them. */
+    fun findAncestorIds(
+        postId: UUID,
+        maxAncestors: Int,
+    ): List<UUID> =
+        jdbcTemplate.query(
+            """
+            WITH RECURSIVE ancestors AS (
+                SELECT reply_to_post_id AS post_id, 1 AS distance
+                FROM post_events
+                WHERE post_id = ?::uuid AND event_type = 'post_created' AND reply_to_post_id IS NOT NULL
+                UNION ALL
+                SELECT e.reply_to_post_id, a.distance + 1
+                FROM ancestors AS a
+                JOIN post_events AS e ON e.post_id = a.post_id AND e.event_type = 'post_created'
+                WHERE e.reply_to_post_id IS NOT NULL AND a.distance < ?
+            )
+            SELECT post_id FROM ancestors ORDER BY distance DESC
+            """.trimIndent(),
+            { rs, _ -> UUID.fromString(rs.getString("post_id")) },
+            postId.toString(),
+            maxAncestors,
+        )
+
+    /**
+     * Ids of the replies below [postId], breadth first and oldest first within a level: the first [breadth] replies
+     * of each post, down to [depth] levels, stopping after [maxDescendants]. The CTE is evaluated lazily, so the outer
+     * limit ends the traversal instead of trimming a finished one.
+     */
+    fun findDescendantIds(
+        postId: UUID,
+        depth: Int,
+        breadth: Int,
+        maxDescendants: Int,
+    ): List<UUID> {
+        if (depth <= 0) return emptyList()
+        return jdbcTemplate.query(
+            """
+            WITH RECURSIVE descendants AS (
+                SELECT post_id, 1 AS depth
+                FROM (
+                    SELECT post_id
+                    FROM post_events
+                    WHERE reply_to_post_id = ?::uuid
+                    ORDER BY occurred_at, post_id
+                    LIMIT ?
+                ) AS replies
+                UNION ALL
+                SELECT r.post_id, d.depth + 1
+                FROM descendants AS d
+                CROSS JOIN LATERAL (
+                    SELECT post_id
+                    FROM post_events
+                    WHERE reply_to_post_id = d.post_id
+                    ORDER BY occurred_at, post_id
+                    LIMIT ?
+                ) AS r
+                WHERE d.depth < ?
+            )
+            SELECT post_id FROM descendants
+            LIMIT ?
+            """.trimIndent(),
+            { rs, _ -> UUID.fromString(rs.getString("post_id")) },
+            postId.toString(),
+            breadth,
+            breadth,
+            depth,
+            maxDescendants,
+        )
+    }
+}
@@ -5,28 +5,21 @@ import java.util.UUID
 data class AggregatedReposts(
     val repostCount: Int,
     val repostedUserIds: Set<UUID>,
-)
-
-fun aggregateRepostEvents(events: List<RepostEvent>): AggregatedReposts {
-    val applyReposted: (Map<UUID, Boolean>, RepostEvent) -> Map<UUID, Boolean> = { currentState, event ->
-        currentState + (event.userId to true)
-    }
+) {
+    fun statusOf(userId: UUID): UserRepostStatus =
+        if (userId in repostedUserIds) UserRepostStatus.Reposted else UserRepostStatus.NotReposted
+}
 
-    val applyUnreposted: (Map<UUID, Boolean>, RepostEvent) -> Map<UUID, Boolean> = { currentState, event ->
-        currentState + (event.userId to false)
-    }
+fun aggregateRepostEvents(events: List<RepostRow>): AggregatedReposts {
+    val repostedUserIds = LinkedHashSet<UUID>()
 
-    val userRepostStatus =
-        events.fold(emptyMap<UUID, Boolean>()) { acc, event ->
-            when (RepostEventType.fromString(event.eventType)) {
-                RepostEventType.REPOSTED -> applyReposted(acc, event)
-                RepostEventType.UNREPOSTED -> applyUnreposted(acc, event)
-                null -> acc
-            }
+    for (event in events) {
+        when (event.type) {
+            RepostEventType.REPOSTED -> repostedUserIds.add(event.userId)
+            RepostEventType.UNREPOSTED -> repostedUserIds.remove(event.userId)
+            null -> Unit
         }
+    }
 
-    val repostedUserIds = userRepostStatus.filter { it.value }.keys
-    val repostCount = repostedUserIds.size
-
-    return AggregatedReposts(repostCount, repostedUserIds)
+    return AggregatedReposts(repostedUserIds.size, repostedUserIds)
 }
@@ -8,6 +8,8 @@ enum class RepostEventType(
     ;
 
     companion object {
-        fun fromString(value: String): RepostEventType? = entries.find { it.value == value }
+        private val byValue = entries.associateBy { it.value }
+
+        fun fromString(value: String): RepostEventType? = byValue[value]
     }
 }
@@ -1,6 +1,7 @@
 package com.example.repost
 
 import com.example.auth.UserRepository
+import com.example.id.timeOrderedUuid
 import com.example.post.PostEventRepository
 import com.example.post.aggregatePostEvents
 import io.opentelemetry.instrumentation.annotations.WithSpan
@@ -41,6 +42,7 @@ class RepostUserNotFoundException(
 @Service
 class RepostService(
     private val repostEventRepository: RepostEventRepository,
+    private val repostEventJdbcRepository: RepostEventJdbcRepository,
     private val postEventRepository: PostEventRepository,
     private val userRepository: UserRepository,
     private val objectMapper: ObjectMapper,
@@ -69,7 +71,7 @@ class RepostService(
 
         val repostEvent =
             RepostEvent(
-                eventId = UUID.randomUUID(),
+                eventId = timeOrderedUuid(),
                 postId = postId,
                 userId = userId,
                 eventType = RepostEventType.REPOSTED.value,
@@ -109,7 +111,7 @@ class RepostService(
 
         val repostEvents =
             try {
-                repostEventRepository.findByPostIdOrderByOccurredAtAsc(postId)
+                repostEventJdbcRepository.findByPostId(postId)
             } catch (e: DataAccessException) {
                 return UnrepostResult.Failure(e)
             }
@@ -122,7 +124,7 @@ class RepostService(
 
         val unrepostEvent =
             RepostEvent(
-                eventId = UUID.randomUUID(),
+                eventId = timeOrderedUuid(),
                 postId = postId,
                 userId = userId,
                 eventType = RepostEventType.UNREPOSTED.value,
@@ -9,14 +9,10 @@ sealed interface UserRepostStatus {
 
     companion object {
         fun fromEvents(
-            repostEvents: List<RepostEvent>,
+            repostEvents: List<RepostRow>,
             userId: UUID,
         ): UserRepostStatus {
-            val userRepostEvents = repostEvents.filter { it.userId == userId }
-            val lastEventType =
-                userRepostEvents.lastOrNull()?.let {
-                    RepostEventType.fromString(it.eventType)
-                }
+            val lastEventType = repostEvents.lastOrNull { it.userId == userId }?.type
 
             return when (lastEventType) {
                 RepostEventType.REPOSTED -> Reposted
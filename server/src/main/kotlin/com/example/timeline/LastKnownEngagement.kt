@@ -0,0 +1,40 @@
+package com.example.timeline
+
+import java.util.UUID
+
+/**
+ * The most recently enriched posts, least recently used evicted first. While enrichment is degraded, pages are served
+ * with the counts last seen for their posts; posts never seen get zero counts.
+ */
+class LastKnownEngagement(
+    private val capacity: Int,
+) {
+    private val posts =
+        object : LinkedHashMap<UUID, TimelineResult.PostItem>(16, 0.75f, true) {
+            override fun removeEldestEntry(eldest: MutableMap.MutableEntry<UUID, TimelineResult.PostItem>): Boolean = size > capacity
+        }
+
+    @Synchronized
+    fun remember(enrichedPosts: List<TimelineResult.PostItem>) {
+        enrichedPosts.forEach { posts[it.postId] = it }
+    }
+
+    @Synchronized
+    fun recall(pagePosts: List<TimelinePostRow>): List<TimelineResult.PostItem> =
+        pagePosts.map { post ->
+            posts[post.postId]
+                ?: TimelineResult.PostItem(
+                    postId = post.postId,
+                    userId = post.userId,
+                    content = post.content,
+                    createdAt = post.createdAt,
+                    likeCount = 0,
+                    repostCount = 0,
+                    replyCount = 0,
+                    viewCount = 0,
+                    uniqueViewCount = 0,
+                    isLikedByCurrentUser = null,
+                    isRepostedByCurrentUser = null,
+                )
+        }
+}
@@ -14,4 +14,6 @@ class MvRefreshLog(
     val viewName: String,
     @Column(name = "last_refreshed_at", nullable = false)
     var lastRefreshedAt: Instant,
+    @Column(name = "last_refresh_duration_ms")
+    var lastRefreshDurationMs: Long? = null,
 )
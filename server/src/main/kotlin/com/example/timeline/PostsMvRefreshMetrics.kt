@@ -0,0 +1,31 @@
+package com.example.timeline
+
+import io.micrometer.core.instrument.Gauge
+import io.micrometer.core.instrument.MeterRegistry
+import org.springframework.stereotype.Component
+import java.time.Instant
+
+/**
+ * Publishes when posts_mv was last refreshed as `app.posts_mv.last_refreshed_at`, in epoch seconds, read from
+ * `mv_refresh_log` on each scrape. The refresh job runs whenever its backlog or age threshold trips, so this is the
+ * only way to tell from outside the database where in the refresh cycle a read or write happened.
+ */
+@Component
+class PostsMvRefreshMetrics(
+    mvRefreshLogRepository: MvRefreshLogRepository,
+    meterRegistry: MeterRegistry,
+) {
+    init {
+        Gauge
+            .builder("app.posts_mv.last_refreshed_at") {
+                // Until the first refresh the log holds -infinity, which has no epoch seconds
+                mvRefreshLogRepository
+                    .findById(TimelineService.POSTS_MV_NAME)
+                    .map { it.lastRefreshedAt }
+                    .filter { it > Instant.EPOCH }
+                    .map { it.toEpochMilli() / 1000.0 }
+                    .orElse(Double.NaN)
+            }.baseUnit("seconds")
+            .register(meterRegistry)
+    }
+}
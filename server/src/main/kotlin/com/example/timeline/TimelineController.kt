@@ -4,33 +4,50 @@ import com.example.api.TimelineApi
 import com.example.model.GetPostsById200Response
 import com.example.model.GetTimelineGlobal200Response
 import org.slf4j.LoggerFactory
+import org.springframework.core.io.InputStreamResource
+import org.springframework.core.io.Resource
 import org.springframework.http.HttpStatus
+import org.springframework.http.MediaType
 import org.springframework.http.ResponseEntity
 import org.springframework.web.bind.annotation.ExceptionHandler
 import org.springframework.web.bind.annotation.RestController
+import tools.jackson.databind.ObjectMapper
+import java.io.ByteArrayOutputStream
+import java.io.InputStream
+import java.io.SequenceInputStream
 import java.time.OffsetDateTime
 import java.time.ZoneOffset
+import java.util.Enumeration
 import java.util.UUID
 
 @RestController
 class TimelineController(
     private val timelineService: TimelineService,
+    private val objectMapper: ObjectMapper,
 ) : TimelineApi {
     private val logger = LoggerFactory.getLogger(TimelineController::class.java)
 
     override fun getTimelineGlobal(
         limit: Int,
         afterPostId: UUID?,
+        cursor: String?,
         userId: UUID?,
+        ifNoneMatch: String?,
     ): ResponseEntity<GetTimelineGlobal200Response> =
-        when (val result = timelineService.getGlobalTimeline(limit, afterPostId, userId)) {
+        when (val result = timelineService.getGlobalTimeline(limit, afterPostId, userId, cursor, ifNoneMatch)) {
             is TimelineResult.Success ->
-                ResponseEntity.ok(
-                    GetTimelineGlobal200Response(
-                        posts = result.posts.map { it.toResponse() },
-                        limit = result.limit,
-                    ),
-                )
+                ResponseEntity
+                    .ok()
+                    .eTagIfPresent(result.entityTag)
+                    .body(
+                        GetTimelineGlobal200Response(
+                            posts = result.posts.map { it.toResponse() },
+                            limit = result.limit,
+                            nextCursor = result.nextCursor,
+                            degraded = result.degraded,
+                        ),
+                    )
+            is TimelineResult.NotModified -> ResponseEntity.status(HttpStatus.NOT_MODIFIED).eTag(result.entityTag).build()
             is TimelineResult.Failure -> throw result.exception
         }
 
@@ -38,19 +55,78 @@ class TimelineController(
         userId: UUID,
         limit: Int,
         afterPostId: UUID?,
+        cursor: String?,
         currentUserId: UUID?,
+        ifNoneMatch: String?,
+    ): ResponseEntity<GetTimelineGlobal200Response> =
+        when (val result = timelineService.getUserTimeline(userId, limit, afterPostId, currentUserId, cursor, ifNoneMatch)) {
+            is TimelineResult.Success ->
+                ResponseEntity
+                    .ok()
+                    .eTagIfPresent(result.entityTag)
+                    .body(
+                        GetTimelineGlobal200Response(
+                            posts = result.posts.map { it.toResponse() },
+                            limit = result.limit,
+                            nextCursor = result.nextCursor,
+                            degraded = result.degraded,
+                        ),
+                    )
+            is TimelineResult.NotModified -> ResponseEntity.status(HttpStatus.NOT_MODIFIED).eTag(result.entityTag).build()
+            is TimelineResult.Failure -> throw result.exception
+        }
+
+    override fun getTimelineTrending(
+        limit: Int,
+        userId: UUID?,
     ): ResponseEntity<GetTimelineGlobal200Response> =
-        when (val result = timelineService.getUserTimeline(userId, limit, afterPostId, currentUserId)) {
+        when (val result = timelineService.getTrendingTimeline(limit, userId)) {
             is TimelineResult.Success ->
                 ResponseEntity.ok(
                     GetTimelineGlobal200Response(
                         posts = result.posts.map { it.toResponse() },
                         limit = result.limit,
+                        degraded = result.degraded,
                     ),
                 )
+            is TimelineResult.NotModified -> ResponseEntity.status(HttpStatus.NOT_MODIFIED).eTag(result.entityTag).build()
             is TimelineResult.Failure -> throw result.exception
         }
 
+    override fun getTimelineByUserIdExport(userId: UUID): ResponseEntity<Resource> =
+        when (val result = timelineService.exportUserTimeline(userId)) {
+            is TimelineExportResult.Success -> {
+                val lines =
+                    result.chunks
+                        .map { chunk ->
+                            ByteArrayOutputStream()
+                                .apply {
+                                    chunk.forEach { post ->
+                                        write(objectMapper.writeValueAsBytes(post.toResponse()))
+                                        write('\n'.code)
+                                    }
+                                }.toByteArray()
+                                .inputStream()
+                        }.iterator()
+                val body =
+                    SequenceInputStream(
+                        object : Enumeration<InputStream> {
+                            override fun hasMoreElements() = lines.hasNext()
+
+                            override fun nextElement() = lines.next()
+                        },
+                    )
+                ResponseEntity.ok().contentType(NDJSON).body(InputStreamResource(body))
+            }
+            is TimelineExportResult.Failure -> throw result.exception
+        }
+
+    @ExceptionHandler(InvalidTimelineCursorException::class)
+    fun handleInvalidTimelineCursorException(e: InvalidTimelineCursorException): ResponseEntity<Void> {
+        logger.info("Invalid cursor: {}", e.message)
+        return ResponseEntity.badRequest().build()
+    }
+
     @ExceptionHandler(IllegalArgumentException::class)
     fun handleIllegalArgumentException(e: IllegalArgumentException): ResponseEntity<Void> {
         logger.info("Post not found: {}", e.message)
@@ -63,6 +139,9 @@ class TimelineController(
         return ResponseEntity.status(HttpStatus.INTERNAL_SERVER_ERROR).build()
     }
 
+    private fun ResponseEntity.BodyBuilder.eTagIfPresent(entityTag: String?): ResponseEntity.BodyBuilder =
+        if (entityTag == null) this else eTag(entityTag)
+
     private fun TimelineResult.PostItem.toResponse() =
         GetPostsById200Response(
             postId = postId,
@@ -73,7 +152,10 @@ class TimelineController(
             repostCount = repostCount,
             replyCount = replyCount,
             viewCount = viewCount,
+            uniqueViewCount = uniqueViewCount,
             isLikedByCurrentUser = isLikedByCurrentUser,
             isRepostedByCurrentUser = isRepostedByCurrentUser,
         )
 }
+
+private val NDJSON = MediaType("application", "x-ndjson")
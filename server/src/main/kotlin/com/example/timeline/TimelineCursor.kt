@@ -0,0 +1,95 @@
+package com.example.timeline
+
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.stereotype.Component
+import java.nio.ByteBuffer
+import java.security.MessageDigest
+import java.time.Instant
+import java.util.Base64
+import java.util.UUID
+import javax.crypto.Mac
+import javax.crypto.spec.SecretKeySpec
+
+data class TimelineCursor(
+    val createdAt: Instant,
+    val postId: UUID,
+    val authorId: UUID?,
+)
+
+class InvalidTimelineCursorException(
+    message: String,
+) : IllegalArgumentException(message)
+
+/**
+ * Encodes the `(created_at, post_id[, author])` keyset of the last post on a page into an opaque token
+ * signed with HMAC-SHA256, so the next page can be queried without looking the post up again.
+ */
+@Component
+class TimelineCursorCodec(
+    @Value("\${app.timeline.cursor-secret}") secret: String,
+) {
+    init {
+        require(secret.isNotBlank()) { "app.timeline.cursor-secret must be set (TIMELINE_CURSOR_SECRET)" }
+    }
+
+    private val key = SecretKeySpec(secret.toByteArray(Charsets.UTF_8), MAC_ALGORITHM)
+
+    fun encode(cursor: TimelineCursor): String {
+        val payload =
+            ByteBuffer
+                .allocate(if (cursor.authorId == null) PAYLOAD_SIZE else PAYLOAD_SIZE + UUID_SIZE)
+                .put(VERSION)
+                .putLong(cursor.createdAt.epochSecond)
+                .putInt(cursor.createdAt.nano)
+                .putUuid(cursor.postId)
+                .apply { cursor.authorId?.let { putUuid(it) } }
+                .array()
+        return encoder.encodeToString(payload + sign(payload))
+    }
+
+    fun decode(token: String): TimelineCursor? {
+        val bytes =
+            try {
+                decoder.decode(token)
+            } catch (e: IllegalArgumentException) {
+                return null
+            }
+        val payloadSize = bytes.size - SIGNATURE_SIZE
+        if (payloadSize != PAYLOAD_SIZE && payloadSize != PAYLOAD_SIZE + UUID_SIZE) return null
+        val payload = bytes.copyOfRange(0, payloadSize)
+        val signature = bytes.copyOfRange(payloadSize, bytes.size)
+        if (!MessageDigest.isEqual(sign(payload), signature)) return null
+
+        val buffer = ByteBuffer.wrap(payload)
+        if (buffer.get() != VERSION) return null
+        val epochSecond = buffer.getLong()
+        val nano = buffer.getInt()
+        if (nano !in 0..999_999_999) return null
+        return TimelineCursor(
+            createdAt = Instant.ofEpochSecond(epochSecond, nano.toLong()),
+            postId = buffer.getUuid(),
+            authorId = if (buffer.hasRemaining()) buffer.getUuid() else null,
+        )
+    }
+
+    private fun sign(payload: ByteArray): ByteArray =
+        Mac
+            .getInstance(MAC_ALGORITHM)
+            .apply { init(key) }
+            .doFinal(payload)
+            .copyOf(SIGNATURE_SIZE)
+
+    private fun ByteBuffer.putUuid(uuid: UUID): ByteBuffer = putLong(uuid.mostSignificantBits).putLong(uuid.leastSignificantBits)
+
+    private fun ByteBuffer.getUuid(): UUID = UUID(getLong(), getLong())
+
+    companion object {
+        private const val MAC_ALGORITHM = "HmacSHA256"
+        private const val VERSION: Byte = 1
+        private const val UUID_SIZE = 16
+        private const val PAYLOAD_SIZE = 1 + Long.SIZE_BYTES + Int.SIZE_BYTES + UUID_SIZE
+        private const val SIGNATURE_SIZE = 16
+        private val encoder = Base64.getUrlEncoder().withoutPadding()
+        private val decoder = Base64.getUrlDecoder()
+    }
+}
@@ -1,5 +1,6 @@
 package com.example.timeline
 
+import com.example.metrics.RequestMetrics
 import com.example.post.PostEvent
 import com.example.post.PostEventType
 import com.example.post.aggregatePostEvents
@@ -45,6 +46,7 @@ fun buildTimelineDelta(
                     events.firstOrNull { it.eventType == PostEventType.POST_DELETED.value }
                         ?: return@count false
                 try {
+                    RequestMetrics.recordEventData(deleteEvent.eventData)
                     val data =
                         objectMapper.readValue(deleteEvent.eventData, Map::class.java) as? Map<*, *>
                             ?: return@count false
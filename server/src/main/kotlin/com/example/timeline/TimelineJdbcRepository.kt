@@ -44,6 +44,19 @@ class TimelineJdbcRepository(
             limit,
         )
 
+    fun findTrending(limit: Int): List<TimelinePostRow> =
+        jdbcTemplate.query(
+            """
+            SELECT p.post_id, p.user_id, p.content, p.created_at
+            FROM post_trending_scores s
+            JOIN posts_mv p ON p.post_id = s.post_id
+            ORDER BY s.log_score DESC, s.post_id DESC
+            LIMIT ?
+            """.trimIndent(),
+            { rs, _ -> rs.toTimelinePostRow() },
+            limit,
+        )
+
     fun findUserTimeline(
         userId: UUID,
         limit: Int,
@@ -1,21 +1,36 @@
 package com.example.timeline
 
-import com.example.like.LikeEventRepository
-import com.example.like.UserLikeStatus
+import com.example.coalescing.SingleFlight
+import com.example.datasource.ReadReplica
+import com.example.datasource.onPrimary
+import com.example.datasource.onReplica
+import com.example.degradation.DegradableQuery
+import com.example.degradation.DegradationController
+import com.example.etag.EngagementVersionRepository
+import com.example.etag.ifNoneMatchMatches
+import com.example.etag.weakEntityTag
+import com.example.id.timeOrderedUuid
+import com.example.like.LikeEventJdbcRepository
 import com.example.like.aggregateLikeEvents
+import com.example.metrics.RequestMetrics
+import com.example.post.CallerEngagementReader
+import com.example.post.PostEvent
+import com.example.post.PostEventJdbcRepository
 import com.example.post.PostEventRepository
 import com.example.post.PostEventType
 import com.example.post.countActiveReplies
-import com.example.repost.RepostEventRepository
-import com.example.repost.UserRepostStatus
+import com.example.repost.RepostEventJdbcRepository
 import com.example.repost.aggregateRepostEvents
+import com.example.view.ViewEventJdbcRepository
 import com.example.view.ViewEventRepository
+import com.example.view.ViewSketchRepository
 import io.opentelemetry.instrumentation.annotations.WithSpan
 import org.springframework.dao.DataAccessException
 import org.springframework.stereotype.Service
 import tools.jackson.databind.ObjectMapper
 import java.time.Instant
 import java.util.UUID
+import java.util.concurrent.atomic.AtomicReference
 
 sealed interface TimelineResult {
     data class PostItem(
@@ -27,6 +42,7 @@ sealed interface TimelineResult {
         val repostCount: Int,
         val replyCount: Int,
         val viewCount: Int,
+        val uniqueViewCount: Int,
         val isLikedByCurrentUser: Boolean?,
         val isRepostedByCurrentUser: Boolean?,
     )
@@ -34,6 +50,14 @@ sealed interface TimelineResult {
     data class Success(
         val posts: List<PostItem>,
         val limit: Int,
+        val nextCursor: String?,
+        val entityTag: String?,
+        // Served without the delta or with last-known counts while those queries are degraded
+        val degraded: Boolean = false,
+    ) : TimelineResult
+
+    data class NotModified(
+        val entityTag: String,
     ) : TimelineResult
 
     data class Failure(
@@ -41,27 +65,62 @@ sealed interface TimelineResult {
     ) : TimelineResult
 }
 
+sealed interface TimelineExportResult {
+    data class Success(
+        val chunks: Sequence<List<TimelineResult.PostItem>>,
+    ) : TimelineExportResult
+
+    data class Failure(
+        val exception: Exception,
+    ) : TimelineExportResult
+}
+
 @Service
 class TimelineService(
     private val timelineJdbcRepository: TimelineJdbcRepository,
     private val postEventRepository: PostEventRepository,
-    private val likeEventRepository: LikeEventRepository,
-    private val repostEventRepository: RepostEventRepository,
+    private val postEventJdbcRepository: PostEventJdbcRepository,
+    private val likeEventJdbcRepository: LikeEventJdbcRepository,
+    private val repostEventJdbcRepository: RepostEventJdbcRepository,
     private val viewEventRepository: ViewEventRepository,
+    private val viewEventJdbcRepository: ViewEventJdbcRepository,
+    private val viewSketchRepository: ViewSketchRepository,
     private val mvRefreshLogRepository: MvRefreshLogRepository,
+    private val engagementVersionRepository: EngagementVersionRepository,
+    private val callerEngagementReader: CallerEngagementReader,
+    private val degradationController: DegradationController,
+    private val timelineCursorCodec: TimelineCursorCodec,
     private val objectMapper: ObjectMapper,
 ) {
+    // Identical concurrent reads share one computation; per-user flags and view recording stay with each caller
+    private val pageFlights = SingleFlight<TimelinePageKey, TimelinePage>()
+    private val trendingFlights = SingleFlight<Int, TimelinePage>()
+    private val entityTagFlights = SingleFlight<TimelinePage, String>()
+    private val enrichmentFlights = SingleFlight<Pair<List<TimelinePostRow>, String?>, List<TimelineResult.PostItem>>()
+    private val lastKnownEngagement = LastKnownEngagement(LAST_KNOWN_ENGAGEMENT_CAPACITY)
+
+    // Every post deleted since the MV refresh, as of the last delta that was loaded
+    private val lastKnownDeletedIds = AtomicReference<Set<UUID>>(emptySet())
+
     @WithSpan
+    @ReadReplica
     fun getGlobalTimeline(
         limit: Int,
         afterPostId: UUID?,
         currentUserId: UUID?,
+        pageCursor: String? = null,
+        ifNoneMatch: String? = null,
     ): TimelineResult {
         val cursor: Pair<Instant, UUID>? =
-            if (afterPostId != null) {
+            if (pageCursor != null) {
+                val decoded =
+                    timelineCursorCodec.decode(pageCursor)
+                        ?: return TimelineResult.Failure(InvalidTimelineCursorException("Invalid cursor: $pageCursor"))
+                decoded.createdAt to decoded.postId
+            } else if (afterPostId != null) {
                 try {
                     val event =
-                        postEventRepository.findFirstByPostIdAndEventType(afterPostId, PostEventType.POST_CREATED.value)
+                        findPostCreatedEvent(afterPostId)
                             ?: return TimelineResult.Failure(IllegalArgumentException("Post not found: $afterPostId"))
                     event.occurredAt to afterPostId
                 } catch (e: DataAccessException) {
@@ -71,165 +130,91 @@ class TimelineService(
                 null
             }
 
-        val lastRefreshedAt =
-            mvRefreshLogRepository
-                .findById(POSTS_MV_NAME)
-                .map { it.lastRefreshedAt }
-                .orElse(Instant.EPOCH)
-
-        val deltaPostEvents =
+        val page =
             try {
-                postEventRepository.findByOccurredAtAfterOrderByOccurredAtAsc(lastRefreshedAt)
-            } catch (e: DataAccessException) {
+                pageFlights.execute(TimelinePageKey(null, limit, cursor)) { loadGlobalPage(limit, cursor) }
+            } catch (e: Exception) {
                 return TimelineResult.Failure(e)
             }
-
-        val delta = buildTimelineDelta(deltaPostEvents.groupBy { it.postId }, { _ -> true }, objectMapper)
-
-        val deltaOnPage =
-            delta.activePosts
-                .filter { cursor == null || it.createdAt < cursor.first || (it.createdAt == cursor.first && it.postId < cursor.second) }
-                .take(limit)
-        val remainingForMv = limit - deltaOnPage.size
-
-        val mvRawPosts =
+        val (pagePosts, _, degradedPage) = page
+        val entityTag =
             try {
-                if (remainingForMv > 0) {
-                    val mvBuffer = remainingForMv + delta.deletedFromMvCount
-                    if (cursor == null) {
-                        timelineJdbcRepository.findGlobalTimeline(mvBuffer.coerceAtLeast(remainingForMv))
-                    } else {
-                        timelineJdbcRepository.findGlobalTimelineAfter(mvBuffer.coerceAtLeast(remainingForMv), cursor.first, cursor.second)
-                    }
-                } else {
-                    emptyList()
-                }
-            } catch (e: Exception) {
-                return TimelineResult.Failure(Exception("Failed to query timeline MV: ${e.message}", e))
+                pageEntityTag(page, currentUserId)
+            } catch (e: DataAccessException) {
+                return TimelineResult.Failure(e)
             }
-
-        val mvPosts = mvRawPosts.filter { it.postId !in delta.deletedIds }.take(remainingForMv)
-        val pagePosts = deltaOnPage + mvPosts
+        if (entityTag != null && ifNoneMatchMatches(ifNoneMatch, entityTag)) {
+            return TimelineResult.NotModified(entityTag)
+        }
 
         if (pagePosts.isEmpty()) {
-            return TimelineResult.Success(emptyList(), limit)
+            return TimelineResult.Success(emptyList(), limit, null, entityTag, degradedPage)
         }
 
         val postIds = pagePosts.map { it.postId }
 
-        val allLikeEvents =
-            try {
-                likeEventRepository.findByPostIdInOrderByOccurredAtAsc(postIds)
-            } catch (e: DataAccessException) {
-                return TimelineResult.Failure(e)
-            }
-        val likesByPostId = allLikeEvents.groupBy { it.postId }
-
-        val allRepostEvents =
-            try {
-                repostEventRepository.findByPostIdInOrderByOccurredAtAsc(postIds)
-            } catch (e: DataAccessException) {
-                return TimelineResult.Failure(e)
-            }
-        val repostsByPostId = allRepostEvents.groupBy { it.postId }
-
-        val viewCountByPostId =
+        val enrichedPage =
             try {
-                viewEventRepository
-                    .countsByPostIdIn(postIds)
-                    .associate { it.getPostId() to it.getCount().coerceAtMost(Int.MAX_VALUE.toLong()).toInt() }
+                enrichPosts(pagePosts, currentUserId, entityTag)
             } catch (e: DataAccessException) {
                 return TimelineResult.Failure(e)
             }
-
-        val replyCreatedEvents =
-            try {
-                postEventRepository.findByReplyToPostIdInOrderByOccurredAtAsc(postIds)
-            } catch (e: DataAccessException) {
-                return TimelineResult.Failure(e)
-            }
-        val replyPostIdsByParent = replyCreatedEvents.groupBy({ it.replyToPostId!! }, { it.postId })
-        val allReplyPostIds = replyCreatedEvents.map { it.postId }.distinct()
-        val allReplyEventsByPostId =
-            if (allReplyPostIds.isEmpty()) {
-                emptyMap()
-            } else {
-                try {
-                    postEventRepository.findByPostIdInOrderByOccurredAtAsc(allReplyPostIds).groupBy { it.postId }
-                } catch (e: DataAccessException) {
-                    return TimelineResult.Failure(e)
-                }
-            }
-
-        val enrichedPosts =
-            pagePosts.map { post ->
-                val postLikeEvents = likesByPostId[post.postId] ?: emptyList()
-                val aggregatedLikes = aggregateLikeEvents(postLikeEvents)
-                val postRepostEvents = repostsByPostId[post.postId] ?: emptyList()
-                val aggregatedReposts = aggregateRepostEvents(postRepostEvents)
-                val replyPostIds = replyPostIdsByParent[post.postId] ?: emptyList()
-                val replyEventsByPostId = replyPostIds.associateWith { allReplyEventsByPostId[it] ?: emptyList() }
-                val replyCount = countActiveReplies(replyEventsByPostId, objectMapper)
-                val viewCount = viewCountByPostId[post.postId] ?: 0
-                TimelineResult.PostItem(
-                    postId = post.postId,
-                    userId = post.userId,
-                    content = post.content,
-                    createdAt = post.createdAt,
-                    likeCount = aggregatedLikes.likeCount,
-                    repostCount = aggregatedReposts.repostCount,
-                    replyCount = replyCount,
-                    viewCount = viewCount,
-                    isLikedByCurrentUser =
-                        currentUserId?.let { uid ->
-                            when (UserLikeStatus.fromEvents(postLikeEvents, uid)) {
-                                UserLikeStatus.Liked -> true
-                                UserLikeStatus.NotLiked -> false
-                            }
-                        },
-                    isRepostedByCurrentUser =
-                        currentUserId?.let { uid ->
-                            when (UserRepostStatus.fromEvents(postRepostEvents, uid)) {
-                                UserRepostStatus.Reposted -> true
-                                UserRepostStatus.NotReposted -> false
-                            }
-                        },
-                )
-            }
+        val degraded = degradedPage || enrichedPage.degraded
 
         if (currentUserId != null) {
             try {
-                viewEventRepository.saveAll(
+                val views =
                     postIds.map { postId ->
                         com.example.view.ViewEvent(
-                            eventId = UUID.randomUUID(),
+                            eventId = timeOrderedUuid(),
                             postId = postId,
                             userId = currentUserId,
                             occurredAt = Instant.now(),
                         )
-                    },
-                )
+                    }
+                onPrimary {
+                    viewEventRepository.saveAll(views)
+                    viewSketchRepository.recordViews(views)
+                }
             } catch (e: DataAccessException) {
                 return TimelineResult.Failure(e)
             }
         }
 
-        return TimelineResult.Success(enrichedPosts, limit)
+        return TimelineResult.Success(
+            enrichedPage.posts,
+            limit,
+            nextCursor(pagePosts, limit, authorId = null),
+            // Approximate counts must not be revalidated as the page's current state
+            entityTag.takeUnless { enrichedPage.degraded },
+            degraded,
+        )
     }
 
     @WithSpan
+    @ReadReplica
     fun getUserTimeline(
         targetUserId: UUID,
         limit: Int,
         afterPostId: UUID?,
         currentUserId: UUID?,
+        pageCursor: String? = null,
+        ifNoneMatch: String? = null,
     ): TimelineResult {
         val cursor: Pair<Instant, UUID>? =
-            if (afterPostId != null) {
+            if (pageCursor != null) {
+                val decoded =
+                    timelineCursorCodec
+                        .decode(pageCursor)
+                        ?.takeIf { it.authorId == targetUserId }
+                        ?: return TimelineResult.Failure(InvalidTimelineCursorException("Invalid cursor: $pageCursor"))
+                decoded.createdAt to decoded.postId
+            } else if (afterPostId != null) {
                 try {
                     val event =
-                        postEventRepository.findFirstByPostIdAndEventType(afterPostId, PostEventType.POST_CREATED.value)
+                        findPostCreatedEvent(afterPostId)
                             ?: return TimelineResult.Failure(IllegalArgumentException("Post not found: $afterPostId"))
+                    RequestMetrics.recordEventData(event.eventData)
                     val data =
                         objectMapper.readValue(event.eventData, Map::class.java) as? Map<*, *>
                             ?: return TimelineResult.Failure(IllegalArgumentException("Post not found: $afterPostId"))
@@ -247,19 +232,113 @@ class TimelineService(
                 null
             }
 
-        val lastRefreshedAt =
-            mvRefreshLogRepository
-                .findById(POSTS_MV_NAME)
-                .map { it.lastRefreshedAt }
-                .orElse(Instant.EPOCH)
+        val page =
+            try {
+                pageFlights.execute(TimelinePageKey(targetUserId, limit, cursor)) { loadUserPage(targetUserId, limit, cursor) }
+            } catch (e: Exception) {
+                return TimelineResult.Failure(e)
+            }
+        val (pagePosts, _, degradedPage) = page
+        val entityTag =
+            try {
+                pageEntityTag(page, currentUserId)
+            } catch (e: DataAccessException) {
+                return TimelineResult.Failure(e)
+            }
+        if (entityTag != null && ifNoneMatchMatches(ifNoneMatch, entityTag)) {
+            return TimelineResult.NotModified(entityTag)
+        }
 
-        val deltaPostEvents =
+        if (pagePosts.isEmpty()) {
+            return TimelineResult.Success(emptyList(), limit, null, entityTag, degradedPage)
+        }
+
+        val postIds = pagePosts.map { it.postId }
+
+        val enrichedPage =
+            try {
+                enrichPosts(pagePosts, currentUserId, entityTag)
+            } catch (e: DataAccessException) {
+                return TimelineResult.Failure(e)
+            }
+        val degraded = degradedPage || enrichedPage.degraded
+
+        if (currentUserId != null) {
+            try {
+                val views =
+                    postIds.map { postId ->
+                        com.example.view.ViewEvent(
+                            eventId = timeOrderedUuid(),
+                            postId = postId,
+                            userId = currentUserId,
+                            occurredAt = Instant.now(),
+                        )
+                    }
+                onPrimary {
+                    viewEventRepository.saveAll(views)
+                    viewSketchRepository.recordViews(views)
+                }
+            } catch (e: DataAccessException) {
+                return TimelineResult.Failure(e)
+            }
+        }
+
+        return TimelineResult.Success(
+            enrichedPage.posts,
+            limit,
+            nextCursor(pagePosts, limit, authorId = targetUserId),
+            entityTag.takeUnless { enrichedPage.degraded },
+            degraded,
+        )
+    }
+
+    /**
+     * Posts ranked by decayed engagement from `post_trending_scores`. Posts enter the ranking once they are in
+     * posts_mv; deletions since the last refresh are filtered out with the delta like on the global timeline.
+     */
+    @WithSpan
+    @ReadReplica
+    fun getTrendingTimeline(
+        limit: Int,
+        currentUserId: UUID?,
+    ): TimelineResult {
+        val (pagePosts, _, degradedPage) =
             try {
-                postEventRepository.findByOccurredAtAfterOrderByOccurredAtAsc(lastRefreshedAt)
+                trendingFlights.execute(limit) { loadTrendingPage(limit) }
             } catch (e: DataAccessException) {
                 return TimelineResult.Failure(e)
             }
 
+        if (pagePosts.isEmpty()) {
+            return TimelineResult.Success(emptyList(), limit, null, null, degradedPage)
+        }
+
+        val enrichedPage =
+            try {
+                enrichPosts(pagePosts, currentUserId)
+            } catch (e: DataAccessException) {
+                return TimelineResult.Failure(e)
+            }
+        val degraded = degradedPage || enrichedPage.degraded
+
+        return TimelineResult.Success(enrichedPage.posts, limit, null, null, degraded)
+    }
+
+    @WithSpan
+    @ReadReplica
+    fun exportUserTimeline(
+        targetUserId: UUID,
+        chunkSize: Int = EXPORT_CHUNK_SIZE,
+    ): TimelineExportResult {
+        val deltaPostEvents =
+            try {
+                // Read from the same datasource as posts_mv, so the primary delta covers whatever the replica MV lacks
+                val lastRefreshedAt = findLastRefreshedAt()
+                onPrimary { postEventRepository.findByOccurredAtAfterOrderByOccurredAtAsc(lastRefreshedAt) }
+            } catch (e: DataAccessException) {
+                return TimelineExportResult.Failure(e)
+            }
+
         val delta =
             buildTimelineDelta(
                 deltaPostEvents.groupBy { it.postId },
@@ -267,6 +346,37 @@ class TimelineService(
                 objectMapper,
             )
 
+        val firstPage =
+            try {
+                userTimelinePage(targetUserId, chunkSize, null, delta)
+            } catch (e: Exception) {
+                return TimelineExportResult.Failure(Exception("Failed to query timeline MV: ${e.message}", e))
+            }
+
+        // The chunks are pulled after this method has returned, so they pick the read datasource themselves
+        val chunks =
+            generateSequence(firstPage) { previous ->
+                if (previous.size < chunkSize) {
+                    null
+                } else {
+                    val last = previous.last()
+                    onReplica { userTimelinePage(targetUserId, chunkSize, last.createdAt to last.postId, delta) }
+                }
+            }.filter { it.isNotEmpty() }
+                .map { page -> onReplica { loadEnrichedPosts(page) } }
+
+        return TimelineExportResult.Success(chunks)
+    }
+
+    private fun loadGlobalPage(
+        limit: Int,
+        cursor: Pair<Instant, UUID>?,
+    ): TimelinePage {
+        // Read from the same datasource as posts_mv, so the primary delta below covers whatever the replica MV lacks
+        val lastRefreshedAt = findLastRefreshedAt()
+        val degraded = degradationController.isDegraded(DegradableQuery.TIMELINE_DELTA)
+        val delta = if (degraded) degradedDelta() else loadDelta(lastRefreshedAt) { _ -> true }
+
         val deltaOnPage =
             delta.activePosts
                 .filter { cursor == null || it.createdAt < cursor.first || (it.createdAt == cursor.first && it.postId < cursor.second) }
@@ -278,132 +388,243 @@ class TimelineService(
                 if (remainingForMv > 0) {
                     val mvBuffer = remainingForMv + delta.deletedFromMvCount
                     if (cursor == null) {
-                        timelineJdbcRepository.findUserTimeline(targetUserId, mvBuffer.coerceAtLeast(remainingForMv))
+                        timelineJdbcRepository.findGlobalTimeline(mvBuffer.coerceAtLeast(remainingForMv))
                     } else {
-                        timelineJdbcRepository.findUserTimelineAfter(
-                            targetUserId,
-                            mvBuffer.coerceAtLeast(remainingForMv),
-                            cursor.first,
-                            cursor.second,
-                        )
+                        timelineJdbcRepository.findGlobalTimelineAfter(mvBuffer.coerceAtLeast(remainingForMv), cursor.first, cursor.second)
                     }
                 } else {
                     emptyList()
                 }
             } catch (e: Exception) {
-                return TimelineResult.Failure(Exception("Failed to query timeline MV: ${e.message}", e))
+                throw Exception("Failed to query timeline MV: ${e.message}", e)
             }
 
         val mvPosts = mvRawPosts.filter { it.postId !in delta.deletedIds }.take(remainingForMv)
         val pagePosts = deltaOnPage + mvPosts
+        return TimelinePage(pagePosts, lastRefreshedAt, degraded)
+    }
 
-        if (pagePosts.isEmpty()) {
-            return TimelineResult.Success(emptyList(), limit)
-        }
-
-        val postIds = pagePosts.map { it.postId }
-
-        val allLikeEvents =
+    private fun loadUserPage(
+        targetUserId: UUID,
+        limit: Int,
+        cursor: Pair<Instant, UUID>?,
+    ): TimelinePage {
+        // Read from the same datasource as posts_mv, so the primary delta below covers whatever the replica MV lacks
+        val lastRefreshedAt = findLastRefreshedAt()
+        val degraded = degradationController.isDegraded(DegradableQuery.TIMELINE_DELTA)
+        val delta = if (degraded) degradedDelta() else loadDelta(lastRefreshedAt) { userId -> userId == targetUserId }
+
+        val pagePosts =
             try {
-                likeEventRepository.findByPostIdInOrderByOccurredAtAsc(postIds)
-            } catch (e: DataAccessException) {
-                return TimelineResult.Failure(e)
+                userTimelinePage(targetUserId, limit, cursor, delta)
+            } catch (e: Exception) {
+                throw Exception("Failed to query timeline MV: ${e.message}", e)
             }
-        val likesByPostId = allLikeEvents.groupBy { it.postId }
+        return TimelinePage(pagePosts, lastRefreshedAt, degraded)
+    }
 
-        val allRepostEvents =
-            try {
-                repostEventRepository.findByPostIdInOrderByOccurredAtAsc(postIds)
-            } catch (e: DataAccessException) {
-                return TimelineResult.Failure(e)
+    private fun loadTrendingPage(limit: Int): TimelinePage {
+        val degraded = degradationController.isDegraded(DegradableQuery.TIMELINE_DELTA)
+        val lastRefreshedAt = findLastRefreshedAt()
+        val delta = if (degraded) degradedDelta() else loadDelta(lastRefreshedAt) { _ -> true }
+
+        val pagePosts =
+            timelineJdbcRepository
+                .findTrending(limit + delta.deletedFromMvCount)
+                .filter { it.postId !in delta.deletedIds }
+                .take(limit)
+        return TimelinePage(pagePosts, lastRefreshedAt, degraded)
+    }
+
+    private fun loadDelta(
+        lastRefreshedAt: Instant,
+        userFilter: (UUID) -> Boolean,
+    ): TimelineDelta {
+        val deltaPostEvents =
+            degradationController.measure(DegradableQuery.TIMELINE_DELTA) {
+                onPrimary { postEventRepository.findByOccurredAtAfterOrderByOccurredAtAsc(lastRefreshedAt) }
             }
-        val repostsByPostId = allRepostEvents.groupBy { it.postId }
+        return buildTimelineDelta(deltaPostEvents.groupBy { it.postId }, userFilter, objectMapper)
+            .also { lastKnownDeletedIds.set(it.deletedIds) }
+    }
 
-        val viewCountByPostId =
-            try {
-                viewEventRepository
-                    .countsByPostIdIn(postIds)
-                    .associate { it.getPostId() to it.getCount().coerceAtMost(Int.MAX_VALUE.toLong()).toInt() }
-            } catch (e: DataAccessException) {
-                return TimelineResult.Failure(e)
+    /**
+     * Stands in for the delta while the delta query is degraded: posts created since are left to posts_mv, but the
+     * deletions the last delta saw still keep their posts off the page, over-fetching the MV by as many rows.
+     */
+    private fun degradedDelta(): TimelineDelta {
+        val deletedIds = lastKnownDeletedIds.get()
+        return TimelineDelta(emptyList(), deletedIds, deletedIds.size)
+    }
+
+    private fun findLastRefreshedAt(): Instant =
+        mvRefreshLogRepository
+            .findById(POSTS_MV_NAME)
+            .map { it.lastRefreshedAt }
+            .orElse(Instant.EPOCH)
+
+    private fun findPostCreatedEvent(postId: UUID): PostEvent? =
+        postEventRepository.findFirstByPostIdAndEventType(postId, PostEventType.POST_CREATED.value)
+            ?: onPrimary { postEventRepository.findFirstByPostIdAndEventType(postId, PostEventType.POST_CREATED.value) }
+
+    private fun userTimelinePage(
+        targetUserId: UUID,
+        limit: Int,
+        cursor: Pair<Instant, UUID>?,
+        delta: TimelineDelta,
+    ): List<TimelinePostRow> {
+        val deltaOnPage =
+            delta.activePosts
+                .filter { cursor == null || it.createdAt < cursor.first || (it.createdAt == cursor.first && it.postId < cursor.second) }
+                .take(limit)
+        val remainingForMv = limit - deltaOnPage.size
+
+        val mvRawPosts =
+            if (remainingForMv > 0) {
+                val mvBuffer = remainingForMv + delta.deletedFromMvCount
+                if (cursor == null) {
+                    timelineJdbcRepository.findUserTimeline(targetUserId, mvBuffer.coerceAtLeast(remainingForMv))
+                } else {
+                    timelineJdbcRepository.findUserTimelineAfter(
+                        targetUserId,
+                        mvBuffer.coerceAtLeast(remainingForMv),
+                        cursor.first,
+                        cursor.second,
+                    )
+                }
+            } else {
+                emptyList()
             }
 
-        val replyCreatedEvents =
-            try {
-                postEventRepository.findByReplyToPostIdInOrderByOccurredAtAsc(postIds)
-            } catch (e: DataAccessException) {
-                return TimelineResult.Failure(e)
+        val mvPosts = mvRawPosts.filter { it.postId !in delta.deletedIds }.take(remainingForMv)
+        return deltaOnPage + mvPosts
+    }
+
+    /**
+     * Enriches the page, or while enrichment is degraded serves the counts last seen for its posts. The caller's flags
+     * are overlaid on the shared counts from their own rows on the primary, degraded or not.
+     *
+     * Concurrent enrichments are only shared between callers that read the same [entityTag], so the shared read
+     * started after that tag was read and the body is never older than the tag it is sent with.
+     */
+    private fun enrichPosts(
+        pagePosts: List<TimelinePostRow>,
+        currentUserId: UUID?,
+        entityTag: String? = null,
+    ): EnrichedPage {
+        val degraded = degradationController.isDegraded(DegradableQuery.ENRICHMENT)
+        val enrichedPosts =
+            if (degraded) {
+                lastKnownEngagement.recall(pagePosts)
+            } else {
+                enrichmentFlights.execute(pagePosts to entityTag) {
+                    degradationController
+                        .measure(DegradableQuery.ENRICHMENT) { loadEnrichedPosts(pagePosts) }
+                        .also { lastKnownEngagement.remember(it) }
+                }
             }
+        val caller = currentUserId?.let { callerEngagementReader.find(pagePosts.map { it.postId }, it) }
+        return EnrichedPage(
+            enrichedPosts.map {
+                it.copy(isLikedByCurrentUser = caller?.isLiked(it.postId), isRepostedByCurrentUser = caller?.isReposted(it.postId))
+            },
+            degraded,
+        )
+    }
+
+    private fun loadEnrichedPosts(pagePosts: List<TimelinePostRow>): List<TimelineResult.PostItem> {
+        val postIds = pagePosts.map { it.postId }
+
+        val likesByPostId = likeEventJdbcRepository.findByPostIds(postIds).groupBy { it.postId }
+        val repostsByPostId = repostEventJdbcRepository.findByPostIds(postIds).groupBy { it.postId }
+
+        val viewCountByPostId =
+            viewEventJdbcRepository
+                .countByPostIds(postIds)
+                .mapValues { (_, count) -> count.coerceAtMost(Int.MAX_VALUE.toLong()).toInt() }
+        val uniqueViewCountByPostId = viewSketchRepository.findUniqueViewCounts(postIds)
+
+        val replyCreatedEvents = postEventJdbcRepository.findByReplyToPostIds(postIds)
         val replyPostIdsByParent = replyCreatedEvents.groupBy({ it.replyToPostId!! }, { it.postId })
         val allReplyPostIds = replyCreatedEvents.map { it.postId }.distinct()
         val allReplyEventsByPostId =
             if (allReplyPostIds.isEmpty()) {
                 emptyMap()
             } else {
-                try {
-                    postEventRepository.findByPostIdInOrderByOccurredAtAsc(allReplyPostIds).groupBy { it.postId }
-                } catch (e: DataAccessException) {
-                    return TimelineResult.Failure(e)
-                }
+                postEventJdbcRepository.findByPostIds(allReplyPostIds).groupBy { it.postId }
             }
 
-        val enrichedPosts =
-            pagePosts.map { post ->
-                val postLikeEvents = likesByPostId[post.postId] ?: emptyList()
-                val aggregatedLikes = aggregateLikeEvents(postLikeEvents)
-                val postRepostEvents = repostsByPostId[post.postId] ?: emptyList()
-                val aggregatedReposts = aggregateRepostEvents(postRepostEvents)
-                val replyPostIds = replyPostIdsByParent[post.postId] ?: emptyList()
-                val replyEventsByPostId = replyPostIds.associateWith { allReplyEventsByPostId[it] ?: emptyList() }
-                val replyCount = countActiveReplies(replyEventsByPostId, objectMapper)
-                val viewCount = viewCountByPostId[post.postId] ?: 0
-                TimelineResult.PostItem(
-                    postId = post.postId,
-                    userId = post.userId,
-                    content = post.content,
-                    createdAt = post.createdAt,
-                    likeCount = aggregatedLikes.likeCount,
-                    repostCount = aggregatedReposts.repostCount,
-                    replyCount = replyCount,
-                    viewCount = viewCount,
-                    isLikedByCurrentUser =
-                        currentUserId?.let { uid ->
-                            when (UserLikeStatus.fromEvents(postLikeEvents, uid)) {
-                                UserLikeStatus.Liked -> true
-                                UserLikeStatus.NotLiked -> false
-                            }
-                        },
-                    isRepostedByCurrentUser =
-                        currentUserId?.let { uid ->
-                            when (UserRepostStatus.fromEvents(postRepostEvents, uid)) {
-                                UserRepostStatus.Reposted -> true
-                                UserRepostStatus.NotReposted -> false
-                            }
-                        },
-                )
-            }
-
-        if (currentUserId != null) {
-            try {
-                viewEventRepository.saveAll(
-                    postIds.map { postId ->
-                        com.example.view.ViewEvent(
-                            eventId = UUID.randomUUID(),
-                            postId = postId,
-                            userId = currentUserId,
-                            occurredAt = Instant.now(),
-                        )
-                    },
-                )
-            } catch (e: DataAccessException) {
-                return TimelineResult.Failure(e)
-            }
+        return pagePosts.map { post ->
+            val postLikeEvents = likesByPostId[post.postId] ?: emptyList()
+            val aggregatedLikes = aggregateLikeEvents(postLikeEvents)
+            val postRepostEvents = repostsByPostId[post.postId] ?: emptyList()
+            val aggregatedReposts = aggregateRepostEvents(postRepostEvents)
+            val replyPostIds = replyPostIdsByParent[post.postId] ?: emptyList()
+            val replyEventsByPostId = replyPostIds.associateWith { allReplyEventsByPostId[it] ?: emptyList() }
+            val replyCount = countActiveReplies(replyEventsByPostId, objectMapper)
+            val viewCount = viewCountByPostId[post.postId] ?: 0
+            TimelineResult.PostItem(
+                postId = post.postId,
+                userId = post.userId,
+                content = post.content,
+                createdAt = post.createdAt,
+                likeCount = aggregatedLikes.likeCount,
+                repostCount = aggregatedReposts.repostCount,
+                replyCount = replyCount,
+                viewCount = viewCount,
+                uniqueViewCount = uniqueViewCountByPostId[post.postId] ?: 0,
+                isLikedByCurrentUser = null,
+                isRepostedByCurrentUser = null,
+            )
         }
+    }
 
-        return TimelineResult.Success(enrichedPosts, limit)
+    /**
+     * The page's validator, or null when the response carries none: signed-in callers record views, and a page
+     * without the delta is not the current state. Concurrent anonymous callers of one page share the read.
+     */
+    private fun pageEntityTag(
+        page: TimelinePage,
+        currentUserId: UUID?,
+    ): String? {
+        if (currentUserId != null || page.degraded) return null
+        if (page.posts.isEmpty()) return weakEntityTag(page.lastRefreshedAt)
+        return entityTagFlights.execute(page) {
+            weakEntityTag(page.lastRefreshedAt, engagementVersionRepository.findByPostIds(page.posts.map { it.postId }))
+        }
     }
 
+    private fun nextCursor(
+        pagePosts: List<TimelinePostRow>,
+        limit: Int,
+        authorId: UUID?,
+    ): String? =
+        pagePosts
+            .takeIf { it.size == limit }
+            ?.last()
+            ?.let { timelineCursorCodec.encode(TimelineCursor(it.createdAt, it.postId, authorId)) }
+
     companion object {
         const val POSTS_MV_NAME = "posts_mv"
+        const val EXPORT_CHUNK_SIZE = 500
+        const val LAST_KNOWN_ENGAGEMENT_CAPACITY = 10_000
     }
 }
+
+/** Identifies a timeline page independently of the caller; the user timeline's author is null for the global one. */
+private data class TimelinePageKey(
+    val authorId: UUID?,
+    val limit: Int,
+    val cursor: Pair<Instant, UUID>?,
+)
+
+private data class TimelinePage(
+    val posts: List<TimelinePostRow>,
+    val lastRefreshedAt: Instant,
+    val degraded: Boolean,
+)
+
+private data class EnrichedPage(
+    val posts: List<TimelineResult.PostItem>,
+    val degraded: Boolean,
+)
@@ -0,0 +1,57 @@
+package com.example.trending
+
+import com.example.like.LikeEventType
+import com.example.replay.EventStream
+import com.example.replay.ReplayEvent
+import com.example.repost.RepostEventType
+import java.time.Duration
+import java.time.Instant
+import java.util.UUID
+import kotlin.math.abs
+import kotlin.math.exp
+import kotlin.math.ln
+import kotlin.math.ln1p
+
+/**
+ * Scores are kept as `ln(sum(weight * 2^((occurredAt - TRENDING_EPOCH) / TRENDING_HALF_LIFE)))`. Decay scales every
+ * post's score by the same factor, so ranking by this log score is ranking by decayed engagement at any moment,
+ * and new events only ever add to it without rescoring older ones.
+ */
+val TRENDING_EPOCH: Instant = Instant.parse("2025-01-01T00:00:00Z")
+
+val TRENDING_HALF_LIFE: Duration = Duration.ofHours(6)
+
+private const val LIKE_WEIGHT = 1.0
+private const val REPOST_WEIGHT = 2.0
+private const val VIEW_WEIGHT = 0.1
+
+/** Weight of an engagement event; withdrawals and unknown events do not count. */
+fun trendingWeightOf(event: ReplayEvent): Double? =
+    when (event.stream) {
+        EventStream.LIKE_EVENTS -> LIKE_WEIGHT.takeIf { LikeEventType.fromString(event.eventType) == LikeEventType.LIKED }
+        EventStream.REPOST_EVENTS -> REPOST_WEIGHT.takeIf { RepostEventType.fromString(event.eventType) == RepostEventType.REPOSTED }
+        EventStream.VIEW_EVENTS -> VIEW_WEIGHT
+        EventStream.POST_EVENTS -> null
+    }
+
+fun trendingLogScoreOf(
+    weight: Double,
+    occurredAt: Instant,
+): Double = ln(weight) + Duration.between(TRENDING_EPOCH, occurredAt).toMillis() / TRENDING_HALF_LIFE.toMillis().toDouble() * ln(2.0)
+
+/** `ln(exp(a) + exp(b))` without overflowing. */
+fun logAddExp(
+    a: Double,
+    b: Double,
+): Double = maxOf(a, b) + ln1p(exp(-abs(a - b)))
+
+/** Folds a partition's events into one log score increment per post. */
+fun trendingLogScoresOf(events: List<ReplayEvent>): Map<UUID, Double> {
+    val scores = LinkedHashMap<UUID, Double>()
+    for (event in events) {
+        val weight = trendingWeightOf(event) ?: continue
+        val score = trendingLogScoreOf(weight, event.occurredAt)
+        scores.merge(event.postId, score, ::logAddExp)
+    }
+    return scores
+}
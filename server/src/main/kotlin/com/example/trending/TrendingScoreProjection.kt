@@ -0,0 +1,39 @@
+package com.example.trending
+
+import com.example.replay.EventStream
+import com.example.replay.Projection
+import com.example.replay.ReplayEvent
+import org.springframework.jdbc.core.JdbcTemplate
+import org.springframework.stereotype.Component
+
+@Component
+class TrendingScoreProjection(
+    private val jdbcTemplate: JdbcTemplate,
+) : Projection {
+    override val name = NAME
+
+    override val streams = listOf(EventStream.LIKE_EVENTS, EventStream.REPOST_EVENTS, EventStream.VIEW_EVENTS)
+
+    override fun reset() {
+        jdbcTemplate.execute("TRUNCATE post_trending_scores")
+    }
+
+    override fun apply(events: List<ReplayEvent>) {
+        // exp() raises an underflow error in PostgreSQL instead of returning 0, hence the LEAST
+        jdbcTemplate.batchUpdate(
+            """
+            INSERT INTO post_trending_scores (post_id, log_score, updated_at)
+            VALUES (?::uuid, ?, now())
+            ON CONFLICT (post_id) DO UPDATE SET
+                log_score = GREATEST(post_trending_scores.log_score, EXCLUDED.log_score)
+                    + ln(1 + exp(-LEAST(abs(post_trending_scores.log_score - EXCLUDED.log_score), 700))),
+                updated_at = now()
+            """.trimIndent(),
+            trendingLogScoresOf(events).map { (postId, logScore) -> arrayOf<Any>(postId.toString(), logScore) },
+        )
+    }
+
+    companion object {
+        const val NAME = "post_trending_scores"
+    }
+}
@@ -0,0 +1,33 @@
+package com.example.trending
+
+import com.example.replay.ReplayCheckpointConflictException
+import com.example.replay.ReplayResult
+import com.example.replay.ReplayService
+import org.slf4j.LoggerFactory
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty
+import org.springframework.scheduling.annotation.EnableScheduling
+import org.springframework.scheduling.annotation.Scheduled
+import org.springframework.stereotype.Component
+
+/** Folds engagement events recorded since the last run into `post_trending_scores`. */
+@Component
+@EnableScheduling
+@ConditionalOnProperty("app.trending.refresh-enabled", matchIfMissing = true)
+class TrendingScoreScheduler(
+    private val replayService: ReplayService,
+) {
+    private val logger = LoggerFactory.getLogger(TrendingScoreScheduler::class.java)
+
+    @Scheduled(fixedDelayString = "\${app.trending.refresh-interval}")
+    fun refresh() {
+        when (val result = replayService.replay(TrendingScoreProjection.NAME, rebuild = false)) {
+            is ReplayResult.Success -> logger.debug("Updated trending scores: {}", result.appliedEvents.mapKeys { it.key.value })
+            is ReplayResult.Failure ->
+                if (result.exception is ReplayCheckpointConflictException) {
+                    logger.info("Trending scores are being updated by another node: {}", result.exception.message)
+                } else {
+                    logger.warn("Failed to update trending scores", result.exception)
+                }
+        }
+    }
+}
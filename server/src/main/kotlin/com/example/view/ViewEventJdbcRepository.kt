@@ -0,0 +1,22 @@
+package com.example.view
+
+import org.springframework.jdbc.core.JdbcTemplate
+import org.springframework.jdbc.core.PreparedStatementSetter
+import org.springframework.stereotype.Repository
+import java.util.UUID
+
+@Repository
+class ViewEventJdbcRepository(
+    private val jdbcTemplate: JdbcTemplate,
+) {
+    /** View counts of the given posts, omitting posts without views; the ids are bound as one `uuid[]`. */
+    fun countByPostIds(postIds: Collection<UUID>): Map<UUID, Long> {
+        if (postIds.isEmpty()) return emptyMap()
+        return jdbcTemplate
+            .query(
+                "SELECT post_id, count(*) AS view_count FROM view_events WHERE post_id = ANY (?) GROUP BY post_id",
+                PreparedStatementSetter { ps -> ps.setArray(1, ps.connection.createArrayOf("uuid", postIds.toTypedArray())) },
+                { rs, _ -> UUID.fromString(rs.getString("post_id")) to rs.getLong("view_count") },
+            ).toMap()
+    }
+}
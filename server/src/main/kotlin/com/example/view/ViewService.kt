@@ -1,6 +1,7 @@
 package com.example.view
 
 import com.example.auth.UserRepository
+import com.example.id.timeOrderedUuid
 import com.example.post.PostEventRepository
 import com.example.post.aggregatePostEvents
 import io.opentelemetry.instrumentation.annotations.WithSpan
@@ -33,6 +34,7 @@ class ViewPostNotFoundException(
 @Service
 class ViewService(
     private val viewEventRepository: ViewEventRepository,
+    private val viewSketchRepository: ViewSketchRepository,
     private val postEventRepository: PostEventRepository,
     private val userRepository: UserRepository,
     private val objectMapper: ObjectMapper,
@@ -58,7 +60,7 @@ class ViewService(
 
         val viewEvent =
             ViewEvent(
-                eventId = UUID.randomUUID(),
+                eventId = timeOrderedUuid(),
                 postId = postId,
                 userId = userId,
                 occurredAt = Instant.now(),
@@ -66,6 +68,7 @@ class ViewService(
 
         return try {
             viewEventRepository.save(viewEvent)
+            viewSketchRepository.recordViews(listOf(viewEvent))
             ViewResult.Success(
                 postId = postId,
                 userId = userId,
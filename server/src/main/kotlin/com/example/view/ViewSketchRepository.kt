@@ -0,0 +1,116 @@
+package com.example.view
+
+import org.springframework.jdbc.core.JdbcTemplate
+import org.springframework.jdbc.core.PreparedStatementCreator
+import org.springframework.stereotype.Repository
+import java.sql.Timestamp
+import java.time.Instant
+import java.time.temporal.ChronoUnit
+import java.util.UUID
+
+/**
+ * Per-post, per-day HyperLogLog sketches of viewer ids in `post_view_sketches`.
+ *
+ * A view raises a single register in place, and only when it ranks higher, so repeat views leave the row untouched.
+ */
+@Repository
+class ViewSketchRepository(
+    private val jdbcTemplate: JdbcTemplate,
+) {
+    /**
+     * Raises the registers of the viewed sketches, one statement per register that grows. The sketches are read
+     * first without locking, and registers the views do not raise are skipped: once a post has a few hundred
+     * viewers almost no view raises one, and an upsert would lock the row even when its update is a no-op, queueing
+     * concurrent viewers of the post behind each other.
+     */
+    fun recordViews(views: Collection<ViewEvent>) {
+        val raised =
+            views
+                .map { view ->
+                    val update = hllUpdateOf(view.userId)
+                    SketchRegister(view.postId, view.occurredAt.truncatedTo(ChronoUnit.DAYS), update.register) to update.rank
+                }.groupingBy { it.first }
+                .fold(0) { max, (_, rank) -> maxOf(max, rank) }
+        if (raised.isEmpty()) return
+
+        val registersBySketch = findRegisters(raised.keys)
+        val updates =
+            raised
+                .filter { (sketch, rank) ->
+                    val current = registersBySketch[sketch.postId to sketch.bucketStart]?.get(sketch.register)?.toInt() ?: 0
+                    current < rank
+                }
+                // A stable row order keeps concurrent batches from deadlocking on the same sketches
+                .toSortedMap(compareBy<SketchRegister> { it.postId }.thenBy { it.bucketStart }.thenBy { it.register })
+        if (updates.isEmpty()) return
+
+        jdbcTemplate.batchUpdate(
+            """
+            INSERT INTO post_view_sketches (post_id, bucket_start, registers)
+            VALUES (?::uuid, ?, set_byte(decode(repeat('00', ?), 'hex'), ?, ?))
+            ON CONFLICT (post_id, bucket_start) DO UPDATE
+            SET registers = set_byte(post_view_sketches.registers, ?, ?)
+            WHERE get_byte(post_view_sketches.registers, ?) < ?
+            """.trimIndent(),
+            updates.map { (sketch, rank) ->
+                arrayOf<Any>(
+                    sketch.postId.toString(),
+                    Timestamp.from(sketch.bucketStart),
+                    HLL_REGISTER_COUNT,
+                    sketch.register,
+                    rank,
+                    sketch.register,
+                    rank,
+                    sketch.register,
+                    rank,
+                )
+            },
+        )
+    }
+
+    fun findUniqueViewCounts(postIds: Collection<UUID>): Map<UUID, Int> {
+        if (postIds.isEmpty()) return emptyMap()
+        val sketchesByPostId =
+            jdbcTemplate
+                .query(
+                    PreparedStatementCreator { connection ->
+                        connection
+                            .prepareStatement("SELECT post_id, registers FROM post_view_sketches WHERE post_id = ANY (?)")
+                            .apply { setArray(1, connection.createArrayOf("uuid", postIds.toTypedArray())) }
+                    },
+                    { rs, _ -> UUID.fromString(rs.getString("post_id")) to rs.getBytes("registers") },
+                ).groupBy({ it.first }, { it.second })
+        return sketchesByPostId.mapValues { (_, sketches) ->
+            estimateHllCardinality(mergeHllRegisters(sketches)).coerceAtMost(Int.MAX_VALUE.toLong()).toInt()
+        }
+    }
+
+    private fun findRegisters(sketches: Collection<SketchRegister>): Map<Pair<UUID, Instant>, ByteArray> {
+        val postIds = sketches.map { it.postId }.distinct()
+        val bucketStarts = sketches.map { Timestamp.from(it.bucketStart) }.distinct()
+        return jdbcTemplate
+            .query(
+                PreparedStatementCreator { connection ->
+                    connection
+                        .prepareStatement(
+                            """
+                            SELECT post_id, bucket_start, registers FROM post_view_sketches
+                            WHERE post_id = ANY (?) AND bucket_start = ANY (?)
+                            """.trimIndent(),
+                        ).apply {
+                            setArray(1, connection.createArrayOf("uuid", postIds.toTypedArray()))
+                            setArray(2, connection.createArrayOf("timestamptz", bucketStarts.toTypedArray()))
+                        }
+                },
+                { rs, _ ->
+                    (UUID.fromString(rs.getString("post_id")) to rs.getTimestamp("bucket_start").toInstant()) to rs.getBytes("registers")
+                },
+            ).toMap()
+    }
+
+    private data class SketchRegister(
+        val postId: UUID,
+        val bucketStart: Instant,
+        val register: Int,
+    )
+}
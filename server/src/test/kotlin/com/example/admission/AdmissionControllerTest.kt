@@ -0,0 +1,111 @@
+package com.example.admission
+
+import io.kotest.assertions.throwables.shouldThrow
+import io.kotest.core.spec.style.FunSpec
+import io.kotest.matchers.shouldBe
+import io.kotest.matchers.types.shouldBeInstanceOf
+import io.micrometer.core.instrument.simple.SimpleMeterRegistry
+import org.springframework.mock.env.MockEnvironment
+import kotlin.concurrent.thread
+
+class AdmissionControllerTest :
+    FunSpec({
+        test("when admissionClassOf with each endpoint then views, batches and exports are bulk and post writes are protected") {
+            admissionClassOf("POST", "/posts") shouldBe AdmissionClass.POST_WRITE
+            admissionClassOf("DELETE", "/posts/0198c2b0-0000-7000-8000-000000000000") shouldBe AdmissionClass.POST_WRITE
+            admissionClassOf("POST", "/posts/0198c2b0-0000-7000-8000-000000000000/replies") shouldBe AdmissionClass.POST_WRITE
+            admissionClassOf("POST", "/auth/login") shouldBe AdmissionClass.POST_WRITE
+            admissionClassOf("GET", "/timeline/global") shouldBe AdmissionClass.READ
+            admissionClassOf("GET", "/posts/0198c2b0-0000-7000-8000-000000000000/replies") shouldBe AdmissionClass.READ
+            admissionClassOf("POST", "/posts/0198c2b0-0000-7000-8000-000000000000/likes") shouldBe AdmissionClass.ENGAGEMENT
+            admissionClassOf("DELETE", "/posts/0198c2b0-0000-7000-8000-000000000000/reposts") shouldBe AdmissionClass.ENGAGEMENT
+            admissionClassOf("POST", "/posts/0198c2b0-0000-7000-8000-000000000000/views") shouldBe AdmissionClass.BULK
+            admissionClassOf("POST", "/engagement/batch") shouldBe AdmissionClass.BULK
+            admissionClassOf("GET", "/timeline/users/0198c2b0-0000-7000-8000-000000000000/export") shouldBe AdmissionClass.BULK
+            admissionClassOf("GET", "/actuator/health") shouldBe null
+        }
+
+        test("when a class is at its concurrency limit and has no queue then rejects until a slot is released") {
+            val controller = admissionController("app.admission.bulk.max-concurrent" to "1")
+
+            val admitted = controller.admit(AdmissionClass.BULK).shouldBeInstanceOf<Admission.Admitted>()
+            controller.admit(AdmissionClass.BULK) shouldBe Admission.Rejected(AdmissionClass.BULK, RejectionReason.QUEUE_FULL)
+            controller.release(admitted)
+
+            controller.admit(AdmissionClass.BULK).shouldBeInstanceOf<Admission.Admitted>()
+        }
+
+        test("when max-concurrent across classes is above the connection pool size then fails at startup") {
+            shouldThrow<IllegalStateException> { admissionController("spring.datasource.hikari.maximum-pool-size" to "9") }
+            shouldThrow<IllegalStateException> {
+                admissionController("spring.datasource.hikari.maximum-pool-size" to "20", "app.admission.read.max-concurrent" to "15")
+            }
+        }
+
+        test("when admitted and queued requests could take every request thread then fails at startup") {
+            shouldThrow<IllegalStateException> { admissionController("server.tomcat.threads.max" to "100") }
+        }
+
+        test("when a class stays at its limit for longer than max wait then rejects the waiting request") {
+            val controller = admissionController("app.admission.read.max-concurrent" to "1", "app.admission.read.max-wait" to "10ms")
+
+            controller.admit(AdmissionClass.READ).shouldBeInstanceOf<Admission.Admitted>()
+
+            controller.admit(AdmissionClass.READ) shouldBe Admission.Rejected(AdmissionClass.READ, RejectionReason.TIMEOUT)
+        }
+
+        test("when a queued request is admitted after a release then it runs in the freed slot") {
+            val meterRegistry = SimpleMeterRegistry()
+            val controller =
+                admissionController(
+                    "app.admission.read.max-concurrent" to "1",
+                    "app.admission.read.max-wait" to "10s",
+                    meterRegistry = meterRegistry,
+                )
+            val first = controller.admit(AdmissionClass.READ) as Admission.Admitted
+
+            var second: Admission? = null
+            val waiter = thread { second = controller.admit(AdmissionClass.READ) }
+            meterRegistry.awaitQueued(AdmissionClass.READ)
+            controller.release(first)
+            waiter.join()
+
+            second shouldBe Admission.Admitted(AdmissionClass.READ)
+        }
+
+        test("when any request is queued then sheds bulk requests first while higher classes still get in") {
+            val meterRegistry = SimpleMeterRegistry()
+            val controller =
+                admissionController(
+                    "app.admission.read.max-concurrent" to "1",
+                    "app.admission.read.max-wait" to "10s",
+                    meterRegistry = meterRegistry,
+                )
+            val held = controller.admit(AdmissionClass.READ) as Admission.Admitted
+            val waiter = thread { (controller.admit(AdmissionClass.READ) as? Admission.Admitted)?.let(controller::release) }
+            meterRegistry.awaitQueued(AdmissionClass.READ)
+
+            controller.admit(AdmissionClass.BULK) shouldBe Admission.Rejected(AdmissionClass.BULK, RejectionReason.SHED)
+            controller.admit(AdmissionClass.POST_WRITE).shouldBeInstanceOf<Admission.Admitted>()
+            controller.admit(AdmissionClass.ENGAGEMENT).shouldBeInstanceOf<Admission.Admitted>()
+            controller.release(held)
+            waiter.join()
+
+            meterRegistry.get("app.admission.rejected").tags("class", "bulk", "reason", "shed").counter().count() shouldBe 1.0
+            meterRegistry.get("app.admission.queued").tags("class", "read").gauge().value() shouldBe 0.0
+        }
+    })
+
+private fun admissionController(
+    vararg properties: Pair<String, String>,
+    meterRegistry: SimpleMeterRegistry = SimpleMeterRegistry(),
+): AdmissionController {
+    val environment = MockEnvironment()
+    properties.forEach { (key, value) -> environment.setProperty(key, value) }
+    return AdmissionController(environment, meterRegistry)
+}
+
+private fun SimpleMeterRegistry.awaitQueued(admissionClass: AdmissionClass) {
+    val queued = get("app.admission.queued").tags("class", admissionClass.value).gauge()
+    while (queued.value() < 1.0) Thread.sleep(1)
+}
@@ -0,0 +1,114 @@
+package com.example.coalescing
+
+import com.example.datasource.onReplica
+import com.example.metrics.RequestMetrics
+import io.kotest.assertions.throwables.shouldThrow
+import io.kotest.core.spec.style.FunSpec
+import io.kotest.matchers.shouldBe
+import java.util.concurrent.CountDownLatch
+import java.util.concurrent.atomic.AtomicInteger
+import kotlin.concurrent.thread
+
+class SingleFlightTest :
+    FunSpec({
+        test("when callers arrive while a computation of the same key runs then they share its value") {
+            val flights = SingleFlight<String, Int>()
+            val computations = AtomicInteger()
+            val leader = BlockedFlight(flights, "key") { computations.incrementAndGet() }
+
+            val results = IntArray(8)
+            val metrics = List(results.size) { RequestMetrics() }
+            val followers =
+                results.indices.map { i ->
+                    thread {
+                        results[i] = RequestMetrics.collect(metrics[i]) { flights.execute("key") { computations.incrementAndGet() } }
+                    }
+                }
+            followers.forEach { it.awaitWaiting() }
+            leader.release()
+            followers.forEach { it.join() }
+
+            leader.result() shouldBe 1
+            results.toList() shouldBe List(results.size) { 1 }
+            computations.get() shouldBe 1
+            metrics.sumOf { it.coalescedReads } shouldBe results.size
+        }
+
+        test("when the shared computation throws then every waiting caller gets the exception") {
+            val flights = SingleFlight<String, Int>()
+            val leader = BlockedFlight(flights, "key") { throw IllegalStateException("boom") }
+
+            var followerError: Throwable? = null
+            val follower =
+                thread {
+                    followerError = runCatching { flights.execute("key") { 0 } }.exceptionOrNull()
+                }
+            follower.awaitWaiting()
+            leader.release()
+            follower.join()
+
+            shouldThrow<IllegalStateException> { leader.result() }.message shouldBe "boom"
+            (followerError as IllegalStateException).message shouldBe "boom"
+        }
+
+        test("when a computation has finished then the next caller computes afresh") {
+            val flights = SingleFlight<String, Int>()
+            val computations = AtomicInteger()
+
+            flights.execute("key") { computations.incrementAndGet() } shouldBe 1
+            flights.execute("key") { computations.incrementAndGet() } shouldBe 2
+            shouldThrow<IllegalStateException> { flights.execute("key") { throw IllegalStateException("boom") } }
+            flights.execute("key") { computations.incrementAndGet() } shouldBe 3
+        }
+
+        test("when a different key or datasource route is requested during a computation then it is computed separately") {
+            val flights = SingleFlight<String, String>()
+            val leader = BlockedFlight(flights, "key") { "primary" }
+
+            flights.execute("other") { "other" } shouldBe "other"
+            onReplica { flights.execute("key") { "replica" } } shouldBe "replica"
+            leader.release()
+
+            leader.result() shouldBe "primary"
+        }
+    })
+
+/** Runs a flight on its own thread and holds it inside the block until [release]. */
+private class BlockedFlight<V>(
+    flights: SingleFlight<String, V>,
+    key: String,
+    block: () -> V,
+) {
+    private val started = CountDownLatch(1)
+    private val released = CountDownLatch(1)
+    private var outcome: Result<V>? = null
+    private val runner =
+        thread {
+            outcome =
+                runCatching {
+                    flights.execute(key) {
+                        started.countDown()
+                        released.await()
+                        block()
+                    }
+                }
+        }
+
+    init {
+        started.await()
+    }
+
+    fun release() = released.countDown()
+
+    fun result(): V {
+        runner.join()
+        return outcome!!.getOrThrow()
+    }
+}
+
+// Parked on the shared computation, or finished if it did not join one
+private fun Thread.awaitWaiting() {
+    while (state != Thread.State.WAITING && state != Thread.State.TERMINATED) {
+        Thread.onSpinWait()
+    }
+}
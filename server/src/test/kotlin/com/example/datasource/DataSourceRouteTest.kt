@@ -0,0 +1,74 @@
+package com.example.datasource
+
+import io.kotest.core.spec.style.FunSpec
+import io.kotest.matchers.shouldBe
+import io.kotest.property.Arb
+import io.kotest.property.arbitrary.enum
+import io.kotest.property.checkAll
+import org.springframework.aop.framework.ProxyFactory
+import org.springframework.jdbc.datasource.AbstractDataSource
+import java.lang.reflect.Proxy
+import java.sql.Connection
+
+class DataSourceRouteTest :
+    FunSpec({
+        test("when no route is set then current is PRIMARY") {
+            DataSourceRoute.current() shouldBe DataSourceRoute.PRIMARY
+        }
+
+        test("when use nests routes then the previous route is restored on exit") {
+            checkAll(Arb.enum<DataSourceRoute>(), Arb.enum<DataSourceRoute>()) { outer, inner ->
+                DataSourceRoute.use(outer) {
+                    DataSourceRoute.use(inner) { DataSourceRoute.current() shouldBe inner }
+                    DataSourceRoute.current() shouldBe outer
+                }
+                DataSourceRoute.current() shouldBe DataSourceRoute.PRIMARY
+            }
+        }
+
+        test("when routing data source is used then connections come from the current route") {
+            val routing = ReadWriteRoutingDataSource(NamedDataSource("primary"), NamedDataSource("replica"))
+
+            routing.connection.toString() shouldBe "primary"
+            onReplica { routing.connection.toString() } shouldBe "replica"
+            onReplica { onPrimary { routing.connection.toString() } } shouldBe "primary"
+        }
+
+        test("when ReadReplicaInterceptor proxies a bean then only annotated methods run on the replica") {
+            val reader =
+                ProxyFactory(RouteReader())
+                    .apply { addAdvice(ReadReplicaInterceptor(RouteReader::class.java)) }
+                    .proxy as Reader
+
+            reader.annotated() shouldBe DataSourceRoute.REPLICA
+            reader.plain() shouldBe DataSourceRoute.PRIMARY
+            DataSourceRoute.current() shouldBe DataSourceRoute.PRIMARY
+        }
+    })
+
+private interface Reader {
+    fun annotated(): DataSourceRoute
+
+    fun plain(): DataSourceRoute
+}
+
+private class RouteReader : Reader {
+    @ReadReplica
+    override fun annotated(): DataSourceRoute = DataSourceRoute.current()
+
+    override fun plain(): DataSourceRoute = DataSourceRoute.current()
+}
+
+private class NamedDataSource(
+    private val name: String,
+) : AbstractDataSource() {
+    override fun getConnection(): Connection =
+        Proxy.newProxyInstance(Connection::class.java.classLoader, arrayOf(Connection::class.java)) { _, method, _ ->
+            if (method.name == "toString") name else null
+        } as Connection
+
+    override fun getConnection(
+        username: String?,
+        password: String?,
+    ): Connection = connection
+}
@@ -0,0 +1,82 @@
+package com.example.degradation
+
+import io.kotest.core.spec.style.FunSpec
+import io.kotest.matchers.booleans.shouldBeFalse
+import io.kotest.matchers.booleans.shouldBeTrue
+import io.kotest.matchers.shouldBe
+import io.kotest.property.Arb
+import io.kotest.property.arbitrary.list
+import io.kotest.property.arbitrary.long
+import io.kotest.property.checkAll
+import java.time.Duration
+import java.time.Instant
+
+class QueryHealthTest :
+    FunSpec({
+        test("when every execution is fast and succeeds then never degrades") {
+            checkAll(Arb.list(Arb.long(0L..200L), 0..100)) { latencies ->
+                val health = QueryHealth(thresholds)
+
+                latencies.forEach { health.record(Duration.ofMillis(it), failed = false, now).shouldBeFalse() }
+
+                health.isDegraded(now).shouldBeFalse()
+            }
+        }
+
+        test("when fewer than minSamples executions are slow then does not degrade yet") {
+            val health = QueryHealth(thresholds)
+
+            repeat(thresholds.minSamples - 1) { health.record(Duration.ofSeconds(5), failed = false, now).shouldBeFalse() }
+
+            health.isDegraded(now).shouldBeFalse()
+        }
+
+        test("when executions stay slow then degrades until the cooldown has passed") {
+            val health = QueryHealth(thresholds)
+
+            val trips = List(thresholds.minSamples) { health.record(Duration.ofSeconds(5), failed = false, now) }
+
+            trips shouldBe List(thresholds.minSamples - 1) { false } + true
+            health.isDegraded(now).shouldBeTrue()
+            health.isDegraded(now.plus(thresholds.cooldown).minusMillis(1)).shouldBeTrue()
+            health.isDegraded(now.plus(thresholds.cooldown)).shouldBeFalse()
+        }
+
+        test("when executions keep failing then degrades even though they are fast") {
+            val health = QueryHealth(thresholds)
+
+            repeat(thresholds.minSamples) { health.record(Duration.ZERO, failed = true, now) }
+
+            health.isDegraded(now).shouldBeTrue()
+        }
+
+        test("when the cooldown has passed then judges the query on fresh samples only") {
+            val health = QueryHealth(thresholds)
+            repeat(thresholds.minSamples) { health.record(Duration.ofSeconds(5), failed = false, now) }
+            val recovered = now.plus(thresholds.cooldown)
+
+            repeat(thresholds.minSamples - 1) { health.record(Duration.ofSeconds(5), failed = false, recovered).shouldBeFalse() }
+            health.isDegraded(recovered).shouldBeFalse()
+
+            health.record(Duration.ofSeconds(5), failed = false, recovered).shouldBeTrue()
+        }
+
+        test("when slow executions finish while degraded then they do not extend the cooldown") {
+            val health = QueryHealth(thresholds)
+            repeat(thresholds.minSamples) { health.record(Duration.ofSeconds(5), failed = false, now) }
+
+            repeat(thresholds.minSamples) { health.record(Duration.ofSeconds(5), failed = false, now.plusSeconds(1)).shouldBeFalse() }
+
+            health.isDegraded(now.plus(thresholds.cooldown)).shouldBeFalse()
+        }
+    })
+
+private val thresholds =
+    DegradationThresholds(
+        latency = Duration.ofMillis(200),
+        errorRate = 0.5,
+        minSamples = 5,
+        cooldown = Duration.ofSeconds(30),
+    )
+
+private val now = Instant.parse("2025-01-01T00:00:00Z")
@@ -0,0 +1,137 @@
+package com.example.engagement
+
+import com.example.like.LikeEventType
+import com.example.like.LikeRow
+import com.example.like.aggregateLikeEvents
+import com.example.repost.RepostEventType
+import com.example.repost.RepostRow
+import com.example.repost.aggregateRepostEvents
+import io.kotest.core.spec.style.FunSpec
+import io.kotest.matchers.collections.shouldBeSortedBy
+import io.kotest.matchers.collections.shouldContainOnly
+import io.kotest.matchers.shouldBe
+import io.kotest.property.Arb
+import io.kotest.property.arbitrary.bind
+import io.kotest.property.arbitrary.element
+import io.kotest.property.arbitrary.enum
+import io.kotest.property.arbitrary.list
+import io.kotest.property.arbitrary.uuid
+import io.kotest.property.checkAll
+import java.time.Instant
+import java.util.UUID
+
+class EngagementPlanTest :
+    FunSpec({
+        val now = Instant.parse("2026-01-01T00:00:00Z")
+
+        test("when planEngagementBatch with unknown user then returns USER_NOT_FOUND and appends nothing") {
+            checkAll(Arb.list(arbCommand(listOf(UUID.randomUUID()), listOf(UUID.randomUUID())), 1..20)) { commands ->
+                val plan = planEngagementBatch(commands, emptySet(), commands.map { it.postId }.toSet(), emptySet(), emptySet(), now)
+
+                plan.statuses shouldContainOnly listOf(EngagementStatus.USER_NOT_FOUND)
+                plan.likeEvents.size + plan.repostEvents.size + plan.viewEvents.size shouldBe 0
+            }
+        }
+
+        test("when planEngagementBatch with inactive post then returns POST_NOT_FOUND") {
+            checkAll(Arb.list(arbCommand(listOf(UUID.randomUUID()), listOf(UUID.randomUUID())), 1..20)) { commands ->
+                val plan = planEngagementBatch(commands, commands.map { it.userId }.toSet(), emptySet(), emptySet(), emptySet(), now)
+
+                plan.statuses shouldContainOnly listOf(EngagementStatus.POST_NOT_FOUND)
+            }
+        }
+
+        test("when planEngagementBatch with UNLIKE of a pair that is not liked then returns UNCHANGED") {
+            checkAll(Arb.uuid(), Arb.uuid()) { postId, userId ->
+                val plan =
+                    planEngagementBatch(
+                        listOf(EngagementCommand(EngagementType.UNLIKE, postId, userId)),
+                        setOf(userId),
+                        setOf(postId),
+                        emptySet(),
+                        emptySet(),
+                        now,
+                    )
+
+                plan.statuses shouldBe listOf(EngagementStatus.UNCHANGED)
+                plan.likeEvents shouldBe emptyList()
+            }
+        }
+
+        test("when planEngagementBatch with UNLIKE of an already liked pair then appends UNLIKED") {
+            checkAll(Arb.uuid(), Arb.uuid()) { postId, userId ->
+                val plan =
+                    planEngagementBatch(
+                        listOf(EngagementCommand(EngagementType.UNLIKE, postId, userId)),
+                        setOf(userId),
+                        setOf(postId),
+                        setOf(postId to userId),
+                        emptySet(),
+                        now,
+                    )
+
+                plan.statuses shouldBe listOf(EngagementStatus.CREATED)
+                plan.likeEvents.map { it.eventType } shouldBe listOf(LikeEventType.UNLIKED.value)
+            }
+        }
+
+        test("when planEngagementBatch with valid commands then appended events fold to the same state as applying them one by one") {
+            val postIds = List(3) { UUID.randomUUID() }
+            val userIds = List(3) { UUID.randomUUID() }
+            checkAll(Arb.list(arbCommand(postIds, userIds), 1..50)) { commands ->
+                val plan = planEngagementBatch(commands, userIds.toSet(), postIds.toSet(), emptySet(), emptySet(), now)
+
+                val expectedLiked = mutableSetOf<Pair<UUID, UUID>>()
+                val expectedReposted = mutableSetOf<Pair<UUID, UUID>>()
+                commands.forEach { command ->
+                    val pair = command.postId to command.userId
+                    when (command.type) {
+                        EngagementType.LIKE -> expectedLiked += pair
+                        EngagementType.UNLIKE -> expectedLiked -= pair
+                        EngagementType.REPOST -> expectedReposted += pair
+                        EngagementType.UNREPOST -> expectedReposted -= pair
+                        EngagementType.VIEW -> Unit
+                    }
+                }
+                postIds.forEach { postId ->
+                    aggregateLikeEvents(
+                        plan.likeEvents
+                            .filter { it.postId == postId }
+                            .map { LikeRow(it.postId, it.userId, LikeEventType.fromString(it.eventType)) },
+                    ).likedUserIds shouldBe
+                        expectedLiked.filter { it.first == postId }.map { it.second }.toSet()
+                    aggregateRepostEvents(
+                        plan.repostEvents
+                            .filter { it.postId == postId }
+                            .map { RepostRow(it.postId, it.userId, RepostEventType.fromString(it.eventType)) },
+                    ).repostedUserIds shouldBe
+                        expectedReposted.filter { it.first == postId }.map { it.second }.toSet()
+                }
+                plan.viewEvents.size shouldBe commands.count { it.type == EngagementType.VIEW }
+                plan.statuses.size shouldBe commands.size
+            }
+        }
+
+        test("when planEngagementBatch then events are timestamped in submission order") {
+            val postIds = List(2) { UUID.randomUUID() }
+            val userIds = List(2) { UUID.randomUUID() }
+            checkAll(Arb.list(arbCommand(postIds, userIds), 1..50)) { commands ->
+                val plan = planEngagementBatch(commands, userIds.toSet(), postIds.toSet(), emptySet(), emptySet(), now)
+
+                plan.likeEvents.shouldBeSortedBy { it.occurredAt }
+                plan.repostEvents.shouldBeSortedBy { it.occurredAt }
+                plan.viewEvents.shouldBeSortedBy { it.occurredAt }
+                (plan.likeEvents.map { it.occurredAt } + plan.repostEvents.map { it.occurredAt } + plan.viewEvents.map { it.occurredAt })
+                    .toSet()
+                    .size shouldBe plan.likeEvents.size + plan.repostEvents.size + plan.viewEvents.size
+            }
+        }
+    })
+
+private fun arbCommand(
+    postIds: List<UUID>,
+    userIds: List<UUID>,
+): Arb<EngagementCommand> =
+    Arb.bind(Arb.enum<EngagementType>(), Arb.element(postIds), Arb.element(userIds)) { type, postId, userId ->
+        EngagementCommand(type, postId, userId)
+    }
@@ -0,0 +1,63 @@
+package com.example.etag
+
+import io.kotest.core.spec.style.FunSpec
+import io.kotest.matchers.booleans.shouldBeFalse
+import io.kotest.matchers.booleans.shouldBeTrue
+import io.kotest.matchers.shouldBe
+import io.kotest.matchers.shouldNotBe
+import io.kotest.matchers.string.shouldStartWith
+import io.kotest.property.Arb
+import io.kotest.property.arbitrary.list
+import io.kotest.property.arbitrary.long
+import io.kotest.property.arbitrary.uuid
+import io.kotest.property.checkAll
+
+class EntityTagTest :
+    FunSpec({
+        test("when weakEntityTag with same parts then returns the same weak tag") {
+            checkAll(Arb.uuid(), Arb.long()) { postId, eventCount ->
+                val tag = weakEntityTag(postId, eventCount)
+
+                tag shouldStartWith "W/\""
+                weakEntityTag(postId, eventCount) shouldBe tag
+            }
+        }
+
+        test("when weakEntityTag with different event count then returns a different tag") {
+            checkAll(Arb.uuid(), Arb.long(0L, Long.MAX_VALUE - 1)) { postId, eventCount ->
+                weakEntityTag(postId, eventCount) shouldNotBe weakEntityTag(postId, eventCount + 1)
+            }
+        }
+
+        test("when ifNoneMatchMatches with tag among a list of tags then returns true") {
+            checkAll(Arb.list(Arb.uuid(), 0..5), Arb.uuid()) { otherIds, postId ->
+                val tag = weakEntityTag(postId)
+                val header = (otherIds.map { weakEntityTag(it) } + tag).joinToString(", ")
+
+                ifNoneMatchMatches(header, tag).shouldBeTrue()
+            }
+        }
+
+        test("when ifNoneMatchMatches with strong form of the tag then returns true") {
+            checkAll(Arb.uuid()) { postId ->
+                val tag = weakEntityTag(postId)
+
+                ifNoneMatchMatches(tag.removePrefix("W/"), tag).shouldBeTrue()
+            }
+        }
+
+        test("when ifNoneMatchMatches with wildcard then returns true") {
+            checkAll(Arb.uuid()) { postId ->
+                ifNoneMatchMatches("*", weakEntityTag(postId)).shouldBeTrue()
+            }
+        }
+
+        test("when ifNoneMatchMatches with null or another tag then returns false") {
+            checkAll(Arb.uuid(), Arb.uuid()) { postId, otherId ->
+                val tag = weakEntityTag(postId)
+
+                ifNoneMatchMatches(null, tag).shouldBeFalse()
+                if (postId != otherId) ifNoneMatchMatches(weakEntityTag(otherId), tag).shouldBeFalse()
+            }
+        }
+    })
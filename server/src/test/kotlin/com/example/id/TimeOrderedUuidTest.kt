@@ -0,0 +1,47 @@
+package com.example.id
+
+import com.example.replay.ReplayKey
+import io.kotest.core.spec.style.FunSpec
+import io.kotest.matchers.comparables.shouldBeLessThan
+import io.kotest.matchers.nulls.shouldBeNull
+import io.kotest.matchers.shouldBe
+import io.kotest.property.Arb
+import io.kotest.property.arbitrary.int
+import io.kotest.property.arbitrary.long
+import io.kotest.property.checkAll
+import java.time.Instant
+import java.util.UUID
+
+class TimeOrderedUuidTest :
+    FunSpec({
+        test("when timeOrderedUuidOf with any fields then is a version 7 RFC 9562 uuid carrying its timestamp") {
+            checkAll(Arb.long(0L..(1L shl 48) - 1), Arb.int(0..4095), Arb.long()) { epochMillis, sequence, random ->
+                val uuid = timeOrderedUuidOf(epochMillis, sequence, random)
+
+                uuid.version() shouldBe 7
+                uuid.variant() shouldBe 2
+                timeOrderedUuidInstantOf(uuid) shouldBe Instant.ofEpochMilli(epochMillis)
+            }
+        }
+
+        test("when timeOrderedUuidOf with an earlier timestamp then sorts first like PostgreSQL compares uuids") {
+            checkAll(Arb.long(0L..(1L shl 47)), Arb.long(1L..(1L shl 47)), Arb.long(), Arb.long()) { epochMillis, later, a, b ->
+                val earlier = timeOrderedUuidOf(epochMillis, 4095, a)
+                val after = timeOrderedUuidOf(epochMillis + later, 0, b)
+
+                ReplayKey(Instant.EPOCH, earlier) shouldBeLessThan ReplayKey(Instant.EPOCH, after)
+            }
+        }
+
+        test("when timeOrderedUuid is minted repeatedly at the same instant then every id is greater than the last") {
+            val now = Instant.now()
+            val uuids = List(10_000) { timeOrderedUuid(now) }
+
+            uuids.zipWithNext().forEach { (a, b) -> ReplayKey(Instant.EPOCH, a) shouldBeLessThan ReplayKey(Instant.EPOCH, b) }
+            uuids.toSet().size shouldBe uuids.size
+        }
+
+        test("when timeOrderedUuidInstantOf with a random uuid then returns null") {
+            timeOrderedUuidInstantOf(UUID.randomUUID()).shouldBeNull()
+        }
+    })
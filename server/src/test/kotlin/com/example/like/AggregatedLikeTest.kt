@@ -4,19 +4,18 @@ import io.kotest.core.spec.style.FunSpec
 import io.kotest.matchers.shouldBe
 import io.kotest.property.Arb
 import io.kotest.property.arbitrary.bind
+import io.kotest.property.arbitrary.boolean
 import io.kotest.property.arbitrary.constant
+import io.kotest.property.arbitrary.int
 import io.kotest.property.arbitrary.list
-import io.kotest.property.arbitrary.long
 import io.kotest.property.arbitrary.map
 import io.kotest.property.arbitrary.uuid
 import io.kotest.property.checkAll
-import java.time.Instant
-import java.util.UUID
 
 class AggregatedLikeTest :
     FunSpec({
         test("when aggregateLikeEvents with empty list then returns zero likes") {
-            checkAll(Arb.constant(emptyList<LikeEvent>())) { events ->
+            checkAll(Arb.constant(emptyList<LikeRow>())) { events ->
                 val result = aggregateLikeEvents(events)
                 result.likeCount shouldBe 0
                 result.likedUserIds shouldBe emptySet()
@@ -71,153 +70,133 @@ class AggregatedLikeTest :
                 result.likeCount shouldBe expectedLikedCount
             }
         }
+
+        test("when aggregateLikeEvents with interleaved events then statusOf matches UserLikeStatus fromEvents") {
+            checkAll(arbInterleavedEvents()) { events ->
+                val userIds = events.map { it.userId }.distinct()
+                val result = aggregateLikeEvents(events)
+
+                userIds.forEach { userId ->
+                    result.statusOf(userId) shouldBe UserLikeStatus.fromEvents(events, userId)
+                }
+                result.likeCount shouldBe userIds.count { UserLikeStatus.fromEvents(events, it) == UserLikeStatus.Liked }
+            }
+        }
     })
 
-private fun arbLikedEvent(): Arb<LikeEvent> =
+private fun arbLikedEvent(): Arb<LikeRow> =
     Arb.bind(
         Arb.uuid(),
         Arb.uuid(),
-        Arb.uuid(),
-        arbInstant(),
-    ) { eventId, postId, userId, occurredAt ->
-        LikeEvent(
-            eventId = eventId,
+    ) { postId, userId ->
+        LikeRow(
             postId = postId,
             userId = userId,
-            eventType = LikeEventType.LIKED.value,
-            occurredAt = occurredAt,
+            type = LikeEventType.LIKED,
         )
     }
 
-private fun arbUnlikedEvent(): Arb<LikeEvent> =
+private fun arbUnlikedEvent(): Arb<LikeRow> =
     Arb.bind(
         Arb.uuid(),
         Arb.uuid(),
-        Arb.uuid(),
-        arbInstant(),
-    ) { eventId, postId, userId, occurredAt ->
-        LikeEvent(
-            eventId = eventId,
+    ) { postId, userId ->
+        LikeRow(
             postId = postId,
             userId = userId,
-            eventType = LikeEventType.UNLIKED.value,
-            occurredAt = occurredAt,
+            type = LikeEventType.UNLIKED,
         )
     }
 
-private fun arbLikedThenUnlikedEvents(): Arb<List<LikeEvent>> =
+private fun arbLikedThenUnlikedEvents(): Arb<List<LikeRow>> =
     Arb.bind(
         Arb.uuid(),
         Arb.uuid(),
-        arbInstant(),
-        arbInstant(),
-    ) { postId, userId, likedTime, unlikedTime ->
+    ) { postId, userId ->
         listOf(
-            LikeEvent(
-                eventId = UUID.randomUUID(),
+            LikeRow(
                 postId = postId,
                 userId = userId,
-                eventType = LikeEventType.LIKED.value,
-                occurredAt = likedTime,
+                type = LikeEventType.LIKED,
             ),
-            LikeEvent(
-                eventId = UUID.randomUUID(),
+            LikeRow(
                 postId = postId,
                 userId = userId,
-                eventType = LikeEventType.UNLIKED.value,
-                occurredAt = unlikedTime,
+                type = LikeEventType.UNLIKED,
             ),
         )
     }
 
-private fun arbLikedUnlikedLikedEvents(): Arb<List<LikeEvent>> =
+private fun arbLikedUnlikedLikedEvents(): Arb<List<LikeRow>> =
     Arb.bind(
         Arb.uuid(),
         Arb.uuid(),
-        arbInstant(),
-        arbInstant(),
-        arbInstant(),
-    ) { postId, userId, time1, time2, time3 ->
+    ) { postId, userId ->
         listOf(
-            LikeEvent(
-                eventId = UUID.randomUUID(),
+            LikeRow(
                 postId = postId,
                 userId = userId,
-                eventType = LikeEventType.LIKED.value,
-                occurredAt = time1,
+                type = LikeEventType.LIKED,
             ),
-            LikeEvent(
-                eventId = UUID.randomUUID(),
+            LikeRow(
                 postId = postId,
                 userId = userId,
-                eventType = LikeEventType.UNLIKED.value,
-                occurredAt = time2,
+                type = LikeEventType.UNLIKED,
             ),
-            LikeEvent(
-                eventId = UUID.randomUUID(),
+            LikeRow(
                 postId = postId,
                 userId = userId,
-                eventType = LikeEventType.LIKED.value,
-                occurredAt = time3,
+                type = LikeEventType.LIKED,
             ),
         )
     }
 
-private fun arbMultipleUsersLikedEvents(userCountRange: IntRange): Arb<List<LikeEvent>> =
+private fun arbMultipleUsersLikedEvents(userCountRange: IntRange): Arb<List<LikeRow>> =
     Arb.bind(
         Arb.uuid(),
         Arb.list(Arb.uuid(), userCountRange),
     ) { postId, userIds ->
-        userIds.mapIndexed { index, userId ->
-            LikeEvent(
-                eventId = UUID.randomUUID(),
+        userIds.map { userId ->
+            LikeRow(
                 postId = postId,
                 userId = userId,
-                eventType = LikeEventType.LIKED.value,
-                occurredAt = Instant.ofEpochSecond(index.toLong()),
+                type = LikeEventType.LIKED,
             )
         }
     }
 
-private fun arbMultipleUsersMixedEvents(): Arb<Pair<List<LikeEvent>, Int>> =
+private fun arbMultipleUsersMixedEvents(): Arb<Pair<List<LikeRow>, Int>> =
     Arb.bind(
         Arb.uuid(),
         Arb.list(Arb.uuid(), 3..5).map { it.distinct() },
     ) { postId, userIds ->
-        val events = mutableListOf<LikeEvent>()
-        var timestamp = 0L
+        val events = mutableListOf<LikeRow>()
         var likedCount = 0
 
         userIds.forEachIndexed { index, userId ->
             val shouldEndWithLiked = index % 2 == 0
             if (shouldEndWithLiked) {
                 events.add(
-                    LikeEvent(
-                        eventId = UUID.randomUUID(),
+                    LikeRow(
                         postId = postId,
                         userId = userId,
-                        eventType = LikeEventType.LIKED.value,
-                        occurredAt = Instant.ofEpochSecond(timestamp++),
+                        type = LikeEventType.LIKED,
                     ),
                 )
                 likedCount++
             } else {
                 events.add(
-                    LikeEvent(
-                        eventId = UUID.randomUUID(),
+                    LikeRow(
                         postId = postId,
                         userId = userId,
-                        eventType = LikeEventType.LIKED.value,
-                        occurredAt = Instant.ofEpochSecond(timestamp++),
+                        type = LikeEventType.LIKED,
                     ),
                 )
                 events.add(
-                    LikeEvent(
-                        eventId = UUID.randomUUID(),
+                    LikeRow(
                         postId = postId,
                         userId = userId,
-                        eventType = LikeEventType.UNLIKED.value,
-                        occurredAt = Instant.ofEpochSecond(timestamp++),
+                        type = LikeEventType.UNLIKED,
                     ),
                 )
             }
@@ -226,4 +205,17 @@ private fun arbMultipleUsersMixedEvents(): Arb<Pair<List<LikeEvent>, Int>> =
         events to likedCount
     }
 
-private fun arbInstant(): Arb<Instant> = Arb.long(0..253402300799L).map { Instant.ofEpochSecond(it) }
+private fun arbInterleavedEvents(): Arb<List<LikeRow>> =
+    Arb.bind(
+        Arb.uuid(),
+        Arb.list(Arb.uuid(), 1..4),
+        Arb.list(Arb.bind(Arb.int(0..3), Arb.boolean()) { userIndex, liked -> userIndex to liked }, 0..30),
+    ) { postId, userIds, toggles ->
+        toggles.map { (userIndex, liked) ->
+            LikeRow(
+                postId = postId,
+                userId = userIds[userIndex % userIds.size],
+                type = if (liked) LikeEventType.LIKED else LikeEventType.UNLIKED,
+            )
+        }
+    }
@@ -4,11 +4,9 @@ import io.kotest.core.spec.style.FunSpec
 import io.kotest.matchers.shouldBe
 import io.kotest.property.Arb
 import io.kotest.property.arbitrary.bind
-import io.kotest.property.arbitrary.long
 import io.kotest.property.arbitrary.map
 import io.kotest.property.arbitrary.uuid
 import io.kotest.property.checkAll
-import java.time.Instant
 import java.util.UUID
 
 class UserLikeStatusTest :
@@ -70,160 +68,122 @@ class UserLikeStatusTest :
         }
     })
 
-private fun arbLikeEvent(eventType: LikeEventType): Arb<LikeEvent> =
+private fun arbLikeEvent(eventType: LikeEventType): Arb<LikeRow> =
     Arb.bind(
         Arb.uuid(),
         Arb.uuid(),
-        Arb.uuid(),
-        arbInstant(),
-    ) { eventId, postId, userId, occurredAt ->
-        LikeEvent(
-            eventId = eventId,
+    ) { postId, userId ->
+        LikeRow(
             postId = postId,
             userId = userId,
-            eventType = eventType.value,
-            occurredAt = occurredAt,
+            type = eventType,
         )
     }
 
-private fun arbDifferentUserEvent(): Arb<Pair<LikeEvent, UUID>> =
+private fun arbDifferentUserEvent(): Arb<Pair<LikeRow, UUID>> =
     Arb
-        .bind(
-            Arb.uuid(),
-            Arb.uuid(),
-            arbInstant(),
-        ) { eventId, postId, occurredAt ->
+        .uuid()
+        .map { postId ->
             val userId1 = UUID.randomUUID()
             val userId2 =
                 generateSequence { UUID.randomUUID() }
                     .first { it != userId1 }
             val event =
-                LikeEvent(
-                    eventId = eventId,
+                LikeRow(
                     postId = postId,
                     userId = userId1,
-                    eventType = LikeEventType.LIKED.value,
-                    occurredAt = occurredAt,
+                    type = LikeEventType.LIKED,
                 )
             event to userId2
         }
 
-private fun arbLikedThenUnliked(): Arb<Pair<List<LikeEvent>, UUID>> =
+private fun arbLikedThenUnliked(): Arb<Pair<List<LikeRow>, UUID>> =
     Arb.bind(
         Arb.uuid(),
         Arb.uuid(),
-        arbInstant(),
-        arbInstant(),
-    ) { postId, userId, time1, time2 ->
+    ) { postId, userId ->
         val events =
             listOf(
-                LikeEvent(
-                    eventId = UUID.randomUUID(),
+                LikeRow(
                     postId = postId,
                     userId = userId,
-                    eventType = LikeEventType.LIKED.value,
-                    occurredAt = time1,
+                    type = LikeEventType.LIKED,
                 ),
-                LikeEvent(
-                    eventId = UUID.randomUUID(),
+                LikeRow(
                     postId = postId,
                     userId = userId,
-                    eventType = LikeEventType.UNLIKED.value,
-                    occurredAt = time2,
+                    type = LikeEventType.UNLIKED,
                 ),
             )
         events to userId
     }
 
-private fun arbUnlikedThenLiked(): Arb<Pair<List<LikeEvent>, UUID>> =
+private fun arbUnlikedThenLiked(): Arb<Pair<List<LikeRow>, UUID>> =
     Arb.bind(
         Arb.uuid(),
         Arb.uuid(),
-        arbInstant(),
-        arbInstant(),
-    ) { postId, userId, time1, time2 ->
+    ) { postId, userId ->
         val events =
             listOf(
-                LikeEvent(
-                    eventId = UUID.randomUUID(),
+                LikeRow(
                     postId = postId,
                     userId = userId,
-                    eventType = LikeEventType.UNLIKED.value,
-                    occurredAt = time1,
+                    type = LikeEventType.UNLIKED,
                 ),
-                LikeEvent(
-                    eventId = UUID.randomUUID(),
+                LikeRow(
                     postId = postId,
                     userId = userId,
-                    eventType = LikeEventType.LIKED.value,
-                    occurredAt = time2,
+                    type = LikeEventType.LIKED,
                 ),
             )
         events to userId
     }
 
-private fun arbMixedUsersLastLiked(): Arb<Pair<List<LikeEvent>, UUID>> =
+private fun arbMixedUsersLastLiked(): Arb<Pair<List<LikeRow>, UUID>> =
     Arb.bind(
         Arb.uuid(),
         Arb.uuid(),
         Arb.uuid(),
-        arbInstant(),
-        arbInstant(),
-    ) { postId, targetUserId, otherUserId, time1, time2 ->
+    ) { postId, targetUserId, otherUserId ->
         val events =
             listOf(
-                LikeEvent(
-                    eventId = UUID.randomUUID(),
+                LikeRow(
                     postId = postId,
                     userId = otherUserId,
-                    eventType = LikeEventType.LIKED.value,
-                    occurredAt = time1,
+                    type = LikeEventType.LIKED,
                 ),
-                LikeEvent(
-                    eventId = UUID.randomUUID(),
+                LikeRow(
                     postId = postId,
                     userId = targetUserId,
-                    eventType = LikeEventType.LIKED.value,
-                    occurredAt = time2,
+                    type = LikeEventType.LIKED,
                 ),
             )
         events to targetUserId
     }
 
-private fun arbMixedUsersLastUnliked(): Arb<Pair<List<LikeEvent>, UUID>> =
+private fun arbMixedUsersLastUnliked(): Arb<Pair<List<LikeRow>, UUID>> =
     Arb.bind(
         Arb.uuid(),
         Arb.uuid(),
         Arb.uuid(),
-        arbInstant(),
-        arbInstant(),
-        arbInstant(),
-    ) { postId, targetUserId, otherUserId, time1, time2, time3 ->
+    ) { postId, targetUserId, otherUserId ->
         val events =
             listOf(
-                LikeEvent(
-                    eventId = UUID.randomUUID(),
+                LikeRow(
                     postId = postId,
                     userId = targetUserId,
-                    eventType = LikeEventType.LIKED.value,
-                    occurredAt = time1,
+                    type = LikeEventType.LIKED,
                 ),
-                LikeEvent(
-                    eventId = UUID.randomUUID(),
+                LikeRow(
                     postId = postId,
                     userId = otherUserId,
-                    eventType = LikeEventType.LIKED.value,
-                    occurredAt = time2,
+                    type = LikeEventType.LIKED,
                 ),
-                LikeEvent(
-                    eventId = UUID.randomUUID(),
+                LikeRow(
                     postId = postId,
                     userId = targetUserId,
-                    eventType = LikeEventType.UNLIKED.value,
-                    occurredAt = time3,
+                    type = LikeEventType.UNLIKED,
                 ),
             )
         events to targetUserId
     }
-
-private fun arbInstant(): Arb<Instant> = Arb.long(0..253402300799L).map { Instant.ofEpochSecond(it) }
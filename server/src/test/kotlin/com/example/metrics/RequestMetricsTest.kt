@@ -0,0 +1,69 @@
+package com.example.metrics
+
+import io.kotest.core.spec.style.FunSpec
+import io.kotest.matchers.nulls.shouldBeNull
+import io.kotest.matchers.shouldBe
+import io.kotest.property.Arb
+import io.kotest.property.arbitrary.filter
+import io.kotest.property.arbitrary.int
+import io.kotest.property.arbitrary.list
+import io.kotest.property.arbitrary.map
+import io.kotest.property.arbitrary.string
+import io.kotest.property.checkAll
+import java.util.Optional
+
+class RequestMetricsTest :
+    FunSpec({
+        test("when utf8Length with any string then returns encoded byte size") {
+            checkAll(arbUnicodeString()) { value ->
+                utf8Length(value) shouldBe value.toByteArray(Charsets.UTF_8).size
+            }
+        }
+
+        test("when rowCount with collection then returns its size") {
+            checkAll(Arb.list(Arb.int(), 0..20)) { rows ->
+                rowCount(rows) shouldBe rows.size
+            }
+        }
+
+        test("when rowCount with map then returns its entry count") {
+            checkAll(Arb.list(Arb.int(), 0..20)) { keys ->
+                rowCount(keys.associateWith { it }) shouldBe keys.distinct().size
+            }
+        }
+
+        test("when rowCount with optional then returns 1 if present and 0 if empty") {
+            rowCount(Optional.of("row")) shouldBe 1
+            rowCount(Optional.empty<String>()) shouldBe 0
+        }
+
+        test("when rowCount with null or Unit then returns 0") {
+            rowCount(null) shouldBe 0
+            rowCount(Unit) shouldBe 0
+        }
+
+        test("when recordRows for the same repository method then sums rows") {
+            checkAll(Arb.list(Arb.int(0..1000), 1..10)) { counts ->
+                val metrics = RequestMetrics()
+                counts.forEach { metrics.recordRows("LikeEventRepository.findByPostIdInOrderByOccurredAtAsc", it) }
+                metrics.rowsByRepositoryMethod shouldBe
+                    mapOf("LikeEventRepository.findByPostIdInOrderByOccurredAtAsc" to counts.sumOf { it.toLong() })
+            }
+        }
+
+        test("when recordEventData inside collect then adds bytes to the collecting metrics only") {
+            checkAll(Arb.string(0..100)) { eventData ->
+                val metrics = RequestMetrics()
+                RequestMetrics.collect(metrics) { RequestMetrics.recordEventData(eventData) }
+                RequestMetrics.recordEventData(eventData)
+
+                metrics.eventDataBytes shouldBe utf8Length(eventData).toLong()
+                RequestMetrics.current().shouldBeNull()
+            }
+        }
+    })
+
+private fun arbUnicodeString(): Arb<String> =
+    Arb
+        .list(Arb.int(0..Character.MAX_CODE_POINT).filter { it !in Character.MIN_SURROGATE.code..Character.MAX_SURROGATE.code }, 0..50)
+        .map { codePoints -> codePoints.joinToString("") { String(Character.toChars(it)) } }
@@ -0,0 +1,83 @@
+package com.example.profiling
+
+import io.kotest.core.spec.style.FunSpec
+import io.kotest.matchers.collections.shouldBeEmpty
+import io.kotest.matchers.longs.shouldBeGreaterThanOrEqual
+import io.kotest.matchers.shouldBe
+import io.kotest.matchers.string.shouldStartWith
+import jdk.jfr.Recording
+import java.nio.file.Files
+import java.time.Duration
+import java.util.concurrent.locks.LockSupport
+
+class ProfileSummaryTest :
+    FunSpec({
+        test("when a recording has no events then summarizes no methods and no collections") {
+            profile(threadParks = false) {} shouldBe ProfileSummary(GcSummary(0, 0, 0), emptyList())
+        }
+
+        test("when service spans are recorded then counts calls per method and lists the slowest traces first") {
+            val summary =
+                profile {
+                    serviceSpan("PostService.getPost", "trace-fast") {}
+                    serviceSpan("PostService.getPost", "trace-slow") { LockSupport.parkNanos(park.toNanos()) }
+                }
+
+            val getPost = summary.methods.single { it.method == "PostService.getPost" }
+
+            getPost.calls shouldBe 2
+            getPost.slowestTraces.map { it.traceId } shouldBe listOf("trace-slow", "trace-fast")
+            getPost.totalMillis shouldBeGreaterThanOrEqual park.toMillis()
+        }
+
+        test("when a thread waits inside nested service spans then attributes the wait to the innermost span") {
+            val summary =
+                profile {
+                    serviceSpan("TimelineService.getGlobalTimeline", "trace-1") {
+                        serviceSpan("PostService.getPost", "trace-1") { LockSupport.parkNanos(park.toNanos()) }
+                    }
+                }
+
+            val methods = summary.methods.associateBy { it.method }
+
+            val wait = methods.getValue("PostService.getPost").waits.single()
+            wait.frame shouldStartWith "ThreadPark "
+            wait.weight shouldBeGreaterThanOrEqual park.toMillis()
+            methods.getValue("TimelineService.getGlobalTimeline").waits.shouldBeEmpty()
+        }
+    })
+
+private val park = Duration.ofMillis(20)
+
+private fun serviceSpan(
+    name: String,
+    traceId: String,
+    block: () -> Unit,
+) {
+    val event = ServiceSpanEvent()
+    event.begin()
+    block()
+    event.spanName = name
+    event.traceId = traceId
+    event.commit()
+}
+
+private fun profile(
+    threadParks: Boolean = true,
+    block: () -> Unit,
+): ProfileSummary {
+    val file = Files.createTempFile("profile-summary-", ".jfr")
+    try {
+        Recording().use { recording ->
+            recording.enable(ServiceSpanEvent::class.java).withoutThreshold()
+            if (threadParks) recording.enable("jdk.ThreadPark").withoutThreshold().withStackTrace()
+            recording.start()
+            block()
+            recording.stop()
+            recording.dump(file)
+        }
+        return summarizeProfile(file)
+    } finally {
+        Files.deleteIfExists(file)
+    }
+}
@@ -0,0 +1,63 @@
+package com.example.profiling
+
+import io.kotest.core.spec.style.FunSpec
+import io.kotest.matchers.nulls.shouldBeNull
+import io.kotest.matchers.nulls.shouldNotBeNull
+import io.kotest.matchers.shouldBe
+import org.springframework.http.HttpHeaders
+import org.springframework.mock.web.MockFilterChain
+import org.springframework.mock.web.MockHttpServletRequest
+import org.springframework.mock.web.MockHttpServletResponse
+
+class ProfilingAccessFilterTest :
+    FunSpec({
+        test("when the profiling path is spelled differently without a token then rejects every spelling") {
+            listOf(
+                "/actuator/profiling",
+                "/actuator/profiling/rolling",
+                "/actuator/%70rofiling",
+                "/actuator;x=1/profiling",
+                "/actuator/profiling;x=1/rolling",
+                "/actuator//profiling",
+            ).forEach { path ->
+                val (response, chain) = filter(ProfilingAccessFilter(ADMIN_TOKEN), path, authorization = null)
+
+                response.status shouldBe 401
+                chain.request.shouldBeNull()
+            }
+        }
+
+        test("when no admin token is configured then answers 404") {
+            val (response, chain) = filter(ProfilingAccessFilter(""), "/actuator/%70rofiling", authorization = "Bearer ")
+
+            response.status shouldBe 404
+            chain.request.shouldBeNull()
+        }
+
+        test("when the bearer token matches then passes the request on") {
+            val (_, chain) = filter(ProfilingAccessFilter(ADMIN_TOKEN), "/actuator/profiling", authorization = "Bearer $ADMIN_TOKEN")
+
+            chain.request.shouldNotBeNull()
+        }
+
+        test("when the request is for another path then passes it on without a token") {
+            val (_, chain) = filter(ProfilingAccessFilter(ADMIN_TOKEN), "/actuator/health", authorization = null)
+
+            chain.request.shouldNotBeNull()
+        }
+    })
+
+private const val ADMIN_TOKEN = "admin-token"
+
+private fun filter(
+    filter: ProfilingAccessFilter,
+    path: String,
+    authorization: String?,
+): Pair<MockHttpServletResponse, MockFilterChain> {
+    val request = MockHttpServletRequest("GET", path)
+    authorization?.let { request.addHeader(HttpHeaders.AUTHORIZATION, it) }
+    val response = MockHttpServletResponse()
+    val chain = MockFilterChain()
+    filter.doFilter(request, response, chain)
+    return response to chain
+}
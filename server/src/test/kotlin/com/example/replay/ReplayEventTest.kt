@@ -0,0 +1,98 @@
+package com.example.replay
+
+import io.kotest.core.spec.style.FunSpec
+import io.kotest.matchers.collections.shouldBeEmpty
+import io.kotest.matchers.ints.shouldBeInRange
+import io.kotest.matchers.shouldBe
+import io.kotest.property.Arb
+import io.kotest.property.arbitrary.bind
+import io.kotest.property.arbitrary.int
+import io.kotest.property.arbitrary.list
+import io.kotest.property.arbitrary.long
+import io.kotest.property.arbitrary.uuid
+import io.kotest.property.checkAll
+import java.time.Instant
+import java.util.UUID
+import kotlin.math.sign
+
+class ReplayEventTest :
+    FunSpec({
+        test("when ReplayKey compares event ids at the same instant then orders them like their canonical strings") {
+            checkAll(Arb.uuid(), Arb.uuid()) { a, b ->
+                val at = Instant.EPOCH
+                ReplayKey(at, a).compareTo(ReplayKey(at, b)).sign shouldBe a.toString().compareTo(b.toString()).sign
+            }
+        }
+
+        test("when ReplayKey compares different instants then the instant decides") {
+            checkAll(Arb.long(0L..1_000_000L), Arb.long(0L..1_000_000L), Arb.uuid(), Arb.uuid()) { s1, s2, a, b ->
+                if (s1 != s2) {
+                    ReplayKey(Instant.ofEpochSecond(s1), a).compareTo(ReplayKey(Instant.ofEpochSecond(s2), b)).sign shouldBe
+                        s1.compareTo(s2).sign
+                }
+            }
+        }
+
+        test("when ReplayKey.endOf an instant then sorts after every event at that instant") {
+            checkAll(Arb.long(0L..1_000_000L), Arb.uuid()) { seconds, eventId ->
+                val at = Instant.ofEpochSecond(seconds)
+                (ReplayKey(at, eventId) < ReplayKey.endOf(at)) shouldBe true
+                (ReplayKey.endOf(at) < ReplayKey(at.plusNanos(1), ReplayKey.START.eventId)) shouldBe true
+            }
+        }
+
+        test("when replayPartitionOf with any post then returns a partition in range") {
+            checkAll(Arb.uuid(), Arb.int(1..64)) { postId, partitions ->
+                replayPartitionOf(postId, partitions) shouldBeInRange (0 until partitions)
+            }
+        }
+
+        test("when partitionReplayChunk without checkpoints then keeps every event in its post's partition in order") {
+            checkAll(arbChunk(), Arb.int(1..16)) { events, partitions ->
+                val partitioned = partitionReplayChunk(events, partitions, emptyMap())
+
+                partitioned.values.sumOf { it.size } shouldBe events.size
+                partitioned.forEach { (partition, partitionEvents) ->
+                    partitionEvents.forEach { replayPartitionOf(it.postId, partitions) shouldBe partition }
+                    partitionEvents shouldBe events.filter { replayPartitionOf(it.postId, partitions) == partition }
+                }
+            }
+        }
+
+        test("when partitionReplayChunk with checkpoints then drops events at or before each partition's checkpoint") {
+            checkAll(arbChunk(), Arb.int(1..16)) { events, partitions ->
+                val checkpoints = events.associate { replayPartitionOf(it.postId, partitions) to it.key }
+
+                val partitioned = partitionReplayChunk(events, partitions, checkpoints)
+
+                partitioned.forEach { (partition, partitionEvents) ->
+                    partitionEvents.forEach { (it.key > checkpoints.getValue(partition)) shouldBe true }
+                }
+            }
+        }
+
+        test("when partitionReplayChunk with every partition checkpointed at the chunk end then returns nothing") {
+            checkAll(arbChunk(), Arb.int(1..16)) { events, partitions ->
+                val end = events.maxOfOrNull { it.key } ?: ReplayKey.START
+                val checkpoints = (0 until partitions).associateWith { end }
+
+                partitionReplayChunk(events, partitions, checkpoints).values.flatten().shouldBeEmpty()
+            }
+        }
+    })
+
+private fun arbChunk(): Arb<List<ReplayEvent>> =
+    Arb.bind(Arb.list(Arb.uuid(), 1..5), Arb.list(Arb.long(0L..1_000L), 0..50)) { postIds, offsets ->
+        offsets
+            .mapIndexed { i, offset ->
+                ReplayEvent(
+                    stream = EventStream.VIEW_EVENTS,
+                    eventId = UUID.randomUUID(),
+                    postId = postIds[i % postIds.size],
+                    userId = UUID.randomUUID(),
+                    eventType = "viewed",
+                    eventData = null,
+                    occurredAt = Instant.ofEpochSecond(offset),
+                )
+            }.sortedBy { it.key }
+    }
@@ -4,19 +4,18 @@ import io.kotest.core.spec.style.FunSpec
 import io.kotest.matchers.shouldBe
 import io.kotest.property.Arb
 import io.kotest.property.arbitrary.bind
+import io.kotest.property.arbitrary.boolean
 import io.kotest.property.arbitrary.constant
+import io.kotest.property.arbitrary.int
 import io.kotest.property.arbitrary.list
-import io.kotest.property.arbitrary.long
 import io.kotest.property.arbitrary.map
 import io.kotest.property.arbitrary.uuid
 import io.kotest.property.checkAll
-import java.time.Instant
-import java.util.UUID
 
 class AggregatedRepostsTest :
     FunSpec({
         test("when aggregateRepostEvents with empty list then returns zero reposts") {
-            checkAll(Arb.constant(emptyList<RepostEvent>())) { events ->
+            checkAll(Arb.constant(emptyList<RepostRow>())) { events ->
                 val result = aggregateRepostEvents(events)
                 result.repostCount shouldBe 0
                 result.repostedUserIds shouldBe emptySet()
@@ -70,117 +69,120 @@ class AggregatedRepostsTest :
                 result.repostedUserIds shouldBe expectedUserIds
             }
         }
+
+        test("when aggregateRepostEvents with interleaved events then statusOf matches UserRepostStatus fromEvents") {
+            checkAll(arbInterleavedEvents()) { events ->
+                val userIds = events.map { it.userId }.distinct()
+                val result = aggregateRepostEvents(events)
+
+                userIds.forEach { userId ->
+                    result.statusOf(userId) shouldBe UserRepostStatus.fromEvents(events, userId)
+                }
+                result.repostCount shouldBe userIds.count { UserRepostStatus.fromEvents(events, it) == UserRepostStatus.Reposted }
+            }
+        }
     })
 
-private fun arbRepostedEvent(): Arb<RepostEvent> =
+private fun arbRepostedEvent(): Arb<RepostRow> =
     Arb.bind(
         Arb.uuid(),
         Arb.uuid(),
-        Arb.uuid(),
-        arbInstant(),
-    ) { eventId, postId, userId, occurredAt ->
-        RepostEvent(
-            eventId = eventId,
+    ) { postId, userId ->
+        RepostRow(
             postId = postId,
             userId = userId,
-            eventType = RepostEventType.REPOSTED.value,
-            occurredAt = occurredAt,
+            type = RepostEventType.REPOSTED,
         )
     }
 
-private fun arbMultipleUsersRepostedEvents(userCountRange: IntRange): Arb<List<RepostEvent>> =
+private fun arbMultipleUsersRepostedEvents(userCountRange: IntRange): Arb<List<RepostRow>> =
     Arb.bind(
         Arb.uuid(),
         Arb.list(Arb.uuid(), userCountRange),
     ) { postId, userIds ->
-        userIds.mapIndexed { index, userId ->
-            RepostEvent(
-                eventId = UUID.randomUUID(),
+        userIds.map { userId ->
+            RepostRow(
                 postId = postId,
                 userId = userId,
-                eventType = RepostEventType.REPOSTED.value,
-                occurredAt = Instant.ofEpochSecond(index.toLong()),
+                type = RepostEventType.REPOSTED,
             )
         }
     }
 
-private fun arbSameUserMultipleReposts(): Arb<List<RepostEvent>> =
+private fun arbSameUserMultipleReposts(): Arb<List<RepostRow>> =
     Arb.bind(
         Arb.uuid(),
         Arb.uuid(),
-        arbInstant(),
-        arbInstant(),
-    ) { postId, userId, time1, time2 ->
+    ) { postId, userId ->
         listOf(
-            RepostEvent(
-                eventId = UUID.randomUUID(),
+            RepostRow(
                 postId = postId,
                 userId = userId,
-                eventType = RepostEventType.REPOSTED.value,
-                occurredAt = time1,
+                type = RepostEventType.REPOSTED,
             ),
-            RepostEvent(
-                eventId = UUID.randomUUID(),
+            RepostRow(
                 postId = postId,
                 userId = userId,
-                eventType = RepostEventType.REPOSTED.value,
-                occurredAt = time2,
+                type = RepostEventType.REPOSTED,
             ),
         )
     }
 
-private fun arbRepostThenUnrepostEvents(): Arb<List<RepostEvent>> =
+private fun arbRepostThenUnrepostEvents(): Arb<List<RepostRow>> =
     Arb.bind(
         Arb.uuid(),
         Arb.uuid(),
     ) { postId, userId ->
         listOf(
-            RepostEvent(
-                eventId = UUID.randomUUID(),
+            RepostRow(
                 postId = postId,
                 userId = userId,
-                eventType = RepostEventType.REPOSTED.value,
-                occurredAt = Instant.ofEpochSecond(0),
+                type = RepostEventType.REPOSTED,
             ),
-            RepostEvent(
-                eventId = UUID.randomUUID(),
+            RepostRow(
                 postId = postId,
                 userId = userId,
-                eventType = RepostEventType.UNREPOSTED.value,
-                occurredAt = Instant.ofEpochSecond(1),
+                type = RepostEventType.UNREPOSTED,
             ),
         )
     }
 
-private fun arbMultipleUsersOneUnreposted(): Arb<List<RepostEvent>> =
+private fun arbMultipleUsersOneUnreposted(): Arb<List<RepostRow>> =
     Arb.bind(
         Arb.uuid(),
         Arb.uuid(),
         Arb.uuid(),
     ) { postId, userId1, userId2 ->
         listOf(
-            RepostEvent(
-                eventId = UUID.randomUUID(),
+            RepostRow(
                 postId = postId,
                 userId = userId1,
-                eventType = RepostEventType.REPOSTED.value,
-                occurredAt = Instant.ofEpochSecond(0),
+                type = RepostEventType.REPOSTED,
             ),
-            RepostEvent(
-                eventId = UUID.randomUUID(),
+            RepostRow(
                 postId = postId,
                 userId = userId2,
-                eventType = RepostEventType.REPOSTED.value,
-                occurredAt = Instant.ofEpochSecond(1),
+                type = RepostEventType.REPOSTED,
             ),
-            RepostEvent(
-                eventId = UUID.randomUUID(),
+            RepostRow(
                 postId = postId,
                 userId = userId1,
-                eventType = RepostEventType.UNREPOSTED.value,
-                occurredAt = Instant.ofEpochSecond(2),
+                type = RepostEventType.UNREPOSTED,
             ),
         )
     }
 
-private fun arbInstant(): Arb<Instant> = Arb.long(0..253402300799L).map { Instant.ofEpochSecond(it) }
+private fun arbInterleavedEvents(): Arb<List<RepostRow>> =
+    Arb.bind(
+        Arb.uuid(),
+        Arb.list(Arb.uuid(), 1..4),
+        Arb.list(Arb.bind(Arb.int(0..3), Arb.boolean()) { userIndex, reposted -> userIndex to reposted }, 0..30),
+    ) { postId, userIds, toggles ->
+        toggles.map { (userIndex, reposted) ->
+            RepostRow(
+                postId = postId,
+                userId = userIds[userIndex % userIds.size],
+                type = if (reposted) RepostEventType.REPOSTED else RepostEventType.UNREPOSTED,
+            )
+        }
+    }
@@ -4,11 +4,9 @@ import io.kotest.core.spec.style.FunSpec
 import io.kotest.matchers.shouldBe
 import io.kotest.property.Arb
 import io.kotest.property.arbitrary.bind
-import io.kotest.property.arbitrary.long
 import io.kotest.property.arbitrary.map
 import io.kotest.property.arbitrary.uuid
 import io.kotest.property.checkAll
-import java.time.Instant
 import java.util.UUID
 
 class UserRepostStatusTest :
@@ -50,69 +48,50 @@ class UserRepostStatusTest :
         }
     })
 
-private fun arbRepostEvent(eventType: RepostEventType): Arb<RepostEvent> =
+private fun arbRepostEvent(eventType: RepostEventType): Arb<RepostRow> =
     Arb.bind(
         Arb.uuid(),
         Arb.uuid(),
-        Arb.uuid(),
-        arbInstant(),
-    ) { eventId, postId, userId, occurredAt ->
-        RepostEvent(
-            eventId = eventId,
+    ) { postId, userId ->
+        RepostRow(
             postId = postId,
             userId = userId,
-            eventType = eventType.value,
-            occurredAt = occurredAt,
+            type = eventType,
         )
     }
 
-private fun arbDifferentUserEvent(): Arb<Pair<RepostEvent, UUID>> =
+private fun arbDifferentUserEvent(): Arb<Pair<RepostRow, UUID>> =
     Arb
-        .bind(
-            Arb.uuid(),
-            Arb.uuid(),
-            arbInstant(),
-        ) { eventId, postId, occurredAt ->
+        .uuid()
+        .map { postId ->
             val userId1 = UUID.randomUUID()
             val userId2 =
                 generateSequence { UUID.randomUUID() }
                     .first { it != userId1 }
             val event =
-                RepostEvent(
-                    eventId = eventId,
+                RepostRow(
                     postId = postId,
                     userId = userId1,
-                    eventType = RepostEventType.REPOSTED.value,
-                    occurredAt = occurredAt,
+                    type = RepostEventType.REPOSTED,
                 )
             event to userId2
         }
 
-private fun arbRepostThenUnrepostEvents(): Arb<List<RepostEvent>> =
+private fun arbRepostThenUnrepostEvents(): Arb<List<RepostRow>> =
     Arb.bind(
         Arb.uuid(),
         Arb.uuid(),
-        Arb.uuid(),
-        arbInstant(),
-        arbInstant(),
-    ) { eventId1, postId, userId, time1, time2 ->
-        val (earlierTime, laterTime) = if (time1 < time2) time1 to time2 else time2 to time1
+    ) { postId, userId ->
         listOf(
-            RepostEvent(
-                eventId = eventId1,
+            RepostRow(
                 postId = postId,
                 userId = userId,
-                eventType = RepostEventType.REPOSTED.value,
-                occurredAt = earlierTime,
+                type = RepostEventType.REPOSTED,
             ),
-            RepostEvent(
-                eventId = UUID.randomUUID(),
+            RepostRow(
                 postId = postId,
                 userId = userId,
-                eventType = RepostEventType.UNREPOSTED.value,
-                occurredAt = laterTime,
+                type = RepostEventType.UNREPOSTED,
             ),
         )
     }
-
-private fun arbInstant(): Arb<Instant> = Arb.long(0..253402300799L).map { Instant.ofEpochSecond(it) }
@@ -0,0 +1,65 @@
+package com.example.timeline
+
+import io.kotest.assertions.throwables.shouldThrow
+import io.kotest.core.spec.style.FunSpec
+import io.kotest.matchers.nulls.shouldBeNull
+import io.kotest.matchers.shouldBe
+import io.kotest.property.Arb
+import io.kotest.property.arbitrary.bind
+import io.kotest.property.arbitrary.int
+import io.kotest.property.arbitrary.long
+import io.kotest.property.arbitrary.orNull
+import io.kotest.property.arbitrary.string
+import io.kotest.property.arbitrary.uuid
+import io.kotest.property.checkAll
+import java.time.Instant
+import java.util.Base64
+
+class TimelineCursorTest :
+    FunSpec({
+        val codec = TimelineCursorCodec("test-cursor-secret")
+
+        test("when encode then decode returns the same cursor") {
+            checkAll(arbTimelineCursor()) { cursor ->
+                codec.decode(codec.encode(cursor)) shouldBe cursor
+            }
+        }
+
+        test("when decode with a flipped byte then returns null") {
+            checkAll(arbTimelineCursor(), Arb.int(0, 1000)) { cursor, position ->
+                val bytes = Base64.getUrlDecoder().decode(codec.encode(cursor))
+                val index = position % bytes.size
+                bytes[index] = (bytes[index].toInt() xor 1).toByte()
+                val tampered = Base64.getUrlEncoder().withoutPadding().encodeToString(bytes)
+
+                codec.decode(tampered).shouldBeNull()
+            }
+        }
+
+        test("when decode with a cursor signed by another secret then returns null") {
+            val otherCodec = TimelineCursorCodec("other-cursor-secret")
+            checkAll(arbTimelineCursor()) { cursor ->
+                codec.decode(otherCodec.encode(cursor)).shouldBeNull()
+            }
+        }
+
+        test("when decode with arbitrary string then returns null") {
+            checkAll(Arb.string()) { token ->
+                codec.decode(token).shouldBeNull()
+            }
+        }
+
+        test("when constructed with a blank secret then throws") {
+            shouldThrow<IllegalArgumentException> { TimelineCursorCodec("") }
+        }
+    })
+
+private fun arbTimelineCursor(): Arb<TimelineCursor> =
+    Arb.bind(
+        Arb.long(0L, 4_102_444_800L),
+        Arb.int(0, 999_999_999),
+        Arb.uuid(),
+        Arb.uuid().orNull(),
+    ) { epochSecond, nano, postId, authorId ->
+        TimelineCursor(Instant.ofEpochSecond(epochSecond, nano.toLong()), postId, authorId)
+    }
@@ -0,0 +1,104 @@
+package com.example.trending
+
+import com.example.like.LikeEventType
+import com.example.replay.EventStream
+import com.example.replay.ReplayEvent
+import com.example.repost.RepostEventType
+import io.kotest.core.spec.style.FunSpec
+import io.kotest.matchers.doubles.plusOrMinus
+import io.kotest.matchers.doubles.shouldBeGreaterThan
+import io.kotest.matchers.nulls.shouldBeNull
+import io.kotest.matchers.shouldBe
+import io.kotest.property.Arb
+import io.kotest.property.arbitrary.bind
+import io.kotest.property.arbitrary.double
+import io.kotest.property.arbitrary.element
+import io.kotest.property.arbitrary.list
+import io.kotest.property.arbitrary.long
+import io.kotest.property.arbitrary.pair
+import io.kotest.property.arbitrary.uuid
+import io.kotest.property.checkAll
+import java.time.Instant
+import java.util.UUID
+import kotlin.math.exp
+import kotlin.math.ln
+
+class TrendingScoreTest :
+    FunSpec({
+        test("when logAddExp with any two scores then is commutative and equals ln(e^a + e^b)") {
+            checkAll(Arb.double(-50.0..50.0), Arb.double(-50.0..50.0)) { a, b ->
+                logAddExp(a, b) shouldBe logAddExp(b, a)
+                logAddExp(a, b) shouldBe (ln(exp(a) + exp(b)) plusOrMinus 1e-9)
+            }
+        }
+
+        test("when logAddExp with scores far beyond exp's range then does not overflow") {
+            logAddExp(10_000.0, 10_000.0) shouldBe (10_000.0 + ln(2.0) plusOrMinus 1e-9)
+        }
+
+        test("when trendingLogScoreOf one half-life later then scores ln 2 higher") {
+            checkAll(Arb.long(0L..10_000_000L)) { seconds ->
+                val at = TRENDING_EPOCH.plusSeconds(seconds)
+                trendingLogScoreOf(1.0, at.plus(TRENDING_HALF_LIFE)) - trendingLogScoreOf(1.0, at) shouldBe (ln(2.0) plusOrMinus 1e-6)
+            }
+        }
+
+        test("when trendingLogScoreOf with a later event then scores higher") {
+            checkAll(Arb.long(0L..10_000_000L), Arb.long(1L..10_000_000L)) { seconds, later ->
+                val at = TRENDING_EPOCH.plusSeconds(seconds)
+                trendingLogScoreOf(1.0, at.plusSeconds(later)) shouldBeGreaterThan trendingLogScoreOf(1.0, at)
+            }
+        }
+
+        test("when trendingWeightOf with a withdrawal or a post event then does not count") {
+            trendingWeightOf(event(EventStream.LIKE_EVENTS, LikeEventType.UNLIKED.value)).shouldBeNull()
+            trendingWeightOf(event(EventStream.REPOST_EVENTS, RepostEventType.UNREPOSTED.value)).shouldBeNull()
+            trendingWeightOf(event(EventStream.POST_EVENTS, "created")).shouldBeNull()
+        }
+
+        test("when trendingLogScoresOf with any events then equals each post's events folded one by one") {
+            checkAll(arbEngagement()) { events ->
+                val scores = trendingLogScoresOf(events)
+
+                scores.keys shouldBe events.map { it.postId }.toSet()
+                scores.forEach { (postId, score) ->
+                    val expected =
+                        events
+                            .filter { it.postId == postId }
+                            .map { trendingLogScoreOf(trendingWeightOf(it)!!, it.occurredAt) }
+                            .reduce(::logAddExp)
+                    score shouldBe (expected plusOrMinus 1e-9)
+                }
+            }
+        }
+    })
+
+private val countedEvents =
+    listOf(
+        EventStream.LIKE_EVENTS to LikeEventType.LIKED.value,
+        EventStream.REPOST_EVENTS to RepostEventType.REPOSTED.value,
+        EventStream.VIEW_EVENTS to "viewed",
+    )
+
+private fun arbEngagement(): Arb<List<ReplayEvent>> =
+    Arb.bind(Arb.list(Arb.uuid(), 1..3), Arb.list(Arb.pair(Arb.element(countedEvents), Arb.long(0L..100_000L)), 0..50)) { postIds, kinds ->
+        kinds.mapIndexed { i, (kind, offset) ->
+            event(kind.first, kind.second, postIds[i % postIds.size], TRENDING_EPOCH.plusSeconds(offset))
+        }
+    }
+
+private fun event(
+    stream: EventStream,
+    eventType: String,
+    postId: UUID = UUID.randomUUID(),
+    occurredAt: Instant = TRENDING_EPOCH,
+): ReplayEvent =
+    ReplayEvent(
+        stream = stream,
+        eventId = UUID.randomUUID(),
+        postId = postId,
+        userId = UUID.randomUUID(),
+        eventType = eventType,
+        eventData = null,
+        occurredAt = occurredAt,
+    )
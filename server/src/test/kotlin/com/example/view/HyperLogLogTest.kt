@@ -0,0 +1,54 @@
+package com.example.view
+
+import io.kotest.core.spec.style.FunSpec
+import io.kotest.matchers.doubles.shouldBeLessThan
+import io.kotest.matchers.ints.shouldBeInRange
+import io.kotest.matchers.shouldBe
+import io.kotest.property.Arb
+import io.kotest.property.arbitrary.int
+import io.kotest.property.arbitrary.list
+import io.kotest.property.arbitrary.uuid
+import io.kotest.property.checkAll
+import java.util.UUID
+import kotlin.math.abs
+
+class HyperLogLogTest :
+    FunSpec({
+        test("when hllUpdateOf with any user then register and rank are in range") {
+            checkAll(Arb.uuid()) { userId ->
+                val update = hllUpdateOf(userId)
+                update.register shouldBeInRange (0 until HLL_REGISTER_COUNT)
+                update.rank shouldBeInRange (1..Long.SIZE_BITS - HLL_PRECISION + 1)
+            }
+        }
+
+        test("when estimateHllCardinality with no viewers then returns 0") {
+            estimateHllCardinality(ByteArray(HLL_REGISTER_COUNT)) shouldBe 0L
+        }
+
+        test("when hllRegistersOf with repeated viewers then equals the sketch of the distinct viewers") {
+            checkAll(Arb.list(Arb.uuid(), 0..200), Arb.int(1..5)) { userIds, repeats ->
+                hllRegistersOf(List(repeats) { userIds }.flatten()).toList() shouldBe hllRegistersOf(userIds.distinct()).toList()
+            }
+        }
+
+        test("when mergeHllRegisters with sketches of two sets then equals the sketch of their union") {
+            checkAll(Arb.list(Arb.uuid(), 0..200), Arb.list(Arb.uuid(), 0..200)) { a, b ->
+                mergeHllRegisters(listOf(hllRegistersOf(a), hllRegistersOf(b))).toList() shouldBe hllRegistersOf(a + b).toList()
+            }
+        }
+
+        test("when estimateHllCardinality with distinct viewers then stays within 4 standard errors") {
+            checkAll(20, Arb.int(100..50_000)) { n ->
+                val estimate = estimateHllCardinality(hllRegistersOf(List(n) { UUID.randomUUID() }))
+                abs(estimate - n).toDouble() / n shouldBeLessThan 4 * 1.04 / kotlin.math.sqrt(HLL_REGISTER_COUNT.toDouble())
+            }
+        }
+
+        test("when estimateHllCardinality with few viewers then is close to exact") {
+            checkAll(Arb.int(1..20)) { n ->
+                val estimate = estimateHllCardinality(hllRegistersOf(List(n) { UUID.randomUUID() }))
+                estimate.toInt() shouldBeInRange (n - 2..n + 2)
+            }
+        }
+    })